@@ -0,0 +1,56 @@
+"""
+종료 세션 아카이브 작업
+
+종료 후 보관 기간이 지난 세션의 상태/이력/그래프 행을
+session_archive 1행(JSONB, TOAST 압축)으로 옮기고 원본 행을 삭제합니다.
+session 행과 이력 요약은 남으며, TRACE 조회는 아카이브를 그대로 읽습니다.
+cron 등 주기 작업으로 실행하는 것을 전제로 합니다.
+
+사용법 (DB 필요, .env 설정 사용):
+    uv run python scripts/archive_sessions.py --dry-run
+    uv run python scripts/archive_sessions.py --days 30 --limit 500
+"""
+
+import argparse
+import asyncio
+import sys
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent / "src"))
+
+from state_db.configs import (  # noqa: E402
+    SESSION_ARCHIVE_AFTER_DAYS,
+    SESSION_ARCHIVE_BATCH_SIZE,
+)
+from state_db.infrastructure import (  # noqa: E402
+    DatabaseManager,
+    archive_ended_sessions,
+)
+
+
+async def run(days: int, limit: int, dry_run: bool) -> None:
+    await DatabaseManager.get_pool()
+    try:
+        results = await archive_ended_sessions(days, limit, dry_run)
+    finally:
+        await DatabaseManager.close_pool()
+
+    print(f"[session archive] days={days} limit={limit} dry_run={dry_run}")
+    if not results:
+        print("  no ended sessions past the archive window")
+    for row in results:
+        rows = "-" if row["archived_rows"] is None else row["archived_rows"]
+        print(f"  {row['session_id']} | ended {row['ended_at']} | rows {rows}")
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--days", type=int, default=SESSION_ARCHIVE_AFTER_DAYS)
+    parser.add_argument("--limit", type=int, default=SESSION_ARCHIVE_BATCH_SIZE)
+    parser.add_argument("--dry-run", action="store_true")
+    args = parser.parse_args()
+    asyncio.run(run(args.days, args.limit, args.dry_run))
+
+
+if __name__ == "__main__":
+    main()
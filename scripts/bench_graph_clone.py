@@ -0,0 +1,117 @@
+"""
+AGE 그래프 복제(세션 시작) 벤치마크
+
+기존 세션 수를 단계적으로 늘리면서 create_session 1건(그래프 복제 포함)의
+평균 소요 시간을 측정합니다. 라벨 한정 + 속성 인덱스(B_graph_index.sql) 적용 시
+기존 세션 수와 무관하게 소요 시간이 일정해야 합니다.
+
+사용법 (DB 필요, .env 설정 사용):
+    uv run python scripts/bench_graph_clone.py
+    uv run python scripts/bench_graph_clone.py --npcs 20 --enemies 20 --steps 0,200,1000
+"""
+
+import argparse
+import asyncio
+import sys
+import time
+import uuid
+from pathlib import Path
+from typing import List
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent / "src"))
+
+from state_db.infrastructure import DatabaseManager, shutdown, startup  # noqa: E402
+from state_db.repositories import ScenarioRepository  # noqa: E402
+from state_db.schemas import ScenarioInjectRequest  # noqa: E402
+
+BACKGROUND_BATCH = 200
+
+
+def build_scenario(npcs: int, enemies: int) -> ScenarioInjectRequest:
+    npc_ids = [str(uuid.uuid4()) for _ in range(npcs)]
+    enemy_ids = [str(uuid.uuid4()) for _ in range(enemies)]
+    # NPC 간 순환 관계 + NPC -> Enemy 관계
+    relations = []
+    if npcs:
+        relations = [
+            {"from_id": npc_ids[i], "to_id": npc_ids[(i + 1) % npcs]}
+            for i in range(npcs)
+        ] + [
+            {"from_id": npc_ids[i % npcs], "to_id": enemy_ids[i]}
+            for i in range(enemies)
+        ]
+    return ScenarioInjectRequest.model_validate(
+        {
+            "title": f"bench-graph-clone-{uuid.uuid4().hex[:8]}",
+            "npcs": [
+                {"scenario_npc_id": nid, "name": f"npc-{i}"}
+                for i, nid in enumerate(npc_ids)
+            ],
+            "enemies": [
+                {"scenario_enemy_id": eid, "name": f"enemy-{i}"}
+                for i, eid in enumerate(enemy_ids)
+            ],
+            "relations": relations,
+        }
+    )
+
+
+async def grow_sessions(scenario_id: str, count: int) -> None:
+    """배경 세션 생성 (일괄 생성 경로로 빠르게 그래프를 키움)"""
+    async with DatabaseManager.get_connection() as conn:
+        while count > 0:
+            batch = min(count, BACKGROUND_BATCH)
+            await conn.execute(
+                "SELECT create_sessions_bulk($1::UUID, $2)", scenario_id, batch
+            )
+            count -= batch
+
+
+async def time_create_session(scenario_id: str, samples: int) -> float:
+    async with DatabaseManager.get_connection() as conn:
+        elapsed = 0.0
+        for _ in range(samples):
+            start = time.perf_counter()
+            await conn.execute("SELECT create_session($1::UUID)", scenario_id)
+            elapsed += time.perf_counter() - start
+    return elapsed / samples
+
+
+async def run(npcs: int, enemies: int, steps: List[int], samples: int) -> None:
+    await startup()
+    try:
+        scenario_request = build_scenario(npcs, enemies)
+        scenario = await ScenarioRepository().inject_scenario(scenario_request)
+        scenario_id = scenario.scenario_id
+        print(
+            f"[graph clone] npcs={npcs} enemies={enemies} "
+            f"relations={len(scenario_request.relations)} samples={samples}"
+        )
+        print(f"  {'existing sessions':>18} | {'create_session':>16}")
+
+        existing = 0
+        for target in steps:
+            if target > existing:
+                await grow_sessions(scenario_id, target - existing)
+                existing = target
+            avg = await time_create_session(scenario_id, samples)
+            print(f"  {existing:>18} | {avg * 1e3:>13.2f} ms")
+            existing += samples
+    finally:
+        await shutdown()
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--npcs", type=int, default=10)
+    parser.add_argument("--enemies", type=int, default=10)
+    parser.add_argument("--steps", default="0,100,500,1000")
+    parser.add_argument("--samples", type=int, default=20)
+    args = parser.parse_args()
+
+    steps = sorted(int(s) for s in args.steps.split(",") if s.strip())
+    asyncio.run(run(args.npcs, args.enemies, steps, args.samples))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,115 @@
+"""
+json/jsonb 코덱 마이크로 벤치마크
+
+스냅샷 크기의 페이로드(플레이어 + NPC/Enemy 상태 + 인벤토리)를 기준으로
+표준 json 모듈과 커넥션 코덱(orjson)의 인코딩/디코딩 시간을 비교합니다.
+
+사용법:
+    uv run python scripts/bench_json_codec.py
+    uv run python scripts/bench_json_codec.py --entities 50 --iterations 20000
+"""
+
+import argparse
+import json
+import sys
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent / "src"))
+
+from state_db.infrastructure.codecs import json_decode, json_encode  # noqa: E402
+
+
+def build_snapshot(entities: int) -> dict:
+    def entity_state(hp: int) -> dict:
+        return {
+            "numeric": {"HP": hp, "MP": 20, "attack": 12, "defense": 7},
+            "boolean": {"hostile": False, "alive": True},
+        }
+
+    session_id = "6f1c1f0e-8f47-4a53-9a7c-3d2b5a4b7c10"
+    return {
+        "session": {
+            "session_id": session_id,
+            "scenario_id": "0b7e6f2a-1d5c-4b8e-9f3a-2c1d0e9f8a7b",
+            "current_act": 2,
+            "current_sequence": 3,
+            "current_phase": "combat",
+            "current_turn": 42,
+            "location": "Ancient Ruins",
+            "status": "active",
+            "updated_at": "2026-01-23T10:05:00",
+        },
+        "player": {
+            "player_id": "a3c9d2e1-4b5f-4c6d-8e7f-9a0b1c2d3e4f",
+            "name": "Hero",
+            "state": entity_state(95),
+            "relations": [],
+            "tags": ["player"],
+        },
+        "npcs": [
+            {
+                "npc_id": f"00000000-0000-4000-8000-{i:012d}",
+                "name": f"NPC {i}",
+                "description": "A villager with a long and winding backstory.",
+                "current_hp": 100,
+                "tags": ["npc", "villager"],
+                "state": entity_state(100),
+            }
+            for i in range(entities)
+        ],
+        "enemies": [
+            {
+                "enemy_instance_id": f"00000000-0000-4000-9000-{i:012d}",
+                "scenario_enemy_id": f"enemy-{i:03d}",
+                "name": f"Goblin {i}",
+                "description": "Small, green and angry.",
+                "current_hp": 30,
+                "tags": ["enemy"],
+                "state": entity_state(30),
+            }
+            for i in range(entities)
+        ],
+        "inventory": [
+            {"player_id": session_id, "item_id": i, "quantity": i + 1}
+            for i in range(entities)
+        ],
+        "phase": {"session_id": session_id, "current_phase": "combat"},
+        "turn": {"session_id": session_id, "current_turn": 42},
+    }
+
+
+def timeit(fn, payload, iterations: int) -> float:
+    start = time.perf_counter()
+    for _ in range(iterations):
+        fn(payload)
+    return (time.perf_counter() - start) / iterations
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--entities", type=int, default=10)
+    parser.add_argument("--iterations", type=int, default=20_000)
+    args = parser.parse_args()
+
+    snapshot = build_snapshot(args.entities)
+    text = json.dumps(snapshot)
+    print(
+        f"[payload] entities={args.entities} size={len(text)} bytes "
+        f"iterations={args.iterations}"
+    )
+
+    for label, stdlib_fn, orjson_fn, payload in (
+        ("decode", json.loads, json_decode, text),
+        ("encode", json.dumps, json_encode, snapshot),
+    ):
+        stdlib = timeit(stdlib_fn, payload, args.iterations)
+        fast = timeit(orjson_fn, payload, args.iterations)
+        print(f"[{label}]")
+        print(f"  json   : {stdlib * 1e6:8.2f} us/op")
+        print(f"  orjson : {fast * 1e6:8.2f} us/op")
+        print(f"  speedup: {stdlib / fast:8.1f}x")
+
+
+if __name__ == "__main__":
+    main()
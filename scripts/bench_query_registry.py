@@ -0,0 +1,98 @@
+"""
+쿼리 레지스트리 벤치마크
+
+1. 조회 비용: 기존 방식(Path 조합 + resolve + dict 조회) vs 이름 기반 레지스트리 조회
+2. (--db) prepared statement 재사용 효과: statement_cache_size=0 vs 기본 풀 설정
+
+사용법:
+    uv run python scripts/bench_query_registry.py
+    uv run python scripts/bench_query_registry.py --db --iterations 2000
+"""
+
+import argparse
+import asyncio
+import sys
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent / "src"))
+
+from state_db.infrastructure.query_registry import (  # noqa: E402
+    DEFAULT_QUERY_DIR,
+    QueryRegistry,
+)
+
+QUERY_PARTS = ("INQUIRY", "session", "Session_show-r.sql")
+QUERY_NAME = "INQUIRY/session/Session_show-r"
+
+
+def bench_lookup(iterations: int) -> None:
+    # 기존 방식: 호출마다 경로 조합 후 resolve 하여 캐시 키 생성
+    legacy_cache = {}
+    for sql_file in DEFAULT_QUERY_DIR.rglob("*.sql"):
+        legacy_cache[str(sql_file.resolve())] = sql_file.read_text(encoding="utf-8")
+
+    start = time.perf_counter()
+    for _ in range(iterations):
+        path = DEFAULT_QUERY_DIR
+        for part in QUERY_PARTS:
+            path = path / part
+        legacy_cache[str(path.resolve())]
+    legacy = time.perf_counter() - start
+
+    registry = QueryRegistry()
+    registry.load()
+    start = time.perf_counter()
+    for _ in range(iterations):
+        registry.get(QUERY_NAME)
+    named = time.perf_counter() - start
+
+    print(f"[lookup] iterations={iterations}")
+    print(f"  path.resolve + dict : {legacy / iterations * 1e6:8.2f} us/op")
+    print(f"  registry.get(name)  : {named / iterations * 1e6:8.2f} us/op")
+    print(f"  speedup             : {legacy / named:8.1f}x")
+
+
+async def bench_db(iterations: int) -> None:
+    import asyncpg
+
+    from state_db.configs.setting import DB_CONFIG
+    from state_db.infrastructure.database import SESSION_SETTINGS, init_connection
+
+    registry = QueryRegistry()
+    registry.load()
+    sql = registry.get(QUERY_NAME).sql
+    session_id = "00000000-0000-0000-0000-000000000000"
+
+    for label, cache_size in (("unprepared", 0), ("prepared  ", 512)):
+        conn = await asyncpg.connect(
+            **DB_CONFIG,
+            statement_cache_size=cache_size,
+            server_settings=SESSION_SETTINGS,
+        )
+        try:
+            await init_connection(conn)
+            await conn.fetch(sql, session_id)
+            start = time.perf_counter()
+            for _ in range(iterations):
+                await conn.fetch(sql, session_id)
+            elapsed = time.perf_counter() - start
+        finally:
+            await conn.close()
+        print(f"  {label} : {elapsed / iterations * 1e3:8.3f} ms/query")
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--iterations", type=int, default=100_000)
+    parser.add_argument("--db", action="store_true", help="DB 왕복 벤치마크 포함")
+    args = parser.parse_args()
+
+    bench_lookup(args.iterations)
+    if args.db:
+        print(f"[db] iterations={min(args.iterations, 5000)}")
+        asyncio.run(bench_db(min(args.iterations, 5000)))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,62 @@
+"""
+turn / phase 이력 파티션 보존 작업
+
+월별 파티션을 보장(기본 파티션의 행 재배치 포함)한 뒤, 보존 기간이 지났고
+모든 세션이 종료된 파티션을 분리(detach)하거나 삭제(drop)합니다.
+분리된 파티션은 일반 테이블(turn_pYYYYMM 등)로 남으므로 덤프 후 직접 삭제할 수 있습니다.
+cron 등 주기 작업으로 실행하는 것을 전제로 합니다.
+
+사용법 (DB 필요, .env 설정 사용):
+    uv run python scripts/history_retention.py --dry-run
+    uv run python scripts/history_retention.py --days 90 --drop
+"""
+
+import argparse
+import asyncio
+import sys
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent / "src"))
+
+from state_db.configs import (  # noqa: E402
+    HISTORY_RETENTION_DAYS,
+    HISTORY_RETENTION_DROP,
+)
+from state_db.infrastructure import (  # noqa: E402
+    DatabaseManager,
+    apply_history_retention,
+)
+
+
+async def run(days: int, drop: bool, dry_run: bool) -> None:
+    await DatabaseManager.get_pool()
+    try:
+        results = await apply_history_retention(days, drop, dry_run)
+    finally:
+        await DatabaseManager.close_pool()
+
+    mode = "drop" if drop else "detach"
+    print(f"[history retention] days={days} mode={mode} dry_run={dry_run}")
+    if not results:
+        print("  no partitions past retention")
+    for row in results:
+        name, end = row["partition_name"], row["partition_end"]
+        print(f"  {name:>16} | < {end} | {row['action']}")
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--days", type=int, default=HISTORY_RETENTION_DAYS)
+    parser.add_argument(
+        "--drop",
+        action="store_true",
+        default=HISTORY_RETENTION_DROP,
+        help="detach 대신 파티션 삭제",
+    )
+    parser.add_argument("--dry-run", action="store_true")
+    args = parser.parse_args()
+    asyncio.run(run(args.days, args.drop, args.dry_run))
+
+
+if __name__ == "__main__":
+    main()
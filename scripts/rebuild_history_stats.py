@@ -0,0 +1,46 @@
+"""
+세션별 turn / phase 이력 요약 테이블 재구축
+
+요약 테이블은 turn / phase INSERT 트리거가 증분 유지합니다.
+트리거 도입 이전 데이터를 채우거나 요약이 어긋났을 때 이력에서 다시 계산합니다.
+보존 정책으로 분리(detach)된 파티션의 이력은 재구축 대상에서 빠집니다.
+
+사용법 (DB 필요, .env 설정 사용):
+    uv run python scripts/rebuild_history_stats.py
+    uv run python scripts/rebuild_history_stats.py --session-id <UUID>
+"""
+
+import argparse
+import asyncio
+import sys
+from pathlib import Path
+from typing import Optional
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent / "src"))
+
+from state_db.infrastructure import (  # noqa: E402
+    DatabaseManager,
+    rebuild_history_stats,
+)
+
+
+async def run(session_id: Optional[str]) -> None:
+    await DatabaseManager.get_pool()
+    try:
+        rebuilt = await rebuild_history_stats(session_id)
+    finally:
+        await DatabaseManager.close_pool()
+
+    target = session_id or "all sessions"
+    print(f"[history stats] rebuilt {rebuilt} session(s) ({target})")
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--session-id", default=None, help="특정 세션만 재구축")
+    args = parser.parse_args()
+    asyncio.run(run(args.session_id))
+
+
+if __name__ == "__main__":
+    main()
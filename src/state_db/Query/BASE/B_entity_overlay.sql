@@ -0,0 +1,33 @@
+-- ====================================================================
+-- B_entity_overlay.sql
+-- NPC/Enemy Copy-on-Write 오버레이 구조 (Base)
+-- ====================================================================
+
+-- 1. 신규 세션 기본 모드 판별 (커넥션 GUC state_db.entity_overlay)
+-- 애플리케이션은 ENTITY_COPY_ON_WRITE 설정을 커넥션 startup 파라미터로 전달합니다.
+CREATE OR REPLACE FUNCTION is_entity_overlay_default()
+RETURNS BOOLEAN AS $$
+    SELECT COALESCE(current_setting('state_db.entity_overlay', true), '') = 'on';
+$$ LANGUAGE sql STABLE;
+
+-- 2. 세션별 모드 (true: Session 0 마스터 행을 오버레이로 읽고 변경 시에만 복제)
+ALTER TABLE session
+    ADD COLUMN IF NOT EXISTS entity_overlay BOOLEAN NOT NULL DEFAULT false;
+ALTER TABLE session
+    ALTER COLUMN entity_overlay SET DEFAULT is_entity_overlay_default();
+
+COMMENT ON COLUMN session.entity_overlay IS
+    'NPC/Enemy Copy-on-Write 모드 (마스터 행 참조, 최초 변경 시 세션 행 생성)';
+
+-- 3. 세션 행이 어떤 마스터 행에서 복제(materialize)되었는지 기록
+-- 오버레이 세션에서 엔티티의 공개 ID는 항상 마스터 행 ID이며,
+-- removed_at은 마스터 행 기반 엔티티 제거 표시(tombstone)입니다.
+ALTER TABLE npc ADD COLUMN IF NOT EXISTS source_npc_id UUID;
+ALTER TABLE npc ADD COLUMN IF NOT EXISTS removed_at TIMESTAMP;
+ALTER TABLE enemy ADD COLUMN IF NOT EXISTS source_enemy_id UUID;
+ALTER TABLE enemy ADD COLUMN IF NOT EXISTS removed_at TIMESTAMP;
+
+CREATE UNIQUE INDEX IF NOT EXISTS uq_npc_session_source
+    ON npc(session_id, source_npc_id) WHERE source_npc_id IS NOT NULL;
+CREATE UNIQUE INDEX IF NOT EXISTS uq_enemy_session_source
+    ON enemy(session_id, source_enemy_id) WHERE source_enemy_id IS NOT NULL;
@@ -0,0 +1,68 @@
+-- ====================================================================
+-- B_graph_index.sql
+-- Apache AGE 라벨 테이블 및 속성 인덱스 (Base)
+-- ====================================================================
+
+-- 1. 라벨 사전 생성
+-- 라벨 테이블(state_db.npc 등)은 최초 CREATE 시점에 만들어지므로,
+-- 인덱스를 걸 수 있도록 스키마 초기화 단계에서 미리 생성합니다.
+DO $$
+DECLARE
+    v_label RECORD;
+BEGIN
+    FOR v_label IN
+        SELECT * FROM (VALUES ('npc', 'v'), ('enemy', 'v'), ('RELATION', 'e')) AS t(name, kind)
+    LOOP
+        IF NOT EXISTS (
+            SELECT 1
+            FROM ag_catalog.ag_label l
+            JOIN ag_catalog.ag_graph g ON g.graphid = l.graph
+            WHERE g.name = 'state_db' AND l.name = v_label.name
+        ) THEN
+            IF v_label.kind = 'v' THEN
+                PERFORM ag_catalog.create_vlabel('state_db'::name, v_label.name::name);
+            ELSE
+                PERFORM ag_catalog.create_elabel('state_db'::name, v_label.name::name);
+            END IF;
+        END IF;
+    END LOOP;
+END;
+$$;
+
+-- 2. 속성 포함 검색용 GIN 인덱스
+-- MATCH (v:npc {session_id: ...}) 형태의 패턴은 properties @> {...} 로 변환됩니다.
+CREATE INDEX IF NOT EXISTS idx_graph_npc_properties
+    ON state_db.npc USING gin (properties);
+CREATE INDEX IF NOT EXISTS idx_graph_enemy_properties
+    ON state_db.enemy USING gin (properties);
+CREATE INDEX IF NOT EXISTS idx_graph_relation_properties
+    ON state_db."RELATION" USING gin (properties);
+
+-- 3. 속성 동등 비교용 표현식 인덱스
+-- WHERE v.session_id = ... 형태는 agtype_access_operator(...) = ... 로 변환됩니다.
+CREATE INDEX IF NOT EXISTS idx_graph_npc_session_id
+    ON state_db.npc USING btree (
+        ag_catalog.agtype_access_operator(VARIADIC ARRAY[properties, '"session_id"'::ag_catalog.agtype])
+    );
+CREATE INDEX IF NOT EXISTS idx_graph_npc_scenario_npc_id
+    ON state_db.npc USING btree (
+        ag_catalog.agtype_access_operator(VARIADIC ARRAY[properties, '"scenario_npc_id"'::ag_catalog.agtype])
+    );
+CREATE INDEX IF NOT EXISTS idx_graph_enemy_session_id
+    ON state_db.enemy USING btree (
+        ag_catalog.agtype_access_operator(VARIADIC ARRAY[properties, '"session_id"'::ag_catalog.agtype])
+    );
+CREATE INDEX IF NOT EXISTS idx_graph_enemy_scenario_enemy_id
+    ON state_db.enemy USING btree (
+        ag_catalog.agtype_access_operator(VARIADIC ARRAY[properties, '"scenario_enemy_id"'::ag_catalog.agtype])
+    );
+CREATE INDEX IF NOT EXISTS idx_graph_relation_session_id
+    ON state_db."RELATION" USING btree (
+        ag_catalog.agtype_access_operator(VARIADIC ARRAY[properties, '"session_id"'::ag_catalog.agtype])
+    );
+
+-- 4. 엣지 탐색용 인덱스 (start_id / end_id)
+CREATE INDEX IF NOT EXISTS idx_graph_relation_start_id
+    ON state_db."RELATION" USING btree (start_id);
+CREATE INDEX IF NOT EXISTS idx_graph_relation_end_id
+    ON state_db."RELATION" USING btree (end_id);
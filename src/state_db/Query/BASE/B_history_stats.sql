@@ -0,0 +1,61 @@
+-- ====================================================================
+-- B_history_stats.sql
+-- 세션별 turn / phase 이력 요약 테이블 구조 (Base)
+-- ====================================================================
+
+-- turn / phase INSERT 시 L_history_stats.sql의 트리거가 증분 갱신하며,
+-- TRACE 통계/요약 조회는 이력 전체 대신 이 테이블만 읽습니다.
+-- 보존 정책으로 이력 파티션이 분리되어도 요약은 유지됩니다.
+
+-- 1. 세션 단위 요약 (turn 수/시각, 현재 Phase 진입 시각)
+CREATE TABLE IF NOT EXISTS session_history_stats (
+    session_id UUID PRIMARY KEY,
+    total_turns BIGINT NOT NULL DEFAULT 0,
+    first_turn_at TIMESTAMP,
+    last_turn_at TIMESTAMP,
+    -- 마지막 Phase 전환 (진행 중인 Phase의 체류 시간 계산용)
+    current_phase phase_type,
+    phase_since TIMESTAMP,
+    updated_at TIMESTAMP NOT NULL DEFAULT NOW(),
+
+    CONSTRAINT fk_session_history_stats_session FOREIGN KEY (session_id)
+        REFERENCES session(session_id) ON DELETE CASCADE
+);
+
+-- 2. Phase별 / Turn Type별 turn 수
+CREATE TABLE IF NOT EXISTS session_turn_phase_stats (
+    session_id UUID NOT NULL,
+    phase_at_turn phase_type NOT NULL,
+    turn_count BIGINT NOT NULL DEFAULT 0,
+
+    PRIMARY KEY (session_id, phase_at_turn),
+    CONSTRAINT fk_session_turn_phase_stats_session FOREIGN KEY (session_id)
+        REFERENCES session(session_id) ON DELETE CASCADE
+);
+
+CREATE TABLE IF NOT EXISTS session_turn_type_stats (
+    session_id UUID NOT NULL,
+    turn_type VARCHAR(50) NOT NULL,
+    turn_count BIGINT NOT NULL DEFAULT 0,
+
+    PRIMARY KEY (session_id, turn_type),
+    CONSTRAINT fk_session_turn_type_stats_session FOREIGN KEY (session_id)
+        REFERENCES session(session_id) ON DELETE CASCADE
+);
+
+-- 3. Phase별 전환 횟수 및 누적 체류 시간 (종료된 체류 구간만 누적)
+CREATE TABLE IF NOT EXISTS session_phase_stats (
+    session_id UUID NOT NULL,
+    phase phase_type NOT NULL,
+    transition_count BIGINT NOT NULL DEFAULT 0,
+    total_duration INTERVAL NOT NULL DEFAULT INTERVAL '0',
+    first_visit TIMESTAMP,
+    last_visit TIMESTAMP,
+
+    PRIMARY KEY (session_id, phase),
+    CONSTRAINT fk_session_phase_stats_session FOREIGN KEY (session_id)
+        REFERENCES session(session_id) ON DELETE CASCADE
+);
+
+COMMENT ON TABLE session_history_stats IS '세션별 turn / phase 이력 요약 (INSERT 트리거로 증분 갱신)';
+COMMENT ON TABLE session_phase_stats IS 'Phase별 전환 횟수 및 누적 체류 시간 (진행 중 구간은 조회 시 가산)';
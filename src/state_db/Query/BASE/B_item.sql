@@ -33,4 +33,4 @@ CREATE INDEX IF NOT EXISTS idx_item_scenario_item_id ON item(scenario_item_id);
 CREATE INDEX IF NOT EXISTS idx_item_type ON item(item_type);
 
 -- 주석
-COMMENT ON TABLE item IS 'RuleEngine에서 관리하는 아이템 정의 테이블';
+COMMENT ON TABLE item IS 'RuleEngine에서 관리하는 아이템 정의 테이블 (Session 0에 시나리오당 1회 저장, 세션 간 공유)';
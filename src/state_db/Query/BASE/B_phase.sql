@@ -3,10 +3,25 @@
 -- Phase 관리 및 규칙 정의 구조 (Base)
 -- ====================================================================
 
--- 1. Phase 이력 추적 테이블
+-- 0. 기존 단일 힙 테이블 -> 파티션 테이블 전환 준비 (B_turn.sql과 동일)
+DO $$
+BEGIN
+    IF EXISTS (
+        SELECT 1 FROM pg_class
+        WHERE oid = to_regclass('phase') AND relkind = 'r'
+    ) THEN
+        ALTER TABLE phase RENAME TO phase_unpartitioned;
+        ALTER TABLE phase_unpartitioned DROP CONSTRAINT IF EXISTS phase_pkey;
+        DROP INDEX IF EXISTS idx_phase_session_id;
+        DROP INDEX IF EXISTS idx_phase_transitioned_at;
+        DROP INDEX IF EXISTS idx_phase_new_phase;
+    END IF;
+END $$;
+
+-- 1. Phase 이력 추적 테이블 (transitioned_at 월 단위 RANGE 파티션)
 CREATE TABLE IF NOT EXISTS phase (
     -- history_id에서 phase_id로 변경
-    phase_id UUID PRIMARY KEY DEFAULT gen_random_uuid(),
+    phase_id UUID NOT NULL DEFAULT gen_random_uuid(),
     session_id UUID NOT NULL,
 
     previous_phase phase_type,
@@ -16,14 +31,36 @@ CREATE TABLE IF NOT EXISTS phase (
 
     transitioned_at TIMESTAMP NOT NULL DEFAULT NOW(),
 
+    PRIMARY KEY (phase_id, transitioned_at),
+
     CONSTRAINT fk_phase_session FOREIGN KEY (session_id)
         REFERENCES session(session_id) ON DELETE CASCADE,
     CONSTRAINT check_phase_change CHECK (previous_phase IS DISTINCT FROM new_phase)
-);
+) PARTITION BY RANGE (transitioned_at);
+
+CREATE TABLE IF NOT EXISTS phase_default PARTITION OF phase DEFAULT;
 
 CREATE INDEX IF NOT EXISTS idx_phase_session_id ON phase(session_id);
 CREATE INDEX IF NOT EXISTS idx_phase_transitioned_at ON phase(transitioned_at DESC);
 CREATE INDEX IF NOT EXISTS idx_phase_new_phase ON phase(new_phase);
+-- 세션 이력 keyset 페이지네이션 (transitioned_at, phase_id) 순서
+CREATE INDEX IF NOT EXISTS idx_phase_session_keyset ON phase(session_id, transitioned_at, phase_id);
+
+-- 기존 데이터 이관 (기본 파티션으로 적재 후 월별 파티션 생성 시 재배치)
+DO $$
+BEGIN
+    IF to_regclass('phase_unpartitioned') IS NOT NULL THEN
+        INSERT INTO phase (
+            phase_id, session_id, previous_phase, new_phase,
+            turn_at_transition, transition_reason, transitioned_at
+        )
+        SELECT
+            phase_id, session_id, previous_phase, new_phase,
+            turn_at_transition, transition_reason, transitioned_at
+        FROM phase_unpartitioned;
+        DROP TABLE phase_unpartitioned;
+    END IF;
+END $$;
 
 -- 2. Phase 규칙 참조 테이블
 CREATE TABLE IF NOT EXISTS phase_rules (
@@ -43,4 +80,4 @@ VALUES
     ('rest', '회복 및 정비 단계', ARRAY['recovery', 'time_pass'], ARRAY['rest', 'heal', 'prepare'])
 ON CONFLICT (phase) DO NOTHING;
 
-COMMENT ON TABLE phase IS 'Phase 전환 이력 추적 (디버깅 및 리플레이용)';
+COMMENT ON TABLE phase IS 'Phase 전환 이력 추적 (디버깅 및 리플레이용, transitioned_at 월 단위 파티션)';
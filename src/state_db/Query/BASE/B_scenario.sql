@@ -25,7 +25,9 @@ CREATE INDEX IF NOT EXISTS idx_scenario_is_published ON scenario(is_published);
 CREATE INDEX IF NOT EXISTS idx_scenario_is_active ON scenario(is_active);
 CREATE INDEX IF NOT EXISTS idx_scenario_difficulty ON scenario(difficulty);
 CREATE INDEX IF NOT EXISTS idx_scenario_genre ON scenario(genre);
-CREATE INDEX IF NOT EXISTS idx_scenario_created_at ON scenario(created_at DESC);
+-- 시나리오 목록 keyset 페이지네이션 (created_at, scenario_id) 순서
+DROP INDEX IF EXISTS idx_scenario_created_at;
+CREATE INDEX IF NOT EXISTS idx_scenario_created_at_id ON scenario(created_at DESC, scenario_id DESC);
 
 CREATE OR REPLACE FUNCTION update_scenario_updated_at()
 RETURNS TRIGGER AS $$
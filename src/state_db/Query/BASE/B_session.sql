@@ -70,7 +70,9 @@ CREATE TABLE IF NOT EXISTS session (
 -- 인덱스 생성
 CREATE INDEX IF NOT EXISTS idx_session_scenario_id ON session(scenario_id);
 CREATE INDEX IF NOT EXISTS idx_session_status ON session(status);
-CREATE INDEX IF NOT EXISTS idx_session_started_at ON session(started_at DESC);
+-- 세션 목록 keyset 페이지네이션 (started_at, session_id) 순서
+DROP INDEX IF EXISTS idx_session_started_at;
+CREATE INDEX IF NOT EXISTS idx_session_started_at_id ON session(started_at DESC, session_id DESC);
 
 
 -- ====================================================================
@@ -92,6 +94,17 @@ CREATE TRIGGER trigger_update_session_timestamp
     FOR EACH ROW
     EXECUTE FUNCTION update_session_timestamp();
 
+-- ====================================================================
+-- 3-1. 대량 복제 모드 판별 함수
+-- ====================================================================
+
+-- create_sessions_bulk(L_session_bulk.sql)가 트랜잭션 범위로 켜며,
+-- 세션 INSERT 초기화 트리거들은 WHEN 절에서 이 값을 확인해 행 단위 복제를 건너뜁니다.
+CREATE OR REPLACE FUNCTION is_bulk_clone()
+RETURNS BOOLEAN AS $$
+    SELECT COALESCE(current_setting('state_db.bulk_clone', true), '') = 'on';
+$$ LANGUAGE sql STABLE;
+
 -- ====================================================================
 -- [핵심 추가] 시스템 마스터 세션 (Session 0) 생성
 -- ====================================================================
@@ -0,0 +1,40 @@
+-- ====================================================================
+-- B_session_archive.sql
+-- 종료 세션 아카이브 구조 (Base)
+-- ====================================================================
+
+-- 1. 종료된 세션 1건 = 아카이브 1행
+-- payload에는 세션의 player / player_inventory / player_npc_relations / npc / enemy /
+-- phase / turn / 체크포인트 / 그래프(Vertex, RELATION) 행을 JSONB로 묶어 저장하고
+-- 원본 행은 삭제합니다 (L_session_archive.sql). session 행과 이력 요약 테이블은 유지됩니다.
+CREATE TABLE IF NOT EXISTS session_archive (
+    session_id UUID PRIMARY KEY,
+    scenario_id UUID NOT NULL,
+    ended_at TIMESTAMP,
+
+    payload JSONB NOT NULL,
+    archived_rows INTEGER NOT NULL DEFAULT 0,
+
+    archived_at TIMESTAMP NOT NULL DEFAULT NOW(),
+
+    CONSTRAINT fk_session_archive_session FOREIGN KEY (session_id)
+        REFERENCES session(session_id) ON DELETE CASCADE
+);
+
+-- 2. payload는 TOAST 압축 대상이며, 서버가 지원하면 lz4로 압축합니다 (기본 pglz)
+DO $$
+BEGIN
+    ALTER TABLE session_archive ALTER COLUMN payload SET COMPRESSION lz4;
+EXCEPTION WHEN OTHERS THEN
+    RAISE NOTICE '[Archive] lz4 compression unavailable, using default: %', SQLERRM;
+END $$;
+
+-- 3. 아카이브 적재 중 여부 (트랜잭션 범위 GUC)
+-- 원본 행 삭제가 이력 요약(L_history_stats.sql)에서 차감되지 않도록 합니다.
+CREATE OR REPLACE FUNCTION is_session_archiving()
+RETURNS BOOLEAN AS $$
+    SELECT COALESCE(current_setting('state_db.session_archiving', true), '') = 'on';
+$$ LANGUAGE sql STABLE;
+
+COMMENT ON TABLE session_archive IS '종료 세션 아카이브 (세션 상태/이력/그래프 JSONB 1행)';
+COMMENT ON COLUMN session_archive.archived_rows IS '아카이브 후 삭제된 원본 행 수 (그래프 포함)';
@@ -0,0 +1,20 @@
+-- ====================================================================
+-- B_session_checkpoint.sql
+-- 세션 상태 체크포인트 구조 (Base)
+-- ====================================================================
+
+-- 특정 turn 종료 시점의 세션 전체 상태 (capture_session_state 결과)
+-- 리플레이는 조회 turn 이하의 가장 가까운 체크포인트에서 시작해
+-- 이후 turn의 state_changes만 순서대로 적용합니다 (L_session_checkpoint.sql).
+CREATE TABLE IF NOT EXISTS session_checkpoint (
+    session_id UUID NOT NULL,
+    turn_number INTEGER NOT NULL,
+    state JSONB NOT NULL,
+    created_at TIMESTAMP NOT NULL DEFAULT NOW(),
+
+    PRIMARY KEY (session_id, turn_number),
+    CONSTRAINT fk_session_checkpoint_session FOREIGN KEY (session_id)
+        REFERENCES session(session_id) ON DELETE CASCADE
+);
+
+COMMENT ON TABLE session_checkpoint IS '세션 상태 체크포인트 (0번 turn 및 K turn마다 기록)';
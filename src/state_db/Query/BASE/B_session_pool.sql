@@ -0,0 +1,20 @@
+-- ====================================================================
+-- B_session_pool.sql
+-- 사전 복제(Pre-provisioned) 세션 풀 구조 (Base)
+-- ====================================================================
+
+-- 시나리오별로 트리거 캐스케이드(Player/NPC/Enemy/Item/Graph 복제)가 끝난
+-- 미할당 세션 목록. 세션 시작 시 한 건을 claim 하여 풀에서 제거합니다.
+CREATE TABLE IF NOT EXISTS session_pool (
+    session_id UUID PRIMARY KEY,
+    scenario_id UUID NOT NULL,
+    provisioned_at TIMESTAMP NOT NULL DEFAULT NOW(),
+
+    CONSTRAINT fk_session_pool_session FOREIGN KEY (session_id)
+        REFERENCES session(session_id) ON DELETE CASCADE
+);
+
+CREATE INDEX IF NOT EXISTS idx_session_pool_scenario
+    ON session_pool(scenario_id, provisioned_at);
+
+COMMENT ON TABLE session_pool IS '사전 복제된 미할당 세션 풀 (시나리오별)';
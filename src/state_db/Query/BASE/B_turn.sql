@@ -3,9 +3,28 @@
 -- Turn 관리 및 상태 변화 이력 추적 구조 (Base)
 -- ====================================================================
 
+-- 0. 기존 단일 힙 테이블 -> 파티션 테이블 전환 준비
+-- 기존 테이블은 turn_unpartitioned로 이름을 바꾸고 이름이 겹치는 PK/인덱스를 제거합니다.
+-- (데이터 이관은 아래 3단계에서 수행)
+DO $$
+BEGIN
+    IF EXISTS (
+        SELECT 1 FROM pg_class
+        WHERE oid = to_regclass('turn') AND relkind = 'r'
+    ) THEN
+        ALTER TABLE turn RENAME TO turn_unpartitioned;
+        ALTER TABLE turn_unpartitioned DROP CONSTRAINT IF EXISTS turn_pkey;
+        DROP INDEX IF EXISTS idx_turn_session_id;
+        DROP INDEX IF EXISTS idx_turn_session_number;
+    END IF;
+END $$;
+
+-- 1. created_at 월 단위 RANGE 파티션 테이블
+-- 월별 파티션(turn_pYYYYMM)은 L_history_partition.sql의 maintain_history_partitions()가
+-- 스키마 초기화 시 생성하며, 범위 밖 행은 기본 파티션(turn_default)이 받습니다.
 CREATE TABLE IF NOT EXISTS turn (
     -- history_id 대신 turn_id 사용
-    turn_id UUID PRIMARY KEY DEFAULT gen_random_uuid(),
+    turn_id UUID NOT NULL DEFAULT gen_random_uuid(),
     session_id UUID NOT NULL,
 
     -- 상태 변화 시퀀스 (1회 변화 = 1턴)
@@ -17,15 +36,36 @@ CREATE TABLE IF NOT EXISTS turn (
 
     created_at TIMESTAMP NOT NULL DEFAULT NOW(),
 
+    -- 파티션 키(created_at)는 PK에 포함되어야 함
+    PRIMARY KEY (turn_id, created_at),
+
     CONSTRAINT fk_turn_session FOREIGN KEY (session_id)
         REFERENCES session(session_id) ON DELETE CASCADE
-);
+) PARTITION BY RANGE (created_at);
 
--- 인덱스: 세션별/턴번호별 빠른 조회를 위함
+CREATE TABLE IF NOT EXISTS turn_default PARTITION OF turn DEFAULT;
+
+-- 인덱스: 세션별/턴번호별 빠른 조회를 위함 (모든 파티션에 전파)
 CREATE INDEX IF NOT EXISTS idx_turn_session_id ON turn(session_id);
 CREATE INDEX IF NOT EXISTS idx_turn_session_number ON turn(session_id, turn_number);
 
+-- 2. 기존 데이터 이관 (기본 파티션으로 적재 후 월별 파티션 생성 시 재배치)
+DO $$
+BEGIN
+    IF to_regclass('turn_unpartitioned') IS NOT NULL THEN
+        INSERT INTO turn (
+            turn_id, session_id, turn_number, phase_at_turn,
+            turn_type, state_changes, related_entities, created_at
+        )
+        SELECT
+            turn_id, session_id, turn_number, phase_at_turn,
+            turn_type, state_changes, related_entities, created_at
+        FROM turn_unpartitioned;
+        DROP TABLE turn_unpartitioned;
+    END IF;
+END $$;
+
 -- 주석
-COMMENT ON TABLE turn IS '상태 변화 발생 시마다 기록되는 턴 이력 테이블';
+COMMENT ON TABLE turn IS '상태 변화 발생 시마다 기록되는 턴 이력 테이블 (created_at 월 단위 파티션)';
 COMMENT ON COLUMN turn.turn_id IS '턴 레코드 고유 ID';
 COMMENT ON COLUMN turn.turn_number IS '상태 변화에 따른 순차적 턴 번호';
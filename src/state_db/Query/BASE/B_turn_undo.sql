@@ -0,0 +1,30 @@
+-- ====================================================================
+-- B_turn_undo.sql
+-- Turn 되돌리기용 변경 전 이미지(before-image) 기록 구조 (Base)
+-- ====================================================================
+
+-- 세션 상태 테이블(session / player / npc / enemy / player_inventory / player_npc_relations)의
+-- 행 변경마다 변경 전 값을 기록합니다 (L_turn_undo.sql 트리거).
+-- after_turn은 변경 시점의 session.current_turn이며, N번 turn으로 되돌리면
+-- after_turn >= N 인 기록만 역순으로 적용하므로 되돌리는 turn 수에 비례해 처리됩니다.
+CREATE TABLE IF NOT EXISTS turn_undo_log (
+    undo_id BIGSERIAL PRIMARY KEY,
+    session_id UUID NOT NULL,
+    after_turn INTEGER NOT NULL,
+
+    table_name TEXT NOT NULL,
+    operation TEXT NOT NULL CHECK (operation IN ('INSERT', 'UPDATE', 'DELETE')),
+    row_key JSONB NOT NULL,   -- 대상 행 PK (예: {"player_id": ..., "item_id": ...})
+    before_image JSONB,       -- 변경 전 행 (INSERT는 NULL)
+
+    created_at TIMESTAMP NOT NULL DEFAULT NOW(),
+
+    CONSTRAINT fk_turn_undo_log_session FOREIGN KEY (session_id)
+        REFERENCES session(session_id) ON DELETE CASCADE
+);
+
+CREATE INDEX IF NOT EXISTS idx_turn_undo_log_session_turn
+    ON turn_undo_log(session_id, after_turn, undo_id);
+
+COMMENT ON TABLE turn_undo_log IS 'Turn 되돌리기용 세션 상태 변경 전 이미지 (세션 종료 시 삭제)';
+COMMENT ON COLUMN turn_undo_log.after_turn IS '변경 시점의 session.current_turn (이 turn 이후의 변경)';
@@ -55,5 +55,6 @@ CREATE TRIGGER trigger_08_initialize_enemies
     AFTER INSERT ON session
     FOR EACH ROW
     -- 시스템 세션(Session 0) 자체 생성 시에는 복제를 수행하지 않음
-    WHEN (NEW.session_id <> '00000000-0000-0000-0000-000000000000')
+    WHEN (NEW.session_id <> '00000000-0000-0000-0000-000000000000' AND NOT is_bulk_clone()
+          AND NOT NEW.entity_overlay)
     EXECUTE FUNCTION initialize_enemies();
@@ -0,0 +1,263 @@
+-- ====================================================================
+-- L_entity_overlay.sql
+-- NPC/Enemy Copy-on-Write 오버레이 조회/복제 로직 (Logic)
+-- ====================================================================
+
+-- 1. 세션 NPC 조회 (세션 행 + 오버레이 세션의 미변경 마스터 행 병합)
+-- 반환 행의 npc_id는 공개 ID(마스터 기반이면 마스터 ID), session_id는 요청 세션입니다.
+-- (jsonb_populate_record로 컬럼 순서에 의존하지 않고 해당 컬럼만 치환)
+CREATE OR REPLACE FUNCTION session_npcs(p_session_id UUID)
+RETURNS SETOF npc AS $$
+    SELECT n.*
+    FROM npc n
+    WHERE n.session_id = p_session_id
+      AND n.source_npc_id IS NULL
+      AND n.removed_at IS NULL
+    UNION ALL
+    SELECT r.*
+    FROM npc n
+    CROSS JOIN LATERAL jsonb_populate_record(n, jsonb_build_object('npc_id', n.source_npc_id)) r
+    WHERE n.session_id = p_session_id
+      AND n.source_npc_id IS NOT NULL
+      AND n.removed_at IS NULL
+    UNION ALL
+    SELECT r.*
+    FROM session s
+    JOIN npc m
+      ON m.session_id = '00000000-0000-0000-0000-000000000000'
+     AND m.scenario_id = s.scenario_id
+    CROSS JOIN LATERAL jsonb_populate_record(m, jsonb_build_object('session_id', s.session_id)) r
+    WHERE s.session_id = p_session_id
+      AND s.entity_overlay
+      AND NOT EXISTS (
+          SELECT 1 FROM npc o
+          WHERE o.session_id = s.session_id AND o.source_npc_id = m.npc_id
+      );
+$$ LANGUAGE sql STABLE;
+
+-- 2. 세션 Enemy 조회 (session_npcs와 동일한 병합 규칙)
+CREATE OR REPLACE FUNCTION session_enemies(p_session_id UUID)
+RETURNS SETOF enemy AS $$
+    SELECT e.*
+    FROM enemy e
+    WHERE e.session_id = p_session_id
+      AND e.source_enemy_id IS NULL
+      AND e.removed_at IS NULL
+    UNION ALL
+    SELECT r.*
+    FROM enemy e
+    CROSS JOIN LATERAL jsonb_populate_record(e, jsonb_build_object('enemy_id', e.source_enemy_id)) r
+    WHERE e.session_id = p_session_id
+      AND e.source_enemy_id IS NOT NULL
+      AND e.removed_at IS NULL
+    UNION ALL
+    SELECT r.*
+    FROM session s
+    JOIN enemy m
+      ON m.session_id = '00000000-0000-0000-0000-000000000000'
+     AND m.scenario_id = s.scenario_id
+    CROSS JOIN LATERAL jsonb_populate_record(m, jsonb_build_object('session_id', s.session_id)) r
+    WHERE s.session_id = p_session_id
+      AND s.entity_overlay
+      AND NOT EXISTS (
+          SELECT 1 FROM enemy o
+          WHERE o.session_id = s.session_id AND o.source_enemy_id = m.enemy_id
+      );
+$$ LANGUAGE sql STABLE;
+
+-- 3. 최초 변경 시 세션 행 생성 (materialize)
+-- 공개 ID(p_npc_id)에 해당하는 세션 행의 실제 npc_id를 반환합니다.
+-- 세션 행이 없고 오버레이 세션의 마스터 행이면 복제 후 반환, 그 외에는 NULL.
+CREATE OR REPLACE FUNCTION materialize_npc(p_session_id UUID, p_npc_id UUID)
+RETURNS UUID AS $$
+DECLARE
+    v_npc_id UUID;
+BEGIN
+    SELECT npc_id INTO v_npc_id
+    FROM npc
+    WHERE session_id = p_session_id
+      AND (npc_id = p_npc_id OR source_npc_id = p_npc_id);
+    IF FOUND THEN
+        RETURN v_npc_id;
+    END IF;
+
+    INSERT INTO npc (
+        entity_type, name, description, session_id, scenario_id,
+        scenario_npc_id, tags, state, relations, source_npc_id
+    )
+    SELECT m.entity_type, m.name, m.description, s.session_id, m.scenario_id,
+           m.scenario_npc_id, m.tags, m.state, m.relations, m.npc_id
+    FROM session s
+    JOIN npc m
+      ON m.session_id = '00000000-0000-0000-0000-000000000000'
+     AND m.scenario_id = s.scenario_id
+     AND m.npc_id = p_npc_id
+    WHERE s.session_id = p_session_id
+      AND s.entity_overlay
+    ON CONFLICT (session_id, source_npc_id) WHERE source_npc_id IS NOT NULL
+        DO NOTHING
+    RETURNING npc_id INTO v_npc_id;
+
+    IF v_npc_id IS NULL THEN
+        -- 동시 요청이 먼저 복제한 경우
+        SELECT npc_id INTO v_npc_id
+        FROM npc
+        WHERE session_id = p_session_id AND source_npc_id = p_npc_id;
+    END IF;
+
+    RETURN v_npc_id;
+END;
+$$ LANGUAGE plpgsql;
+
+CREATE OR REPLACE FUNCTION materialize_enemy(p_session_id UUID, p_enemy_id UUID)
+RETURNS UUID AS $$
+DECLARE
+    v_enemy_id UUID;
+BEGIN
+    SELECT enemy_id INTO v_enemy_id
+    FROM enemy
+    WHERE session_id = p_session_id
+      AND (enemy_id = p_enemy_id OR source_enemy_id = p_enemy_id);
+    IF FOUND THEN
+        RETURN v_enemy_id;
+    END IF;
+
+    INSERT INTO enemy (
+        entity_type, name, description, session_id, scenario_id,
+        scenario_enemy_id, tags, state, relations, dropped_items, source_enemy_id
+    )
+    SELECT m.entity_type, m.name, m.description, s.session_id, m.scenario_id,
+           m.scenario_enemy_id, m.tags, m.state, m.relations, m.dropped_items,
+           m.enemy_id
+    FROM session s
+    JOIN enemy m
+      ON m.session_id = '00000000-0000-0000-0000-000000000000'
+     AND m.scenario_id = s.scenario_id
+     AND m.enemy_id = p_enemy_id
+    WHERE s.session_id = p_session_id
+      AND s.entity_overlay
+    ON CONFLICT (session_id, source_enemy_id) WHERE source_enemy_id IS NOT NULL
+        DO NOTHING
+    RETURNING enemy_id INTO v_enemy_id;
+
+    IF v_enemy_id IS NULL THEN
+        SELECT enemy_id INTO v_enemy_id
+        FROM enemy
+        WHERE session_id = p_session_id AND source_enemy_id = p_enemy_id;
+    END IF;
+
+    RETURN v_enemy_id;
+END;
+$$ LANGUAGE plpgsql;
+
+-- 4. 세션 엔티티 제거
+-- 세션 고유 행은 삭제, 마스터 기반 행은 제거 표시(tombstone)하여 오버레이에서 숨깁니다.
+CREATE OR REPLACE FUNCTION remove_session_npc(p_session_id UUID, p_npc_id UUID)
+RETURNS BOOLEAN AS $$
+DECLARE
+    v_npc_id UUID := materialize_npc(p_session_id, p_npc_id);
+BEGIN
+    IF v_npc_id IS NULL THEN
+        RETURN false;
+    END IF;
+
+    DELETE FROM npc WHERE npc_id = v_npc_id AND source_npc_id IS NULL;
+    IF NOT FOUND THEN
+        UPDATE npc SET removed_at = NOW() WHERE npc_id = v_npc_id;
+    END IF;
+    RETURN true;
+END;
+$$ LANGUAGE plpgsql;
+
+CREATE OR REPLACE FUNCTION remove_session_enemy(p_session_id UUID, p_enemy_id UUID)
+RETURNS BOOLEAN AS $$
+DECLARE
+    v_enemy_id UUID := materialize_enemy(p_session_id, p_enemy_id);
+BEGIN
+    IF v_enemy_id IS NULL THEN
+        RETURN false;
+    END IF;
+
+    DELETE FROM enemy WHERE enemy_id = v_enemy_id AND source_enemy_id IS NULL;
+    IF NOT FOUND THEN
+        UPDATE enemy SET removed_at = NOW() WHERE enemy_id = v_enemy_id;
+    END IF;
+    RETURN true;
+END;
+$$ LANGUAGE plpgsql;
+
+-- 5. 마스터 행 변경/삭제 전 오버레이 세션에 현재 값 고정 (증분 재주입)
+-- 아직 세션 행이 없는 오버레이 세션마다 마스터 행을 복제하여 이후 마스터 변경이
+-- 진행 중인 세션에 반영되지 않도록 합니다. 마스터 행이 삭제된 뒤에도 세션 행의
+-- source_*_id는 공개 ID로 유지됩니다. 풀 미할당 세션(새 마스터 값 사용)과
+-- 아카이브된 세션은 제외합니다.
+-- 게임 진행에 따른 변경이 아니므로 되돌리기 기록 대상에서 제외합니다 (is_bulk_clone).
+-- 반환: 복제한 세션 행 수
+CREATE OR REPLACE FUNCTION freeze_master_npcs(p_npc_ids UUID[])
+RETURNS INTEGER AS $$
+DECLARE
+    v_frozen INTEGER;
+BEGIN
+    PERFORM set_config('state_db.bulk_clone', 'on', true);
+
+    INSERT INTO npc (
+        entity_type, name, description, session_id, scenario_id,
+        scenario_npc_id, tags, state, relations, source_npc_id
+    )
+    SELECT m.entity_type, m.name, m.description, s.session_id, m.scenario_id,
+           m.scenario_npc_id, m.tags, m.state, m.relations, m.npc_id
+    FROM npc m
+    JOIN session s
+      ON s.scenario_id = m.scenario_id
+     AND s.entity_overlay
+    WHERE m.npc_id = ANY(p_npc_ids)
+      AND m.session_id = '00000000-0000-0000-0000-000000000000'
+      AND NOT EXISTS (SELECT 1 FROM session_pool sp WHERE sp.session_id = s.session_id)
+      AND NOT EXISTS (SELECT 1 FROM session_archive a WHERE a.session_id = s.session_id)
+      AND NOT EXISTS (
+          SELECT 1 FROM npc o
+          WHERE o.session_id = s.session_id AND o.source_npc_id = m.npc_id
+      )
+    ON CONFLICT (session_id, source_npc_id) WHERE source_npc_id IS NOT NULL
+        DO NOTHING;
+    GET DIAGNOSTICS v_frozen = ROW_COUNT;
+
+    PERFORM set_config('state_db.bulk_clone', 'off', true);
+    RETURN v_frozen;
+END;
+$$ LANGUAGE plpgsql;
+
+CREATE OR REPLACE FUNCTION freeze_master_enemies(p_enemy_ids UUID[])
+RETURNS INTEGER AS $$
+DECLARE
+    v_frozen INTEGER;
+BEGIN
+    PERFORM set_config('state_db.bulk_clone', 'on', true);
+
+    INSERT INTO enemy (
+        entity_type, name, description, session_id, scenario_id,
+        scenario_enemy_id, tags, state, relations, dropped_items, source_enemy_id
+    )
+    SELECT m.entity_type, m.name, m.description, s.session_id, m.scenario_id,
+           m.scenario_enemy_id, m.tags, m.state, m.relations, m.dropped_items,
+           m.enemy_id
+    FROM enemy m
+    JOIN session s
+      ON s.scenario_id = m.scenario_id
+     AND s.entity_overlay
+    WHERE m.enemy_id = ANY(p_enemy_ids)
+      AND m.session_id = '00000000-0000-0000-0000-000000000000'
+      AND NOT EXISTS (SELECT 1 FROM session_pool sp WHERE sp.session_id = s.session_id)
+      AND NOT EXISTS (SELECT 1 FROM session_archive a WHERE a.session_id = s.session_id)
+      AND NOT EXISTS (
+          SELECT 1 FROM enemy o
+          WHERE o.session_id = s.session_id AND o.source_enemy_id = m.enemy_id
+      )
+    ON CONFLICT (session_id, source_enemy_id) WHERE source_enemy_id IS NOT NULL
+        DO NOTHING;
+    GET DIAGNOSTICS v_frozen = ROW_COUNT;
+
+    PERFORM set_config('state_db.bulk_clone', 'off', true);
+    RETURN v_frozen;
+END;
+$$ LANGUAGE plpgsql;
@@ -3,48 +3,76 @@
 -- Apache AGE 그래프 데이터(Vertex, Edge) 복제 로직
 -- ====================================================================
 
-CREATE OR REPLACE FUNCTION initialize_graph_data()
-RETURNS TRIGGER AS $func$
+-- 1. 시나리오 마스터 그래프를 세션 목록으로 복제 (단건 트리거/일괄 생성 공용)
+-- 모든 MATCH를 라벨로 한정하고 session_id/scenario_id를 속성 패턴으로 지정하여
+-- B_graph_index.sql의 인덱스로 탐색합니다. (기존 세션 수와 무관하게 마스터 그래프 크기에 비례)
+CREATE OR REPLACE FUNCTION clone_graph_for_sessions(
+    p_scenario_id UUID,
+    p_session_ids UUID[]
+)
+RETURNS VOID AS $func$
 DECLARE
     MASTER_SESSION_ID CONSTANT UUID := '00000000-0000-0000-0000-000000000000';
+    v_cypher_ids TEXT;
+    v_from RECORD;
+    v_to RECORD;
+BEGIN
+    IF p_session_ids IS NULL OR cardinality(p_session_ids) = 0 THEN
+        RETURN;
+    END IF;
+
+    SELECT '[' || string_agg(quote_literal(id::text), ', ') || ']'
+    INTO v_cypher_ids
+    FROM unnest(p_session_ids) AS id;
+
+    -- 1-1. Vertex 복제 (NPC, Enemy)
+    FOR v_from IN
+        SELECT * FROM (VALUES ('npc'), ('enemy')) AS t(label)
+    LOOP
+        EXECUTE format($fmt$
+            SELECT * FROM ag_catalog.cypher('state_db'::name, $$
+                MATCH (v:%1$s {session_id: %2$L, scenario_id: %3$L})
+                UNWIND %4$s AS sid
+                CREATE (v2:%1$s)
+                SET v2 = properties(v)
+                SET v2.session_id = sid
+            $$) AS (result agtype);
+        $fmt$, v_from.label, MASTER_SESSION_ID::text, p_scenario_id::text, v_cypher_ids);
+    END LOOP;
+
+    -- 1-2. Edge 복제 (RELATION): 시작/끝 라벨 조합별로 실행
+    -- 새 Vertex는 라벨 + session_id + scenario_*_id 인덱스로 직접 조회합니다.
+    FOR v_from IN
+        SELECT * FROM (VALUES ('npc', 'scenario_npc_id'), ('enemy', 'scenario_enemy_id')) AS t(label, key)
+    LOOP
+        FOR v_to IN
+            SELECT * FROM (VALUES ('npc', 'scenario_npc_id'), ('enemy', 'scenario_enemy_id')) AS t(label, key)
+        LOOP
+            EXECUTE format($fmt$
+                SELECT * FROM ag_catalog.cypher('state_db'::name, $$
+                    MATCH (v1:%1$s {session_id: %5$L, scenario_id: %6$L})
+                          -[r:RELATION {session_id: %5$L}]->
+                          (v2:%3$s {session_id: %5$L, scenario_id: %6$L})
+                    UNWIND %7$s AS sid
+                    MATCH (nv1:%1$s), (nv2:%3$s)
+                    WHERE nv1.session_id = sid AND nv1.%2$s = v1.%2$s
+                      AND nv2.session_id = sid AND nv2.%4$s = v2.%4$s
+                    CREATE (nv1)-[nr:RELATION]->(nv2)
+                    SET nr = properties(r)
+                    SET nr.session_id = sid
+                $$) AS (result agtype);
+            $fmt$, v_from.label, v_from.key, v_to.label, v_to.key,
+               MASTER_SESSION_ID::text, p_scenario_id::text, v_cypher_ids);
+        END LOOP;
+    END LOOP;
+END;
+$func$ LANGUAGE plpgsql;
+
+-- 2. 세션 생성 트리거: 단일 세션 그래프 복제
+CREATE OR REPLACE FUNCTION initialize_graph_data()
+RETURNS TRIGGER AS $func$
 BEGIN
-    -- 1. Vertex 복제 (NPC)
-    EXECUTE format($fmt$
-        SELECT * FROM ag_catalog.cypher('state_db'::name, $$
-            MATCH (v:npc)
-            WHERE v.session_id = %L AND v.scenario_id = %L
-            CREATE (v2:npc)
-            SET v2 = properties(v)
-            SET v2.session_id = %L
-        $$) AS (result agtype);
-    $fmt$, MASTER_SESSION_ID::text, NEW.scenario_id::text, NEW.session_id::text);
-
-    -- 2. Vertex 복제 (Enemy)
-    EXECUTE format($fmt$
-        SELECT * FROM ag_catalog.cypher('state_db'::name, $$
-            MATCH (v:enemy)
-            WHERE v.session_id = %L AND v.scenario_id = %L
-            CREATE (v2:enemy)
-            SET v2 = properties(v)
-            SET v2.session_id = %L
-        $$) AS (result agtype);
-    $fmt$, MASTER_SESSION_ID::text, NEW.scenario_id::text, NEW.session_id::text);
-
-    -- 3. Edge 복제 (RELATION)
-    EXECUTE format($fmt$
-        SELECT * FROM ag_catalog.cypher('state_db'::name, $$
-            MATCH (v1)-[r:RELATION]->(v2)
-            WHERE r.session_id = %L
-            MATCH (nv1), (nv2)
-            WHERE nv1.session_id = %L
-              AND (nv1.scenario_npc_id = v1.scenario_npc_id OR nv1.scenario_enemy_id = v1.scenario_enemy_id)
-              AND nv2.session_id = %L
-              AND (nv2.scenario_npc_id = v2.scenario_npc_id OR nv2.scenario_enemy_id = v2.scenario_enemy_id)
-            CREATE (nv1)-[nr:RELATION]->(nv2)
-            SET nr = properties(r)
-            SET nr.session_id = %L
-        $$) AS (result agtype);
-    $fmt$, MASTER_SESSION_ID::text, NEW.session_id::text, NEW.session_id::text, NEW.session_id::text);
+    PERFORM clone_graph_for_sessions(NEW.scenario_id, ARRAY[NEW.session_id]);
 
     RAISE NOTICE '[Graph] Initialized graph nodes and edges for session %', NEW.session_id;
 
@@ -57,5 +85,5 @@ DROP TRIGGER IF EXISTS trigger_09_initialize_graph ON session;
 CREATE TRIGGER trigger_09_initialize_graph
     AFTER INSERT ON session
     FOR EACH ROW
-    WHEN (NEW.session_id <> '00000000-0000-0000-0000-000000000000')
+    WHEN (NEW.session_id <> '00000000-0000-0000-0000-000000000000' AND NOT is_bulk_clone())
     EXECUTE FUNCTION initialize_graph_data();
@@ -0,0 +1,180 @@
+-- ====================================================================
+-- L_history_partition.sql
+-- turn / phase 이력 테이블 월 단위 파티션 관리 및 보존 정책 (Logic)
+-- ====================================================================
+
+-- 1. 세션 이력 시간 범위 (TRACE 쿼리 파티션 pruning용)
+-- STABLE 함수이므로 실행 시작 시점에 평가되어 범위 밖 파티션은 스캔 대상에서 제외됩니다.
+-- 예) WHERE t.session_id = $1
+--       AND t.created_at BETWEEN session_history_start($1) AND session_history_end($1)
+CREATE OR REPLACE FUNCTION session_history_start(p_session_id UUID)
+RETURNS TIMESTAMP AS $$
+    SELECT COALESCE(
+        (SELECT started_at FROM session WHERE session_id = p_session_id),
+        '-infinity'::timestamp
+    );
+$$ LANGUAGE sql STABLE;
+
+CREATE OR REPLACE FUNCTION session_history_end(p_session_id UUID)
+RETURNS TIMESTAMP AS $$
+    SELECT COALESCE(
+        (SELECT ended_at FROM session WHERE session_id = p_session_id),
+        'infinity'::timestamp
+    );
+$$ LANGUAGE sql STABLE;
+
+-- 2. 월별 파티션 생성 (p_table_pYYYYMM)
+-- 기본 파티션에 해당 월의 행이 있으면 임시 테이블로 옮긴 뒤 파티션을 만들고 다시 적재합니다.
+-- 반환값: 새로 만든 파티션 수
+CREATE OR REPLACE FUNCTION ensure_history_partitions(
+    p_table TEXT,
+    p_column TEXT,
+    p_from TIMESTAMP,
+    p_to TIMESTAMP
+)
+RETURNS INTEGER AS $$
+DECLARE
+    v_month TIMESTAMP := date_trunc('month', p_from);
+    v_next TIMESTAMP;
+    v_partition TEXT;
+    v_default TEXT := p_table || '_default';
+    v_has_rows BOOLEAN;
+    v_created INTEGER := 0;
+BEGIN
+    WHILE v_month <= p_to LOOP
+        v_next := v_month + INTERVAL '1 month';
+        v_partition := p_table || '_p' || to_char(v_month, 'YYYYMM');
+
+        IF to_regclass(v_partition) IS NULL THEN
+            EXECUTE format(
+                'SELECT EXISTS (SELECT 1 FROM %I WHERE %I >= $1 AND %I < $2)',
+                v_default, p_column, p_column
+            ) INTO v_has_rows USING v_month, v_next;
+
+            IF v_has_rows THEN
+                EXECUTE format(
+                    'CREATE TEMP TABLE history_partition_moving ON COMMIT DROP AS '
+                    'SELECT * FROM %I WHERE %I >= %L AND %I < %L',
+                    v_default, p_column, v_month, p_column, v_next
+                );
+                EXECUTE format(
+                    'DELETE FROM %I WHERE %I >= $1 AND %I < $2',
+                    v_default, p_column, p_column
+                ) USING v_month, v_next;
+            END IF;
+
+            EXECUTE format(
+                'CREATE TABLE %I PARTITION OF %I FOR VALUES FROM (%L) TO (%L)',
+                v_partition, p_table, v_month, v_next
+            );
+
+            -- 부모 테이블이 아닌 새 파티션에 직접 적재하여 이력 요약 트리거
+            -- (L_history_stats.sql, 부모 테이블 문장 트리거)가 재배치를 중복 집계하지 않게 합니다.
+            IF v_has_rows THEN
+                EXECUTE format(
+                    'INSERT INTO %I SELECT * FROM history_partition_moving', v_partition
+                );
+                DROP TABLE history_partition_moving;
+            END IF;
+
+            v_created := v_created + 1;
+        END IF;
+
+        v_month := v_next;
+    END LOOP;
+
+    RETURN v_created;
+END;
+$$ LANGUAGE plpgsql;
+
+-- 3. turn / phase 파티션 유지 (스키마 초기화 및 보존 작업 시 호출)
+-- 기본 파티션에 쌓인 가장 오래된 월부터 현재 월 + p_months_ahead 까지 파티션을 보장합니다.
+CREATE OR REPLACE FUNCTION maintain_history_partitions(p_months_ahead INTEGER DEFAULT 3)
+RETURNS INTEGER AS $$
+DECLARE
+    v_target RECORD;
+    v_oldest TIMESTAMP;
+    v_until TIMESTAMP := date_trunc('month', LOCALTIMESTAMP)
+        + make_interval(months => p_months_ahead);
+    v_created INTEGER := 0;
+BEGIN
+    FOR v_target IN
+        SELECT * FROM (VALUES ('turn', 'created_at'), ('phase', 'transitioned_at'))
+            AS t(table_name, column_name)
+    LOOP
+        EXECUTE format(
+            'SELECT MIN(%I) FROM %I', v_target.column_name, v_target.table_name || '_default'
+        ) INTO v_oldest;
+
+        v_created := v_created + ensure_history_partitions(
+            v_target.table_name,
+            v_target.column_name,
+            LEAST(COALESCE(v_oldest, LOCALTIMESTAMP), LOCALTIMESTAMP),
+            v_until
+        );
+    END LOOP;
+
+    RETURN v_created;
+END;
+$$ LANGUAGE plpgsql;
+
+-- 4. 보존 정책: 보존 기간이 지난 월별 파티션 분리(detach) 또는 삭제(drop)
+-- 파티션 안에 종료되지 않은 세션의 행이 하나라도 있으면 유지(kept)합니다.
+-- p_dry_run이면 실제 변경 없이 수행될 작업만 반환합니다.
+CREATE OR REPLACE FUNCTION apply_history_retention(
+    p_retention INTERVAL,
+    p_drop BOOLEAN DEFAULT false,
+    p_dry_run BOOLEAN DEFAULT false
+)
+RETURNS TABLE (partition_name TEXT, partition_end TIMESTAMP, action TEXT) AS $$
+DECLARE
+    v_partition RECORD;
+    v_active BOOLEAN;
+BEGIN
+    FOR v_partition IN
+        SELECT
+            parent.relname::text AS parent_name,
+            child.relname::text AS child_name,
+            to_date(right(child.relname, 6), 'YYYYMM')::timestamp
+                + INTERVAL '1 month' AS upper_bound
+        FROM pg_inherits i
+        JOIN pg_class parent ON parent.oid = i.inhparent
+        JOIN pg_class child ON child.oid = i.inhrelid
+        WHERE parent.relname IN ('turn', 'phase')
+          AND parent.relnamespace = to_regnamespace(current_schema())
+          AND child.relname ~ '_p[0-9]{6}$'
+        ORDER BY upper_bound, child_name
+    LOOP
+        CONTINUE WHEN v_partition.upper_bound > LOCALTIMESTAMP - p_retention;
+
+        partition_name := v_partition.child_name;
+        partition_end := v_partition.upper_bound;
+
+        EXECUTE format(
+            'SELECT EXISTS ('
+            '  SELECT 1 FROM %I h JOIN session s ON s.session_id = h.session_id'
+            '  WHERE s.status <> ''ended'')',
+            v_partition.child_name
+        ) INTO v_active;
+
+        IF v_active THEN
+            action := 'kept';
+        ELSIF p_dry_run THEN
+            action := CASE WHEN p_drop THEN 'would_drop' ELSE 'would_detach' END;
+        ELSE
+            EXECUTE format(
+                'ALTER TABLE %I DETACH PARTITION %I',
+                v_partition.parent_name, v_partition.child_name
+            );
+            IF p_drop THEN
+                EXECUTE format('DROP TABLE %I', v_partition.child_name);
+                action := 'dropped';
+            ELSE
+                action := 'detached';
+            END IF;
+        END IF;
+
+        RETURN NEXT;
+    END LOOP;
+END;
+$$ LANGUAGE plpgsql;
@@ -0,0 +1,263 @@
+-- ====================================================================
+-- L_history_stats.sql
+-- 세션별 turn / phase 이력 요약 증분 갱신 및 재구축 (Logic)
+-- ====================================================================
+
+-- record_state_change, initialize_turn, create_sessions_bulk 등 모든 기록 경로를
+-- 한 곳에서 처리하도록 turn / phase 테이블의 문장 단위(FOR EACH STATEMENT) 트리거로 갱신합니다.
+-- (일괄 INSERT도 세션별로 묶어 한 번씩만 upsert)
+
+-- 1. turn INSERT: 세션 / Phase / Turn Type별 turn 수 및 시각 누적
+CREATE OR REPLACE FUNCTION accumulate_turn_stats()
+RETURNS TRIGGER AS $$
+BEGIN
+    INSERT INTO session_history_stats AS s (
+        session_id, total_turns, first_turn_at, last_turn_at
+    )
+    SELECT session_id, COUNT(*), MIN(created_at), MAX(created_at)
+    FROM new_turns
+    GROUP BY session_id
+    ON CONFLICT (session_id) DO UPDATE
+    SET total_turns = s.total_turns + EXCLUDED.total_turns,
+        first_turn_at = LEAST(s.first_turn_at, EXCLUDED.first_turn_at),
+        last_turn_at = GREATEST(s.last_turn_at, EXCLUDED.last_turn_at),
+        updated_at = NOW();
+
+    INSERT INTO session_turn_phase_stats AS s (session_id, phase_at_turn, turn_count)
+    SELECT session_id, phase_at_turn, COUNT(*)
+    FROM new_turns
+    GROUP BY session_id, phase_at_turn
+    ON CONFLICT (session_id, phase_at_turn) DO UPDATE
+    SET turn_count = s.turn_count + EXCLUDED.turn_count;
+
+    INSERT INTO session_turn_type_stats AS s (session_id, turn_type, turn_count)
+    SELECT session_id, turn_type, COUNT(*)
+    FROM new_turns
+    GROUP BY session_id, turn_type
+    ON CONFLICT (session_id, turn_type) DO UPDATE
+    SET turn_count = s.turn_count + EXCLUDED.turn_count;
+
+    RETURN NULL;
+END;
+$$ LANGUAGE plpgsql;
+
+DROP TRIGGER IF EXISTS trigger_turn_stats_insert ON turn;
+CREATE TRIGGER trigger_turn_stats_insert
+    AFTER INSERT ON turn
+    REFERENCING NEW TABLE AS new_turns
+    FOR EACH STATEMENT
+    EXECUTE FUNCTION accumulate_turn_stats();
+
+-- 2. turn DELETE (턴 되돌리기 등): 수 차감 후 첫/마지막 시각은 남은 양 끝 turn으로 보정
+-- (session_id, turn_number) 인덱스의 양 끝만 읽으므로 세션 이력 길이와 무관합니다.
+CREATE OR REPLACE FUNCTION subtract_turn_stats()
+RETURNS TRIGGER AS $$
+BEGIN
+    UPDATE session_turn_phase_stats s
+    SET turn_count = GREATEST(s.turn_count - d.removed, 0)
+    FROM (
+        SELECT session_id, phase_at_turn, COUNT(*) AS removed
+        FROM old_turns
+        GROUP BY session_id, phase_at_turn
+    ) d
+    WHERE s.session_id = d.session_id AND s.phase_at_turn = d.phase_at_turn;
+
+    UPDATE session_turn_type_stats s
+    SET turn_count = GREATEST(s.turn_count - d.removed, 0)
+    FROM (
+        SELECT session_id, turn_type, COUNT(*) AS removed
+        FROM old_turns
+        GROUP BY session_id, turn_type
+    ) d
+    WHERE s.session_id = d.session_id AND s.turn_type = d.turn_type;
+
+    UPDATE session_history_stats s
+    SET total_turns = GREATEST(s.total_turns - d.removed, 0),
+        first_turn_at = (
+            SELECT t.created_at FROM turn t
+            WHERE t.session_id = s.session_id
+            ORDER BY t.turn_number ASC LIMIT 1
+        ),
+        last_turn_at = (
+            SELECT t.created_at FROM turn t
+            WHERE t.session_id = s.session_id
+            ORDER BY t.turn_number DESC LIMIT 1
+        ),
+        updated_at = NOW()
+    FROM (
+        SELECT session_id, COUNT(*) AS removed
+        FROM old_turns
+        GROUP BY session_id
+    ) d
+    WHERE s.session_id = d.session_id;
+
+    RETURN NULL;
+END;
+$$ LANGUAGE plpgsql;
+
+-- 아카이브(L_session_archive.sql)로 옮겨진 이력은 요약을 유지하므로 차감하지 않습니다.
+DROP TRIGGER IF EXISTS trigger_turn_stats_delete ON turn;
+CREATE TRIGGER trigger_turn_stats_delete
+    AFTER DELETE ON turn
+    REFERENCING OLD TABLE AS old_turns
+    FOR EACH STATEMENT
+    WHEN (NOT is_session_archiving())
+    EXECUTE FUNCTION subtract_turn_stats();
+
+-- 3. phase INSERT: 직전 Phase 체류 시간 마감 + 새 Phase 전환 횟수 누적
+-- 한 문장에 같은 세션의 전환이 여러 건이면 시각 순으로 차례대로 반영합니다.
+CREATE OR REPLACE FUNCTION accumulate_phase_stats()
+RETURNS TRIGGER AS $$
+DECLARE
+    v_transition RECORD;
+    v_current RECORD;
+BEGIN
+    FOR v_transition IN
+        SELECT session_id, new_phase, transitioned_at
+        FROM new_phases
+        ORDER BY session_id, transitioned_at
+    LOOP
+        SELECT current_phase, phase_since INTO v_current
+        FROM session_history_stats
+        WHERE session_id = v_transition.session_id
+        FOR UPDATE;
+
+        IF FOUND AND v_current.current_phase IS NOT NULL THEN
+            UPDATE session_phase_stats
+            SET total_duration = total_duration
+                + GREATEST(v_transition.transitioned_at - v_current.phase_since, INTERVAL '0')
+            WHERE session_id = v_transition.session_id
+              AND phase = v_current.current_phase;
+        END IF;
+
+        INSERT INTO session_phase_stats AS s (
+            session_id, phase, transition_count, first_visit, last_visit
+        )
+        VALUES (
+            v_transition.session_id, v_transition.new_phase, 1,
+            v_transition.transitioned_at, v_transition.transitioned_at
+        )
+        ON CONFLICT (session_id, phase) DO UPDATE
+        SET transition_count = s.transition_count + 1,
+            first_visit = LEAST(s.first_visit, EXCLUDED.first_visit),
+            last_visit = GREATEST(s.last_visit, EXCLUDED.last_visit);
+
+        INSERT INTO session_history_stats AS s (session_id, current_phase, phase_since)
+        VALUES (
+            v_transition.session_id, v_transition.new_phase, v_transition.transitioned_at
+        )
+        ON CONFLICT (session_id) DO UPDATE
+        SET current_phase = EXCLUDED.current_phase,
+            phase_since = EXCLUDED.phase_since,
+            updated_at = NOW();
+    END LOOP;
+
+    RETURN NULL;
+END;
+$$ LANGUAGE plpgsql;
+
+DROP TRIGGER IF EXISTS trigger_phase_stats_insert ON phase;
+CREATE TRIGGER trigger_phase_stats_insert
+    AFTER INSERT ON phase
+    REFERENCING NEW TABLE AS new_phases
+    FOR EACH STATEMENT
+    EXECUTE FUNCTION accumulate_phase_stats();
+
+-- 4. 요약 재구축 (기존 데이터 / 불일치 보정용)
+-- p_session_id가 NULL이면 전체 세션을 재구축하며, 재구축한 세션 수를 반환합니다.
+-- 아카이브된 세션은 원본 이력이 없으므로 기존 요약을 그대로 둡니다.
+CREATE OR REPLACE FUNCTION rebuild_history_stats(p_session_id UUID DEFAULT NULL)
+RETURNS INTEGER AS $$
+DECLARE
+    v_rebuilt INTEGER;
+BEGIN
+    DELETE FROM session_turn_phase_stats
+    WHERE (p_session_id IS NULL OR session_id = p_session_id)
+      AND session_id NOT IN (SELECT session_id FROM session_archive);
+    DELETE FROM session_turn_type_stats
+    WHERE (p_session_id IS NULL OR session_id = p_session_id)
+      AND session_id NOT IN (SELECT session_id FROM session_archive);
+    DELETE FROM session_phase_stats
+    WHERE (p_session_id IS NULL OR session_id = p_session_id)
+      AND session_id NOT IN (SELECT session_id FROM session_archive);
+    DELETE FROM session_history_stats
+    WHERE (p_session_id IS NULL OR session_id = p_session_id)
+      AND session_id NOT IN (SELECT session_id FROM session_archive);
+
+    INSERT INTO session_history_stats (
+        session_id, total_turns, first_turn_at, last_turn_at, current_phase, phase_since
+    )
+    SELECT
+        s.session_id,
+        COALESCE(t.total_turns, 0),
+        t.first_turn_at,
+        t.last_turn_at,
+        p.new_phase,
+        p.transitioned_at
+    FROM session s
+    LEFT JOIN (
+        SELECT session_id, COUNT(*) AS total_turns,
+               MIN(created_at) AS first_turn_at, MAX(created_at) AS last_turn_at
+        FROM turn
+        WHERE p_session_id IS NULL OR session_id = p_session_id
+        GROUP BY session_id
+    ) t ON t.session_id = s.session_id
+    LEFT JOIN (
+        SELECT DISTINCT ON (session_id) session_id, new_phase, transitioned_at
+        FROM phase
+        WHERE p_session_id IS NULL OR session_id = p_session_id
+        ORDER BY session_id, transitioned_at DESC
+    ) p ON p.session_id = s.session_id
+    WHERE (p_session_id IS NULL OR s.session_id = p_session_id)
+      AND (t.session_id IS NOT NULL OR p.session_id IS NOT NULL);
+    GET DIAGNOSTICS v_rebuilt = ROW_COUNT;
+
+    INSERT INTO session_turn_phase_stats (session_id, phase_at_turn, turn_count)
+    SELECT session_id, phase_at_turn, COUNT(*)
+    FROM turn
+    WHERE p_session_id IS NULL OR session_id = p_session_id
+    GROUP BY session_id, phase_at_turn;
+
+    INSERT INTO session_turn_type_stats (session_id, turn_type, turn_count)
+    SELECT session_id, turn_type, COUNT(*)
+    FROM turn
+    WHERE p_session_id IS NULL OR session_id = p_session_id
+    GROUP BY session_id, turn_type;
+
+    -- 각 전환의 체류 시간 = 다음 전환 시각 - 전환 시각 (마지막 전환은 진행 중이므로 제외)
+    INSERT INTO session_phase_stats (
+        session_id, phase, transition_count, total_duration, first_visit, last_visit
+    )
+    SELECT
+        session_id,
+        new_phase,
+        COUNT(*),
+        COALESCE(SUM(next_at - transitioned_at), INTERVAL '0'),
+        MIN(transitioned_at),
+        MAX(transitioned_at)
+    FROM (
+        SELECT
+            session_id,
+            new_phase,
+            transitioned_at,
+            LEAD(transitioned_at) OVER (
+                PARTITION BY session_id ORDER BY transitioned_at
+            ) AS next_at
+        FROM phase
+        WHERE p_session_id IS NULL OR session_id = p_session_id
+    ) transitions
+    GROUP BY session_id, new_phase;
+
+    RETURN v_rebuilt;
+END;
+$$ LANGUAGE plpgsql;
+
+-- 5. 요약 테이블 최초 생성 시 기존 이력으로 1회 채움
+-- (이후에는 트리거가 유지하며, 불일치 보정은 scripts/rebuild_history_stats.py 사용)
+DO $$
+BEGIN
+    IF NOT EXISTS (SELECT 1 FROM session_history_stats)
+       AND (EXISTS (SELECT 1 FROM turn) OR EXISTS (SELECT 1 FROM phase)) THEN
+        PERFORM rebuild_history_stats();
+    END IF;
+END $$;
@@ -47,4 +47,5 @@ DROP TRIGGER IF EXISTS trigger_04_initialize_inventory ON session;
 CREATE TRIGGER trigger_04_initialize_inventory
     AFTER INSERT ON session
     FOR EACH ROW
+    WHEN (NOT is_bulk_clone())
     EXECUTE FUNCTION initialize_player_inventory();
@@ -1,53 +1,47 @@
 -- ====================================================================
 -- L_item.sql
--- 아이템 세션 초기화 로직 (Logic)
+-- 시나리오 공유 아이템 카탈로그 로직 (Logic)
 -- ====================================================================
 
-CREATE OR REPLACE FUNCTION initialize_items()
-RETURNS TRIGGER AS $$
-DECLARE
-    -- 마스터 데이터가 저장된 시스템 세션 ID (Session 0)
-    MASTER_SESSION_ID CONSTANT UUID := '00000000-0000-0000-0000-000000000000';
-BEGIN
-    -- [Deep Copy] Session 0에 저장된 해당 시나리오의 원본 아이템 데이터를 신규 세션 ID로 복제 삽입
-    INSERT INTO item (
-        item_id,
-        entity_type,
-        session_id,
-        scenario_id,
-        scenario_item_id,
-        name,
-        description,
-        item_type,
-        meta,
-        created_at
-    )
-    SELECT
-        gen_random_uuid(),  -- 복사본에 새로운 고유 ID 부여
-        entity_type,
-        NEW.session_id,     -- 트리거를 발생시킨 실제 세션 ID
-        scenario_id,
-        scenario_item_id,
-        name,
-        description,
-        item_type,
-        meta,
-        NOW()
-    FROM item
-    WHERE session_id = MASTER_SESSION_ID
-      AND scenario_id = NEW.scenario_id;
+-- 아이템 정의는 플레이 중 변하지 않으므로 Session 0에 시나리오당 1회만 저장하고,
+-- 세션은 마스터 item_id를 그대로 참조합니다. (세션별 상태는 player_inventory/inventory)
+-- 세션 생성 시 아이템 복제(구 trigger_05_initialize_items)는 더 이상 수행하지 않습니다.
+DROP TRIGGER IF EXISTS trigger_05_initialize_items ON session;
+DROP FUNCTION IF EXISTS initialize_items();
 
-    RAISE NOTICE '[Item] Initialized session % by cloning Master Items from Session 0', NEW.session_id;
+-- 1. 세션 아이템 조회 (세션 시나리오의 마스터 아이템 + 이전 방식으로 복제된 세션 행)
+CREATE OR REPLACE FUNCTION session_items(p_session_id UUID)
+RETURNS SETOF item AS $$
+    SELECT i.*
+    FROM session s
+    JOIN item i
+      ON (i.session_id = '00000000-0000-0000-0000-000000000000'
+          AND i.scenario_id = s.scenario_id)
+      OR i.session_id = s.session_id
+    WHERE s.session_id = p_session_id;
+$$ LANGUAGE sql STABLE;
 
-    RETURN NEW;
-END;
-$$ LANGUAGE plpgsql;
+-- 2. 세션별 아이템 복제본 정리 (이전 버전에서 생성된 세션 대상, 재실행 시 no-op)
+-- player_inventory 참조를 마스터 아이템으로 옮긴 뒤 복제본을 삭제합니다.
+INSERT INTO player_inventory (player_id, item_id, quantity, created_at, updated_at)
+SELECT pi.player_id, m.item_id, pi.quantity, pi.created_at, pi.updated_at
+FROM player_inventory pi
+JOIN item c
+  ON c.item_id = pi.item_id
+ AND c.session_id <> '00000000-0000-0000-0000-000000000000'
+JOIN item m
+  ON m.session_id = '00000000-0000-0000-0000-000000000000'
+ AND m.scenario_id = c.scenario_id
+ AND m.scenario_item_id = c.scenario_item_id
+ON CONFLICT (player_id, item_id)
+DO UPDATE SET
+    quantity = player_inventory.quantity + EXCLUDED.quantity,
+    updated_at = GREATEST(player_inventory.updated_at, EXCLUDED.updated_at);
 
--- 트리거 설정
-DROP TRIGGER IF EXISTS trigger_05_initialize_items ON session;
-CREATE TRIGGER trigger_05_initialize_items
-    AFTER INSERT ON session
-    FOR EACH ROW
-    -- 시스템 세션(Session 0) 자체 생성 시에는 복제를 수행하지 않음
-    WHEN (NEW.session_id <> '00000000-0000-0000-0000-000000000000')
-    EXECUTE FUNCTION initialize_items();
+-- 복제본을 참조하던 player_inventory 행은 FK(ON DELETE CASCADE)로 함께 삭제됨
+DELETE FROM item c
+USING item m
+WHERE c.session_id <> '00000000-0000-0000-0000-000000000000'
+  AND m.session_id = '00000000-0000-0000-0000-000000000000'
+  AND m.scenario_id = c.scenario_id
+  AND m.scenario_item_id = c.scenario_item_id;
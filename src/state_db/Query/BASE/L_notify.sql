@@ -0,0 +1,90 @@
+-- ====================================================================
+-- L_notify.sql
+-- 워커 간 캐시 무효화 알림 (LISTEN/NOTIFY) 로직 (Logic)
+-- ====================================================================
+
+-- 1. 무효화 알림 트리거 함수
+-- 채널: state_invalidation
+-- 페이로드: {"t": 테이블명, "s": session_id, "v": 트랜잭션 ID(version)}
+-- NOTIFY는 commit 시점에만 전달되며, 한 트랜잭션 내 동일 페이로드는 1회로 병합되므로
+-- 대량 변경(세션 복제 등)도 테이블·세션당 1건의 알림만 발생합니다.
+CREATE OR REPLACE FUNCTION notify_state_invalidation()
+RETURNS TRIGGER AS $$
+DECLARE
+    v_row RECORD;
+    v_session_id UUID;
+BEGIN
+    IF TG_LEVEL = 'STATEMENT' THEN
+        -- 세션과 무관한 공유 테이블 (phase_rules: 규칙 매트릭스, item: 아이템 카탈로그 재로딩)
+        v_session_id := NULL;
+    ELSE
+        IF TG_OP = 'DELETE' THEN
+            v_row := OLD;
+        ELSE
+            v_row := NEW;
+        END IF;
+
+        IF TG_TABLE_NAME = 'player_inventory' THEN
+            -- player_inventory는 session_id가 없으므로 player를 통해 조회
+            SELECT p.session_id INTO v_session_id
+            FROM player p
+            WHERE p.player_id = v_row.player_id;
+        ELSE
+            v_session_id := v_row.session_id;
+        END IF;
+    END IF;
+
+    PERFORM pg_notify(
+        'state_invalidation',
+        json_build_object(
+            't', TG_TABLE_NAME,
+            's', v_session_id,
+            'v', txid_current()
+        )::text
+    );
+    RETURN NULL;
+END;
+$$ LANGUAGE plpgsql;
+
+-- 2. 대상 테이블 트리거 등록
+DROP TRIGGER IF EXISTS trigger_notify_session ON session;
+CREATE TRIGGER trigger_notify_session
+    AFTER INSERT OR UPDATE OR DELETE ON session
+    FOR EACH ROW
+    EXECUTE FUNCTION notify_state_invalidation();
+
+DROP TRIGGER IF EXISTS trigger_notify_player ON player;
+CREATE TRIGGER trigger_notify_player
+    AFTER INSERT OR UPDATE OR DELETE ON player
+    FOR EACH ROW
+    EXECUTE FUNCTION notify_state_invalidation();
+
+DROP TRIGGER IF EXISTS trigger_notify_npc ON npc;
+CREATE TRIGGER trigger_notify_npc
+    AFTER INSERT OR UPDATE OR DELETE ON npc
+    FOR EACH ROW
+    EXECUTE FUNCTION notify_state_invalidation();
+
+DROP TRIGGER IF EXISTS trigger_notify_enemy ON enemy;
+CREATE TRIGGER trigger_notify_enemy
+    AFTER INSERT OR UPDATE OR DELETE ON enemy
+    FOR EACH ROW
+    EXECUTE FUNCTION notify_state_invalidation();
+
+DROP TRIGGER IF EXISTS trigger_notify_player_inventory ON player_inventory;
+CREATE TRIGGER trigger_notify_player_inventory
+    AFTER INSERT OR UPDATE OR DELETE ON player_inventory
+    FOR EACH ROW
+    EXECUTE FUNCTION notify_state_invalidation();
+
+DROP TRIGGER IF EXISTS trigger_notify_phase_rules ON phase_rules;
+CREATE TRIGGER trigger_notify_phase_rules
+    AFTER INSERT OR UPDATE OR DELETE ON phase_rules
+    FOR EACH STATEMENT
+    EXECUTE FUNCTION notify_state_invalidation();
+
+DROP TRIGGER IF EXISTS trigger_notify_item ON item;
+CREATE TRIGGER trigger_notify_item
+    AFTER INSERT OR UPDATE OR DELETE ON item
+    FOR EACH STATEMENT
+    EXECUTE FUNCTION notify_state_invalidation();
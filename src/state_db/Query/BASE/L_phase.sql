@@ -23,6 +23,7 @@ DROP TRIGGER IF EXISTS trigger_01_initialize_phase ON session;
 CREATE TRIGGER trigger_01_initialize_phase
     AFTER INSERT ON session
     FOR EACH ROW
+    WHEN (NOT is_bulk_clone())
     EXECUTE FUNCTION initialize_phase();
 
 -- 2. Phase 전환 로깅 트리거
@@ -63,16 +64,21 @@ END;
 $$ LANGUAGE plpgsql;
 
 -- 4. 통계 함수
+-- 이력 요약 테이블(L_history_stats.sql)에서 읽으며, 진행 중인 Phase는 진입 이후 경과 시간을 더합니다.
 CREATE OR REPLACE FUNCTION get_phase_statistics(p_session_id UUID)
 RETURNS TABLE (phase phase_type, total_duration INTERVAL, transition_count BIGINT) AS $$
 BEGIN
     RETURN QUERY
-    WITH phase_durations AS (
-        SELECT ph.new_phase,
-            LEAD(ph.transitioned_at, 1, NOW()) OVER (ORDER BY ph.transitioned_at) - ph.transitioned_at AS duration
-        FROM phase ph WHERE ph.session_id = p_session_id
-    )
-    SELECT pd.new_phase, SUM(pd.duration), COUNT(*)
-    FROM phase_durations pd GROUP BY pd.new_phase ORDER BY 2 DESC;
+    SELECT
+        ps.phase,
+        ps.total_duration + CASE
+            WHEN ps.phase = hs.current_phase THEN NOW() - hs.phase_since
+            ELSE INTERVAL '0'
+        END,
+        ps.transition_count
+    FROM session_phase_stats ps
+    LEFT JOIN session_history_stats hs ON hs.session_id = ps.session_id
+    WHERE ps.session_id = p_session_id
+    ORDER BY 2 DESC;
 END;
 $$ LANGUAGE plpgsql;
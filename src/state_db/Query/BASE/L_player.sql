@@ -47,4 +47,5 @@ DROP TRIGGER IF EXISTS trigger_03_initialize_player ON session;
 CREATE TRIGGER trigger_03_initialize_player
     AFTER INSERT ON session
     FOR EACH ROW
+    WHEN (NOT is_bulk_clone())
     EXECUTE FUNCTION initialize_player();
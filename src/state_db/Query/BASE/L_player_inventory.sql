@@ -31,4 +31,5 @@ DROP TRIGGER IF EXISTS trigger_06_initialize_starting_items ON session;
 CREATE TRIGGER trigger_06_initialize_starting_items
     AFTER INSERT ON session
     FOR EACH ROW
+    WHEN (NOT is_bulk_clone())
     EXECUTE FUNCTION initialize_starting_items();
@@ -38,7 +38,8 @@ BEGIN
     IF v_player_id IS NOT NULL THEN
         -- [Logic] 세션 내에 존재하는 모든 NPC와 플레이어 사이의 관계 슬롯 생성
         FOR v_npc_record IN
-            SELECT npc_id FROM npc WHERE session_id = NEW.session_id
+            -- 오버레이 세션은 마스터 NPC ID(공개 ID)로 슬롯 생성
+            SELECT npc_id FROM session_npcs(NEW.session_id)
         LOOP
             INSERT INTO player_npc_relations (
                 player_id,
@@ -69,4 +70,5 @@ DROP TRIGGER IF EXISTS trigger_09_initialize_npc_relations ON session;
 CREATE TRIGGER trigger_09_initialize_npc_relations
     AFTER INSERT ON session
     FOR EACH ROW
+    WHEN (NOT is_bulk_clone())
     EXECUTE FUNCTION initialize_npc_relations();
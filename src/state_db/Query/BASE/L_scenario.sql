@@ -51,5 +51,6 @@ CREATE TRIGGER trigger_08_initialize_enemies
     AFTER INSERT ON session
     FOR EACH ROW
     -- 0번 세션 자체 생성 시에는 동작 방지
-    WHEN (NEW.session_id <> '00000000-0000-0000-0000-000000000000')
+    WHEN (NEW.session_id <> '00000000-0000-0000-0000-000000000000' AND NOT is_bulk_clone()
+          AND NOT NEW.entity_overlay)
     EXECUTE FUNCTION initialize_enemies();
@@ -212,6 +212,7 @@ BEGIN
         s.started_at
     FROM session s
     WHERE s.status = 'active'
+      AND NOT EXISTS (SELECT 1 FROM session_pool sp WHERE sp.session_id = s.session_id)
     ORDER BY s.started_at DESC;
 END;
 $$ LANGUAGE plpgsql;
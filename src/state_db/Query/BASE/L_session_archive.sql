@@ -0,0 +1,197 @@
+-- ====================================================================
+-- L_session_archive.sql
+-- 종료 세션 아카이브 적재 및 이력 통합 조회 로직 (Logic)
+-- ====================================================================
+
+-- 1. 세션 이력 조회 (원본 테이블 + 아카이브 병합)
+-- TRACE 쿼리는 turn / phase / session_checkpoint 대신 아래 함수를 조회하여
+-- 아카이브된 세션도 같은 결과를 받습니다. 단일 SELECT의 SQL 함수이므로 호출 쿼리에
+-- 인라인되어 원본 테이블 쪽은 기존과 같이 인덱스 / 파티션 pruning을 사용합니다.
+CREATE OR REPLACE FUNCTION session_turns(p_session_id UUID)
+RETURNS SETOF turn AS $$
+    SELECT t.*
+    FROM turn t
+    WHERE t.session_id = p_session_id
+      AND t.created_at BETWEEN session_history_start(p_session_id)
+                           AND session_history_end(p_session_id)
+    UNION ALL
+    SELECT r.*
+    FROM session_archive a
+    CROSS JOIN LATERAL jsonb_populate_recordset(NULL::turn, a.payload->'turns') r
+    WHERE a.session_id = p_session_id;
+$$ LANGUAGE sql STABLE;
+
+CREATE OR REPLACE FUNCTION session_phases(p_session_id UUID)
+RETURNS SETOF phase AS $$
+    SELECT p.*
+    FROM phase p
+    WHERE p.session_id = p_session_id
+      AND p.transitioned_at BETWEEN session_history_start(p_session_id)
+                                AND session_history_end(p_session_id)
+    UNION ALL
+    SELECT r.*
+    FROM session_archive a
+    CROSS JOIN LATERAL jsonb_populate_recordset(NULL::phase, a.payload->'phases') r
+    WHERE a.session_id = p_session_id;
+$$ LANGUAGE sql STABLE;
+
+CREATE OR REPLACE FUNCTION session_checkpoints(p_session_id UUID)
+RETURNS SETOF session_checkpoint AS $$
+    SELECT c.*
+    FROM session_checkpoint c
+    WHERE c.session_id = p_session_id
+    UNION ALL
+    SELECT r.*
+    FROM session_archive a
+    CROSS JOIN LATERAL jsonb_populate_recordset(
+        NULL::session_checkpoint, a.payload->'checkpoints'
+    ) r
+    WHERE a.session_id = p_session_id;
+$$ LANGUAGE sql STABLE;
+
+-- 2. 세션 그래프(Vertex + RELATION) 추출 후 삭제
+-- Vertex는 라벨별 속성 목록, RELATION은 시작/끝 Vertex 속성과 함께 저장합니다.
+CREATE OR REPLACE FUNCTION archive_session_graph(p_session_id UUID)
+RETURNS JSONB AS $func$
+DECLARE
+    v_label TEXT;
+    v_rows JSONB;
+    v_graph JSONB := '{}'::jsonb;
+BEGIN
+    EXECUTE format($fmt$
+        SELECT COALESCE(jsonb_agg(result::text::jsonb), '[]'::jsonb)
+        FROM ag_catalog.cypher('state_db'::name, $$
+            MATCH (v1)-[r:RELATION {session_id: %1$L}]->(v2)
+            RETURN {start: properties(v1), end: properties(v2), properties: properties(r)}
+        $$) AS (result agtype);
+    $fmt$, p_session_id::text) INTO v_rows;
+    v_graph := v_graph || jsonb_build_object('RELATION', v_rows);
+
+    FOREACH v_label IN ARRAY ARRAY['npc', 'enemy'] LOOP
+        EXECUTE format($fmt$
+            SELECT COALESCE(jsonb_agg(result::text::jsonb), '[]'::jsonb)
+            FROM ag_catalog.cypher('state_db'::name, $$
+                MATCH (v:%1$s {session_id: %2$L})
+                RETURN properties(v)
+            $$) AS (result agtype);
+        $fmt$, v_label, p_session_id::text) INTO v_rows;
+        v_graph := v_graph || jsonb_build_object(v_label, v_rows);
+
+        EXECUTE format($fmt$
+            SELECT * FROM ag_catalog.cypher('state_db'::name, $$
+                MATCH (v:%1$s {session_id: %2$L})
+                DETACH DELETE v
+            $$) AS (result agtype);
+        $fmt$, v_label, p_session_id::text);
+    END LOOP;
+
+    RETURN v_graph;
+END;
+$func$ LANGUAGE plpgsql;
+
+-- 3. 종료 세션 1건 아카이브
+-- 세션 범위 행(DEBUG/session_dump-r.sql 범위 + 체크포인트 + 그래프)을 payload 1행으로 묶어
+-- session_archive에 적재한 뒤 원본 행을 삭제합니다. 한 트랜잭션에서 수행됩니다.
+-- 반환: 삭제한 원본 행 수 (종료되지 않았거나 이미 아카이브된 세션이면 NULL)
+CREATE OR REPLACE FUNCTION archive_session(p_session_id UUID)
+RETURNS INTEGER AS $$
+DECLARE
+    v_session session%ROWTYPE;
+    v_payload JSONB;
+    v_rows INTEGER;
+BEGIN
+    SELECT * INTO v_session
+    FROM session
+    WHERE session_id = p_session_id
+      AND status = 'ended'
+      AND session_id <> '00000000-0000-0000-0000-000000000000'
+    FOR UPDATE;
+
+    IF NOT FOUND
+       OR EXISTS (SELECT 1 FROM session_archive WHERE session_id = p_session_id) THEN
+        RETURN NULL;
+    END IF;
+
+    SELECT jsonb_build_object(
+        'session', to_jsonb(v_session),
+        'player', (
+            SELECT COALESCE(jsonb_agg(to_jsonb(p)), '[]'::jsonb)
+            FROM player p
+            WHERE p.session_id = p_session_id
+        ),
+        'player_inventory', (
+            SELECT COALESCE(jsonb_agg(to_jsonb(pi)), '[]'::jsonb)
+            FROM player_inventory pi
+            JOIN player p ON p.player_id = pi.player_id
+            WHERE p.session_id = p_session_id
+        ),
+        'player_npc_relations', (
+            SELECT COALESCE(jsonb_agg(to_jsonb(pnr)), '[]'::jsonb)
+            FROM player_npc_relations pnr
+            JOIN player p ON p.player_id = pnr.player_id
+            WHERE p.session_id = p_session_id
+        ),
+        'npcs', (
+            SELECT COALESCE(jsonb_agg(to_jsonb(n)), '[]'::jsonb)
+            FROM npc n
+            WHERE n.session_id = p_session_id
+        ),
+        'enemies', (
+            SELECT COALESCE(jsonb_agg(to_jsonb(e)), '[]'::jsonb)
+            FROM enemy e
+            WHERE e.session_id = p_session_id
+        ),
+        'phases', (
+            SELECT COALESCE(jsonb_agg(to_jsonb(ph) ORDER BY ph.transitioned_at), '[]'::jsonb)
+            FROM phase ph
+            WHERE ph.session_id = p_session_id
+              AND ph.transitioned_at BETWEEN session_history_start(p_session_id)
+                                         AND session_history_end(p_session_id)
+        ),
+        'turns', (
+            SELECT COALESCE(jsonb_agg(to_jsonb(t) ORDER BY t.turn_number), '[]'::jsonb)
+            FROM turn t
+            WHERE t.session_id = p_session_id
+              AND t.created_at BETWEEN session_history_start(p_session_id)
+                                   AND session_history_end(p_session_id)
+        ),
+        'checkpoints', (
+            SELECT COALESCE(jsonb_agg(to_jsonb(c) ORDER BY c.turn_number), '[]'::jsonb)
+            FROM session_checkpoint c
+            WHERE c.session_id = p_session_id
+        ),
+        'graph', archive_session_graph(p_session_id)
+    )
+    INTO v_payload;
+
+    -- session 행은 유지되므로 제외하고 집계
+    SELECT COALESCE(SUM(jsonb_array_length(value)), 0)::int INTO v_rows
+    FROM jsonb_each(v_payload - 'session' - 'graph');
+    SELECT v_rows + COALESCE(SUM(jsonb_array_length(value)), 0)::int INTO v_rows
+    FROM jsonb_each(v_payload->'graph');
+
+    INSERT INTO session_archive (session_id, scenario_id, ended_at, payload, archived_rows)
+    VALUES (p_session_id, v_session.scenario_id, v_session.ended_at, v_payload, v_rows);
+
+    -- 원본 행 삭제 (이력 요약은 유지: is_session_archiving() 동안 차감 트리거 생략)
+    PERFORM set_config('state_db.session_archiving', 'on', true);
+
+    DELETE FROM turn
+    WHERE session_id = p_session_id
+      AND created_at BETWEEN session_history_start(p_session_id)
+                         AND session_history_end(p_session_id);
+    DELETE FROM phase
+    WHERE session_id = p_session_id
+      AND transitioned_at BETWEEN session_history_start(p_session_id)
+                              AND session_history_end(p_session_id);
+    DELETE FROM session_checkpoint WHERE session_id = p_session_id;
+    -- player 삭제 시 player_inventory / player_npc_relations는 FK CASCADE로 함께 삭제
+    DELETE FROM player WHERE session_id = p_session_id;
+    DELETE FROM npc WHERE session_id = p_session_id;
+    DELETE FROM enemy WHERE session_id = p_session_id;
+
+    PERFORM set_config('state_db.session_archiving', 'off', true);
+
+    RETURN v_rows;
+END;
+$$ LANGUAGE plpgsql;
@@ -0,0 +1,149 @@
+-- ====================================================================
+-- L_session_bulk.sql
+-- 동일 시나리오 세션 N개 일괄 생성 (집합 기반 복제) 로직 (Logic)
+-- ====================================================================
+
+-- 세션 INSERT 초기화 트리거(trigger_01 ~ trigger_09)가 세션마다 수행하던 작업을
+-- N개 세션 전체에 대해 테이블당 INSERT ... SELECT 1회로 처리합니다.
+-- 행 단위 트리거는 is_bulk_clone() (트랜잭션 범위 GUC)으로 건너뜁니다.
+-- p_clone_graph = false 이면 그래프 복제는 호출자(GraphLoader)가 같은 트랜잭션에서 수행합니다.
+DROP FUNCTION IF EXISTS create_sessions_bulk(UUID, INTEGER, INTEGER, INTEGER, TEXT);
+CREATE OR REPLACE FUNCTION create_sessions_bulk(
+    p_scenario_id UUID,
+    p_count INTEGER,
+    p_current_act INTEGER DEFAULT 1,
+    p_current_sequence INTEGER DEFAULT 1,
+    p_location TEXT DEFAULT NULL,
+    p_clone_graph BOOLEAN DEFAULT true
+)
+RETURNS UUID[] AS $func$
+DECLARE
+    MASTER_SESSION_ID CONSTANT UUID := '00000000-0000-0000-0000-000000000000';
+    v_session_ids UUID[];
+    -- 세션 INSERT 시 entity_overlay 기본값과 동일 (Copy-on-Write 모드)
+    v_overlay BOOLEAN := is_entity_overlay_default();
+BEGIN
+    IF p_count IS NULL OR p_count < 1 THEN
+        RETURN ARRAY[]::UUID[];
+    END IF;
+
+    -- 트랜잭션 종료 시 자동 해제 (is_local = true)
+    PERFORM set_config('state_db.bulk_clone', 'on', true);
+
+    -- 1. 세션 생성
+    WITH inserted AS (
+        INSERT INTO session (
+            scenario_id, current_act, current_sequence, location, status, current_phase
+        )
+        SELECT p_scenario_id, p_current_act, p_current_sequence, p_location,
+               'active', 'dialogue'
+        FROM generate_series(1, p_count)
+        RETURNING session_id
+    )
+    SELECT array_agg(session_id) INTO v_session_ids FROM inserted;
+
+    -- 2. 초기 Phase / 0번 Turn 기록 (initialize_phase, initialize_turn)
+    INSERT INTO phase (
+        phase_id, session_id, previous_phase, new_phase,
+        turn_at_transition, transition_reason, transitioned_at
+    )
+    SELECT gen_random_uuid(), s.session_id, NULL, s.current_phase,
+           s.current_turn, 'session_start', s.started_at
+    FROM session s
+    WHERE s.session_id = ANY(v_session_ids);
+
+    INSERT INTO turn (
+        turn_id, session_id, turn_number, phase_at_turn,
+        turn_type, state_changes, created_at
+    )
+    SELECT gen_random_uuid(), s.session_id, 0, s.current_phase,
+           'initial_state', '{}'::jsonb, s.started_at
+    FROM session s
+    WHERE s.session_id = ANY(v_session_ids);
+
+    -- 3. 기본 플레이어 및 인벤토리 (initialize_player, initialize_player_inventory)
+    INSERT INTO player (session_id, name, description, state, created_at)
+    SELECT
+        s.session_id,
+        'Player',
+        'Default player character',
+        '{
+            "numeric": {
+                "HP": 100,
+                "MP": 50,
+                "STR": null,
+                "DEX": null,
+                "INT": null,
+                "LUX": null,
+                "SAN": 10
+            },
+            "boolean": {}
+        }'::jsonb,
+        s.started_at
+    FROM session s
+    WHERE s.session_id = ANY(v_session_ids);
+
+    INSERT INTO inventory (
+        session_id, owner_entity_type, owner_entity_id,
+        capacity, weight_limit, created_at
+    )
+    SELECT p.session_id, 'player', p.player_id, NULL, NULL, p.created_at
+    FROM player p
+    WHERE p.session_id = ANY(v_session_ids);
+
+    -- 4. Session 0 마스터 데이터 복제 (initialize_npcs / enemies)
+    -- 아이템은 시나리오 공유 카탈로그를 참조하므로 복제하지 않음 (L_item.sql)
+    -- 오버레이 모드에서는 NPC/Enemy를 복제하지 않고 마스터 행을 참조 (L_entity_overlay.sql)
+    IF NOT v_overlay THEN
+        INSERT INTO npc (
+            npc_id, entity_type, name, description, session_id, scenario_id,
+            scenario_npc_id, tags, state, relations, created_at, updated_at
+        )
+        SELECT gen_random_uuid(), m.entity_type, m.name, m.description, t.session_id,
+               m.scenario_id, m.scenario_npc_id, m.tags, m.state, m.relations,
+               NOW(), NOW()
+        FROM npc m
+        CROSS JOIN unnest(v_session_ids) AS t(session_id)
+        WHERE m.session_id = MASTER_SESSION_ID
+          AND m.scenario_id = p_scenario_id;
+
+        INSERT INTO enemy (
+            enemy_id, entity_type, name, description, session_id, scenario_id,
+            scenario_enemy_id, tags, state, relations, dropped_items,
+            created_at, updated_at
+        )
+        SELECT gen_random_uuid(), m.entity_type, m.name, m.description, t.session_id,
+               m.scenario_id, m.scenario_enemy_id, m.tags, m.state, m.relations,
+               m.dropped_items, NOW(), NOW()
+        FROM enemy m
+        CROSS JOIN unnest(v_session_ids) AS t(session_id)
+        WHERE m.session_id = MASTER_SESSION_ID
+          AND m.scenario_id = p_scenario_id;
+    END IF;
+
+    -- 5. 플레이어-NPC 관계 슬롯 (initialize_npc_relations)
+    INSERT INTO player_npc_relations (
+        player_id, npc_id, affinity_score, relation_type, created_at
+    )
+    SELECT p.player_id, n.npc_id, 50, 'neutral', p.created_at
+    FROM player p
+    CROSS JOIN LATERAL session_npcs(p.session_id) n
+    WHERE p.session_id = ANY(v_session_ids)
+    ON CONFLICT (player_id, npc_id) DO NOTHING;
+
+    -- 6. 그래프 복제 (initialize_graph_data): 세션 목록을 UNWIND 하여 라벨 조합당 1회 실행
+    IF p_clone_graph THEN
+        PERFORM clone_graph_for_sessions(p_scenario_id, v_session_ids);
+    END IF;
+
+    -- 7. 세션 시작 상태 체크포인트 (checkpoint_initial_state)
+    PERFORM save_session_checkpoint(t.session_id, 0)
+    FROM unnest(v_session_ids) AS t(session_id);
+
+    PERFORM set_config('state_db.bulk_clone', 'off', true);
+
+    RAISE NOTICE '[Session] Bulk created % sessions for scenario %', p_count, p_scenario_id;
+
+    RETURN v_session_ids;
+END;
+$func$ LANGUAGE plpgsql;
@@ -0,0 +1,136 @@
+-- ====================================================================
+-- L_session_checkpoint.sql
+-- 세션 상태 체크포인트 기록 로직 (Logic)
+-- ====================================================================
+
+-- 1. 체크포인트 간격 (커넥션 GUC state_db.checkpoint_interval, 기본 10)
+-- 애플리케이션은 TURN_CHECKPOINT_INTERVAL 설정을 커넥션 startup 파라미터로 전달합니다.
+-- 0 이하이면 주기 체크포인트를 기록하지 않습니다 (0번 turn 체크포인트는 항상 기록).
+CREATE OR REPLACE FUNCTION checkpoint_interval()
+RETURNS INTEGER AS $$
+    SELECT COALESCE(NULLIF(current_setting('state_db.checkpoint_interval', true), '')::int, 10);
+$$ LANGUAGE sql STABLE;
+
+-- 2. 세션 전체 상태 캡처 (리플레이 기준 상태)
+-- 엔티티는 공개 ID(Copy-on-Write 세션은 마스터 ID) 키의 객체로 저장하여
+-- state_changes의 enemy_hp / npc_affinity 키와 그대로 대응시킵니다.
+CREATE OR REPLACE FUNCTION capture_session_state(p_session_id UUID)
+RETURNS JSONB AS $$
+    SELECT jsonb_build_object(
+        'session', jsonb_build_object(
+            'scenario_id', s.scenario_id,
+            'current_act', s.current_act,
+            'current_sequence', s.current_sequence,
+            'current_phase', s.current_phase,
+            'current_turn', s.current_turn,
+            'location', s.location,
+            'status', s.status
+        ),
+        'player', (
+            SELECT jsonb_build_object(
+                'player_id', p.player_id,
+                'name', p.name,
+                'state', p.state,
+                'tags', to_jsonb(p.tags)
+            )
+            FROM player p
+            WHERE p.session_id = s.session_id
+            LIMIT 1
+        ),
+        'npcs', COALESCE((
+            SELECT jsonb_object_agg(n.npc_id, jsonb_build_object(
+                'scenario_npc_id', n.scenario_npc_id,
+                'name', n.name,
+                'state', n.state,
+                'tags', to_jsonb(n.tags)
+            ))
+            FROM session_npcs(s.session_id) n
+        ), '{}'::jsonb),
+        'enemies', COALESCE((
+            SELECT jsonb_object_agg(e.enemy_id, jsonb_build_object(
+                'scenario_enemy_id', e.scenario_enemy_id,
+                'name', e.name,
+                'state', e.state,
+                'tags', to_jsonb(e.tags)
+            ))
+            FROM session_enemies(s.session_id) e
+        ), '{}'::jsonb),
+        'inventory', COALESCE((
+            SELECT jsonb_object_agg(pi.item_id, pi.quantity)
+            FROM player p
+            JOIN player_inventory pi ON pi.player_id = p.player_id
+            WHERE p.session_id = s.session_id
+        ), '{}'::jsonb),
+        'npc_affinity', COALESCE((
+            SELECT jsonb_object_agg(r.npc_id, r.affinity_score)
+            FROM player p
+            JOIN player_npc_relations r ON r.player_id = p.player_id
+            WHERE p.session_id = s.session_id
+        ), '{}'::jsonb)
+    )
+    FROM session s
+    WHERE s.session_id = p_session_id;
+$$ LANGUAGE sql STABLE;
+
+-- 3. 체크포인트 저장 (같은 turn이면 덮어씀)
+CREATE OR REPLACE FUNCTION save_session_checkpoint(p_session_id UUID, p_turn_number INTEGER)
+RETURNS VOID AS $$
+    INSERT INTO session_checkpoint (session_id, turn_number, state)
+    SELECT p_session_id, p_turn_number, capture_session_state(p_session_id)
+    ON CONFLICT (session_id, turn_number) DO UPDATE
+    SET state = EXCLUDED.state,
+        created_at = NOW();
+$$ LANGUAGE sql;
+
+-- 4. K turn마다 체크포인트 기록 (turn INSERT 문장 트리거)
+-- record_state_change는 모든 변경 적용 후 turn을 기록하므로 해당 turn 종료 시점 상태가 저장됩니다.
+CREATE OR REPLACE FUNCTION checkpoint_on_turn()
+RETURNS TRIGGER AS $$
+DECLARE
+    v_interval INTEGER := checkpoint_interval();
+BEGIN
+    IF v_interval > 0 THEN
+        PERFORM save_session_checkpoint(session_id, turn_number)
+        FROM new_turns
+        WHERE turn_number > 0
+          AND turn_number % v_interval = 0;
+    END IF;
+    RETURN NULL;
+END;
+$$ LANGUAGE plpgsql;
+
+DROP TRIGGER IF EXISTS trigger_turn_checkpoint ON turn;
+CREATE TRIGGER trigger_turn_checkpoint
+    AFTER INSERT ON turn
+    REFERENCING NEW TABLE AS new_turns
+    FOR EACH STATEMENT
+    EXECUTE FUNCTION checkpoint_on_turn();
+
+-- 5. 세션 시작 상태(0번 turn) 체크포인트
+-- 초기화 트리거(trigger_01 ~ trigger_09)가 플레이어/엔티티를 만든 뒤 실행되도록 마지막 순서로 둡니다.
+-- 일괄 생성(create_sessions_bulk)은 함수 안에서 직접 기록합니다.
+CREATE OR REPLACE FUNCTION checkpoint_initial_state()
+RETURNS TRIGGER AS $$
+BEGIN
+    PERFORM save_session_checkpoint(NEW.session_id, NEW.current_turn);
+    RETURN NEW;
+END;
+$$ LANGUAGE plpgsql;
+
+DROP TRIGGER IF EXISTS trigger_99_checkpoint_initial_state ON session;
+CREATE TRIGGER trigger_99_checkpoint_initial_state
+    AFTER INSERT ON session
+    FOR EACH ROW
+    WHEN (NOT is_bulk_clone())
+    EXECUTE FUNCTION checkpoint_initial_state();
+
+-- 6. 체크포인트 도입 이전 세션은 현재 상태를 현재 turn 체크포인트로 1회 기록
+-- (그 이전 turn은 재구성할 수 없으며, 이후 turn부터 리플레이 가능)
+DO $$
+BEGIN
+    IF NOT EXISTS (SELECT 1 FROM session_checkpoint) THEN
+        PERFORM save_session_checkpoint(s.session_id, s.current_turn)
+        FROM session s
+        WHERE s.session_id <> '00000000-0000-0000-0000-000000000000';
+    END IF;
+END $$;
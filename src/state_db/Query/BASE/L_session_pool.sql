@@ -0,0 +1,114 @@
+-- ====================================================================
+-- L_session_pool.sql
+-- 사전 복제 세션 풀 보충/할당 로직 (Logic)
+-- ====================================================================
+
+-- 1. 풀 보충: 세션 1건 사전 복제
+-- 시나리오별 advisory lock으로 여러 워커의 동시 보충을 직렬화하고,
+-- 이미 p_high_watermark 이상 채워져 있거나 다른 워커가 보충 중이면 NULL을 반환합니다.
+CREATE OR REPLACE FUNCTION provision_pooled_session(
+    p_scenario_id UUID,
+    p_high_watermark INTEGER
+)
+RETURNS UUID AS $$
+DECLARE
+    v_pooled INTEGER;
+    v_session_id UUID;
+BEGIN
+    IF NOT pg_try_advisory_xact_lock(hashtext('session_pool:' || p_scenario_id::text)) THEN
+        RETURN NULL;
+    END IF;
+
+    SELECT COUNT(*) INTO v_pooled
+    FROM session_pool
+    WHERE scenario_id = p_scenario_id;
+
+    IF v_pooled >= p_high_watermark THEN
+        RETURN NULL;
+    END IF;
+
+    -- 기존 create_session 경로 그대로 트리거 캐스케이드 수행
+    v_session_id := create_session(p_scenario_id, 1, 1, NULL);
+
+    INSERT INTO session_pool (session_id, scenario_id)
+    VALUES (v_session_id, p_scenario_id);
+
+    RETURN v_session_id;
+END;
+$$ LANGUAGE plpgsql;
+
+-- 2. 풀 할당: 미할당 세션 1건을 원자적으로 claim
+-- FOR UPDATE SKIP LOCKED로 동시 요청끼리 같은 세션을 두고 대기하지 않으며,
+-- 풀이 비어 있으면 NULL을 반환합니다(호출 측에서 create_session으로 대체).
+CREATE OR REPLACE FUNCTION claim_pooled_session(
+    p_scenario_id UUID,
+    p_current_act INTEGER DEFAULT 1,
+    p_current_sequence INTEGER DEFAULT 1,
+    p_location TEXT DEFAULT NULL
+)
+RETURNS UUID AS $$
+DECLARE
+    v_session_id UUID;
+BEGIN
+    SELECT sp.session_id INTO v_session_id
+    FROM session_pool sp
+    WHERE sp.scenario_id = p_scenario_id
+    ORDER BY sp.provisioned_at
+    LIMIT 1
+    FOR UPDATE SKIP LOCKED;
+
+    IF v_session_id IS NULL THEN
+        RETURN NULL;
+    END IF;
+
+    DELETE FROM session_pool WHERE session_id = v_session_id;
+
+    -- 외부 전달 값 적용 및 시작 시각을 실제 시작 시점으로 갱신
+    UPDATE session
+    SET
+        current_act = p_current_act,
+        current_sequence = p_current_sequence,
+        location = p_location,
+        started_at = NOW(),
+        created_at = NOW()
+    WHERE session_id = v_session_id;
+
+    UPDATE turn SET created_at = NOW()
+    WHERE session_id = v_session_id AND turn_number = 0;
+
+    UPDATE phase SET transitioned_at = NOW()
+    WHERE session_id = v_session_id AND previous_phase IS NULL;
+
+    -- 이력 요약(first_turn_at / phase_since / first_visit)도 갱신된 시작 시각으로 재구축
+    PERFORM rebuild_history_stats(v_session_id);
+
+    -- 보충 시점에 기록된 시작 상태 체크포인트를 외부 전달 값이 적용된 상태로 덮어씀
+    PERFORM save_session_checkpoint(v_session_id, 0);
+
+    RETURN v_session_id;
+END;
+$$ LANGUAGE plpgsql;
+
+-- 3. 비활성 시나리오의 풀 정리
+-- 더 이상 시작될 수 없는 시나리오의 미할당 세션은 종료 처리 후 풀에서 제거합니다.
+CREATE OR REPLACE FUNCTION drain_session_pool()
+RETURNS INTEGER AS $$
+DECLARE
+    v_drained INTEGER;
+BEGIN
+    WITH drained AS (
+        DELETE FROM session_pool sp
+        USING scenario sc
+        WHERE sc.scenario_id = sp.scenario_id
+          AND sc.is_active = false
+        RETURNING sp.session_id
+    )
+    UPDATE session s
+    SET status = 'ended', ended_at = NOW()
+    FROM drained d
+    WHERE s.session_id = d.session_id;
+
+    GET DIAGNOSTICS v_drained = ROW_COUNT;
+    RETURN v_drained;
+END;
+$$ LANGUAGE plpgsql;
@@ -0,0 +1,153 @@
+-- ====================================================================
+-- L_state_changes.sql
+-- 판정 결과(state_changes) 일괄 적용 로직 (Logic)
+-- ====================================================================
+
+-- 1. 상태 변경 일괄 적용 함수
+-- RuleEngine 판정 결과 전체를 한 번의 호출(단일 트랜잭션)로 반영합니다.
+-- 엔티티별 반복 대신 jsonb_each 기반의 집합 연산으로 처리하므로
+-- 적/NPC 수와 관계없이 왕복 횟수는 1회입니다.
+--
+-- p_changes 예:
+-- {
+--   "player_id": "uuid", "player_hp": -10, "player_stats": {"gold": 50},
+--   "enemy_hp": {"enemy-uuid": -20}, "npc_affinity": {"npc-uuid": 70},
+--   "location": "Town", "phase": "combat", "turn_increment": true,
+--   "act": 2, "sequence": 1
+-- }
+-- 반환: 적용된 필드 목록 (세션이 없으면 NULL)
+CREATE OR REPLACE FUNCTION apply_state_changes(
+    p_session_id UUID,
+    p_changes JSONB
+)
+RETURNS TEXT[] AS $$
+DECLARE
+    v_player_id UUID := NULLIF(p_changes->>'player_id', '')::UUID;
+    v_updated TEXT[] := ARRAY[]::TEXT[];
+BEGIN
+    -- [Lock] 동시 판정 적용 직렬화 (세션 단위)
+    PERFORM 1 FROM session WHERE session_id = p_session_id FOR UPDATE;
+    IF NOT FOUND THEN
+        RETURN NULL;
+    END IF;
+
+    -- [Player] HP 변경
+    IF p_changes ? 'player_hp' AND v_player_id IS NOT NULL THEN
+        UPDATE player
+        SET state = jsonb_set(
+                state,
+                '{numeric,HP}',
+                to_jsonb(
+                    COALESCE((state->'numeric'->>'HP')::int, 100)
+                    + (p_changes->>'player_hp')::int
+                )
+            ),
+            updated_at = NOW()
+        WHERE player_id = v_player_id
+          AND session_id = p_session_id;
+        v_updated := array_append(v_updated, 'player_hp_updated');
+    END IF;
+
+    -- [Player] 수치 스탯 병합
+    IF p_changes ? 'player_stats' AND v_player_id IS NOT NULL THEN
+        UPDATE player
+        SET state = jsonb_set(
+                state,
+                '{numeric}',
+                COALESCE(state->'numeric', '{}'::jsonb) || (p_changes->'player_stats')
+            ),
+            updated_at = NOW()
+        WHERE player_id = v_player_id
+          AND session_id = p_session_id;
+        v_updated := array_append(v_updated, 'player_stats_updated');
+    END IF;
+
+    -- [Enemy] HP 변경 + HP 0 이하 시 패배 처리 (HP=0, 'defeated' 태그)
+    IF p_changes ? 'enemy_hp' THEN
+        -- Copy-on-Write 오버레이 세션은 변경 대상 Enemy를 먼저 세션 행으로 복제
+        PERFORM materialize_enemy(p_session_id, key::UUID)
+        FROM jsonb_each_text(p_changes->'enemy_hp');
+
+        WITH delta AS (
+            SELECT key::UUID AS enemy_id, value::int AS hp_change
+            FROM jsonb_each_text(p_changes->'enemy_hp')
+        ),
+        next_hp AS (
+            SELECT
+                e.enemy_id,
+                (e.state->'numeric'->>'HP')::int + d.hp_change AS hp
+            FROM enemy e
+            JOIN delta d
+              ON d.enemy_id = e.enemy_id OR d.enemy_id = e.source_enemy_id
+            WHERE e.session_id = p_session_id
+        )
+        UPDATE enemy e
+        SET state = jsonb_set(e.state, '{numeric, HP}', to_jsonb(GREATEST(n.hp, 0))),
+            tags = CASE
+                WHEN n.hp <= 0 AND NOT COALESCE('defeated' = ANY(e.tags), false)
+                    THEN array_append(e.tags, 'defeated')
+                ELSE e.tags
+            END
+        FROM next_hp n
+        WHERE e.enemy_id = n.enemy_id
+          AND e.session_id = p_session_id;
+        v_updated := array_append(v_updated, 'enemy_hp_updated');
+    END IF;
+
+    -- [NPC] 호감도 설정 (upsert)
+    IF p_changes ? 'npc_affinity' AND v_player_id IS NOT NULL THEN
+        INSERT INTO player_npc_relations (player_id, npc_id, affinity_score)
+        SELECT v_player_id, key::UUID, value::int
+        FROM jsonb_each_text(p_changes->'npc_affinity')
+        ON CONFLICT (player_id, npc_id) DO UPDATE
+        SET affinity_score = EXCLUDED.affinity_score,
+            updated_at = NOW();
+        v_updated := array_append(v_updated, 'npc_affinity_updated');
+    END IF;
+
+    -- [Session] 위치 / Phase
+    IF p_changes ? 'location' THEN
+        UPDATE session
+        SET location = p_changes->>'location'
+        WHERE session_id = p_session_id
+          AND status = 'active';
+        v_updated := array_append(v_updated, 'location_updated');
+    END IF;
+
+    IF p_changes ? 'phase' THEN
+        UPDATE session
+        SET current_phase = (p_changes->>'phase')::phase_type
+        WHERE session_id = p_session_id;
+        v_updated := array_append(v_updated, 'phase_updated');
+    END IF;
+
+    -- [Session] Act / Sequence
+    IF p_changes ? 'act' THEN
+        UPDATE session
+        SET current_act = (p_changes->>'act')::int
+        WHERE session_id = p_session_id;
+        v_updated := array_append(v_updated, 'act_updated');
+    END IF;
+
+    IF p_changes ? 'sequence' THEN
+        UPDATE session
+        SET current_sequence = (p_changes->>'sequence')::int
+        WHERE session_id = p_session_id;
+        v_updated := array_append(v_updated, 'sequence_updated');
+    END IF;
+
+    -- [Turn] 턴 증가 및 변경 내역 기록
+    -- 모든 변경을 적용한 뒤 기록하여 turn 체크포인트(L_session_checkpoint.sql)가
+    -- 해당 turn 종료 시점의 상태를 담도록 합니다.
+    IF COALESCE((p_changes->>'turn_increment')::boolean, false) THEN
+        PERFORM record_state_change(
+            p_session_id,
+            COALESCE(p_changes->>'turn_type', 'action'),
+            p_changes - 'turn_increment' - 'turn_type'
+        );
+        v_updated := array_append(v_updated, 'turn_incremented');
+    END IF;
+
+    RETURN v_updated;
+END;
+$$ LANGUAGE plpgsql;
@@ -80,4 +80,5 @@ DROP TRIGGER IF EXISTS trigger_02_initialize_turn ON session;
 CREATE TRIGGER trigger_02_initialize_turn
     AFTER INSERT ON session
     FOR EACH ROW
+    WHEN (NOT is_bulk_clone())
     EXECUTE FUNCTION initialize_turn();
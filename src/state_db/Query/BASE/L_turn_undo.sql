@@ -0,0 +1,260 @@
+-- ====================================================================
+-- L_turn_undo.sql
+-- 변경 전 이미지 기록 및 Turn 되돌리기 로직 (Logic)
+-- ====================================================================
+
+-- 1. 되돌리기 적용 중 여부 (트랜잭션 범위 GUC)
+-- 되돌리기가 수행하는 복원 변경은 다시 기록하지 않습니다.
+CREATE OR REPLACE FUNCTION is_undo_replaying()
+RETURNS BOOLEAN AS $$
+    SELECT COALESCE(current_setting('state_db.undo_replaying', true), '') = 'on';
+$$ LANGUAGE sql STABLE;
+
+-- 2. 엔티티 행 변경 전 이미지 기록 (player / npc / enemy / player_inventory / player_npc_relations)
+-- 트리거 인자: 대상 테이블의 PK 컬럼명 목록
+-- session_id 컬럼이 없는 테이블은 player_id로 세션을 찾습니다.
+-- Session 0(마스터 데이터)과 세션 생성 트랜잭션(복제 단계)의 변경은 되돌릴 대상이 아니므로 기록하지 않습니다.
+CREATE OR REPLACE FUNCTION capture_undo_image()
+RETURNS TRIGGER AS $$
+DECLARE
+    v_row JSONB;
+    v_session_id UUID;
+    v_session RECORD;
+BEGIN
+    IF TG_OP = 'INSERT' THEN
+        v_row := to_jsonb(NEW);
+    ELSE
+        v_row := to_jsonb(OLD);
+    END IF;
+
+    IF v_row ? 'session_id' THEN
+        v_session_id := (v_row->>'session_id')::UUID;
+    ELSE
+        SELECT session_id INTO v_session_id
+        FROM player
+        WHERE player_id = (v_row->>'player_id')::UUID;
+    END IF;
+
+    IF v_session_id IS NULL
+       OR v_session_id = '00000000-0000-0000-0000-000000000000' THEN
+        RETURN NULL;
+    END IF;
+
+    SELECT current_turn, started_at = NOW() AS is_starting, status INTO v_session
+    FROM session
+    WHERE session_id = v_session_id;
+
+    -- 종료된 세션은 되돌릴 수 없으므로 (아카이브 삭제 등) 기록하지 않음
+    IF NOT FOUND OR v_session.is_starting OR v_session.status = 'ended' THEN
+        RETURN NULL;
+    END IF;
+
+    INSERT INTO turn_undo_log (
+        session_id, after_turn, table_name, operation, row_key, before_image
+    )
+    VALUES (
+        v_session_id,
+        v_session.current_turn,
+        TG_TABLE_NAME,
+        TG_OP,
+        (SELECT jsonb_object_agg(k, v_row->k) FROM unnest(TG_ARGV) AS k),
+        CASE WHEN TG_OP = 'INSERT' THEN NULL ELSE v_row END
+    );
+
+    RETURN NULL;
+END;
+$$ LANGUAGE plpgsql;
+
+DROP TRIGGER IF EXISTS trigger_undo_player ON player;
+CREATE TRIGGER trigger_undo_player
+    AFTER INSERT OR UPDATE OR DELETE ON player
+    FOR EACH ROW
+    WHEN (NOT is_bulk_clone() AND NOT is_undo_replaying())
+    EXECUTE FUNCTION capture_undo_image('player_id');
+
+DROP TRIGGER IF EXISTS trigger_undo_npc ON npc;
+CREATE TRIGGER trigger_undo_npc
+    AFTER INSERT OR UPDATE OR DELETE ON npc
+    FOR EACH ROW
+    WHEN (NOT is_bulk_clone() AND NOT is_undo_replaying())
+    EXECUTE FUNCTION capture_undo_image('npc_id');
+
+DROP TRIGGER IF EXISTS trigger_undo_enemy ON enemy;
+CREATE TRIGGER trigger_undo_enemy
+    AFTER INSERT OR UPDATE OR DELETE ON enemy
+    FOR EACH ROW
+    WHEN (NOT is_bulk_clone() AND NOT is_undo_replaying())
+    EXECUTE FUNCTION capture_undo_image('enemy_id');
+
+DROP TRIGGER IF EXISTS trigger_undo_player_inventory ON player_inventory;
+CREATE TRIGGER trigger_undo_player_inventory
+    AFTER INSERT OR UPDATE OR DELETE ON player_inventory
+    FOR EACH ROW
+    WHEN (NOT is_bulk_clone() AND NOT is_undo_replaying())
+    EXECUTE FUNCTION capture_undo_image('player_id', 'item_id');
+
+DROP TRIGGER IF EXISTS trigger_undo_player_npc_relations ON player_npc_relations;
+CREATE TRIGGER trigger_undo_player_npc_relations
+    AFTER INSERT OR UPDATE OR DELETE ON player_npc_relations
+    FOR EACH ROW
+    WHEN (NOT is_bulk_clone() AND NOT is_undo_replaying())
+    EXECUTE FUNCTION capture_undo_image('player_id', 'npc_id');
+
+-- 3. 세션 진행 상태(위치 / Phase / Act / Sequence) 변경 전 이미지 기록
+-- current_turn 증가는 되돌리기에서 직접 맞추므로 기록하지 않습니다.
+CREATE OR REPLACE FUNCTION capture_session_undo_image()
+RETURNS TRIGGER AS $$
+BEGIN
+    IF NEW.started_at = NOW() THEN
+        RETURN NULL;
+    END IF;
+
+    INSERT INTO turn_undo_log (
+        session_id, after_turn, table_name, operation, row_key, before_image
+    )
+    VALUES (
+        OLD.session_id,
+        OLD.current_turn,
+        TG_TABLE_NAME,
+        TG_OP,
+        jsonb_build_object('session_id', OLD.session_id),
+        jsonb_build_object(
+            'location', OLD.location,
+            'current_phase', OLD.current_phase,
+            'current_act', OLD.current_act,
+            'current_sequence', OLD.current_sequence
+        )
+    );
+
+    RETURN NULL;
+END;
+$$ LANGUAGE plpgsql;
+
+DROP TRIGGER IF EXISTS trigger_undo_session ON session;
+CREATE TRIGGER trigger_undo_session
+    AFTER UPDATE OF location, current_phase, current_act, current_sequence ON session
+    FOR EACH ROW
+    WHEN (
+        OLD.session_id <> '00000000-0000-0000-0000-000000000000'
+        AND (OLD.location, OLD.current_phase, OLD.current_act, OLD.current_sequence)
+            IS DISTINCT FROM
+            (NEW.location, NEW.current_phase, NEW.current_act, NEW.current_sequence)
+        AND NOT is_bulk_clone()
+        AND NOT is_undo_replaying()
+    )
+    EXECUTE FUNCTION capture_session_undo_image();
+
+-- 4. 세션 종료 시 되돌리기 기록 정리 (종료된 세션은 되돌릴 수 없음)
+CREATE OR REPLACE FUNCTION purge_turn_undo_log()
+RETURNS TRIGGER AS $$
+BEGIN
+    DELETE FROM turn_undo_log WHERE session_id = NEW.session_id;
+    RETURN NULL;
+END;
+$$ LANGUAGE plpgsql;
+
+DROP TRIGGER IF EXISTS trigger_purge_turn_undo_log ON session;
+CREATE TRIGGER trigger_purge_turn_undo_log
+    AFTER UPDATE OF status ON session
+    FOR EACH ROW
+    WHEN (NEW.status = 'ended' AND OLD.status IS DISTINCT FROM NEW.status)
+    EXECUTE FUNCTION purge_turn_undo_log();
+
+-- 5. N번 turn 종료 시점으로 되돌리기
+-- after_turn >= N 인 변경 전 이미지를 기록 역순으로 적용한 뒤
+-- N 이후의 turn / 체크포인트 / 되돌리기 기록을 삭제하고 current_turn을 N으로 맞춥니다.
+-- 모든 작업이 호출 트랜잭션 안에서 수행되며, 처리량은 되돌리는 turn의 변경 수에 비례합니다.
+-- Phase 전환 이력(phase)은 지우지 않고 복원된 Phase로의 전환이 새로 기록됩니다.
+-- 반환: 세션이 없거나 종료되었으면 0행, N이 범위 밖(N < 0 또는 N >= 현재 turn)이면 변경 없이 1행
+CREATE OR REPLACE FUNCTION rollback_to_turn(p_session_id UUID, p_target_turn INTEGER)
+RETURNS TABLE (previous_turn INTEGER, undone_turns INTEGER, undone_changes INTEGER) AS $$
+DECLARE
+    v_entry RECORD;
+    v_match TEXT;
+    v_columns TEXT;
+    v_values TEXT;
+BEGIN
+    -- [Lock] apply_state_changes와 같은 세션 단위 직렬화
+    SELECT s.current_turn INTO previous_turn
+    FROM session s
+    WHERE s.session_id = p_session_id
+      AND s.status <> 'ended'
+    FOR UPDATE;
+
+    IF NOT FOUND THEN
+        RETURN;
+    END IF;
+
+    undone_turns := 0;
+    undone_changes := 0;
+
+    IF p_target_turn < 0 OR p_target_turn >= previous_turn THEN
+        RETURN NEXT;
+        RETURN;
+    END IF;
+
+    PERFORM set_config('state_db.undo_replaying', 'on', true);
+
+    FOR v_entry IN
+        SELECT u.table_name, u.operation, u.row_key, u.before_image
+        FROM turn_undo_log u
+        WHERE u.session_id = p_session_id
+          AND u.after_turn >= p_target_turn
+        ORDER BY u.undo_id DESC
+    LOOP
+        SELECT string_agg(format('t.%1$I = k.%1$I', key), ' AND ')
+        INTO v_match
+        FROM jsonb_object_keys(v_entry.row_key) AS key;
+
+        IF v_entry.operation = 'INSERT' THEN
+            EXECUTE format(
+                'DELETE FROM %1$I t USING jsonb_populate_record(NULL::%1$I, $1) k WHERE %2$s',
+                v_entry.table_name, v_match
+            ) USING v_entry.row_key;
+        ELSIF v_entry.operation = 'DELETE' THEN
+            EXECUTE format(
+                'INSERT INTO %1$I SELECT * FROM jsonb_populate_record(NULL::%1$I, $1)',
+                v_entry.table_name
+            ) USING v_entry.before_image;
+        ELSE
+            SELECT
+                string_agg(format('%I', key), ', '),
+                string_agg(format('r.%I', key), ', ')
+            INTO v_columns, v_values
+            FROM jsonb_object_keys(v_entry.before_image) AS key;
+
+            EXECUTE format(
+                'UPDATE %1$I t SET (%2$s) = ('
+                '  SELECT %3$s FROM jsonb_populate_record(NULL::%1$I, $1) r'
+                ') FROM jsonb_populate_record(NULL::%1$I, $2) k WHERE %4$s',
+                v_entry.table_name, v_columns, v_values, v_match
+            ) USING v_entry.before_image, v_entry.row_key;
+        END IF;
+
+        undone_changes := undone_changes + 1;
+    END LOOP;
+
+    PERFORM set_config('state_db.undo_replaying', 'off', true);
+
+    DELETE FROM turn t
+    WHERE t.session_id = p_session_id
+      AND t.turn_number > p_target_turn
+      AND t.created_at BETWEEN session_history_start(p_session_id)
+                           AND session_history_end(p_session_id);
+    GET DIAGNOSTICS undone_turns = ROW_COUNT;
+
+    DELETE FROM session_checkpoint c
+    WHERE c.session_id = p_session_id
+      AND c.turn_number > p_target_turn;
+
+    DELETE FROM turn_undo_log u
+    WHERE u.session_id = p_session_id
+      AND u.after_turn >= p_target_turn;
+
+    UPDATE session s
+    SET current_turn = p_target_turn
+    WHERE s.session_id = p_session_id;
+
+    RETURN NEXT;
+END;
+$$ LANGUAGE plpgsql;
@@ -0,0 +1,15 @@
+-- [용도] 시나리오 아이템 카탈로그 전체 조회 (인메모리 카탈로그 적재용)
+-- [설명] 아이템 정의는 Session 0에 시나리오당 1회만 저장되며 세션 간 공유됨
+-- Parameters: $1 scenario_id
+SELECT
+    item_id,
+    scenario_item_id,
+    name,
+    description,
+    item_type,
+    meta,
+    created_at
+FROM item
+WHERE session_id = '00000000-0000-0000-0000-000000000000'
+  AND scenario_id = $1::UUID
+ORDER BY name;
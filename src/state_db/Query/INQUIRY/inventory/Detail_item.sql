@@ -1,10 +1,13 @@
 -- [용도] 특정 아이템의 전체 속성 및 규칙 확인
+-- [설명] 세션 시나리오의 공유 아이템 카탈로그에서 조회 (카탈로그 캐시 미사용 시)
+-- Parameters: $1 session_id, $2 item_id
 SELECT
     item_id,
+    scenario_item_id,
     name,
     description,
     item_type,
     meta, -- 내구도, 스택 정보 등
     created_at
-FROM item
-WHERE session_id = :session_id AND item_id = :item_id;
+FROM session_items($1::UUID)
+WHERE item_id = $2::UUID;
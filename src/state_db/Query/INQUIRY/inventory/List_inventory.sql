@@ -1,11 +1,16 @@
 -- [용도] 플레이어가 보유한 모든 아이템 이름, 설명, 수량 조회
--- [설명] 아이템(item) 테이블과 조인하여 상세 정보를 함께 표시
+-- [설명] 공유 아이템 카탈로그(session_items)와 조인하여 상세 정보를 함께 표시
+-- Parameters: $1 session_id
 SELECT
-    i.name,
-    i.description,
+    pi.player_id,
+    pi.item_id,
+    i.name AS item_name,
+    i.item_type AS category,
     pi.quantity,
-    i.item_type,
-    i.state AS item_state
+    pi.created_at AS acquired_at
 FROM player_inventory pi
-JOIN item i ON pi.item_id = i.item_id
-WHERE pi.player_id = :player_id;
+JOIN player p ON pi.player_id = p.player_id
+LEFT JOIN session_items($1::UUID) i ON i.item_id = pi.item_id
+WHERE p.session_id = $1::UUID
+  AND pi.quantity > 0
+ORDER BY pi.created_at ASC;
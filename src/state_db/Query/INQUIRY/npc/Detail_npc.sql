@@ -1,4 +1,5 @@
 -- [용도] 특정 NPC의 스탯(HP, MP 등) 및 관계(Relations) 상세 조회
+-- $1: session_id, $2: npc_id
 SELECT *
-FROM npc
-WHERE session_id = :session_id AND npc_id = :npc_id;
+FROM session_npcs($1)
+WHERE npc_id = $2;
@@ -1,4 +1,4 @@
 -- [용도] 현재 세션에 존재하는 모든 NPC의 기본 정보와 상태 조회
+-- $1: session_id
 SELECT npc_id, name, description, state, tags
-FROM npc
-WHERE session_id = :session_id;
+FROM session_npcs($1);
@@ -1,2 +1,2 @@
 -- 특정 행동의 허용 여부 반환 (t/f)
-SELECT is_action_allowed(:session_id, :action_name);
+SELECT is_action_allowed($1::UUID, $2) AS is_allowed;
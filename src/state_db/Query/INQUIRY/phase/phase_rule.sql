@@ -1,2 +1,4 @@
-SELECT phase, description, allowed_actions
-FROM phase_rules;
+-- Phase별 허용 행동 규칙 전체 조회 (인메모리 규칙 매트릭스 로드용)
+SELECT phase::text AS phase, description, allowed_actions
+FROM phase_rules
+ORDER BY phase;
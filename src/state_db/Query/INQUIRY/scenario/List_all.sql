@@ -0,0 +1,11 @@
+-- [용도] 전체 시나리오 목록 (최근 생성 순, keyset 페이지네이션)
+-- Parameters: $1 after_created_at, $2 after_scenario_id, $3 limit
+--             ($1이 NULL이면 처음부터, $2가 NULL이면 $1 시각 이전부터, $3이 NULL이면 전체)
+--             다음 페이지는 마지막 행의 (created_at, scenario_id)를 전달
+SELECT *
+FROM scenario
+WHERE $1::TIMESTAMP IS NULL
+   OR (created_at, scenario_id)
+      < ($1::TIMESTAMP, COALESCE($2::UUID, '00000000-0000-0000-0000-000000000000'::UUID))
+ORDER BY created_at DESC, scenario_id DESC
+LIMIT $3::INTEGER;
@@ -0,0 +1,13 @@
+-- [용도] 시나리오 마스터 Enemy 조회 (증분 재주입 diff 계산용)
+-- Parameters: $1 scenario_id
+SELECT
+    enemy_id,
+    scenario_enemy_id,
+    name,
+    description,
+    tags,
+    state,
+    dropped_items
+FROM enemy
+WHERE session_id = '00000000-0000-0000-0000-000000000000'
+  AND scenario_id = $1::UUID;
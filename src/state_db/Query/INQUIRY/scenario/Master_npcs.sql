@@ -0,0 +1,12 @@
+-- [용도] 시나리오 마스터 NPC 조회 (증분 재주입 diff 계산용)
+-- Parameters: $1 scenario_id
+SELECT
+    npc_id,
+    scenario_npc_id,
+    name,
+    description,
+    tags,
+    state
+FROM npc
+WHERE session_id = '00000000-0000-0000-0000-000000000000'
+  AND scenario_id = $1::UUID;
@@ -0,0 +1,13 @@
+-- [용도] 삭제 대상 마스터 행을 참조 중인 세션 데이터 조회 (증분 재주입 충돌 검사)
+-- [설명] player_inventory / player_npc_relations는 ON DELETE CASCADE이므로
+--        참조 중인 마스터 행을 지우면 플레이어 데이터가 함께 사라집니다.
+-- Parameters: $1 item_id 목록, $2 npc_id 목록
+SELECT DISTINCT 'item' AS kind, i.scenario_item_id::text AS ref
+FROM player_inventory pi
+JOIN item i ON i.item_id = pi.item_id
+WHERE pi.item_id = ANY($1::UUID[])
+UNION
+SELECT DISTINCT 'npc' AS kind, n.scenario_npc_id AS ref
+FROM player_npc_relations r
+JOIN npc n ON n.npc_id = r.npc_id
+WHERE r.npc_id = ANY($2::UUID[]);
@@ -0,0 +1,14 @@
+-- [용도] 시나리오 메타데이터 조회 (증분 재주입 diff 계산용)
+-- Parameters: $1 scenario_id
+SELECT
+    scenario_id,
+    title,
+    description,
+    author,
+    version,
+    difficulty,
+    genre,
+    tags,
+    total_acts
+FROM scenario
+WHERE scenario_id = $1::UUID;
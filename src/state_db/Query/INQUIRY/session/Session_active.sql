@@ -1,4 +1,7 @@
 -- 활성 세션 조회
+-- Parameters: $1 after_started_at, $2 after_session_id, $3 limit (keyset 페이지네이션)
+--             ($1이 NULL이면 처음부터, $2가 NULL이면 $1 시각 이전부터, $3이 NULL이면 전체)
+--             다음 페이지는 마지막 행의 (started_at, session_id)를 전달
 SELECT
     session_id,
     scenario_id,
@@ -11,7 +14,15 @@ SELECT
     started_at,
     created_at,
     updated_at
-FROM session
+FROM session s
 WHERE status = 'active'
-ORDER BY started_at DESC;
+  -- 사전 복제 풀의 미할당 세션 제외
+  AND NOT EXISTS (SELECT 1 FROM session_pool sp WHERE sp.session_id = s.session_id)
+  AND (
+      $1::TIMESTAMP IS NULL
+      OR (started_at, session_id)
+         < ($1::TIMESTAMP, COALESCE($2::UUID, '00000000-0000-0000-0000-000000000000'::UUID))
+  )
+ORDER BY started_at DESC, session_id DESC
+LIMIT $3::INTEGER;
 -- p.player_id is missing here, but let's keep it simple for now or join
@@ -1,4 +1,7 @@
--- 세션 전체 목록 조회 (플레이어 ID 포함)
+-- 세션 전체 목록 조회 (플레이어 ID 포함, 최근 시작 순)
+-- Parameters: $1 after_started_at, $2 after_session_id, $3 limit (keyset 페이지네이션)
+--             ($1이 NULL이면 처음부터, $2가 NULL이면 $1 시각 이전부터, $3이 NULL이면 전체)
+--             다음 페이지는 마지막 행의 (started_at, session_id)를 전달
 SELECT
     s.session_id,
     s.scenario_id,
@@ -15,4 +18,12 @@ SELECT
     s.updated_at
 FROM session s
 LEFT JOIN player p ON s.session_id = p.session_id
-ORDER BY s.created_at DESC;
+-- 사전 복제 풀의 미할당 세션 제외
+WHERE NOT EXISTS (SELECT 1 FROM session_pool sp WHERE sp.session_id = s.session_id)
+  AND (
+      $1::TIMESTAMP IS NULL
+      OR (s.started_at, s.session_id)
+         < ($1::TIMESTAMP, COALESCE($2::UUID, '00000000-0000-0000-0000-000000000000'::UUID))
+  )
+ORDER BY s.started_at DESC, s.session_id DESC
+LIMIT $3::INTEGER;
@@ -1,5 +1,8 @@
 -- 종료된 세션 조회
 -- SessionInfo 모델 필드에 맞춰 모든 필요 컬럼 반환
+-- Parameters: $1 after_started_at, $2 after_session_id, $3 limit (keyset 페이지네이션)
+--             ($1이 NULL이면 처음부터, $2가 NULL이면 $1 시각 이전부터, $3이 NULL이면 전체)
+--             다음 페이지는 마지막 행의 (started_at, session_id)를 전달
 
 SELECT
     session_id,
@@ -16,4 +19,10 @@ SELECT
     updated_at
 FROM session
 WHERE status = 'ended'
-ORDER BY ended_at DESC;
+  AND (
+      $1::TIMESTAMP IS NULL
+      OR (started_at, session_id)
+         < ($1::TIMESTAMP, COALESCE($2::UUID, '00000000-0000-0000-0000-000000000000'::UUID))
+  )
+ORDER BY started_at DESC, session_id DESC
+LIMIT $3::INTEGER;
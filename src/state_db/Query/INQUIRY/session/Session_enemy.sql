@@ -12,7 +12,6 @@ SELECT
     (state->'numeric'->>'HP')::int AS current_hp,
     tags,
     state
-FROM enemy
-WHERE session_id = $1
-  AND ($2 = false OR (state->'numeric'->>'HP')::int > 0)
+FROM session_enemies($1)  -- 세션 행 + Copy-on-Write 오버레이 마스터 행
+WHERE ($2 = false OR (state->'numeric'->>'HP')::int > 0)
 ORDER BY created_at DESC;
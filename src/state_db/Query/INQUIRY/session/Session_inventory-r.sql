@@ -2,10 +2,12 @@
 -- Session_inventory.sql
 -- 세션의 플레이어 인벤토리 조회
 -- 용도: 현재 세션의 플레이어가 보유한 아이템 목록 확인
+-- (아이템 이름/분류는 scenario_id로 인메모리 아이템 카탈로그에서 채움)
 -- API: GET /state/session/{session_id}/inventory
 -- --------------------------------------------------------------------
 
 SELECT
+    s.scenario_id,
     pi.player_id,
     pi.item_id,
     pi.quantity,
@@ -13,6 +15,7 @@ SELECT
     pi.updated_at AS last_updated
 FROM player_inventory pi
 JOIN player p ON pi.player_id = p.player_id
+JOIN session s ON p.session_id = s.session_id
 WHERE p.session_id = $1
   AND pi.quantity > 0
 ORDER BY pi.created_at ASC;
@@ -11,6 +11,5 @@ SELECT
     (state->'numeric'->>'HP')::int AS current_hp,
     tags,
     state
-FROM npc
-WHERE session_id = $1
+FROM session_npcs($1)  -- 세션 행 + Copy-on-Write 오버레이 마스터 행
 ORDER BY name ASC;
@@ -1,14 +1,15 @@
 -- --------------------------------------------------------------------
 -- 2-2. Session의 현재 Phase 정보 조회
 -- 용도: RuleEngine이 현재 허용되는 행동 확인
+-- $1: session_id
+-- 허용 행동 목록은 MANAGE/phase/is_action_allowed 참고
 -- --------------------------------------------------------------------
 
--- 현재 Phase 조회
-SELECT current_phase
+SELECT
+    session_id::text AS session_id,
+    current_phase::text AS current_phase
 FROM session
 WHERE session_id = $1;
 
--- 현재 Phase의 허용 행동 조회
-SELECT get_session_allowed_actions($1);
-
--- 결과 예: {move, inspect, talk, use_item}
+-- 결과 예: session_id | current_phase
+--          uuid-123   | exploration
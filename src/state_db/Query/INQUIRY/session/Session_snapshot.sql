@@ -0,0 +1,106 @@
+-- --------------------------------------------------------------------
+-- Session_snapshot.sql
+-- 세션 상태 스냅샷을 단일 쿼리(1 round trip)로 조회
+-- 용도: StateService.get_state_snapshot, pipeline.process_action
+-- $1: session_id
+-- 결과: 세션이 없으면 0 row, 있으면 json 컬럼 1 row
+--   session / player / npcs / enemies(HP > 0) / inventory / phase / turn
+--   (inventory 아이템 이름/분류는 공유 아이템 카탈로그 session_items와 조인)
+-- --------------------------------------------------------------------
+
+WITH s AS (
+    SELECT
+        s.session_id,
+        s.scenario_id,
+        p.player_id,
+        s.current_act,
+        s.current_sequence,
+        s.current_phase,
+        s.current_turn,
+        s.location,
+        s.status,
+        s.started_at,
+        s.ended_at,
+        s.created_at,
+        s.updated_at
+    FROM session s
+    LEFT JOIN player p ON s.session_id = p.session_id
+    WHERE s.session_id = $1
+    LIMIT 1
+)
+SELECT json_build_object(
+    'session', row_to_json(s),
+    'player', (
+        SELECT row_to_json(pl)
+        FROM (
+            SELECT
+                player_id,
+                entity_type,
+                name,
+                description,
+                session_id,
+                state,
+                relations,
+                tags,
+                created_at,
+                updated_at
+            FROM player
+            WHERE player_id = s.player_id
+        ) pl
+    ),
+    'npcs', COALESCE((
+        SELECT json_agg(n ORDER BY n.name ASC)
+        FROM (
+            SELECT
+                npc_id,
+                name,
+                description,
+                (state->'numeric'->>'HP')::int AS current_hp,
+                tags,
+                state
+            FROM session_npcs(s.session_id)
+        ) n
+    ), '[]'::json),
+    'enemies', COALESCE((
+        SELECT json_agg(e ORDER BY e.created_at DESC)
+        FROM (
+            SELECT
+                enemy_id AS enemy_instance_id,
+                scenario_enemy_id,
+                name,
+                description,
+                (state->'numeric'->>'HP')::int AS current_hp,
+                tags,
+                state,
+                created_at
+            FROM session_enemies(s.session_id)
+            WHERE (state->'numeric'->>'HP')::int > 0
+        ) e
+    ), '[]'::json),
+    'inventory', COALESCE((
+        SELECT json_agg(i ORDER BY i.acquired_at ASC)
+        FROM (
+            SELECT
+                pi.player_id,
+                pi.item_id,
+                i.name AS item_name,
+                i.item_type AS category,
+                pi.quantity,
+                pi.created_at AS acquired_at,
+                pi.updated_at AS last_updated
+            FROM player_inventory pi
+            LEFT JOIN session_items(s.session_id) i ON i.item_id = pi.item_id
+            WHERE pi.player_id = s.player_id
+              AND pi.quantity > 0
+        ) i
+    ), '[]'::json),
+    'phase', json_build_object(
+        'session_id', s.session_id,
+        'current_phase', s.current_phase
+    ),
+    'turn', json_build_object(
+        'session_id', s.session_id,
+        'current_turn', s.current_turn
+    )
+) AS snapshot
+FROM s;
@@ -1,8 +1,11 @@
 -- --------------------------------------------------------------------
 -- 2-3. Session의 현재 Turn 정보 조회
 -- 용도: 상태 변경 트랜잭션의 기준점 확인
+-- $1: session_id
 -- --------------------------------------------------------------------
 
-SELECT current_turn
+SELECT
+    session_id::text AS session_id,
+    current_turn
 FROM session
 WHERE session_id = $1;
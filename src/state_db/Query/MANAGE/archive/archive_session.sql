@@ -0,0 +1,4 @@
+-- [용도] 종료 세션 1건을 session_archive로 옮기고 원본 행 삭제
+-- [설명] 종료되지 않았거나 이미 아카이브된 세션이면 archived_rows가 NULL
+-- Parameters: $1 session_id
+SELECT archive_session($1::UUID) AS archived_rows;
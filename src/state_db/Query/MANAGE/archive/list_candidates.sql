@@ -0,0 +1,12 @@
+-- [용도] 아카이브 대상 세션 조회: 종료 후 보관 기간이 지났고 아직 아카이브되지 않은 세션
+-- Parameters: $1 종료 후 보관 일수, $2 최대 세션 수
+SELECT s.session_id, s.ended_at
+FROM session s
+WHERE s.status = 'ended'
+  AND s.session_id <> '00000000-0000-0000-0000-000000000000'
+  AND s.ended_at <= LOCALTIMESTAMP - make_interval(days => $1::INTEGER)
+  AND NOT EXISTS (
+      SELECT 1 FROM session_archive a WHERE a.session_id = s.session_id
+  )
+ORDER BY s.ended_at ASC
+LIMIT $2::INTEGER;
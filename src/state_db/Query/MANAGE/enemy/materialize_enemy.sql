@@ -0,0 +1,4 @@
+-- Copy-on-Write: 변경 전 세션 Enemy 행 확보 (오버레이 마스터 행이면 최초 1회 복제)
+-- $1: session_id, $2: enemy_instance_id (공개 ID)
+-- 반환: 실제 세션 행의 enemy_id (없으면 NULL)
+SELECT materialize_enemy($1::UUID, $2::UUID) AS enemy_id;
@@ -1,3 +1,4 @@
 -- 특정 적 제거 (사망 처리 등)
-DELETE FROM enemy
-WHERE enemy_id = '{enemy_uuid}' AND session_id = '{session_uuid}';
+-- $1: enemy_instance_id, $2: session_id
+-- 세션 고유 Enemy는 물리 삭제, 오버레이(마스터 기반) Enemy는 제거 표시 (L_entity_overlay.sql)
+SELECT remove_session_enemy($2::UUID, $1::UUID) AS removed;
@@ -0,0 +1,10 @@
+-- [용도] 시나리오 마스터 Enemy 갱신 (증분 재주입)
+-- Parameters: $1 enemy_id, $2 name, $3 description, $4 tags, $5 state, $6 dropped_items
+UPDATE enemy
+SET name = $2,
+    description = $3,
+    tags = $4,
+    state = $5,
+    dropped_items = $6
+WHERE enemy_id = $1::UUID
+  AND session_id = '00000000-0000-0000-0000-000000000000';
@@ -0,0 +1,9 @@
+-- [용도] 보존 기간이 지난 turn / phase 파티션 분리 또는 삭제
+-- [설명] 종료되지 않은 세션의 행이 남아 있는 파티션은 유지(kept)
+-- Parameters: $1 보존 일수, $2 삭제 여부 (false면 detach), $3 dry_run
+SELECT partition_name, partition_end, action
+FROM apply_history_retention(
+    make_interval(days => $1::INTEGER),
+    $2::BOOLEAN,
+    $3::BOOLEAN
+);
@@ -0,0 +1,3 @@
+-- [용도] turn / phase 월별 파티션 보장 (기본 파티션의 행 재배치 포함)
+-- Parameters: $1 현재 월 이후로 미리 만들 파티션 수
+SELECT maintain_history_partitions($1::INTEGER) AS created;
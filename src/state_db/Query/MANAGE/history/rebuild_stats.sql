@@ -0,0 +1,3 @@
+-- [용도] 세션별 turn / phase 이력 요약 테이블 재구축 (기존 데이터 채움 / 불일치 보정)
+-- Parameters: $1 session_id (NULL이면 전체 세션)
+SELECT rebuild_history_stats($1::UUID) AS rebuilt;
@@ -0,0 +1,5 @@
+-- [용도] 시나리오 마스터 아이템 삭제 (증분 재주입)
+-- Parameters: $1 item_id 목록
+DELETE FROM item
+WHERE item_id = ANY($1::UUID[])
+  AND session_id = '00000000-0000-0000-0000-000000000000';
@@ -0,0 +1,9 @@
+-- [용도] 시나리오 마스터 아이템 갱신 (증분 재주입)
+-- Parameters: $1 item_id, $2 name, $3 description, $4 item_type, $5 meta
+UPDATE item
+SET name = $2,
+    description = $3,
+    item_type = $4,
+    meta = $5
+WHERE item_id = $1::UUID
+  AND session_id = '00000000-0000-0000-0000-000000000000';
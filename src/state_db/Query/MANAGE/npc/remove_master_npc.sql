@@ -0,0 +1,5 @@
+-- [용도] 시나리오 마스터 NPC 삭제 (증분 재주입)
+-- Parameters: $1 npc_id 목록
+DELETE FROM npc
+WHERE npc_id = ANY($1::UUID[])
+  AND session_id = '00000000-0000-0000-0000-000000000000';
@@ -1,38 +1,18 @@
 -- --------------------------------------------------------------------
 -- remove_npc.sql
--- NPC 제거 (물리적 삭제)
+-- NPC 제거
 -- 용도: 스토리 진행으로 NPC 퇴장 또는 GM 명령
--- API: DELETE /state/npc/{npc_instance_id}
+-- API: DELETE /state/session/{session_id}/npc/{npc_instance_id}
 -- --------------------------------------------------------------------
 
--- NPC 인스턴스 삭제
-DELETE FROM npc
-WHERE npc_instance_id = $1
-  AND session_id = $2
-RETURNING
-    npc_instance_id,
-    npc_id,
-    name,
-    description,
-    created_at,
-    updated_at;
+-- 세션 고유 NPC는 물리 삭제, 오버레이(마스터 기반) NPC는 제거 표시 (L_entity_overlay.sql)
+SELECT remove_session_npc($2::UUID, $1::UUID) AS removed;
 
 -- 파라미터:
 -- $1: npc_instance_id (UUID)
 -- $2: session_id (UUID)
 
--- 결과 예:
--- npc_instance_id | npc_id | name         | description
--- ----------------|--------|--------------|----------------------
--- uuid-456        | 5      | Merchant Tom | A friendly merchant
-
 -- 주의:
 -- - CASCADE 관계가 있다면 관련 데이터도 함께 삭제됨
 --   (예: player_npc_relations에 ON DELETE CASCADE 설정 시)
 -- - 물리적 삭제이므로 복구 불가능
--- - 중요한 NPC는 soft delete 권장
-
--- 사용 예:
--- 스토리상 NPC가 떠날 때
--- 테스트 데이터 정리
--- GM이 동적으로 NPC 제거
@@ -0,0 +1,9 @@
+-- [용도] 시나리오 마스터 NPC 갱신 (증분 재주입)
+-- Parameters: $1 npc_id, $2 name, $3 description, $4 tags, $5 state
+UPDATE npc
+SET name = $2,
+    description = $3,
+    tags = $4,
+    state = $5
+WHERE npc_id = $1::UUID
+  AND session_id = '00000000-0000-0000-0000-000000000000';
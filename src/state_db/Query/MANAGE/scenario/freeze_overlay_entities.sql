@@ -0,0 +1,4 @@
+-- [용도] 변경/삭제 예정 마스터 NPC/Enemy를 오버레이 세션에 고정 (증분 재주입)
+-- [설명] Copy-on-Write 세션은 마스터 행을 그대로 읽으므로 반영 전에 세션 행으로 복제합니다.
+-- Parameters: $1 npc_id 목록, $2 enemy_id 목록
+SELECT freeze_master_npcs($1::UUID[]) + freeze_master_enemies($2::UUID[]) AS frozen_rows;
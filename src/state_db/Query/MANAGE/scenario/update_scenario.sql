@@ -0,0 +1,14 @@
+-- [용도] 시나리오 메타데이터 갱신 (증분 재주입)
+-- Parameters: $1 scenario_id, $2 title, $3 description, $4 author, $5 version,
+--             $6 difficulty, $7 genre, $8 tags, $9 total_acts
+UPDATE scenario
+SET title = $2,
+    description = $3,
+    author = $4,
+    version = $5,
+    difficulty = $6,
+    genre = $7,
+    tags = $8,
+    total_acts = $9,
+    updated_at = NOW()
+WHERE scenario_id = $1::UUID;
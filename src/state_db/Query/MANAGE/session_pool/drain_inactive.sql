@@ -0,0 +1,2 @@
+-- 비활성 시나리오의 미할당 세션 종료 및 풀 제거
+SELECT drain_session_pool() AS drained;
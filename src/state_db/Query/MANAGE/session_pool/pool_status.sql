@@ -0,0 +1,9 @@
+-- 활성 시나리오별 미할당 세션 수 (Session 0 마스터 시나리오 제외)
+SELECT
+    sc.scenario_id::text AS scenario_id,
+    COUNT(sp.session_id)::int AS pooled
+FROM scenario sc
+LEFT JOIN session_pool sp ON sp.scenario_id = sc.scenario_id
+WHERE sc.is_active = true
+  AND sc.scenario_id <> '00000000-0000-0000-0000-000000000000'
+GROUP BY sc.scenario_id;
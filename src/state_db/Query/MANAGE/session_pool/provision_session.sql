@@ -0,0 +1,2 @@
+-- 풀 보충: 세션 1건 사전 복제 (상한 도달 또는 다른 워커가 보충 중이면 NULL)
+SELECT provision_pooled_session($1::UUID, $2::INTEGER) AS session_id;
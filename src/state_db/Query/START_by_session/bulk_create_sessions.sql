@@ -0,0 +1,10 @@
+-- 동일 시나리오 세션 N개 일괄 생성 (집합 기반 복제, 단일 트랜잭션)
+-- $6 = false 이면 그래프 복제는 호출자(GraphLoader)가 수행
+SELECT create_sessions_bulk(
+    $1::UUID,
+    $2::INTEGER,
+    $3::INTEGER,
+    $4::INTEGER,
+    $5,
+    $6::BOOLEAN
+) AS session_ids;
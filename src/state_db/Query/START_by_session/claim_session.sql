@@ -0,0 +1,2 @@
+-- 사전 복제 세션 풀에서 세션 1건 할당 (풀이 비어 있으면 NULL)
+SELECT claim_pooled_session($1::UUID, $2::INTEGER, $3::INTEGER, $4) AS session_id;
@@ -1,11 +1,21 @@
+-- [용도] 세션 Phase 전환 이력 (오름차순, keyset 페이지네이션)
+-- [설명] session_phases(): 세션 기간 밖 월별 파티션은 스캔하지 않으며 아카이브된 세션도 조회
+--        같은 시각의 전환이 있을 수 있으므로 (transitioned_at, phase_id) 순서로 이어 읽음
+-- Parameters: $1 session_id, $2 after_transitioned_at, $3 after_phase_id, $4 limit
+--             ($2가 NULL이면 처음부터, $3이 NULL이면 $2 시각 이후부터, $4가 NULL이면 전체)
 SELECT
-    history_id,
+    phase_id,
     session_id,
     previous_phase,
     new_phase,
     turn_at_transition,
     transition_reason,
     transitioned_at
-FROM phase_history
-WHERE session_id = $1
-ORDER BY transitioned_at ASC;
+FROM session_phases($1::UUID)
+WHERE (
+      $2::TIMESTAMP IS NULL
+      OR (transitioned_at, phase_id)
+         > ($2::TIMESTAMP, COALESCE($3::UUID, 'ffffffff-ffff-ffff-ffff-ffffffffffff'::UUID))
+  )
+ORDER BY transitioned_at ASC, phase_id ASC
+LIMIT $4::INTEGER;
@@ -1,11 +1,11 @@
 -- [용도] 특정 Turn 범위 내에서 발생한 Phase 전환 추적
+-- Parameters: $1 session_id, $2 start_turn, $3 end_turn
 SELECT
     previous_phase,
     new_phase,
     turn_at_transition,
     transition_reason,
     transitioned_at
-FROM phase
-WHERE session_id = :session_id
-  AND turn_at_transition BETWEEN :start_turn AND :end_turn
+FROM session_phases($1::UUID)
+WHERE turn_at_transition BETWEEN $2 AND $3
 ORDER BY turn_at_transition ASC;
@@ -1,10 +1,10 @@
+-- Parameters: $1 session_id, $2 limit
 SELECT
     previous_phase,
     new_phase,
     turn_at_transition,
     transition_reason,
     transitioned_at
-FROM phase_history
-WHERE session_id = $1
+FROM session_phases($1::UUID)
 ORDER BY transitioned_at DESC
 LIMIT $2;
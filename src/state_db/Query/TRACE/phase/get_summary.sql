@@ -1,16 +1,13 @@
 -- [용도] 세션 종료 후 페이즈별 체류 요약 리포트
-WITH phase_summary AS (
-    SELECT
-        new_phase,
-        COUNT(*) AS transition_count,
-        MIN(transitioned_at) AS first_visit,
-        MAX(transitioned_at) AS last_visit
-    FROM phase
-    WHERE session_id = :session_id
-    GROUP BY new_phase
-)
+-- [대상] 세션별 이력 요약 테이블 (phase INSERT 시 트리거로 갱신, 이력 크기와 무관)
+-- Parameters: $1 session_id
 SELECT
-    ps.*,
-    (SELECT total_duration FROM get_phase_statistics(:session_id) WHERE phase = ps.new_phase) AS total_duration
-FROM phase_summary ps
-ORDER BY total_duration DESC;
+    ps.phase AS new_phase,
+    ps.transition_count,
+    ps.first_visit,
+    ps.last_visit,
+    stats.total_duration
+FROM session_phase_stats ps
+LEFT JOIN get_phase_statistics($1::UUID) stats ON stats.phase = ps.phase
+WHERE ps.session_id = $1::UUID
+ORDER BY stats.total_duration DESC NULLS LAST;
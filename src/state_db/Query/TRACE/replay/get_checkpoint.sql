@@ -0,0 +1,7 @@
+-- [용도] 리플레이 시작점: 조회 turn 이하에서 가장 가까운 세션 상태 체크포인트
+-- Parameters: $1 session_id, $2 turn_number
+SELECT turn_number, state
+FROM session_checkpoints($1::UUID)
+WHERE turn_number <= $2::INTEGER
+ORDER BY turn_number DESC
+LIMIT 1;
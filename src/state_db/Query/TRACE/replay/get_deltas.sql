@@ -0,0 +1,8 @@
+-- [용도] 리플레이 적용 대상: 체크포인트 이후 ~ 조회 turn까지의 변경 내역 (오름차순)
+-- [설명] session_turns(): 세션 기간 밖 월별 파티션은 스캔하지 않으며 아카이브된 세션도 조회
+-- Parameters: $1 session_id, $2 체크포인트 turn_number (제외), $3 조회 turn_number (포함)
+SELECT turn_number, phase_at_turn, turn_type, state_changes
+FROM session_turns($1::UUID)
+WHERE turn_number > $2::INTEGER
+  AND turn_number <= $3::INTEGER
+ORDER BY turn_number ASC;
@@ -1,3 +1,4 @@
+-- Parameters: $1 session_id, $2 turn_number
 SELECT turn_id, turn_number, phase_at_turn, turn_type, state_changes, related_entities, created_at
-FROM turn
-WHERE session_id = :session_id AND turn_number = :turn_number;
+FROM session_turns($1::UUID)
+WHERE turn_number = $2;
@@ -0,0 +1,10 @@
+-- [용도] 각 Turn의 소요 시간 (직전 Turn과의 간격) 분석
+-- Parameters: $1 session_id
+SELECT
+    turn_number,
+    phase_at_turn,
+    turn_type,
+    created_at,
+    created_at - LAG(created_at) OVER (ORDER BY turn_number) AS duration
+FROM session_turns($1::UUID)
+ORDER BY turn_number ASC;
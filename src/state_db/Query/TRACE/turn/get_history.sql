@@ -0,0 +1,9 @@
+-- [용도] 세션 Turn 이력 조회 (오름차순, keyset 페이지네이션)
+-- [설명] session_turns(): 세션 기간 밖 월별 파티션은 스캔하지 않으며 아카이브된 세션도 조회
+--        다음 페이지는 마지막 행의 turn_number를 $2로 전달 (OFFSET 없이 인덱스에서 이어 읽음)
+-- Parameters: $1 session_id, $2 after_turn (NULL이면 처음부터), $3 limit (NULL이면 전체)
+SELECT turn_id, turn_number, phase_at_turn, turn_type, state_changes, related_entities, created_at
+FROM session_turns($1::UUID)
+WHERE turn_number > COALESCE($2::INTEGER, -1)
+ORDER BY turn_number ASC
+LIMIT $3::INTEGER;
@@ -1,4 +1,4 @@
+-- Parameters: $1 session_id
 SELECT turn_number, phase_at_turn, turn_type, state_changes, created_at
-FROM turn
-WHERE session_id = :session_id
+FROM session_turns($1::UUID)
 ORDER BY turn_number DESC LIMIT 1;
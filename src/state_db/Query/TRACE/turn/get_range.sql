@@ -0,0 +1,6 @@
+-- [용도] Turn 범위 조회 (리플레이용)
+-- Parameters: $1 session_id, $2 start_turn, $3 end_turn
+SELECT turn_id, turn_number, phase_at_turn, turn_type, state_changes, related_entities, created_at
+FROM session_turns($1::UUID)
+WHERE turn_number BETWEEN $2 AND $3
+ORDER BY turn_number ASC;
@@ -1,6 +1,6 @@
 -- 최근 N개의 턴 조회 (UI용)
+-- Parameters: $1 session_id, $2 limit
 SELECT turn_number, phase_at_turn, turn_type, state_changes, created_at
-FROM turn
-WHERE session_id = :session_id
+FROM session_turns($1::UUID)
 ORDER BY turn_number DESC
-LIMIT :limit;
+LIMIT $2;
@@ -1,5 +1,5 @@
--- Phase별 진행된 턴 수 집계
-SELECT phase_at_turn, COUNT(*) AS turn_count
-FROM turn
-WHERE session_id = :session_id
-GROUP BY phase_at_turn;
+-- Phase별 진행된 턴 수 집계 (이력 요약 테이블)
+-- Parameters: $1 session_id
+SELECT phase_at_turn, turn_count
+FROM session_turn_phase_stats
+WHERE session_id = $1::UUID AND turn_count > 0;
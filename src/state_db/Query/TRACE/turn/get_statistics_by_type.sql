@@ -0,0 +1,6 @@
+-- Turn Type별 턴 수 집계 (이력 요약 테이블)
+-- Parameters: $1 session_id
+SELECT turn_type, turn_count
+FROM session_turn_type_stats
+WHERE session_id = $1::UUID AND turn_count > 0
+ORDER BY turn_count DESC;
@@ -1,14 +1,21 @@
 -- [용도] 세션 종료 후 플레이 리뷰 및 전체 통계 제공
--- [대상] 특정 세션의 모든 턴 데이터 분석
+-- [대상] 세션별 이력 요약 테이블 (turn INSERT 시 트리거로 갱신, 이력 크기와 무관)
+-- Parameters: $1 session_id
 
 SELECT
-    COUNT(*) AS total_turns,
-    COUNT(DISTINCT phase_at_turn) AS phases_used,
-    COUNT(DISTINCT turn_type) AS turn_types_used,
-    MIN(created_at) AS first_turn_at,
-    MAX(created_at) AS last_turn_at,
-    MAX(created_at) - MIN(created_at) AS total_session_duration,
+    COALESCE(hs.total_turns, 0) AS total_turns,
+    (
+        SELECT COUNT(*) FROM session_turn_phase_stats
+        WHERE session_id = $1::UUID AND turn_count > 0
+    ) AS phases_used,
+    (
+        SELECT COUNT(*) FROM session_turn_type_stats
+        WHERE session_id = $1::UUID AND turn_count > 0
+    ) AS turn_types_used,
+    hs.first_turn_at,
+    hs.last_turn_at,
+    hs.last_turn_at - hs.first_turn_at AS total_session_duration,
     -- 턴당 평균 소요 시간 계산 (0으로 나누기 방지)
-    (MAX(created_at) - MIN(created_at)) / NULLIF(COUNT(*), 0) AS avg_turn_duration
-FROM turn
-WHERE session_id = :session_id;
+    (hs.last_turn_at - hs.first_turn_at) / NULLIF(hs.total_turns, 0) AS avg_turn_duration
+FROM (SELECT $1::UUID AS session_id) target
+LEFT JOIN session_history_stats hs ON hs.session_id = target.session_id;
@@ -1,6 +1,11 @@
--- 특정 턴 이후 데이터 삭제 (Rollback)
-DELETE FROM turn
-WHERE session_id = :session_id AND turn_number > :target_turn;
-
--- 세션 카운터도 함께 맞춰줌
-UPDATE session SET current_turn = :target_turn WHERE session_id = :session_id;
+-- [작업] N번 turn 종료 시점으로 세션 상태 되돌리기 (Rollback)
+-- [기능] turn_undo_log의 변경 전 이미지를 역순 적용하여 HP / 인벤토리 / 호감도 / Enemy /
+--       세션 진행 상태를 복원하고, N 이후의 turn 이력과 체크포인트를 삭제한 뒤 current_turn을 맞춤
+-- Parameters: $1 session_id, $2 target_turn
+SELECT
+    $1::UUID::TEXT AS session_id,
+    $2::INTEGER AS target_turn,
+    previous_turn,
+    undone_turns,
+    undone_changes
+FROM rollback_to_turn($1::UUID, $2::INTEGER);
@@ -0,0 +1,8 @@
+-- --------------------------------------------------------------------
+-- apply_state_changes.sql
+-- 판정 결과(state_changes) 일괄 적용 (단일 트랜잭션, 1 round trip)
+-- $1: session_id, $2: state_changes (JSONB)
+-- 반환: updated_fields (세션이 없으면 NULL)
+-- --------------------------------------------------------------------
+
+SELECT apply_state_changes($1::UUID, $2::JSONB) AS updated_fields;
@@ -1,5 +1,5 @@
 -- 1. 수치 업데이트 (state JSONB 내부 HP 수정)
--- $1: enemy_id, $2: session_id, $3: hp_change
+-- $1: enemy_id (materialize_enemy로 확보한 세션 행 ID), $2: session_id, $3: hp_change
 UPDATE enemy
 SET state = jsonb_set(
     state,
@@ -8,6 +8,6 @@ SET state = jsonb_set(
 )
 WHERE enemy_id = $1 AND session_id = $2
 RETURNING
-    enemy_id AS enemy_instance_id,
+    COALESCE(source_enemy_id, enemy_id) AS enemy_instance_id,
     (state->'numeric'->>'HP')::int AS current_hp,
     ((state->'numeric'->>'HP')::int <= 0) AS is_defeated;
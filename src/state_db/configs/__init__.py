@@ -13,7 +13,30 @@ from state_db.configs.setting import (
     DB_PASSWORD,
     DB_PORT,
     DB_USER,
+    ENTITY_COPY_ON_WRITE,
+    HISTORY_PARTITION_MONTHS_AHEAD,
+    HISTORY_RETENTION_DAYS,
+    HISTORY_RETENTION_DROP,
+    INVALIDATION_CHANNEL,
+    INVALIDATION_HEARTBEAT_SECONDS,
+    INVALIDATION_LISTENER_ENABLED,
+    INVALIDATION_RECONNECT_MAX_SECONDS,
+    ITEM_CATALOG_ENABLED,
+    LIST_PAGE_DEFAULT_LIMIT,
+    LIST_PAGE_MAX_LIMIT,
     REDIS_PORT,
+    SCENARIO_INJECT_BATCH_SIZE,
+    SESSION_ARCHIVE_AFTER_DAYS,
+    SESSION_ARCHIVE_BATCH_SIZE,
+    SESSION_CACHE_ENABLED,
+    SESSION_CACHE_MAX_SIZE,
+    SESSION_CACHE_TTL_SECONDS,
+    SESSION_POOL_ENABLED,
+    SESSION_POOL_HIGH_WATERMARK,
+    SESSION_POOL_LOW_WATERMARK,
+    SESSION_POOL_REFILL_INTERVAL_SECONDS,
+    STREAM_CURSOR_PREFETCH,
+    TURN_CHECKPOINT_INTERVAL,
 )
 
 __all__ = [
@@ -34,4 +57,37 @@ __all__ = [
     "DB_CONFIG",
     # Apache AGE
     "AGE_GRAPH_NAME",
+    # Session Cache
+    "SESSION_CACHE_ENABLED",
+    "SESSION_CACHE_MAX_SIZE",
+    "SESSION_CACHE_TTL_SECONDS",
+    # Cache Invalidation
+    "INVALIDATION_LISTENER_ENABLED",
+    "INVALIDATION_CHANNEL",
+    "INVALIDATION_HEARTBEAT_SECONDS",
+    "INVALIDATION_RECONNECT_MAX_SECONDS",
+    # Session Pool
+    "SESSION_POOL_ENABLED",
+    "SESSION_POOL_LOW_WATERMARK",
+    "SESSION_POOL_HIGH_WATERMARK",
+    "SESSION_POOL_REFILL_INTERVAL_SECONDS",
+    # Entity Overlay
+    "ENTITY_COPY_ON_WRITE",
+    # Item Catalog
+    "ITEM_CATALOG_ENABLED",
+    # Scenario Injection
+    "SCENARIO_INJECT_BATCH_SIZE",
+    # History Partitions
+    "HISTORY_PARTITION_MONTHS_AHEAD",
+    "HISTORY_RETENTION_DAYS",
+    "HISTORY_RETENTION_DROP",
+    # List Pagination
+    "LIST_PAGE_DEFAULT_LIMIT",
+    "LIST_PAGE_MAX_LIMIT",
+    "STREAM_CURSOR_PREFETCH",
+    # Replay Checkpoints
+    "TURN_CHECKPOINT_INTERVAL",
+    # Session Archive
+    "SESSION_ARCHIVE_AFTER_DAYS",
+    "SESSION_ARCHIVE_BATCH_SIZE",
 ]
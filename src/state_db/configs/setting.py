@@ -25,6 +25,87 @@ APP_HOST = os.getenv("APP_HOST", "0.0.0.0")
 APP_PORT = int(os.getenv("APP_PORT", 8030))
 APP_ENV = os.getenv("APP_ENV", "local")
 
+# ====================================================================
+# 인메모리 세션 상태 캐시 (LRU + TTL)
+# ====================================================================
+SESSION_CACHE_ENABLED = os.getenv("SESSION_CACHE_ENABLED", "true").lower() == "true"
+SESSION_CACHE_MAX_SIZE = int(os.getenv("SESSION_CACHE_MAX_SIZE", 10000))
+SESSION_CACHE_TTL_SECONDS = float(os.getenv("SESSION_CACHE_TTL_SECONDS", 30))
+
+# ====================================================================
+# 워커 간 캐시 무효화 (Postgres LISTEN/NOTIFY)
+# ====================================================================
+INVALIDATION_LISTENER_ENABLED = (
+    os.getenv("INVALIDATION_LISTENER_ENABLED", "true").lower() == "true"
+)
+INVALIDATION_CHANNEL = os.getenv("INVALIDATION_CHANNEL", "state_invalidation")
+INVALIDATION_HEARTBEAT_SECONDS = float(os.getenv("INVALIDATION_HEARTBEAT_SECONDS", 5))
+INVALIDATION_RECONNECT_MAX_SECONDS = float(
+    os.getenv("INVALIDATION_RECONNECT_MAX_SECONDS", 30)
+)
+
+# ====================================================================
+# 사전 복제 세션 풀 (시나리오별 미할당 세션)
+# ====================================================================
+SESSION_POOL_ENABLED = os.getenv("SESSION_POOL_ENABLED", "false").lower() == "true"
+# 미할당 세션 수가 LOW 미만으로 떨어지면 HIGH까지 보충
+SESSION_POOL_LOW_WATERMARK = int(os.getenv("SESSION_POOL_LOW_WATERMARK", 2))
+SESSION_POOL_HIGH_WATERMARK = int(os.getenv("SESSION_POOL_HIGH_WATERMARK", 5))
+SESSION_POOL_REFILL_INTERVAL_SECONDS = float(
+    os.getenv("SESSION_POOL_REFILL_INTERVAL_SECONDS", 10)
+)
+
+# ====================================================================
+# NPC/Enemy Copy-on-Write 오버레이 (신규 세션 기본 모드)
+# ====================================================================
+# true면 세션 시작 시 Session 0의 NPC/Enemy를 복제하지 않고,
+# 최초 변경 시점에만 세션 행을 생성합니다 (Query/BASE/L_entity_overlay.sql).
+ENTITY_COPY_ON_WRITE = os.getenv("ENTITY_COPY_ON_WRITE", "false").lower() == "true"
+
+# ====================================================================
+# 시나리오 아이템 카탈로그 (인메모리, 시나리오별 아이템 정의)
+# ====================================================================
+ITEM_CATALOG_ENABLED = os.getenv("ITEM_CATALOG_ENABLED", "true").lower() == "true"
+
+# ====================================================================
+# 시나리오 일괄 주입
+# ====================================================================
+# 그래프 Vertex/Edge를 UNWIND 한 번에 생성하는 최대 행 수
+SCENARIO_INJECT_BATCH_SIZE = int(os.getenv("SCENARIO_INJECT_BATCH_SIZE", 500))
+
+# ====================================================================
+# turn / phase 이력 파티션 및 보존 정책
+# ====================================================================
+# 스키마 초기화 시 현재 월 이후로 미리 만들어 둘 월별 파티션 수
+HISTORY_PARTITION_MONTHS_AHEAD = int(os.getenv("HISTORY_PARTITION_MONTHS_AHEAD", 3))
+# 보존 기간이 지난 파티션(모든 세션 종료)은 분리(detach), DROP=true면 삭제
+HISTORY_RETENTION_DAYS = int(os.getenv("HISTORY_RETENTION_DAYS", 180))
+HISTORY_RETENTION_DROP = os.getenv("HISTORY_RETENTION_DROP", "false").lower() == "true"
+
+# ====================================================================
+# 목록 조회 페이지네이션 및 스트리밍
+# ====================================================================
+# limit 미지정 시 한 페이지 행 수 / 요청 가능한 최대 행 수
+LIST_PAGE_DEFAULT_LIMIT = int(os.getenv("LIST_PAGE_DEFAULT_LIMIT", 100))
+LIST_PAGE_MAX_LIMIT = int(os.getenv("LIST_PAGE_MAX_LIMIT", 1000))
+# stream=true 응답에서 서버 측 커서가 한 번에 가져오는 행 수
+STREAM_CURSOR_PREFETCH = int(os.getenv("STREAM_CURSOR_PREFETCH", 500))
+
+# ====================================================================
+# 세션 상태 체크포인트 (리플레이)
+# ====================================================================
+# K turn마다 세션 전체 상태를 저장 (0 이하면 0번 turn 체크포인트만 기록)
+# 특정 turn 상태 재구성 시 최대 K-1개 turn만 다시 적용합니다.
+TURN_CHECKPOINT_INTERVAL = int(os.getenv("TURN_CHECKPOINT_INTERVAL", 10))
+
+# ====================================================================
+# 종료 세션 아카이브
+# ====================================================================
+# 종료 후 보관 기간이 지난 세션을 session_archive 1행으로 옮기고 원본 행을 삭제
+# 한 번의 작업에서 처리할 최대 세션 수 (세션마다 별도 트랜잭션)
+SESSION_ARCHIVE_AFTER_DAYS = int(os.getenv("SESSION_ARCHIVE_AFTER_DAYS", 7))
+SESSION_ARCHIVE_BATCH_SIZE = int(os.getenv("SESSION_ARCHIVE_BATCH_SIZE", 100))
+
 # ====================================================================
 # 데이터베이스 포트
 # ====================================================================
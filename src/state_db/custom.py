@@ -1,10 +1,12 @@
 # src/gm/state_db/custom.py
-# CustomStatus, CommonResponse, WrappedResponse, CustomJSONResponse 정의
+# CustomStatus, CommonResponse, WrappedResponse, CustomJSONResponse,
+# NDJSONStreamingResponse 정의
 
 from enum import Enum
-from typing import Any, Dict, Generic, Optional, TypeVar
+from typing import Any, AsyncIterator, Dict, Generic, Optional, TypeVar
 
-from fastapi.responses import JSONResponse
+import orjson
+from fastapi.responses import JSONResponse, StreamingResponse
 from pydantic import BaseModel, ConfigDict, Field
 
 # ====================================================================
@@ -111,3 +113,36 @@ class CustomJSONResponse(JSONResponse):
             media_type=media_type,
             background=background,
         )
+
+
+# ====================================================================
+# NDJSON 스트리밍 응답 (목록 조회 stream=true)
+# ====================================================================
+
+
+class NDJSONStreamingResponse(StreamingResponse):
+    """
+    행(dict) 비동기 이터레이터를 한 줄에 하나씩 application/x-ndjson으로 전송
+
+    목록 전체를 메모리에 모으지 않으므로 {status, data} 래핑 없이 행만 보냅니다.
+    """
+
+    media_type = "application/x-ndjson"
+
+    def __init__(
+        self,
+        rows: AsyncIterator[Dict[str, Any]],
+        status_code: int = 200,
+        headers: Optional[Dict[str, Any]] = None,
+    ) -> None:
+        super().__init__(
+            _encode_ndjson(rows),
+            status_code=status_code,
+            headers=headers,
+            media_type=self.media_type,
+        )
+
+
+async def _encode_ndjson(rows: AsyncIterator[Dict[str, Any]]) -> AsyncIterator[bytes]:
+    async for row in rows:
+        yield orjson.dumps(row) + b"\n"
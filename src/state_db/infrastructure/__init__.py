@@ -1,31 +1,68 @@
+from state_db.infrastructure.cache import SESSION_CACHE, SessionStateCache, TTLCache
 from state_db.infrastructure.database import (
-    SQL_CACHE,
     DatabaseManager,
     execute_sql_function,
     init_age_graph,
+    init_connection,
     load_queries,
     run_cypher_query,
     run_raw_command,
     run_raw_query,
     run_sql_command,
     run_sql_query,
-    set_age_path,
     shutdown,
     startup,
+    stream_sql_query,
+    wrap_cypher,
 )
+from state_db.infrastructure.graph_loader import GraphLoader
+from state_db.infrastructure.history_retention import (
+    apply_history_retention,
+    maintain_history_partitions,
+)
+from state_db.infrastructure.history_stats import rebuild_history_stats
+from state_db.infrastructure.item_catalog import ITEM_CATALOG, ItemCatalog
+from state_db.infrastructure.phase_rules import PHASE_RULES, PhaseRulesMatrix
+from state_db.infrastructure.query_registry import (
+    QUERY_REGISTRY,
+    QueryRegistry,
+    RegisteredQuery,
+)
+from state_db.infrastructure.session_archive import archive_ended_sessions
+from state_db.infrastructure.session_pool import SESSION_POOL, SessionPoolRefiller
+from state_db.infrastructure.unit_of_work import UnitOfWork
 
 __all__ = [
-    "SQL_CACHE",
+    "SESSION_CACHE",
+    "SessionStateCache",
+    "TTLCache",
+    "ITEM_CATALOG",
+    "ItemCatalog",
+    "PHASE_RULES",
+    "PhaseRulesMatrix",
+    "QUERY_REGISTRY",
+    "QueryRegistry",
+    "RegisteredQuery",
+    "SESSION_POOL",
+    "SessionPoolRefiller",
     "DatabaseManager",
+    "UnitOfWork",
+    "GraphLoader",
+    "maintain_history_partitions",
+    "apply_history_retention",
+    "rebuild_history_stats",
+    "archive_ended_sessions",
     "init_age_graph",
+    "init_connection",
     "load_queries",
     "run_sql_query",
     "run_raw_query",
+    "stream_sql_query",
     "run_sql_command",
     "run_raw_command",
     "run_cypher_query",
+    "wrap_cypher",
     "execute_sql_function",
-    "set_age_path",
     "startup",
     "shutdown",
 ]
@@ -0,0 +1,180 @@
+import logging
+import time
+from collections import OrderedDict
+from threading import RLock
+from typing import Any, Callable, Dict, Generic, Hashable, Optional, Tuple, TypeVar
+
+from state_db.configs.setting import (
+    SESSION_CACHE_ENABLED,
+    SESSION_CACHE_MAX_SIZE,
+    SESSION_CACHE_TTL_SECONDS,
+)
+
+from .database import DatabaseManager, InvalidationMessage, current_unit_of_work
+
+logger = logging.getLogger("state_db.infrastructure.cache")
+
+V = TypeVar("V")
+
+
+class TTLCache(Generic[V]):
+    """
+    LRU + TTL 인메모리 캐시
+
+    - max_size 초과 시 가장 오래 사용되지 않은 항목부터 제거(eviction)
+    - ttl_seconds 경과한 항목은 조회 시점에 만료 처리(expiration)
+    - hits / misses / evictions / expirations / invalidations 카운터 제공
+    """
+
+    def __init__(
+        self,
+        max_size: int,
+        ttl_seconds: float,
+        clock: Callable[[], float] = time.monotonic,
+    ) -> None:
+        self.max_size = max_size
+        self.ttl_seconds = ttl_seconds
+        self._clock = clock
+        self._data: "OrderedDict[Hashable, Tuple[float, V]]" = OrderedDict()
+        self._lock = RLock()
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self.expirations = 0
+        self.invalidations = 0
+
+    def get(self, key: Hashable) -> Optional[V]:
+        with self._lock:
+            item = self._data.get(key)
+            if item is None:
+                self.misses += 1
+                return None
+            expires_at, value = item
+            if expires_at <= self._clock():
+                del self._data[key]
+                self.expirations += 1
+                self.misses += 1
+                return None
+            self._data.move_to_end(key)
+            self.hits += 1
+            return value
+
+    def set(self, key: Hashable, value: V) -> None:
+        if self.max_size <= 0:
+            return
+        with self._lock:
+            self._data[key] = (self._clock() + self.ttl_seconds, value)
+            self._data.move_to_end(key)
+            while len(self._data) > self.max_size:
+                self._data.popitem(last=False)
+                self.evictions += 1
+
+    def invalidate(self, key: Hashable) -> bool:
+        with self._lock:
+            if self._data.pop(key, None) is None:
+                return False
+            self.invalidations += 1
+            return True
+
+    def clear(self) -> None:
+        with self._lock:
+            self.invalidations += len(self._data)
+            self._data.clear()
+
+    def __len__(self) -> int:
+        return len(self._data)
+
+    def __contains__(self, key: object) -> bool:
+        return key in self._data
+
+    def stats(self) -> Dict[str, Any]:
+        with self._lock:
+            lookups = self.hits + self.misses
+            return {
+                "size": len(self._data),
+                "max_size": self.max_size,
+                "ttl_seconds": self.ttl_seconds,
+                "hits": self.hits,
+                "misses": self.misses,
+                "hit_ratio": round(self.hits / lookups, 4) if lookups else 0.0,
+                "evictions": self.evictions,
+                "expirations": self.expirations,
+                "invalidations": self.invalidations,
+            }
+
+
+class SessionStateCache:
+    """
+    session_id 단위 세션 상태 캐시
+
+    세션별로 SessionInfo("info"), PhaseChangeResult("phase"),
+    TurnAddResult("turn")를 (session_id, kind) 키로 보관하며,
+    무효화는 세션 단위(모든 kind)로 동작합니다.
+    """
+
+    KINDS = ("info", "phase", "turn")
+
+    # 세션 상태에 반영되는 테이블 (그 외 테이블 알림은 무시)
+    TABLES = frozenset({"session", "player", "npc", "enemy", "player_inventory"})
+
+    def __init__(self, max_size: int, ttl_seconds: float, enabled: bool = True):
+        self.enabled = enabled
+        self._cache: TTLCache[Any] = TTLCache(max_size, ttl_seconds)
+
+    def get(self, session_id: Any, kind: str) -> Optional[Any]:
+        if not self.enabled or DatabaseManager.invalidation_degraded():
+            return None
+        return self._cache.get((str(session_id), kind))
+
+    def put(self, session_id: Any, kind: str, value: Any) -> None:
+        if not self.enabled or DatabaseManager.invalidation_degraded():
+            # 무효화 리스너가 끊긴 동안에는 다른 워커의 변경을 알 수 없음
+            return
+        unit_of_work = current_unit_of_work.get()
+        if unit_of_work is not None and unit_of_work.transactional:
+            # commit 전의 값은 다른 요청에 노출하지 않음
+            return
+        self._cache.set((str(session_id), kind), value)
+
+    def invalidate(self, session_id: Any) -> None:
+        """세션 상태 무효화 (트랜잭션 진행 중이면 종료 시점에 한 번 더 무효화)"""
+        key = str(session_id)
+        self._invalidate_key(key)
+        unit_of_work = current_unit_of_work.get()
+        if unit_of_work is not None and unit_of_work.transactional:
+            # commit 이전에 다른 요청이 이전 값을 다시 캐시하는 경우 방지
+            unit_of_work.add_exit_callback(lambda: self._invalidate_key(key))
+
+    def _invalidate_key(self, session_id: str) -> None:
+        for kind in self.KINDS:
+            self._cache.invalidate((session_id, kind))
+
+    def clear(self) -> None:
+        self._cache.clear()
+        logger.debug("Session state cache flushed")
+
+    def apply_invalidation(self, message: Optional[InvalidationMessage]) -> None:
+        """
+        워커 간 무효화 메시지 적용 (DatabaseManager 리스너 핸들러)
+
+        session/player/npc/enemy/player_inventory 변경 알림은 해당 세션 전체를,
+        None(리스너 재연결 등)은 캐시 전체를 무효화합니다.
+        """
+        if message is not None and message.table not in self.TABLES:
+            return
+        if message is None or message.session_id is None:
+            self.clear()
+        else:
+            self._invalidate_key(message.session_id)
+
+    def stats(self) -> Dict[str, Any]:
+        return {"enabled": self.enabled, **self._cache.stats()}
+
+
+# 애플리케이션(워커 프로세스) 전역 세션 상태 캐시
+SESSION_CACHE = SessionStateCache(
+    max_size=SESSION_CACHE_MAX_SIZE,
+    ttl_seconds=SESSION_CACHE_TTL_SECONDS,
+    enabled=SESSION_CACHE_ENABLED,
+)
+DatabaseManager.add_invalidation_handler(SESSION_CACHE.apply_invalidation)
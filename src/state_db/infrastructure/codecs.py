@@ -0,0 +1,83 @@
+import json
+import logging
+import re
+from typing import Any
+
+import asyncpg
+import orjson
+
+logger = logging.getLogger("state_db.infrastructure.codecs")
+
+# agtype 텍스트의 타입 주석(::vertex 등). 문자열 리터럴은 함께 매칭하여 그대로 둠
+_AGTYPE_TOKEN = re.compile(r'"(?:[^"\\]|\\.)*"|::(?:vertex|edge|path|numeric)\b')
+
+# dict 키가 문자열이 아닌 경우(int 등)도 그대로 직렬화
+_ORJSON_OPTIONS = orjson.OPT_NON_STR_KEYS
+
+
+def json_encode(value: Any) -> str:
+    """Python 객체 -> JSON 텍스트 (asyncpg text 포맷)"""
+    return orjson.dumps(value, option=_ORJSON_OPTIONS).decode("utf-8")
+
+
+def json_decode(value: str) -> Any:
+    """JSON 텍스트 -> Python 객체"""
+    return orjson.loads(value)
+
+
+async def register_json_codecs(conn: asyncpg.Connection) -> None:
+    """
+    json/jsonb 타입 코덱 등록
+
+    조회 결과의 json/jsonb 컬럼은 dict/list로, 파라미터는 Python 객체 그대로 전달합니다.
+    (레포지토리에서 json.dumps/json.loads를 직접 호출하지 않습니다.)
+    """
+    for type_name in ("json", "jsonb"):
+        await conn.set_type_codec(
+            type_name,
+            schema="pg_catalog",
+            encoder=json_encode,
+            decoder=json_decode,
+            format="text",
+        )
+
+
+def _strip_agtype_annotation(match: "re.Match[str]") -> str:
+    token = match.group(0)
+    return token if token.startswith('"') else ""
+
+
+def agtype_decode(value: str) -> Any:
+    """
+    agtype 텍스트 -> Python 객체
+
+    vertex/edge는 {"id", "label", "properties"(, "start_id", "end_id")} dict로,
+    path는 vertex/edge가 번갈아 나오는 list로 변환됩니다.
+    """
+    text = _AGTYPE_TOKEN.sub(_strip_agtype_annotation, value)
+    try:
+        return orjson.loads(text)
+    except orjson.JSONDecodeError:
+        # NaN / Infinity 등 orjson이 지원하지 않는 float 표기
+        return json.loads(text)
+
+
+async def register_agtype_codec(conn: asyncpg.Connection) -> bool:
+    """
+    Apache AGE agtype 코덱 등록
+
+    Cypher 결과는 ::text 캐스팅 없이 Python 객체로, 파라미터 맵($1)은 dict로 전달합니다.
+    AGE extension 생성 전의 커넥션에서는 등록하지 않고 False를 반환합니다.
+    """
+    try:
+        await conn.set_type_codec(
+            "agtype",
+            schema="ag_catalog",
+            encoder=json_encode,
+            decoder=agtype_decode,
+            format="text",
+        )
+    except ValueError:
+        logger.debug("agtype is not available yet; codec registration skipped")
+        return False
+    return True
@@ -1,16 +1,64 @@
+import asyncio
 import logging
 from contextlib import asynccontextmanager
+from contextvars import ContextVar
+from dataclasses import dataclass
+from functools import lru_cache
 from pathlib import Path
-from typing import Any, Dict, List, Optional, Union
+from typing import Any, AsyncIterator, Callable, Dict, List, Optional, Union
 
 import asyncpg
 
-from state_db.configs.setting import AGE_GRAPH_NAME, DB_CONFIG
+from state_db.configs.setting import (
+    AGE_GRAPH_NAME,
+    DB_CONFIG,
+    ENTITY_COPY_ON_WRITE,
+    INVALIDATION_CHANNEL,
+    INVALIDATION_HEARTBEAT_SECONDS,
+    INVALIDATION_LISTENER_ENABLED,
+    INVALIDATION_RECONNECT_MAX_SECONDS,
+    STREAM_CURSOR_PREFETCH,
+    TURN_CHECKPOINT_INTERVAL,
+)
+
+from .codecs import json_decode, register_agtype_codec, register_json_codecs
+from .query_registry import QUERY_REGISTRY
 
 logger = logging.getLogger("state_db.infrastructure.database")
 
-# SQL 쿼리 캐시
-SQL_CACHE: Dict[str, str] = {}
+# 커넥션별 prepared statement 캐시 크기 (등록된 SQL 파일 수보다 넉넉하게)
+STATEMENT_CACHE_SIZE = 512
+
+# 커넥션 생성 시 startup 패킷으로 전달되는 세션 GUC
+# startup 패킷 값은 세션 기본값이 되므로 풀 반환 시의 RESET ALL 이후에도 유지됩니다.
+SESSION_SETTINGS: Dict[str, str] = {
+    "search_path": 'public, ag_catalog, "$user"',
+    "application_name": "state-manager",
+    # 신규 세션의 NPC/Enemy Copy-on-Write 모드 (is_entity_overlay_default)
+    "state_db.entity_overlay": "on" if ENTITY_COPY_ON_WRITE else "off",
+    # K turn마다 세션 상태 체크포인트 기록 (checkpoint_interval)
+    "state_db.checkpoint_interval": str(TURN_CHECKPOINT_INTERVAL),
+}
+
+
+# 현재 요청(Task)에 바인딩된 Unit of Work (unit_of_work.UnitOfWork)
+# 바인딩되어 있으면 get_connection은 풀 대신 Unit of Work의 커넥션을 공유합니다.
+current_unit_of_work: ContextVar[Optional[Any]] = ContextVar(
+    "current_unit_of_work", default=None
+)
+
+
+@dataclass(frozen=True)
+class InvalidationMessage:
+    """워커 간 캐시 무효화 메시지 (L_notify.sql 트리거 페이로드)"""
+
+    table: str
+    session_id: Optional[str]
+    version: int
+
+
+# 무효화 핸들러: 메시지를 받으면 해당 세션을, None을 받으면 전체 캐시를 비웁니다.
+InvalidationHandler = Callable[[Optional[InvalidationMessage]], None]
 
 
 class DatabaseManager:
@@ -18,6 +66,12 @@ class DatabaseManager:
 
     _pool: Optional[asyncpg.Pool] = None
 
+    # 캐시 무효화 리스너 (LISTEN 전용 커넥션)
+    _listener_task: Optional["asyncio.Task[None]"] = None
+    _listener_connected: bool = False
+    _invalidation_handlers: List[InvalidationHandler] = []
+    _last_invalidation_version: int = 0
+
     @classmethod
     async def get_pool(cls) -> asyncpg.Pool:
         if cls._pool is None:
@@ -27,6 +81,9 @@ class DatabaseManager:
                 min_size=2,
                 max_size=10,
                 command_timeout=60,
+                statement_cache_size=STATEMENT_CACHE_SIZE,
+                server_settings=SESSION_SETTINGS,
+                init=init_connection,
             )
         return cls._pool
 
@@ -37,17 +94,146 @@ class DatabaseManager:
             await cls._pool.close()
             cls._pool = None
 
+    # ----------------------------------------------------------------
+    # 워커 간 캐시 무효화 (LISTEN/NOTIFY)
+    # ----------------------------------------------------------------
+
+    @classmethod
+    def add_invalidation_handler(cls, handler: InvalidationHandler) -> None:
+        """무효화 핸들러 등록 (캐시 모듈에서 import 시점에 등록)"""
+        if handler not in cls._invalidation_handlers:
+            cls._invalidation_handlers.append(handler)
+
+    @classmethod
+    def invalidation_degraded(cls) -> bool:
+        """
+        리스너가 실행 중이지만 연결이 끊긴 상태인지 여부
+
+        이 동안에는 다른 워커의 변경을 수신할 수 없으므로 캐시를 우회해야 합니다.
+        리스너를 사용하지 않는 경우(단일 워커, 테스트)는 False입니다.
+        """
+        return cls._listener_task is not None and not cls._listener_connected
+
+    @classmethod
+    def listener_status(cls) -> Dict[str, Any]:
+        return {
+            "enabled": cls._listener_task is not None,
+            "connected": cls._listener_connected,
+            "channel": INVALIDATION_CHANNEL,
+            "last_version": cls._last_invalidation_version,
+        }
+
+    @classmethod
+    async def start_listener(cls) -> None:
+        if not INVALIDATION_LISTENER_ENABLED or cls._listener_task is not None:
+            return
+        cls._listener_task = asyncio.create_task(
+            cls._listen_forever(), name="state-invalidation-listener"
+        )
+
+    @classmethod
+    async def stop_listener(cls) -> None:
+        task, cls._listener_task = cls._listener_task, None
+        if task is not None:
+            task.cancel()
+            try:
+                await task
+            except asyncio.CancelledError:
+                pass
+        cls._listener_connected = False
+
+    @classmethod
+    def _dispatch_invalidation(cls, message: Optional[InvalidationMessage]) -> None:
+        for handler in cls._invalidation_handlers:
+            try:
+                handler(message)
+            except Exception as e:
+                logger.error(f"Invalidation handler failed: {e}")
+
+    @classmethod
+    def _on_notification(cls, conn: Any, pid: int, channel: str, payload: str) -> None:
+        try:
+            data = json_decode(payload)
+            message = InvalidationMessage(
+                table=data["t"],
+                session_id=data.get("s"),
+                version=int(data.get("v") or 0),
+            )
+        except Exception as e:
+            # 해석할 수 없는 메시지는 안전하게 전체 무효화
+            logger.warning(f"Malformed invalidation payload {payload!r}: {e}")
+            cls._dispatch_invalidation(None)
+            return
+        cls._last_invalidation_version = max(
+            cls._last_invalidation_version, message.version
+        )
+        cls._dispatch_invalidation(message)
+
+    @classmethod
+    async def _listen_forever(cls) -> None:
+        """
+        LISTEN 전용 커넥션 유지 루프
+
+        - 연결(재연결) 직후와 연결 끊김 시 전체 캐시를 비웁니다(누락된 알림 대비).
+        - heartbeat 주기로 연결을 확인하므로, 끊김 감지까지의 지연은
+          INVALIDATION_HEARTBEAT_SECONDS 이내로 제한됩니다.
+        - 재연결은 지수 백오프(최대 INVALIDATION_RECONNECT_MAX_SECONDS)로 시도합니다.
+        """
+        backoff = 1.0
+        while True:
+            conn: Optional[asyncpg.Connection] = None
+            try:
+                conn = await asyncpg.connect(
+                    **DB_CONFIG, server_settings=SESSION_SETTINGS
+                )
+                await conn.add_listener(INVALIDATION_CHANNEL, cls._on_notification)
+                cls._listener_connected = True
+                cls._dispatch_invalidation(None)
+                logger.info(
+                    f"Listening for cache invalidation on '{INVALIDATION_CHANNEL}'"
+                )
+                backoff = 1.0
+                while not conn.is_closed():
+                    await asyncio.sleep(INVALIDATION_HEARTBEAT_SECONDS)
+                    await conn.execute("SELECT 1")
+            except asyncio.CancelledError:
+                raise
+            except Exception as e:
+                logger.warning(f"Invalidation listener disconnected: {e}")
+            finally:
+                if cls._listener_connected:
+                    cls._listener_connected = False
+                    cls._dispatch_invalidation(None)
+                if conn is not None and not conn.is_closed():
+                    await conn.close(timeout=5)
+            await asyncio.sleep(backoff)
+            backoff = min(backoff * 2, INVALIDATION_RECONNECT_MAX_SECONDS)
+
     @classmethod
     @asynccontextmanager
     async def get_connection(cls) -> Any:
+        unit_of_work = current_unit_of_work.get()
+        if unit_of_work is not None:
+            yield await unit_of_work.connection()
+            return
+
         pool = await cls.get_pool()
         async with pool.acquire() as connection:
             yield connection
 
 
-async def set_age_path(conn: asyncpg.Connection) -> None:
-    """Apache AGE 사용을 위한 search_path 설정 (public 테이블 우선)"""
-    await conn.execute('SET search_path = public, ag_catalog, "$user";')
+async def init_connection(conn: asyncpg.Connection) -> None:
+    """
+    풀 커넥션 생성 시 1회 실행되는 초기화 훅
+
+    search_path 등 세션 GUC는 SESSION_SETTINGS로 접속 시점에 설정되고,
+    여기서는 RESET ALL로 되돌아가지 않는 백엔드 상태(AGE 라이브러리 로드)와
+    json/jsonb/agtype 타입 코덱만 준비합니다.
+    따라서 쿼리마다 SET을 다시 보낼 필요가 없습니다.
+    """
+    await conn.execute("LOAD 'age';")
+    await register_json_codecs(conn)
+    await register_agtype_codec(conn)
 
 
 async def init_age_graph() -> None:
@@ -57,7 +243,6 @@ async def init_age_graph() -> None:
         await conn.execute("CREATE EXTENSION IF NOT EXISTS age CASCADE;")
         await conn.execute("LOAD 'age';")
 
-        await set_age_path(conn)
         graph_exists = await conn.fetchval(
             "SELECT EXISTS (SELECT 1 FROM ag_catalog.ag_graph WHERE name = $1)",
             AGE_GRAPH_NAME,
@@ -70,35 +255,30 @@ async def init_age_graph() -> None:
 
 
 def load_queries(query_dir: Path) -> None:
-    """특정 디렉토리의 SQL 파일들을 캐시에 로드"""
-    global SQL_CACHE
-    count = 0
-    for sql_file in query_dir.rglob("*.sql"):
-        try:
-            with open(sql_file, "r", encoding="utf-8") as f:
-                SQL_CACHE[str(sql_file.resolve())] = f.read()
-                count += 1
-        except Exception as e:
-            logger.error(f"Failed to load {sql_file}: {e}")
-    logger.info(f"Loaded {count} SQL files into cache from {query_dir}")
+    """특정 디렉토리의 SQL 파일들을 쿼리 레지스트리에 등록"""
+    QUERY_REGISTRY.load(query_dir)
+
+
+def _resolve_query(query: Union[str, Path], params: Optional[List[Any]]) -> str:
+    """쿼리 이름(또는 파일 경로)을 SQL 문자열로 변환하고 파라미터 개수 검증"""
+    if isinstance(query, Path):
+        registered = QUERY_REGISTRY.get_by_path(query)
+    else:
+        registered = QUERY_REGISTRY.get(query)
+    given = len(params) if params else 0
+    if given != registered.param_count:
+        raise ValueError(
+            f"Query '{registered.name}' expects {registered.param_count} "
+            f"parameter(s), got {given}"
+        )
+    return registered.sql
 
 
 async def run_sql_query(
-    sql_path: Union[str, Path], params: Optional[List[Any]] = None
+    query: Union[str, Path], params: Optional[List[Any]] = None
 ) -> List[Dict[str, Any]]:
-    """SELECT 쿼리 실행 (파일 경로 기반)"""
-    sql_path = Path(sql_path).resolve()
-    sql_key = str(sql_path)
-
-    query = SQL_CACHE.get(sql_key)
-    if not query:
-        if not sql_path.exists():
-            raise FileNotFoundError(f"SQL file not found: {sql_path}")
-        with open(sql_path, "r", encoding="utf-8") as f:
-            query = f.read()
-            SQL_CACHE[sql_key] = query
-
-    return await run_raw_query(query, params)
+    """SELECT 쿼리 실행 (등록된 쿼리 이름 기반)"""
+    return await run_raw_query(_resolve_query(query, params), params)
 
 
 async def run_raw_query(
@@ -106,7 +286,6 @@ async def run_raw_query(
 ) -> List[Dict[str, Any]]:
     """원시 SQL 쿼리 문자열 실행"""
     async with DatabaseManager.get_connection() as conn:
-        await set_age_path(conn)
         if params:
             rows = await conn.fetch(query, *params)
         else:
@@ -114,28 +293,36 @@ async def run_raw_query(
     return [dict(row) for row in rows]
 
 
-async def run_sql_command(
-    sql_path: Union[str, Path], params: Optional[List[Any]] = None
-) -> str:
-    """INSERT/UPDATE/DELETE 명령 실행 (파일 경로 기반)"""
-    sql_path = Path(sql_path).resolve()
-    sql_key = str(sql_path)
+async def stream_sql_query(
+    query: Union[str, Path],
+    params: Optional[List[Any]] = None,
+    prefetch: int = STREAM_CURSOR_PREFETCH,
+) -> AsyncIterator[Dict[str, Any]]:
+    """
+    SELECT 쿼리 결과를 서버 측 커서로 prefetch 행씩 읽어 한 행씩 반환
 
-    query = SQL_CACHE.get(sql_key)
-    if not query:
-        if not sql_path.exists():
-            raise FileNotFoundError(f"SQL file not found: {sql_path}")
-        with open(sql_path, "r", encoding="utf-8") as f:
-            query = f.read()
-            SQL_CACHE[sql_key] = query
+    결과 전체를 메모리에 올리지 않으므로 긴 이력의 스트리밍 응답에 사용합니다.
+    응답 본문은 요청 핸들러(Unit of Work) 종료 후에 소비되므로 풀에서 별도 커넥션을
+    받아 읽기 전용 트랜잭션(커서 유지에 필요) 안에서 읽습니다.
+    """
+    sql = _resolve_query(query, params)
+    pool = await DatabaseManager.get_pool()
+    async with pool.acquire() as conn:
+        async with conn.transaction(readonly=True):
+            async for row in conn.cursor(sql, *(params or []), prefetch=prefetch):
+                yield dict(row)
 
-    return await run_raw_command(query, params)
+
+async def run_sql_command(
+    query: Union[str, Path], params: Optional[List[Any]] = None
+) -> str:
+    """INSERT/UPDATE/DELETE 명령 실행 (등록된 쿼리 이름 기반)"""
+    return await run_raw_command(_resolve_query(query, params), params)
 
 
 async def run_raw_command(query: str, params: Optional[List[Any]] = None) -> str:
     """원시 SQL 명령 문자열 실행"""
     async with DatabaseManager.get_connection() as conn:
-        await set_age_path(conn)
         if params:
             result = await conn.execute(query, *params)
         else:
@@ -148,7 +335,6 @@ async def execute_sql_function(
 ) -> List[Dict[str, Any]]:
     """DB 함수 호출"""
     async with DatabaseManager.get_connection() as conn:
-        await set_age_path(conn)
         if params:
             placeholders = ", ".join([f"${i + 1}" for i in range(len(params))])
             query = f"SELECT {function_name}({placeholders})"
@@ -159,45 +345,76 @@ async def execute_sql_function(
     return [dict(row) for row in rows]
 
 
-async def run_cypher_query(
-    cypher: str, params: Optional[List[Any]] = None
-) -> List[Dict[str, Any]]:
-    """Cypher 쿼리 실행"""
-    import json
+@lru_cache(maxsize=256)
+def wrap_cypher(cypher: str, graph_name: str = AGE_GRAPH_NAME) -> str:
+    """
+    Cypher 템플릿을 SQL 문장으로 감싸기 (템플릿별 1회 생성 후 캐시)
+
+    동일 템플릿은 항상 동일한 SQL 문자열이 되므로 커넥션별 prepared statement가
+    재사용되며, 파라미터는 agtype 맵($1)으로 전달됩니다.
+    """
+    if "$cypher$" in cypher:
+        raise ValueError("Cypher template must not contain '$cypher$'")
+    return (
+        f"SELECT result FROM ag_catalog.cypher('{graph_name}'::name, $cypher$\n"
+        f"{cypher}\n"
+        "$cypher$, $1) AS (result agtype);"
+    )
 
-    async with DatabaseManager.get_connection() as conn:
-        await set_age_path(conn)
-        wrapped_query = f"""
-            SELECT result::text as result
-            FROM ag_catalog.cypher('{AGE_GRAPH_NAME}'::name, $$
-                {cypher}
-            $$) AS (result agtype);
-        """
-        if params:
-            rows = await conn.fetch(wrapped_query, *params)
-        else:
-            rows = await conn.fetch(wrapped_query)
 
-    return [json.loads(row["result"]) for row in rows]
+async def run_cypher_query(
+    cypher: str, params: Optional[Dict[str, Any]] = None
+) -> List[Any]:
+    """
+    Cypher 쿼리 실행
+
+    cypher: $name 형태로 파라미터를 참조하는 Cypher 템플릿
+    params: 파라미터 맵 (agtype으로 전달)
+    반환: agtype 코덱으로 디코딩된 결과 목록 (vertex/edge/path 포함)
+    """
+    async with DatabaseManager.get_connection() as conn:
+        rows = await conn.fetch(wrap_cypher(cypher), params or {})
+    return [row["result"] for row in rows]
 
 
 async def startup() -> None:
     """애플리케이션 시작 시 초기화"""
     from .schema import initialize_schema
 
-    await DatabaseManager.get_pool()
-
-    # 쿼리 로드 (상위 폴더의 Query 디렉토리)
+    # 쿼리 레지스트리 구성 (상위 폴더의 Query 디렉토리)
     query_dir = Path(__file__).parent.parent / "Query"
     load_queries(query_dir)
 
+    pool = await DatabaseManager.get_pool()
+
     # 1. AGE 초기화
     await init_age_graph()
+    # extension 생성 이전에 열린 커넥션은 agtype 코덱이 없으므로 재생성
+    await pool.expire_connections()
 
     # 2. 스키마 초기화 (테이블 및 트리거 생성)
     await initialize_schema(query_dir)
 
+    # 3. Phase 규칙 매트릭스 로드 (action 검증은 이후 DB 접근 없이 처리)
+    from .phase_rules import PHASE_RULES
+
+    await PHASE_RULES.refresh()
+
+    # 4. 워커 간 캐시 무효화 리스너 시작
+    await DatabaseManager.start_listener()
+
+    # 5. 사전 복제 세션 풀 보충기 시작 (SESSION_POOL_ENABLED)
+    from .session_pool import SESSION_POOL
+
+    await SESSION_POOL.start()
+
 
 async def shutdown() -> None:
     """애플리케이션 종료 시 정리"""
+    from .cache import SESSION_CACHE
+    from .session_pool import SESSION_POOL
+
+    await SESSION_POOL.stop()
+    await DatabaseManager.stop_listener()
     await DatabaseManager.close_pool()
+    SESSION_CACHE.clear()
@@ -0,0 +1,302 @@
+import logging
+from collections import defaultdict
+from typing import Any, Collection, Dict, Iterable, List, Sequence, Tuple
+
+from state_db.configs.setting import AGE_GRAPH_NAME, SCENARIO_INJECT_BATCH_SIZE
+
+from .database import wrap_cypher
+
+logger = logging.getLogger("state_db.infrastructure.graph_loader")
+
+MASTER_SESSION_ID = "00000000-0000-0000-0000-000000000000"
+
+# 로더가 다루는 Vertex 라벨과 시나리오 내 식별 키
+VERTEX_KEYS: Dict[str, str] = {
+    "npc": "scenario_npc_id",
+    "enemy": "scenario_enemy_id",
+}
+EDGE_LABEL = "RELATION"
+
+
+class GraphLoader:
+    """
+    AGE 그래프 일괄 로더 (Vertex 생성 시 내부 id 맵 확보 -> id로 Edge 생성)
+
+    Vertex는 라벨별 UNWIND ... CREATE ... RETURN id(n) 으로 배치 생성하면서
+    호출자가 지정한 참조 키(ref)와 AGE 내부 id를 id_map에 기록합니다.
+    Edge는 (시작 라벨, 끝 라벨) 조합별 UNWIND 배치에서 id로 양 끝을 바로 찾으므로
+    관계마다 전체 Vertex를 속성으로 탐색하지 않습니다.
+    시나리오 주입(ref = scenario_*_id)과 세션 그래프 복제(ref = (세션, 마스터 id))에서
+    공용으로 사용합니다.
+    record_ids=False이면 생성한 Vertex id를 보관하지 않으며(스트리밍 주입),
+    Edge 생성 전에 resolve_refs로 필요한 Vertex id만 조회해 채웁니다.
+    """
+
+    def __init__(
+        self,
+        conn: Any,
+        batch_size: int = SCENARIO_INJECT_BATCH_SIZE,
+        graph_name: str = AGE_GRAPH_NAME,
+        record_ids: bool = True,
+    ) -> None:
+        self.conn = conn
+        self.batch_size = max(batch_size, 1)
+        self.graph_name = graph_name
+        self.record_ids = record_ids
+        # ref -> (label, AGE 내부 id)
+        self.id_map: Dict[Any, Tuple[str, int]] = {}
+        self.vertices_created = 0
+        self.edges_created = 0
+
+    def _batches(self, rows: Sequence[Any]) -> Iterable[Sequence[Any]]:
+        for offset in range(0, len(rows), self.batch_size):
+            yield rows[offset : offset + self.batch_size]
+
+    async def _fetch(self, cypher: str, params: Dict[str, Any]) -> List[Any]:
+        rows = await self.conn.fetch(wrap_cypher(cypher, self.graph_name), params)
+        return [row["result"] for row in rows]
+
+    async def create_vertices(
+        self, label: str, vertices: Sequence[Tuple[Any, Dict[str, Any]]]
+    ) -> None:
+        """(ref, properties) 목록으로 Vertex 일괄 생성 후 id_map 갱신"""
+        _check_label(label)
+        cypher = (
+            "UNWIND $rows AS row\n"
+            f"CREATE (n:{label})\n"
+            "SET n = row.properties\n"
+            "RETURN [row.ref, id(n)]"
+        )
+        for batch in self._batches(vertices):
+            # ref는 agtype으로 왕복 가능하도록 인덱스로 전달 후 원래 값으로 복원
+            rows = [
+                {"ref": index, "properties": properties}
+                for index, (_, properties) in enumerate(batch)
+            ]
+            for index, vertex_id in await self._fetch(cypher, {"rows": rows}):
+                if self.record_ids:
+                    self.id_map[batch[index][0]] = (label, vertex_id)
+            self.vertices_created += len(batch)
+
+    async def resolve_refs(self, scenario_id: Any, refs: Collection[str]) -> None:
+        """Session 0 시나리오 Vertex 중 참조 키가 refs인 것의 id를 id_map에 적재"""
+        refs = [ref for ref in refs if ref not in self.id_map]
+        if not refs:
+            return
+        for label, key in VERTEX_KEYS.items():
+            cypher = (
+                f"MATCH (v:{label} {{session_id: $session_id, "
+                "scenario_id: $scenario_id})\n"
+                f"WHERE v.{key} IN $refs\n"
+                f"RETURN [v.{key}, id(v)]"
+            )
+            for batch in self._batches(refs):
+                rows = await self._fetch(
+                    cypher,
+                    {
+                        "session_id": MASTER_SESSION_ID,
+                        "scenario_id": str(scenario_id),
+                        "refs": list(batch),
+                    },
+                )
+                for ref, vertex_id in rows:
+                    self.id_map[ref] = (label, vertex_id)
+
+    async def create_edges(
+        self, edges: Sequence[Tuple[Any, Any, Dict[str, Any]]]
+    ) -> int:
+        """
+        (시작 ref, 끝 ref, properties) 목록으로 RELATION Edge 일괄 생성
+
+        id_map에 없는 ref를 참조하는 Edge는 건너뛰며, 생성된 Edge 수를 반환합니다.
+        """
+        grouped: Dict[Tuple[str, str], List[Dict[str, Any]]] = defaultdict(list)
+        skipped = 0
+        for start_ref, end_ref, properties in edges:
+            start = self.id_map.get(start_ref)
+            end = self.id_map.get(end_ref)
+            if start is None or end is None:
+                skipped += 1
+                continue
+            grouped[(start[0], end[0])].append(
+                {"start": start[1], "end": end[1], "properties": properties}
+            )
+        if skipped:
+            logger.warning(f"Skipped {skipped} edge(s) with unknown endpoints")
+
+        created = 0
+        for (start_label, end_label), rows in grouped.items():
+            cypher = (
+                "UNWIND $rows AS row\n"
+                f"MATCH (a:{start_label}), (b:{end_label})\n"
+                "WHERE id(a) = row.start AND id(b) = row.end\n"
+                f"CREATE (a)-[r:{EDGE_LABEL}]->(b)\n"
+                "SET r = row.properties"
+            )
+            for batch in self._batches(rows):
+                await self._fetch(cypher, {"rows": list(batch)})
+                created += len(batch)
+        self.edges_created += created
+        return created
+
+    async def fetch_master_edges(self, scenario_id: Any) -> List[Dict[str, Any]]:
+        """Session 0 시나리오 RELATION 목록 (양 끝은 scenario_*_id 참조 키)"""
+        edges: List[Dict[str, Any]] = []
+        for start_label, start_key in VERTEX_KEYS.items():
+            for end_label, end_key in VERTEX_KEYS.items():
+                rows = await self._fetch(
+                    f"MATCH (a:{start_label} {{session_id: $session_id, "
+                    "scenario_id: $scenario_id})\n"
+                    f"      -[r:{EDGE_LABEL} {{session_id: $session_id}}]->\n"
+                    f"      (b:{end_label} {{session_id: $session_id, "
+                    "scenario_id: $scenario_id})\n"
+                    f"RETURN [a.{start_key}, b.{end_key}, id(r), properties(r)]",
+                    {"session_id": MASTER_SESSION_ID, "scenario_id": str(scenario_id)},
+                )
+                edges.extend(
+                    {"start": start, "end": end, "id": edge_id, "properties": props}
+                    for start, end, edge_id, props in rows
+                )
+        return edges
+
+    async def update_vertices(
+        self,
+        label: str,
+        scenario_id: Any,
+        vertices: Sequence[Tuple[str, Dict[str, Any]]],
+    ) -> None:
+        """Session 0 시나리오 Vertex 속성을 (참조 키, properties)로 일괄 교체"""
+        _check_label(label)
+        key = VERTEX_KEYS[label]
+        cypher = (
+            "UNWIND $rows AS row\n"
+            f"MATCH (v:{label} {{session_id: $session_id, "
+            "scenario_id: $scenario_id})\n"
+            f"WHERE v.{key} = row.ref\n"
+            "SET v = row.properties"
+        )
+        for batch in self._batches(vertices):
+            await self._fetch(
+                cypher,
+                {
+                    "session_id": MASTER_SESSION_ID,
+                    "scenario_id": str(scenario_id),
+                    "rows": [
+                        {"ref": ref, "properties": properties}
+                        for ref, properties in batch
+                    ],
+                },
+            )
+
+    async def delete_vertices(
+        self, label: str, scenario_id: Any, refs: Sequence[str]
+    ) -> None:
+        """Session 0 시나리오 Vertex와 연결된 Edge를 참조 키로 일괄 삭제"""
+        _check_label(label)
+        key = VERTEX_KEYS[label]
+        cypher = (
+            f"MATCH (v:{label} {{session_id: $session_id, "
+            "scenario_id: $scenario_id})\n"
+            f"WHERE v.{key} IN $refs\n"
+            "DETACH DELETE v"
+        )
+        for batch in self._batches(refs):
+            await self._fetch(
+                cypher,
+                {
+                    "session_id": MASTER_SESSION_ID,
+                    "scenario_id": str(scenario_id),
+                    "refs": list(batch),
+                },
+            )
+
+    async def update_edges(self, edges: Sequence[Tuple[int, Dict[str, Any]]]) -> None:
+        """Session 0 RELATION 속성을 (Edge id, properties)로 일괄 교체"""
+        cypher = (
+            "UNWIND $rows AS row\n"
+            f"MATCH ()-[r:{EDGE_LABEL} {{session_id: $session_id}}]->()\n"
+            "WHERE id(r) = row.id\n"
+            "SET r = row.properties"
+        )
+        for batch in self._batches(edges):
+            await self._fetch(
+                cypher,
+                {
+                    "session_id": MASTER_SESSION_ID,
+                    "rows": [
+                        {"id": edge_id, "properties": properties}
+                        for edge_id, properties in batch
+                    ],
+                },
+            )
+
+    async def delete_edges(self, edge_ids: Sequence[int]) -> None:
+        """Session 0 RELATION을 Edge id로 일괄 삭제"""
+        cypher = (
+            f"MATCH ()-[r:{EDGE_LABEL} {{session_id: $session_id}}]->()\n"
+            "WHERE id(r) IN $ids\n"
+            "DELETE r"
+        )
+        for batch in self._batches(edge_ids):
+            await self._fetch(
+                cypher, {"session_id": MASTER_SESSION_ID, "ids": list(batch)}
+            )
+
+    async def clone_scenario_graph(
+        self, scenario_id: Any, session_ids: Sequence[Any]
+    ) -> None:
+        """Session 0의 시나리오 그래프(Vertex + RELATION)를 세션 목록으로 복제"""
+        scenario_id = str(scenario_id)
+        session_ids = [str(session_id) for session_id in session_ids]
+        if not session_ids:
+            return
+
+        # 1. 마스터 Vertex 조회 후 세션별 복제 (ref = (session_id, 마스터 id))
+        for label in VERTEX_KEYS:
+            masters = await self._fetch(
+                f"MATCH (v:{label} {{session_id: $session_id, "
+                "scenario_id: $scenario_id})\nRETURN v",
+                {"session_id": MASTER_SESSION_ID, "scenario_id": scenario_id},
+            )
+            await self.create_vertices(
+                label,
+                [
+                    (
+                        (session_id, vertex["id"]),
+                        {**vertex["properties"], "session_id": session_id},
+                    )
+                    for session_id in session_ids
+                    for vertex in masters
+                ],
+            )
+
+        # 2. 마스터 Edge 조회 후 세션별 복제 (양 끝은 id_map으로 해석)
+        master_edges = await self._fetch(
+            f"MATCH (a)-[r:{EDGE_LABEL} {{session_id: $session_id}}]->(b)\n"
+            "WHERE a.scenario_id = $scenario_id AND b.scenario_id = $scenario_id\n"
+            "RETURN r",
+            {"session_id": MASTER_SESSION_ID, "scenario_id": scenario_id},
+        )
+        await self.create_edges(
+            [
+                (
+                    (session_id, edge["start_id"]),
+                    (session_id, edge["end_id"]),
+                    {**edge["properties"], "session_id": session_id},
+                )
+                for session_id in session_ids
+                for edge in master_edges
+            ]
+        )
+
+    def stats(self) -> Dict[str, int]:
+        return {
+            "vertices": self.vertices_created,
+            "edges": self.edges_created,
+        }
+
+
+def _check_label(label: str) -> None:
+    # 라벨은 Cypher 문에 직접 삽입되므로 허용된 이름만 사용
+    if label not in VERTEX_KEYS:
+        raise ValueError(f"Unsupported vertex label: {label}")
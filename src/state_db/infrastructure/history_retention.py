@@ -0,0 +1,47 @@
+import logging
+from typing import Any, Dict, List
+
+from state_db.configs.setting import (
+    HISTORY_PARTITION_MONTHS_AHEAD,
+    HISTORY_RETENTION_DAYS,
+    HISTORY_RETENTION_DROP,
+)
+
+from .database import run_sql_query
+
+logger = logging.getLogger("state_db.infrastructure.history_retention")
+
+
+async def maintain_history_partitions(
+    months_ahead: int = HISTORY_PARTITION_MONTHS_AHEAD,
+) -> int:
+    """turn / phase 월별 파티션 보장 (기본 파티션의 행은 해당 월 파티션으로 이동)"""
+    rows = await run_sql_query("MANAGE/history/maintain_partitions", [months_ahead])
+    created = rows[0]["created"] if rows else 0
+    if created:
+        logger.info(f"History partitions created: {created}")
+    return created
+
+
+async def apply_history_retention(
+    retention_days: int = HISTORY_RETENTION_DAYS,
+    drop: bool = HISTORY_RETENTION_DROP,
+    dry_run: bool = False,
+) -> List[Dict[str, Any]]:
+    """
+    보존 기간이 지난 turn / phase 파티션 분리(detach) 또는 삭제(drop)
+
+    보존 판단 전에 파티션을 먼저 정리하여 기본 파티션에 남은 오래된 행도
+    월별 파티션 단위로 보존 정책을 적용받게 합니다.
+    """
+    if not dry_run:
+        await maintain_history_partitions()
+    results = await run_sql_query(
+        "MANAGE/history/apply_retention", [retention_days, drop, dry_run]
+    )
+    for row in results:
+        logger.info(
+            f"History retention: {row['partition_name']} "
+            f"(< {row['partition_end']}) -> {row['action']}"
+        )
+    return results
@@ -0,0 +1,20 @@
+import logging
+from typing import Optional
+
+from .database import run_sql_query
+
+logger = logging.getLogger("state_db.infrastructure.history_stats")
+
+
+async def rebuild_history_stats(session_id: Optional[str] = None) -> int:
+    """
+    세션별 turn / phase 이력 요약 테이블 재구축
+
+    요약은 turn / phase INSERT 트리거가 증분 유지하므로 평소에는 필요 없으며,
+    트리거 도입 이전 데이터 채움이나 불일치 보정용입니다.
+    session_id가 없으면 전체 세션을 재구축하고, 재구축한 세션 수를 반환합니다.
+    """
+    rows = await run_sql_query("MANAGE/history/rebuild_stats", [session_id])
+    rebuilt = rows[0]["rebuilt"] if rows else 0
+    logger.info(f"History stats rebuilt: {rebuilt} session(s)")
+    return rebuilt
@@ -0,0 +1,90 @@
+import asyncio
+import logging
+from typing import Any, Dict, Mapping, Optional
+
+from state_db.configs.setting import ITEM_CATALOG_ENABLED
+
+from .database import DatabaseManager, InvalidationMessage, run_sql_query
+
+logger = logging.getLogger("state_db.infrastructure.item_catalog")
+
+ITEM_TABLE = "item"
+
+
+class ItemCatalog:
+    """
+    시나리오별 아이템 정의 인메모리 카탈로그 (scenario_id -> {item_id: row})
+
+    아이템 정의는 Session 0에 시나리오당 1회만 저장되고 플레이 중 변하지 않으므로,
+    시나리오 단위로 한 번 적재한 뒤 인벤토리/아이템 상세 조회를 DB 조인 없이 처리합니다.
+    item 테이블 변경 알림(L_notify.sql) 또는 리스너 재연결 시 전체를 비웁니다.
+    """
+
+    query = "INQUIRY/inventory/Catalog_items"
+
+    def __init__(self, enabled: bool = True) -> None:
+        self.enabled = enabled
+        self._scenarios: Dict[str, Dict[str, Dict[str, Any]]] = {}
+        self._locks: Dict[str, asyncio.Lock] = {}
+        self.hits = 0
+        self.misses = 0
+        self.loads = 0
+        self.invalidations = 0
+
+    def load(self, scenario_id: Any, rows: Any) -> Dict[str, Dict[str, Any]]:
+        """카탈로그 조회 결과로 시나리오 아이템을 통째로 교체"""
+        items = {str(row["item_id"]): dict(row) for row in rows}
+        self._scenarios[str(scenario_id)] = items
+        self.loads += 1
+        return items
+
+    async def scenario_items(self, scenario_id: Any) -> Mapping[str, Dict[str, Any]]:
+        """시나리오의 전체 아이템 정의 (미적재 시 DB에서 1회 적재)"""
+        key = str(scenario_id)
+        items = self._scenarios.get(key)
+        if items is not None:
+            self.hits += 1
+            return items
+        self.misses += 1
+        # 동일 시나리오 동시 요청은 한 번만 적재
+        lock = self._locks.setdefault(key, asyncio.Lock())
+        async with lock:
+            items = self._scenarios.get(key)
+            if items is None:
+                rows = await run_sql_query(self.query, [key])
+                items = self.load(key, rows)
+        return items
+
+    async def get(self, scenario_id: Any, item_id: Any) -> Optional[Dict[str, Any]]:
+        items = await self.scenario_items(scenario_id)
+        return items.get(str(item_id))
+
+    def invalidate(self, scenario_id: Any = None) -> None:
+        if scenario_id is None:
+            self.invalidations += len(self._scenarios)
+            self._scenarios = {}
+        elif self._scenarios.pop(str(scenario_id), None) is not None:
+            self.invalidations += 1
+
+    def apply_invalidation(self, message: Optional[InvalidationMessage]) -> None:
+        """워커 간 무효화 메시지 적용 (item 변경 또는 리스너 재연결)"""
+        if message is None or message.table == ITEM_TABLE:
+            self.invalidate()
+
+    def stats(self) -> Dict[str, Any]:
+        lookups = self.hits + self.misses
+        return {
+            "enabled": self.enabled,
+            "scenarios": len(self._scenarios),
+            "items": sum(len(items) for items in self._scenarios.values()),
+            "hits": self.hits,
+            "misses": self.misses,
+            "hit_ratio": round(self.hits / lookups, 4) if lookups else 0.0,
+            "loads": self.loads,
+            "invalidations": self.invalidations,
+        }
+
+
+# 애플리케이션(워커 프로세스) 전역 아이템 카탈로그
+ITEM_CATALOG = ItemCatalog(enabled=ITEM_CATALOG_ENABLED)
+DatabaseManager.add_invalidation_handler(ITEM_CATALOG.apply_invalidation)
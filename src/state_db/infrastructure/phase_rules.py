@@ -0,0 +1,111 @@
+import asyncio
+import logging
+from typing import Any, Dict, FrozenSet, Iterable, List, Mapping, Optional
+
+from .database import DatabaseManager, InvalidationMessage, run_sql_query
+
+logger = logging.getLogger("state_db.infrastructure.phase_rules")
+
+PHASE_RULES_TABLE = "phase_rules"
+
+
+class PhaseRulesMatrix:
+    """
+    phase_rules 인메모리 매트릭스 (phase -> 허용 행동 비트셋)
+
+    행동 이름마다 비트 위치를 부여하고, phase별 허용 행동을 int 마스크로 보관합니다.
+    단건/배치 검증 모두 DB 접근 없이 비트 연산으로 처리되며,
+    phase_rules 변경 알림(L_notify.sql) 또는 리스너 재연결 시 전체를 다시 읽습니다.
+    """
+
+    query = "INQUIRY/phase/phase_rule"
+
+    def __init__(self) -> None:
+        self._action_bits: Dict[str, int] = {}
+        self._phase_masks: Dict[str, int] = {}
+        self._loaded = False
+        self._refresh_task: Optional["asyncio.Task[None]"] = None
+        self.version = 0
+
+    @property
+    def loaded(self) -> bool:
+        return self._loaded
+
+    def load(self, rows: Iterable[Mapping[str, Any]]) -> None:
+        """phase_rules 조회 결과로 매트릭스를 통째로 교체"""
+        action_bits: Dict[str, int] = {}
+        phase_masks: Dict[str, int] = {}
+        for row in rows:
+            mask = 0
+            for action in row["allowed_actions"] or []:
+                bit = action_bits.setdefault(action, 1 << len(action_bits))
+                mask |= bit
+            phase_masks[str(row["phase"])] = mask
+        # 참조 교체만으로 반영되므로 검증 중인 요청이 절반만 갱신된 상태를 보지 않음
+        self._action_bits, self._phase_masks = action_bits, phase_masks
+        self._loaded = True
+        self.version += 1
+
+    async def refresh(self) -> None:
+        """DB에서 phase_rules를 다시 읽어 매트릭스 갱신"""
+        rows = await run_sql_query(self.query)
+        self.load(rows)
+        logger.info(
+            f"Phase rules loaded: {len(self._phase_masks)} phases, "
+            f"{len(self._action_bits)} actions (v{self.version})"
+        )
+
+    async def ensure_loaded(self) -> None:
+        if not self._loaded:
+            await self.refresh()
+
+    def invalidate(self) -> None:
+        """다음 검증 시 다시 읽도록 표시하고, 이벤트 루프가 있으면 즉시 재로딩 예약"""
+        self._loaded = False
+        try:
+            loop = asyncio.get_running_loop()
+        except RuntimeError:
+            return
+        if self._refresh_task is None or self._refresh_task.done():
+            self._refresh_task = loop.create_task(self._refresh_quietly())
+
+    async def _refresh_quietly(self) -> None:
+        try:
+            await self.refresh()
+        except Exception as e:
+            # 실패 시 _loaded=False 유지 -> 다음 검증에서 ensure_loaded가 재시도
+            logger.error(f"Phase rules refresh failed: {e}")
+
+    def apply_invalidation(self, message: Optional[InvalidationMessage]) -> None:
+        """워커 간 무효화 메시지 적용 (phase_rules 변경 또는 리스너 재연결)"""
+        if message is None or message.table == PHASE_RULES_TABLE:
+            self.invalidate()
+
+    def allowed_actions(self, phase: str) -> FrozenSet[str]:
+        mask = self._phase_masks.get(phase, 0)
+        return frozenset(a for a, bit in self._action_bits.items() if mask & bit)
+
+    def is_allowed(self, phase: str, action: str) -> bool:
+        return bool(self._phase_masks.get(phase, 0) & self._action_bits.get(action, 0))
+
+    def check(self, phase: str, actions: Iterable[str]) -> Dict[str, bool]:
+        """여러 행동의 허용 여부를 한 번에 판정 ({action: bool})"""
+        mask = self._phase_masks.get(phase, 0)
+        bits = self._action_bits
+        return {action: bool(mask & bits.get(action, 0)) for action in actions}
+
+    def phases(self) -> List[str]:
+        return sorted(self._phase_masks)
+
+    def stats(self) -> Dict[str, Any]:
+        return {
+            "loaded": self._loaded,
+            "version": self.version,
+            "phases": len(self._phase_masks),
+            "actions": len(self._action_bits),
+        }
+
+
+# 애플리케이션(워커 프로세스) 전역 phase 규칙 매트릭스
+PHASE_RULES = PhaseRulesMatrix()
+DatabaseManager.add_invalidation_handler(PHASE_RULES.apply_invalidation)
@@ -0,0 +1,123 @@
+import logging
+import re
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Dict, List, Optional, Union
+
+logger = logging.getLogger("state_db.infrastructure.query_registry")
+
+# 기본 Query 디렉토리 (src/state_db/Query)
+DEFAULT_QUERY_DIR = Path(__file__).parent.parent / "Query"
+
+# 파라미터 개수 계산 시 제외할 영역 (dollar-quote 본문, 문자열 리터럴, 라인 주석)
+# 앞에서부터 한 번에 매칭하여 리터럴 안의 '--'나 주석 안의 따옴표도 구분합니다.
+_IGNORED = re.compile(
+    r"\$(?P<tag>[A-Za-z_]\w*|)\$.*?\$(?P=tag)\$"  # dollar-quote 본문
+    r"|'(?:[^']|'')*'"  # 문자열 리터럴 ('' 이스케이프 포함)
+    r"|--[^\n]*",  # 라인 주석
+    re.DOTALL,
+)
+_PLACEHOLDER = re.compile(r"\$(\d+)")
+
+
+def count_params(sql: str) -> int:
+    """SQL 본문에서 사용하는 위치 파라미터($1, $2 ...)의 개수 계산"""
+    body = _IGNORED.sub("", sql)
+    numbers = [int(n) for n in _PLACEHOLDER.findall(body)]
+    return max(numbers, default=0)
+
+
+@dataclass(frozen=True)
+class RegisteredQuery:
+    """Query 디렉토리의 SQL 파일 하나에 대한 등록 정보"""
+
+    name: str
+    path: Path
+    sql: str
+    param_count: int
+
+
+class QueryRegistry:
+    """
+    Query 디렉토리 SQL 파일의 이름 기반 레지스트리
+
+    파일은 Query 디렉토리 기준 상대 경로(확장자 제외)로 등록됩니다.
+    예: INQUIRY/session/Session_show-r.sql -> "INQUIRY/session/Session_show-r"
+    동일한 SQL 문자열 객체를 재사용하므로 asyncpg의 커넥션별 statement cache에서
+    한 번 준비된 문장이 계속 재사용됩니다.
+    """
+
+    def __init__(self, query_dir: Path = DEFAULT_QUERY_DIR) -> None:
+        self.query_dir = query_dir
+        self._queries: Dict[str, RegisteredQuery] = {}
+        self._loaded = False
+
+    def load(self, query_dir: Optional[Path] = None) -> int:
+        """디렉토리 아래의 모든 SQL 파일 등록"""
+        if query_dir is not None:
+            self.query_dir = query_dir
+        count = 0
+        for sql_file in sorted(self.query_dir.rglob("*.sql")):
+            try:
+                self._register_file(sql_file)
+                count += 1
+            except Exception as e:
+                logger.error(f"Failed to load {sql_file}: {e}")
+        self._loaded = True
+        logger.info(f"Registered {count} SQL queries from {self.query_dir}")
+        return count
+
+    def get(self, name: str) -> RegisteredQuery:
+        """이름으로 등록된 쿼리 조회"""
+        query = self._queries.get(name)
+        if query is None:
+            if not self._loaded:
+                self.load()
+                query = self._queries.get(name)
+            if query is None:
+                raise FileNotFoundError(f"SQL query not registered: {name}")
+        return query
+
+    def get_by_path(self, path: Union[str, Path]) -> RegisteredQuery:
+        """파일 경로로 쿼리 조회 (Query 디렉토리 밖의 파일은 즉시 등록)"""
+        path = Path(path).resolve()
+        name = self._name_for(path)
+        query = self._queries.get(name)
+        if query is None:
+            if not path.exists():
+                raise FileNotFoundError(f"SQL file not found: {path}")
+            query = self._register_file(path)
+        return query
+
+    def names(self) -> List[str]:
+        return sorted(self._queries)
+
+    def __contains__(self, name: object) -> bool:
+        return name in self._queries
+
+    def __len__(self) -> int:
+        return len(self._queries)
+
+    def _name_for(self, path: Path) -> str:
+        try:
+            relative = path.relative_to(self.query_dir.resolve())
+        except ValueError:
+            return str(path)
+        return relative.with_suffix("").as_posix()
+
+    def _register_file(self, sql_file: Path) -> RegisteredQuery:
+        path = sql_file.resolve()
+        with open(path, "r", encoding="utf-8") as f:
+            sql = f.read()
+        query = RegisteredQuery(
+            name=self._name_for(path),
+            path=path,
+            sql=sql,
+            param_count=count_params(sql),
+        )
+        self._queries[query.name] = query
+        return query
+
+
+# 애플리케이션 전역 레지스트리
+QUERY_REGISTRY = QueryRegistry()
@@ -1,7 +1,9 @@
 import logging
 from pathlib import Path
 
-from .database import DatabaseManager, set_age_path
+from state_db.configs.setting import HISTORY_PARTITION_MONTHS_AHEAD
+
+from .database import DatabaseManager
 
 logger = logging.getLogger("state_db.infrastructure.schema")
 
@@ -27,8 +29,6 @@ async def initialize_schema(query_dir: Path) -> None:
     ]
 
     async with DatabaseManager.get_connection() as conn:
-        await set_age_path(conn)
-
         async with conn.transaction():
             # 1단계: 기본 테이블
             for filename in initial_tables:
@@ -52,6 +52,14 @@ async def initialize_schema(query_dir: Path) -> None:
             for file_path in sorted(base_dir.glob("L_*.sql")):
                 await _execute_sql_file(conn, file_path, "Stage 5 (Logic)")
 
+            # 6단계: turn / phase 월별 파티션 보장 (L_history_partition.sql)
+            created = await conn.fetchval(
+                "SELECT maintain_history_partitions($1)",
+                HISTORY_PARTITION_MONTHS_AHEAD,
+            )
+            if created:
+                logger.info(f"History partitions created: {created}")
+
     logger.info("✅ Database schema and logic initialization completed.")
 
 
@@ -0,0 +1,49 @@
+import logging
+from typing import Any, Dict, List
+
+from state_db.configs.setting import (
+    SESSION_ARCHIVE_AFTER_DAYS,
+    SESSION_ARCHIVE_BATCH_SIZE,
+)
+
+from .database import run_sql_query
+
+logger = logging.getLogger("state_db.infrastructure.session_archive")
+
+
+async def archive_ended_sessions(
+    after_days: int = SESSION_ARCHIVE_AFTER_DAYS,
+    limit: int = SESSION_ARCHIVE_BATCH_SIZE,
+    dry_run: bool = False,
+) -> List[Dict[str, Any]]:
+    """
+    종료 후 after_days가 지난 세션을 session_archive로 옮기고 원본 행 삭제
+
+    세션마다 별도 트랜잭션으로 처리하므로 한 세션의 실패가 나머지에 영향을 주지 않으며,
+    dry_run이면 대상 세션만 반환합니다 (archived_rows = None).
+    """
+    candidates = await run_sql_query(
+        "MANAGE/archive/list_candidates", [after_days, limit]
+    )
+    results: List[Dict[str, Any]] = []
+    for candidate in candidates:
+        session_id = candidate["session_id"]
+        archived_rows = None
+        if not dry_run:
+            try:
+                rows = await run_sql_query(
+                    "MANAGE/archive/archive_session", [session_id]
+                )
+                archived_rows = rows[0]["archived_rows"] if rows else None
+            except Exception as e:
+                logger.error(f"Session archive failed for {session_id}: {e}")
+                continue
+            logger.info(f"Session archived: {session_id} ({archived_rows} rows)")
+        results.append(
+            {
+                "session_id": session_id,
+                "ended_at": candidate["ended_at"],
+                "archived_rows": archived_rows,
+            }
+        )
+    return results
@@ -0,0 +1,136 @@
+import asyncio
+import logging
+from typing import Any, Dict, Optional
+
+from state_db.configs.setting import (
+    SESSION_POOL_ENABLED,
+    SESSION_POOL_HIGH_WATERMARK,
+    SESSION_POOL_LOW_WATERMARK,
+    SESSION_POOL_REFILL_INTERVAL_SECONDS,
+)
+
+from .database import current_unit_of_work, run_sql_query
+
+logger = logging.getLogger("state_db.infrastructure.session_pool")
+
+
+class SessionPoolRefiller:
+    """
+    사전 복제 세션 풀 보충기
+
+    활성 시나리오별 미할당 세션(session_pool) 수가 low_watermark 미만이면
+    high_watermark까지 provision_pooled_session으로 한 건씩 보충합니다.
+    세션 1건 = 트랜잭션 1건이므로 보충 중에도 claim이 오래 대기하지 않으며,
+    워커 간 중복 보충은 DB의 시나리오별 advisory lock으로 막습니다.
+    """
+
+    def __init__(
+        self,
+        low_watermark: int,
+        high_watermark: int,
+        interval_seconds: float,
+        enabled: bool = True,
+    ) -> None:
+        self.enabled = enabled
+        self.low_watermark = low_watermark
+        self.high_watermark = max(high_watermark, low_watermark)
+        self.interval_seconds = interval_seconds
+        self._task: Optional["asyncio.Task[None]"] = None
+        self._wake: Optional[asyncio.Event] = None
+        self.claims = 0
+        self.misses = 0
+        self.provisioned = 0
+        self.drained = 0
+
+    async def start(self) -> None:
+        if not self.enabled or self._task is not None:
+            return
+        self._wake = asyncio.Event()
+        self._task = asyncio.create_task(
+            self._refill_forever(), name="session-pool-refiller"
+        )
+
+    async def stop(self) -> None:
+        task, self._task = self._task, None
+        if task is not None:
+            task.cancel()
+            try:
+                await task
+            except asyncio.CancelledError:
+                pass
+
+    def record_claim(self, claimed: bool) -> None:
+        """claim 결과 기록 (성공 시 보충기를 깨워 바로 채우도록 함)"""
+        if claimed:
+            self.claims += 1
+        else:
+            self.misses += 1
+        unit_of_work = current_unit_of_work.get()
+        if unit_of_work is not None and unit_of_work.transactional:
+            # claim이 commit된 뒤에야 풀 감소가 보이므로 종료 시점에 깨움
+            unit_of_work.add_exit_callback(self._wake_refiller)
+        else:
+            self._wake_refiller()
+
+    def _wake_refiller(self) -> None:
+        if self._wake is not None:
+            self._wake.set()
+
+    async def refill_once(self) -> int:
+        """비활성 시나리오 풀 정리 후 low_watermark 미만인 시나리오 보충"""
+        drained = await run_sql_query("MANAGE/session_pool/drain_inactive")
+        self.drained += drained[0]["drained"] if drained else 0
+
+        created = 0
+        for row in await run_sql_query("MANAGE/session_pool/pool_status"):
+            if row["pooled"] >= self.low_watermark:
+                continue
+            for _ in range(self.high_watermark - row["pooled"]):
+                result = await run_sql_query(
+                    "MANAGE/session_pool/provision_session",
+                    [row["scenario_id"], self.high_watermark],
+                )
+                if not result or result[0]["session_id"] is None:
+                    # 상한 도달 또는 다른 워커가 보충 중
+                    break
+                created += 1
+        self.provisioned += created
+        if created:
+            logger.info(f"Session pool refilled: {created} sessions provisioned")
+        return created
+
+    async def _refill_forever(self) -> None:
+        assert self._wake is not None
+        while True:
+            try:
+                await self.refill_once()
+            except asyncio.CancelledError:
+                raise
+            except Exception as e:
+                logger.error(f"Session pool refill failed: {e}")
+            try:
+                await asyncio.wait_for(self._wake.wait(), self.interval_seconds)
+            except asyncio.TimeoutError:
+                pass
+            self._wake.clear()
+
+    def stats(self) -> Dict[str, Any]:
+        return {
+            "enabled": self.enabled,
+            "running": self._task is not None and not self._task.done(),
+            "low_watermark": self.low_watermark,
+            "high_watermark": self.high_watermark,
+            "claims": self.claims,
+            "misses": self.misses,
+            "provisioned": self.provisioned,
+            "drained": self.drained,
+        }
+
+
+# 애플리케이션(워커 프로세스) 전역 세션 풀 보충기
+SESSION_POOL = SessionPoolRefiller(
+    low_watermark=SESSION_POOL_LOW_WATERMARK,
+    high_watermark=SESSION_POOL_HIGH_WATERMARK,
+    interval_seconds=SESSION_POOL_REFILL_INTERVAL_SECONDS,
+    enabled=SESSION_POOL_ENABLED,
+)
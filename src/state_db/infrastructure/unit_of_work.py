@@ -0,0 +1,88 @@
+import asyncio
+import logging
+from contextvars import Token
+from typing import Any, Callable, List, Optional
+
+import asyncpg
+
+from .database import DatabaseManager, current_unit_of_work
+
+logger = logging.getLogger("state_db.infrastructure.unit_of_work")
+
+
+class UnitOfWork:
+    """
+    요청 범위 Unit of Work
+
+    컨텍스트 안에서 호출되는 모든 레포지토리(run_sql_query 등)가 하나의 풀 커넥션을
+    공유합니다. 커넥션은 첫 쿼리 시점에 획득하며(lazy), transactional=True이면
+    같은 시점에 트랜잭션을 시작하여 정상 종료 시 commit, 예외 발생 시 rollback 합니다.
+
+    사용 예:
+        async with UnitOfWork(transactional=True):
+            await session_repo.update_location(session_id, "Town")
+            await player_repo.update_hp(player_id, session_id, -10)
+    """
+
+    def __init__(self, transactional: bool = False) -> None:
+        self.transactional = transactional
+        self._pool: Optional[asyncpg.Pool] = None
+        self._conn: Optional[asyncpg.Connection] = None
+        self._transaction: Any = None
+        self._token: Optional[Token] = None
+        self._lock = asyncio.Lock()
+        self._exit_callbacks: List[Callable[[], Any]] = []
+
+    @property
+    def is_active(self) -> bool:
+        """커넥션을 실제로 획득했는지 여부"""
+        return self._conn is not None
+
+    def add_exit_callback(self, callback: Callable[[], Any]) -> None:
+        """commit/rollback 및 커넥션 반환 이후 실행할 콜백 등록 (캐시 무효화 등)"""
+        self._exit_callbacks.append(callback)
+
+    async def connection(self) -> asyncpg.Connection:
+        """공유 커넥션 반환 (최초 호출 시 획득 및 트랜잭션 시작)"""
+        if self._conn is not None:
+            return self._conn
+        async with self._lock:
+            if self._conn is None:
+                self._pool = await DatabaseManager.get_pool()
+                conn = await self._pool.acquire()
+                if self.transactional:
+                    self._transaction = conn.transaction()
+                    await self._transaction.start()
+                self._conn = conn
+        return self._conn
+
+    async def __aenter__(self) -> "UnitOfWork":
+        self._token = current_unit_of_work.set(self)
+        return self
+
+    async def __aexit__(self, exc_type: Any, exc: Any, tb: Any) -> None:
+        try:
+            if self._transaction is not None:
+                if exc_type is None:
+                    await self._transaction.commit()
+                else:
+                    logger.debug(f"Rolling back unit of work: {exc_type.__name__}")
+                    await self._transaction.rollback()
+        finally:
+            if self._conn is not None and self._pool is not None:
+                await self._pool.release(self._conn)
+            self._conn = None
+            self._transaction = None
+            if self._token is not None:
+                try:
+                    current_unit_of_work.reset(self._token)
+                except ValueError:
+                    # 다른 Context에서 종료되는 경우 (의존성 정리 단계 등)
+                    current_unit_of_work.set(None)
+                self._token = None
+            callbacks, self._exit_callbacks = self._exit_callbacks, []
+            for callback in callbacks:
+                try:
+                    callback()
+                except Exception as e:
+                    logger.error(f"Unit of work exit callback failed: {e}")
@@ -152,6 +152,30 @@ async def db_health_check() -> Dict[str, Any]:
         }
 
 
+@app.get(
+    "/health/cache",
+    description="인메모리 세션 상태 캐시 통계 (hit/miss/eviction)",
+    summary="캐시 상태 확인",
+)
+def cache_health_check() -> Dict[str, Any]:
+    from state_db.infrastructure import (
+        ITEM_CATALOG,
+        PHASE_RULES,
+        SESSION_CACHE,
+        SESSION_POOL,
+        DatabaseManager,
+    )
+
+    return {
+        "status": "healthy",
+        "session_cache": SESSION_CACHE.stats(),
+        "phase_rules": PHASE_RULES.stats(),
+        "item_catalog": ITEM_CATALOG.stats(),
+        "session_pool": SESSION_POOL.stats(),
+        "invalidation_listener": DatabaseManager.listener_status(),
+    }
+
+
 # ====================================================================
 # 서버 실행
 # ====================================================================
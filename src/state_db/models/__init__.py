@@ -9,6 +9,7 @@ from .entity import (
 from .player import (
     FullPlayerState,
     InventoryItem,
+    ItemInfo,
     NPCAffinityUpdateResult,
     NPCRelation,
     PlayerHPUpdateResult,
@@ -20,12 +21,15 @@ from .player import (
 from .session import SessionInfo
 from .world import (
     ActChangeResult,
+    ActionAllowedResult,
     ApplyJudgmentSkipped,
     LocationUpdateResult,
     PhaseChangeResult,
+    ReplayedState,
     SequenceChangeResult,
     StateUpdateResult,
     TurnAddResult,
+    TurnRollbackResult,
 )
 
 __all__ = [
@@ -34,6 +38,7 @@ __all__ = [
     "SessionStatus",
     "SessionInfo",
     "InventoryItem",
+    "ItemInfo",
     "NPCInfo",
     "NPCRelation",
     "EnemyInfo",
@@ -48,7 +53,10 @@ __all__ = [
     "LocationUpdateResult",
     "PhaseChangeResult",
     "TurnAddResult",
+    "TurnRollbackResult",
+    "ReplayedState",
     "ActChangeResult",
+    "ActionAllowedResult",
     "SequenceChangeResult",
     "SpawnResult",
     "RemoveEntityResult",
@@ -1,7 +1,7 @@
-import json
 from enum import Enum
 from typing import Annotated, Any
 
+import orjson
 from pydantic import BeforeValidator
 
 # ====================================================================
@@ -12,8 +12,8 @@ from pydantic import BeforeValidator
 def parse_json(v: Any) -> Any:
     if isinstance(v, str):
         try:
-            return json.loads(v)
-        except json.JSONDecodeError:
+            return orjson.loads(v)
+        except orjson.JSONDecodeError:
             return v
     return v
 
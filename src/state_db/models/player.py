@@ -8,8 +8,8 @@ from .base import JsonField
 
 
 class InventoryItem(BaseModel):
-    player_id: Optional[str] = None
-    item_id: int
+    player_id: Optional[Union[str, UUID]] = None
+    item_id: Union[int, str, UUID]
     item_name: Optional[str] = None
     quantity: int
     category: Optional[str] = None
@@ -17,6 +17,17 @@ class InventoryItem(BaseModel):
     model_config = ConfigDict(from_attributes=True)
 
 
+class ItemInfo(BaseModel):
+    item_id: Union[str, UUID]
+    scenario_item_id: Optional[Union[str, UUID]] = None
+    name: str
+    description: Optional[str] = None
+    item_type: Optional[str] = None
+    meta: Optional[JsonField] = {}
+    created_at: Optional[datetime] = None
+    model_config = ConfigDict(from_attributes=True)
+
+
 class NPCRelation(BaseModel):
     npc_id: Union[str, UUID]
     npc_name: Optional[str] = None
@@ -1,4 +1,4 @@
-from typing import List
+from typing import Any, Dict, List
 
 from pydantic import BaseModel, ConfigDict
 
@@ -15,12 +15,37 @@ class PhaseChangeResult(BaseModel):
     model_config = ConfigDict(from_attributes=True)
 
 
+class ActionAllowedResult(BaseModel):
+    session_id: str
+    current_phase: str
+    allowed: Dict[str, bool]
+    model_config = ConfigDict(from_attributes=True)
+
+
 class TurnAddResult(BaseModel):
     session_id: str
     current_turn: int
     model_config = ConfigDict(from_attributes=True)
 
 
+class TurnRollbackResult(BaseModel):
+    session_id: str
+    target_turn: int
+    previous_turn: int
+    undone_turns: int
+    undone_changes: int
+    model_config = ConfigDict(from_attributes=True)
+
+
+class ReplayedState(BaseModel):
+    session_id: str
+    turn_number: int
+    checkpoint_turn: int
+    replayed_turns: int
+    state: Dict[str, Any]
+    model_config = ConfigDict(from_attributes=True)
+
+
 class ActChangeResult(BaseModel):
     session_id: str
     current_phase: str = ""
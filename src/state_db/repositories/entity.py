@@ -16,12 +16,12 @@ from state_db.repositories.base import BaseRepository
 class EntityRepository(BaseRepository):
     # NPC
     async def get_session_npcs(self, session_id: str) -> List[NPCInfo]:
-        sql_path = self.query_dir / "INQUIRY" / "session" / "Session_npc-r.sql"
-        results = await run_sql_query(sql_path, [session_id])
+        query = "INQUIRY/session/Session_npc-r"
+        results = await run_sql_query(query, [session_id])
         return [NPCInfo.model_validate(row) for row in results]
 
     async def spawn_npc(self, session_id: str, data: Dict[str, Any]) -> SpawnResult:
-        sql_path = self.query_dir / "MANAGE" / "npc" / "spawn_npc.sql"
+        query = "MANAGE/npc/spawn_npc"
         params = [
             session_id,
             data.get("npc_id"),
@@ -30,7 +30,7 @@ class EntityRepository(BaseRepository):
             data.get("hp", 100),
             data.get("tags", ["npc"]),
         ]
-        result = await run_sql_query(sql_path, params)
+        result = await run_sql_query(query, params)
         if result:
             return SpawnResult(
                 id=result[0].get("id", ""), name=result[0].get("name", "")
@@ -40,20 +40,20 @@ class EntityRepository(BaseRepository):
     async def remove_npc(
         self, session_id: str, npc_instance_id: str
     ) -> RemoveEntityResult:
-        sql_path = self.query_dir / "MANAGE" / "npc" / "remove_npc.sql"
-        await run_sql_command(sql_path, [npc_instance_id, session_id])
+        query = "MANAGE/npc/remove_npc"
+        await run_sql_command(query, [npc_instance_id, session_id])
         return RemoveEntityResult()
 
     # Enemy
     async def get_session_enemies(
         self, session_id: str, active_only: bool = True
     ) -> List[EnemyInfo]:
-        sql_path = self.query_dir / "INQUIRY" / "session" / "Session_enemy.sql"
-        results = await run_sql_query(sql_path, [session_id, active_only])
+        query = "INQUIRY/session/Session_enemy"
+        results = await run_sql_query(query, [session_id, active_only])
         return [EnemyInfo.model_validate(row) for row in results]
 
     async def spawn_enemy(self, session_id: str, data: Dict[str, Any]) -> SpawnResult:
-        sql_path = self.query_dir / "MANAGE" / "enemy" / "spawn_enemy.sql"
+        query = "MANAGE/enemy/spawn_enemy"
         params = [
             session_id,
             data.get("enemy_id"),
@@ -64,7 +64,7 @@ class EntityRepository(BaseRepository):
             data.get("defense", 5),
             data.get("tags", ["enemy"]),
         ]
-        result = await run_sql_query(sql_path, params)
+        result = await run_sql_query(query, params)
         if result:
             return SpawnResult(
                 id=result[0].get("id", ""),
@@ -72,13 +72,21 @@ class EntityRepository(BaseRepository):
             )
         raise HTTPException(status_code=500, detail="Failed to spawn enemy")
 
+    async def _materialize_enemy(self, session_id: str, enemy_instance_id: str) -> Any:
+        """Copy-on-Write: 변경 대상 Enemy의 세션 행 ID 확보 (없으면 404)"""
+        query = "MANAGE/enemy/materialize_enemy"
+        result = await run_sql_query(query, [session_id, enemy_instance_id])
+        enemy_id = result[0].get("enemy_id") if result else None
+        if enemy_id is None:
+            raise HTTPException(status_code=404, detail="Enemy or Session not found")
+        return enemy_id
+
     async def update_enemy_hp(
         self, session_id: str, enemy_instance_id: str, hp_change: int
     ) -> EnemyHPUpdateResult:
-        sql_path = self.query_dir / "UPDATE" / "enemy" / "update_enemy_hp.sql"
-        result = await run_sql_query(
-            sql_path, [enemy_instance_id, session_id, hp_change]
-        )
+        enemy_id = await self._materialize_enemy(session_id, enemy_instance_id)
+        query = "UPDATE/enemy/update_enemy_hp"
+        result = await run_sql_query(query, [enemy_id, session_id, hp_change])
         if result:
             # SQL에서 반환하는 필드명과 모델 필드명이 일치해야 함
             return EnemyHPUpdateResult.model_validate(result[0])
@@ -87,10 +95,11 @@ class EntityRepository(BaseRepository):
     async def remove_enemy(
         self, session_id: str, enemy_instance_id: str
     ) -> RemoveEntityResult:
-        sql_path = self.query_dir / "MANAGE" / "enemy" / "remove_enemy.sql"
-        await run_sql_command(sql_path, [enemy_instance_id, session_id])
+        query = "MANAGE/enemy/remove_enemy"
+        await run_sql_command(query, [enemy_instance_id, session_id])
         return RemoveEntityResult()
 
     async def defeat_enemy(self, session_id: str, enemy_instance_id: str) -> None:
-        sql_path = self.query_dir / "UPDATE" / "defeated_enemy-r.sql"
-        await run_sql_command(sql_path, [enemy_instance_id, session_id])
+        enemy_id = await self._materialize_enemy(session_id, enemy_instance_id)
+        query = "UPDATE/defeated_enemy-r"
+        await run_sql_command(query, [enemy_id, session_id])
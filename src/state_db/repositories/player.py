@@ -2,7 +2,7 @@ from typing import Any, Dict, List
 
 from fastapi import HTTPException
 
-from state_db.infrastructure import run_sql_command, run_sql_query
+from state_db.infrastructure import ITEM_CATALOG, run_sql_command, run_sql_query
 from state_db.models import (
     FullPlayerState,
     InventoryItem,
@@ -17,8 +17,8 @@ from state_db.repositories.base import BaseRepository
 
 class PlayerRepository(BaseRepository):
     async def get_stats(self, player_id: str) -> PlayerStats:
-        sql_path = self.query_dir / "INQUIRY" / "Player_stats.sql"
-        result = await run_sql_query(sql_path, [player_id])
+        query = "INQUIRY/Player_stats"
+        result = await run_sql_query(query, [player_id])
         if result:
             return PlayerStats.model_validate(result[0])
         raise HTTPException(status_code=404, detail="Player not found")
@@ -56,8 +56,8 @@ class PlayerRepository(BaseRepository):
     async def update_hp(
         self, player_id: str, session_id: str, hp_change: int
     ) -> PlayerHPUpdateResult:
-        sql_path = self.query_dir / "UPDATE" / "player" / "update_player_hp.sql"
-        result = await run_sql_query(sql_path, [player_id, session_id, hp_change])
+        query = "UPDATE/player/update_player_hp"
+        result = await run_sql_query(query, [player_id, session_id, hp_change])
         if result:
             return PlayerHPUpdateResult.model_validate(result[0])
         raise HTTPException(status_code=404, detail="Player or Session not found")
@@ -65,17 +65,29 @@ class PlayerRepository(BaseRepository):
     async def update_stats(
         self, player_id: str, session_id: str, stat_changes: Dict[str, int]
     ) -> PlayerStats:
-        import json
-
-        sql_path = self.query_dir / "UPDATE" / "player" / "update_player_stats.sql"
-        params = [player_id, session_id, json.dumps(stat_changes)]
-        await run_sql_command(sql_path, params)
+        query = "UPDATE/player/update_player_stats"
+        params = [player_id, session_id, stat_changes]
+        await run_sql_command(query, params)
         return await self.get_stats(player_id)
 
     async def get_inventory(self, session_id: str) -> List[InventoryItem]:
-        sql_path = self.query_dir / "INQUIRY" / "session" / "Session_inventory-r.sql"
-        results = await run_sql_query(sql_path, [session_id])
-        return [InventoryItem.model_validate(row) for row in results]
+        if not ITEM_CATALOG.enabled:
+            query = "INQUIRY/inventory/List_inventory"
+            results = await run_sql_query(query, [session_id])
+            return [InventoryItem.model_validate(row) for row in results]
+
+        # 수량만 DB에서 조회하고 아이템 이름/분류는 시나리오 카탈로그에서 채움
+        query = "INQUIRY/session/Session_inventory-r"
+        results = await run_sql_query(query, [session_id])
+        inventory = []
+        for row in results:
+            item = await ITEM_CATALOG.get(row["scenario_id"], row["item_id"])
+            data = dict(row)
+            if item is not None:
+                data["item_name"] = item["name"]
+                data["category"] = item["item_type"]
+            inventory.append(InventoryItem.model_validate(data))
+        return inventory
 
     async def update_inventory(
         self, player_id: str, item_id: int, quantity: int
@@ -84,15 +96,15 @@ class PlayerRepository(BaseRepository):
         return {"player_id": player_id, "item_id": item_id, "quantity": quantity}
 
     async def get_npc_relations(self, player_id: str) -> List[NPCRelation]:
-        sql_path = self.query_dir / "INQUIRY" / "Npc_relations.sql"
-        results = await run_sql_query(sql_path, [player_id])
+        query = "INQUIRY/Npc_relations"
+        results = await run_sql_query(query, [player_id])
         return [NPCRelation.model_validate(row) for row in results]
 
     async def update_npc_affinity(
         self, player_id: str, npc_id: str, affinity_change: int
     ) -> NPCAffinityUpdateResult:
-        sql_path = self.query_dir / "UPDATE" / "update_npc_affinity-r.sql"
-        result = await run_sql_query(sql_path, [player_id, npc_id, affinity_change])
+        query = "UPDATE/update_npc_affinity-r"
+        result = await run_sql_query(query, [player_id, npc_id, affinity_change])
         new_affinity = result[0].get("new_affinity", 0) if result else 0
         return NPCAffinityUpdateResult(
             player_id=player_id, npc_id=npc_id, new_affinity=new_affinity
@@ -101,10 +113,8 @@ class PlayerRepository(BaseRepository):
     async def earn_item(
         self, session_id: str, player_id: str, item_id: int, quantity: int
     ) -> Dict[str, Any]:
-        sql_path = self.query_dir / "UPDATE" / "earn_item.sql"
-        result = await run_sql_query(
-            sql_path, [session_id, player_id, item_id, quantity]
-        )
+        query = "UPDATE/earn_item"
+        result = await run_sql_query(query, [session_id, player_id, item_id, quantity])
         if result:
             return result[0]
         return {"player_id": player_id, "item_id": item_id, "quantity": quantity}
@@ -112,10 +122,8 @@ class PlayerRepository(BaseRepository):
     async def use_item(
         self, session_id: str, player_id: str, item_id: int, quantity: int
     ) -> Dict[str, Any]:
-        sql_path = self.query_dir / "UPDATE" / "use_item.sql"
-        result = await run_sql_query(
-            sql_path, [session_id, player_id, item_id, quantity]
-        )
+        query = "UPDATE/use_item"
+        result = await run_sql_query(query, [session_id, player_id, item_id, quantity])
         if result:
             return result[0]
         return {"player_id": player_id, "item_id": item_id, "quantity": quantity}
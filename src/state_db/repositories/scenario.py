@@ -1,175 +1,788 @@
-import json
 import logging
-from typing import Any, Dict, List
+import time
+from datetime import datetime
+from typing import (
+    Any,
+    AsyncIterator,
+    Callable,
+    Dict,
+    List,
+    Optional,
+    Tuple,
+    Type,
+    TypeVar,
+)
 from uuid import UUID
 
 from fastapi import HTTPException
+from pydantic import BaseModel, ValidationError
 
+from state_db.configs.setting import (
+    LIST_PAGE_DEFAULT_LIMIT,
+    SCENARIO_INJECT_BATCH_SIZE,
+)
 from state_db.infrastructure import (
-    SQL_CACHE,
+    QUERY_REGISTRY,
     DatabaseManager,
-    set_age_path,
+    GraphLoader,
+    run_sql_query,
 )
+from state_db.infrastructure.graph_loader import MASTER_SESSION_ID
 from state_db.repositories.base import BaseRepository
-from state_db.schemas import ScenarioInjectRequest, ScenarioInjectResponse
+from state_db.schemas import (
+    ScenarioEntityDiff,
+    ScenarioInjectEnemy,
+    ScenarioInjectHeader,
+    ScenarioInjectItem,
+    ScenarioInjectNPC,
+    ScenarioInjectRelation,
+    ScenarioInjectRequest,
+    ScenarioInjectResponse,
+    ScenarioReinjectResponse,
+)
 
 logger = logging.getLogger(__name__)
 
+M = TypeVar("M", bound=BaseModel)
+
+
+# 스트리밍 주입 레코드 유형 -> 검증 모델
+STREAM_RECORD_MODELS: Dict[str, Type[BaseModel]] = {
+    "npc": ScenarioInjectNPC,
+    "enemy": ScenarioInjectEnemy,
+    "item": ScenarioInjectItem,
+    "relation": ScenarioInjectRelation,
+}
+
+
+def _npc_row(npc: ScenarioInjectNPC, scenario_id: str) -> Tuple[Any, ...]:
+    return (
+        npc.name,
+        npc.description,
+        scenario_id,
+        npc.scenario_npc_id,
+        npc.tags,
+        npc.state,
+    )
+
+
+def _npc_vertex(npc: ScenarioInjectNPC, scenario_id: str) -> Tuple[str, Dict[str, Any]]:
+    return (
+        npc.scenario_npc_id,
+        {
+            # Master id is not used for vertex link usually
+            "npc_id": str(UUID(int=0)),
+            "session_id": MASTER_SESSION_ID,
+            "scenario_id": scenario_id,
+            "scenario_npc_id": npc.scenario_npc_id,
+            "name": npc.name,
+            "tags": npc.tags,
+        },
+    )
+
+
+def _enemy_row(enemy: ScenarioInjectEnemy, scenario_id: str) -> Tuple[Any, ...]:
+    return (
+        enemy.name,
+        enemy.description,
+        scenario_id,
+        enemy.scenario_enemy_id,
+        enemy.tags,
+        enemy.state,
+        enemy.dropped_items,
+    )
+
+
+def _enemy_vertex(
+    enemy: ScenarioInjectEnemy, scenario_id: str
+) -> Tuple[str, Dict[str, Any]]:
+    return (
+        enemy.scenario_enemy_id,
+        {
+            "enemy_id": str(UUID(int=0)),
+            "session_id": MASTER_SESSION_ID,
+            "scenario_id": scenario_id,
+            "scenario_enemy_id": enemy.scenario_enemy_id,
+            "name": enemy.name,
+            "tags": enemy.tags,
+        },
+    )
+
+
+def _item_row(item: ScenarioInjectItem, scenario_id: str) -> Tuple[Any, ...]:
+    return (
+        item.item_id,
+        item.name,
+        item.description,
+        scenario_id,
+        item.item_type,
+        item.meta,
+    )
+
+
+def _relation_edge(rel: ScenarioInjectRelation) -> Tuple[str, str, Dict[str, Any]]:
+    return (
+        rel.from_id,
+        rel.to_id,
+        {
+            "relation_type": rel.relation_type,
+            "affinity": rel.affinity,
+            "session_id": MASTER_SESSION_ID,
+            "meta": rel.meta,
+        },
+    )
+
+
+def _inject_response(
+    scenario_id: str, title: str, inserted_rows: int, started: float
+) -> ScenarioInjectResponse:
+    elapsed = time.perf_counter() - started
+    rows_per_sec = inserted_rows / elapsed if elapsed > 0 else 0.0
+    logger.info(
+        f"Scenario {scenario_id} injected: {inserted_rows} rows "
+        f"in {elapsed * 1e3:.1f} ms ({rows_per_sec:.0f} rows/sec)"
+    )
+    return ScenarioInjectResponse(
+        scenario_id=scenario_id,
+        title=title,
+        inserted_rows=inserted_rows,
+        elapsed_ms=round(elapsed * 1e3, 3),
+        rows_per_sec=round(rows_per_sec, 1),
+    )
+
 
 class ScenarioRepository(BaseRepository):
-    def _get_query(self, path: Any) -> str:
-        """캐시에서 쿼리를 가져오거나 없으면 새로 로드"""
-        query_path = str(path.resolve())
-        if query_path not in SQL_CACHE:
-            with open(query_path, "r", encoding="utf-8") as f:
-                SQL_CACHE[query_path] = f.read()
-        return SQL_CACHE[query_path]
+    def _get_query(self, name: str) -> str:
+        """쿼리 레지스트리에서 SQL 문자열 조회"""
+        return QUERY_REGISTRY.get(name).sql
+
+    async def _insert_scenario(self, conn: Any, header: ScenarioInjectHeader) -> str:
+        scenario_query = self._get_query("MANAGE/scenario/inject_scenario")
+
+        scenario_row = await conn.fetchrow(
+            scenario_query,
+            header.title,
+            header.description,
+            header.author,
+            header.version,
+            header.difficulty,
+            header.genre,
+            header.tags,
+            header.total_acts,
+        )
+
+        if not scenario_row:
+            raise HTTPException(status_code=500, detail="Failed to create scenario")
+        return str(scenario_row["scenario_id"])
 
     async def inject_scenario(
         self, request: ScenarioInjectRequest
     ) -> ScenarioInjectResponse:
-        """시나리오와 모든 마스터 데이터를 트랜잭션으로 주입"""
+        """
+        시나리오와 모든 마스터 데이터를 하나의 트랜잭션으로 일괄 주입
+
+        테이블 행은 엔티티 종류별 executemany 1회로, 그래프 Vertex/Edge는
+        GraphLoader의 UNWIND 배치(Vertex id 맵 기반 Edge 연결)로 생성합니다.
+        """
+        started = time.perf_counter()
 
         async with DatabaseManager.get_connection() as conn:
-            await set_age_path(conn)
             async with conn.transaction():
                 # 1. 시나리오 삽입
-                scenario_query = self._get_query(
-                    self.query_dir / "MANAGE" / "scenario" / "inject_scenario.sql"
-                )
+                scenario_id = await self._insert_scenario(conn, request)
+                graph = GraphLoader(conn)
 
-                scenario_row = await conn.fetchrow(
-                    scenario_query,
-                    request.title,
-                    request.description,
-                    request.author,
-                    request.version,
-                    request.difficulty,
-                    request.genre,
-                    request.tags,
-                    request.total_acts,
+                # 2. NPC 삽입 (SQL 테이블 + AGE 그래프 Vertex)
+                await self._execute_many(
+                    conn,
+                    "MANAGE/npc/inject_master_npc",
+                    [_npc_row(npc, scenario_id) for npc in request.npcs],
+                )
+                await graph.create_vertices(
+                    "npc", [_npc_vertex(npc, scenario_id) for npc in request.npcs]
                 )
 
-                if not scenario_row:
-                    raise HTTPException(
-                        status_code=500, detail="Failed to create scenario"
-                    )
+                # 3. Enemy 삽입 (SQL 테이블 + AGE 그래프 Vertex)
+                await self._execute_many(
+                    conn,
+                    "MANAGE/enemy/inject_master_enemy",
+                    [_enemy_row(enemy, scenario_id) for enemy in request.enemies],
+                )
+                await graph.create_vertices(
+                    "enemy",
+                    [_enemy_vertex(enemy, scenario_id) for enemy in request.enemies],
+                )
 
-                scenario_id = str(scenario_row["scenario_id"])
+                # 4. Item 삽입
+                await self._execute_many(
+                    conn,
+                    "MANAGE/item/inject_master_item",
+                    [_item_row(item, scenario_id) for item in request.items],
+                )
 
-                # 2. NPC 삽입
-                npc_query = self._get_query(
-                    self.query_dir / "MANAGE" / "npc" / "inject_master_npc.sql"
+                # 5. Relation(Edge) 삽입: 주입 중 확보한 Vertex id로 양 끝 지정
+                created_edges = await self._create_edges(
+                    graph, [_relation_edge(rel) for rel in request.relations]
                 )
-                npc_vertex_query = self._get_query(
-                    self.query_dir / "MANAGE" / "npc" / "inject_vertex_npc.sql"
+
+        inserted_rows = (
+            1
+            + 2 * len(request.npcs)
+            + 2 * len(request.enemies)
+            + len(request.items)
+            + created_edges
+        )
+        return _inject_response(scenario_id, request.title, inserted_rows, started)
+
+    async def inject_scenario_stream(
+        self, records: AsyncIterator[Tuple[int, Dict[str, Any]]]
+    ) -> ScenarioInjectResponse:
+        """
+        NDJSON 레코드 스트림으로 시나리오를 하나의 트랜잭션에서 주입
+
+        records: (줄 번호, 레코드) 비동기 이터레이터. 첫 레코드는 type=scenario 헤더,
+        이후 npc/enemy/item/relation 레코드가 임의 순서로 올 수 있습니다.
+        레코드는 유형별 버퍼에 SCENARIO_INJECT_BATCH_SIZE 건까지만 쌓인 뒤 flush 되므로
+        메모리 사용량은 시나리오 크기와 무관합니다. Edge 양 끝 id는 flush 시점에
+        해당 배치가 참조하는 Vertex만 DB에서 조회합니다.
+        아직 도착하지 않은 Vertex를 참조하는 relation은 스트림 끝까지 보류했다가
+        연결하며(보류 건수만큼만 메모리 사용), 끝까지 양 끝이 없으면 422입니다.
+        """
+        started = time.perf_counter()
+
+        async with DatabaseManager.get_connection() as conn:
+            async with conn.transaction():
+                ingest: Optional[_ScenarioStreamIngest] = None
+                async for line_no, record in records:
+                    record_type = record.pop("type", None)
+                    if ingest is None:
+                        if record_type != "scenario":
+                            raise HTTPException(
+                                status_code=422,
+                                detail=f"line {line_no}: first record must be "
+                                "type 'scenario'",
+                            )
+                        header = _validate(ScenarioInjectHeader, record, line_no)
+                        scenario_id = await self._insert_scenario(conn, header)
+                        ingest = _ScenarioStreamIngest(self, conn, scenario_id)
+                        continue
+
+                    model = STREAM_RECORD_MODELS.get(record_type or "")
+                    if model is None:
+                        raise HTTPException(
+                            status_code=422,
+                            detail=f"line {line_no}: unknown record type "
+                            f"{record_type!r}",
+                        )
+                    await ingest.add(record_type, _validate(model, record, line_no))
+
+                if ingest is None:
+                    raise HTTPException(status_code=422, detail="Empty scenario stream")
+                await ingest.flush()
+
+        return _inject_response(
+            ingest.scenario_id, header.title, ingest.inserted_rows, started
+        )
+
+    async def reinject_scenario(
+        self, scenario_id: str, request: ScenarioInjectRequest, dry_run: bool = False
+    ) -> ScenarioReinjectResponse:
+        """
+        기존 시나리오의 Session 0 마스터 데이터를 요청 내용으로 증분 갱신
+
+        NPC/Enemy/Item은 scenario_npc_id / scenario_enemy_id / item_id로,
+        관계는 (from_id, to_id)로 대응시켜 diff를 계산하고 추가/변경/삭제된 행과
+        Vertex/Edge만 반영합니다. dry_run이면 diff만 반환합니다.
+        플레이어 인벤토리/NPC 관계가 참조 중인 항목의 삭제는 conflicts로 보고하며,
+        실제 반영 시에는 409로 거부합니다(ON DELETE CASCADE로 세션 데이터 유실 방지).
+        Copy-on-Write 세션이 마스터 행을 그대로 읽는 NPC/Enemy는 변경/삭제 전에
+        해당 세션 행으로 복제하여 진행 중인 세션의 상태를 유지합니다.
+        """
+        started = time.perf_counter()
+
+        async with DatabaseManager.get_connection() as conn:
+            async with conn.transaction():
+                header = await conn.fetchrow(
+                    self._get_query("INQUIRY/scenario/Scenario_header"), scenario_id
                 )
+                if not header:
+                    raise HTTPException(status_code=404, detail="Scenario not found")
+                scenario_id = str(header["scenario_id"])
+                graph = GraphLoader(conn)
 
-                for npc in request.npcs:
-                    # SQL 테이블 삽입
-                    await conn.execute(
-                        npc_query,
-                        npc.name,
-                        npc.description,
+                # 1. 현재 마스터 데이터 (참조 키 -> 행)
+                npc_rows = {
+                    row["scenario_npc_id"]: row
+                    for row in await conn.fetch(
+                        self._get_query("INQUIRY/scenario/Master_npcs"), scenario_id
+                    )
+                }
+                enemy_rows = {
+                    row["scenario_enemy_id"]: row
+                    for row in await conn.fetch(
+                        self._get_query("INQUIRY/scenario/Master_enemies"),
                         scenario_id,
-                        npc.scenario_npc_id,
-                        npc.tags,
-                        json.dumps(npc.state),
                     )
-                    # AGE 그래프 Vertex 생성
-                    await conn.execute(
-                        npc_vertex_query,
-                        json.dumps(
-                            {
-                                "npc_id": str(
-                                    UUID(int=0)
-                                ),  # Master id is not used for vertex link usually
-                                "session_id": "00000000-0000-0000-0000-000000000000",
-                                "scenario_id": scenario_id,
-                                "scenario_npc_id": npc.scenario_npc_id,
-                                "name": npc.name,
-                                "tags": npc.tags,
-                            }
-                        ),
+                }
+                item_rows = {
+                    str(row["item_id"]): row
+                    for row in await conn.fetch(
+                        self._get_query("INQUIRY/inventory/Catalog_items"),
+                        scenario_id,
                     )
+                }
+                edges = {
+                    _relation_key(edge["start"], edge["end"]): edge
+                    for edge in await graph.fetch_master_edges(scenario_id)
+                }
 
-                # 3. Enemy 삽입
-                enemy_query = self._get_query(
-                    self.query_dir / "MANAGE" / "enemy" / "inject_master_enemy.sql"
+                # 2. 요청 데이터 (참조 키 -> 모델)
+                npcs = _keyed(request.npcs, lambda npc: npc.scenario_npc_id, "npc")
+                enemies = _keyed(
+                    request.enemies, lambda enemy: enemy.scenario_enemy_id, "enemy"
                 )
-                enemy_vertex_query = self._get_query(
-                    self.query_dir / "MANAGE" / "enemy" / "inject_vertex_enemy.sql"
+                items = _keyed(
+                    request.items, lambda item: _uuid_key(item.item_id), "item"
+                )
+                relations = _keyed(
+                    request.relations,
+                    lambda rel: _relation_key(rel.from_id, rel.to_id),
+                    "relation",
                 )
 
-                for enemy in request.enemies:
-                    # SQL 테이블 삽입
-                    await conn.execute(
-                        enemy_query,
-                        enemy.name,
-                        enemy.description,
-                        scenario_id,
-                        enemy.scenario_enemy_id,
-                        enemy.tags,
-                        json.dumps(enemy.state),
-                        enemy.dropped_items,
+                # 3. diff 계산
+                npc_diff = _diff(
+                    {key: _npc_fields(row) for key, row in npc_rows.items()},
+                    {
+                        key: npc.model_dump(exclude={"scenario_npc_id"})
+                        for key, npc in npcs.items()
+                    },
+                )
+                enemy_diff = _diff(
+                    {key: _enemy_fields(row) for key, row in enemy_rows.items()},
+                    {
+                        key: enemy.model_dump(exclude={"scenario_enemy_id"})
+                        for key, enemy in enemies.items()
+                    },
+                )
+                item_diff = _diff(
+                    {key: _item_fields(row) for key, row in item_rows.items()},
+                    {
+                        key: item.model_dump(exclude={"item_id"})
+                        for key, item in items.items()
+                    },
+                )
+                relation_diff = _diff(
+                    {key: edge["properties"] for key, edge in edges.items()},
+                    {key: _relation_edge(rel)[2] for key, rel in relations.items()},
+                )
+                scenario_updated = any(
+                    header[field] != getattr(request, field)
+                    for field in ScenarioInjectHeader.model_fields
+                )
+
+                conflicts = await self._removal_conflicts(
+                    conn,
+                    [item_rows[key]["item_id"] for key in item_diff.removed],
+                    [npc_rows[key]["npc_id"] for key in npc_diff.removed],
+                )
+
+                result = ScenarioReinjectResponse(
+                    scenario_id=scenario_id,
+                    dry_run=dry_run,
+                    scenario_updated=scenario_updated,
+                    npcs=npc_diff,
+                    enemies=enemy_diff,
+                    items=item_diff,
+                    relations=relation_diff,
+                    conflicts=conflicts,
+                )
+                if dry_run:
+                    result.elapsed_ms = round((time.perf_counter() - started) * 1e3, 3)
+                    return result
+                if conflicts:
+                    raise HTTPException(
+                        status_code=409,
+                        detail=f"Master entities referenced by sessions: {conflicts}",
                     )
-                    # AGE 그래프 Vertex 생성
-                    await conn.execute(
-                        enemy_vertex_query,
-                        json.dumps(
-                            {
-                                "enemy_id": str(UUID(int=0)),
-                                "session_id": "00000000-0000-0000-0000-000000000000",
-                                "scenario_id": scenario_id,
-                                "scenario_enemy_id": enemy.scenario_enemy_id,
-                                "name": enemy.name,
-                                "tags": enemy.tags,
-                            }
-                        ),
+
+                # 4. Copy-on-Write 세션이 읽는 마스터 행은 바꾸기 전에 세션 행으로 고정
+                frozen_npcs = npc_diff.updated + npc_diff.removed
+                frozen_enemies = enemy_diff.updated + enemy_diff.removed
+                if frozen_npcs or frozen_enemies:
+                    result.frozen_rows = await conn.fetchval(
+                        self._get_query("MANAGE/scenario/freeze_overlay_entities"),
+                        [npc_rows[key]["npc_id"] for key in frozen_npcs],
+                        [enemy_rows[key]["enemy_id"] for key in frozen_enemies],
                     )
 
-                # 4. Item 삽입
-                item_query = self._get_query(
-                    self.query_dir / "MANAGE" / "item" / "inject_master_item.sql"
+                # 5. 반영: Edge 삭제 -> Vertex/행 삭제·변경·추가 -> Edge 변경·추가
+                await graph.delete_edges(
+                    [edges[key]["id"] for key in relation_diff.removed]
                 )
 
-                for item in request.items:
+                if scenario_updated:
                     await conn.execute(
-                        item_query,
-                        item.item_id,
-                        item.name,
-                        item.description,
+                        self._get_query("MANAGE/scenario/update_scenario"),
                         scenario_id,
-                        item.item_type,
-                        json.dumps(item.meta),
+                        request.title,
+                        request.description,
+                        request.author,
+                        request.version,
+                        request.difficulty,
+                        request.genre,
+                        request.tags,
+                        request.total_acts,
                     )
 
-                # 5. Relation(Edge) 삽입
-                edge_query = self._get_query(
-                    self.query_dir / "MANAGE" / "scenario" / "inject_edge_relation.sql"
+                if npc_diff.removed:
+                    await conn.execute(
+                        self._get_query("MANAGE/npc/remove_master_npc"),
+                        [npc_rows[key]["npc_id"] for key in npc_diff.removed],
+                    )
+                    await graph.delete_vertices("npc", scenario_id, npc_diff.removed)
+                await self._execute_many(
+                    conn,
+                    "MANAGE/npc/update_master_npc",
+                    [
+                        (
+                            npc_rows[key]["npc_id"],
+                            npcs[key].name,
+                            npcs[key].description,
+                            npcs[key].tags,
+                            npcs[key].state,
+                        )
+                        for key in npc_diff.updated
+                    ],
+                )
+                await graph.update_vertices(
+                    "npc",
+                    scenario_id,
+                    [_npc_vertex(npcs[key], scenario_id) for key in npc_diff.updated],
                 )
-                for rel in request.relations:
+                await self._execute_many(
+                    conn,
+                    "MANAGE/npc/inject_master_npc",
+                    [_npc_row(npcs[key], scenario_id) for key in npc_diff.added],
+                )
+                await graph.create_vertices(
+                    "npc",
+                    [_npc_vertex(npcs[key], scenario_id) for key in npc_diff.added],
+                )
+
+                if enemy_diff.removed:
                     await conn.execute(
-                        edge_query,
-                        json.dumps(
-                            {
-                                "session_id": "00000000-0000-0000-0000-000000000000",
-                                "from_id": rel.from_id,
-                                "to_id": rel.to_id,
-                                "relation_type": rel.relation_type,
-                                "affinity": rel.affinity,
-                                "meta": rel.meta,
-                            }
-                        ),
+                        self._get_query("MANAGE/enemy/remove_master_enemy"),
+                        [enemy_rows[key]["enemy_id"] for key in enemy_diff.removed],
                     )
+                    await graph.delete_vertices(
+                        "enemy", scenario_id, enemy_diff.removed
+                    )
+                await self._execute_many(
+                    conn,
+                    "MANAGE/enemy/update_master_enemy",
+                    [
+                        (
+                            enemy_rows[key]["enemy_id"],
+                            enemies[key].name,
+                            enemies[key].description,
+                            enemies[key].tags,
+                            enemies[key].state,
+                            enemies[key].dropped_items,
+                        )
+                        for key in enemy_diff.updated
+                    ],
+                )
+                await graph.update_vertices(
+                    "enemy",
+                    scenario_id,
+                    [
+                        _enemy_vertex(enemies[key], scenario_id)
+                        for key in enemy_diff.updated
+                    ],
+                )
+                await self._execute_many(
+                    conn,
+                    "MANAGE/enemy/inject_master_enemy",
+                    [_enemy_row(enemies[key], scenario_id) for key in enemy_diff.added],
+                )
+                await graph.create_vertices(
+                    "enemy",
+                    [
+                        _enemy_vertex(enemies[key], scenario_id)
+                        for key in enemy_diff.added
+                    ],
+                )
+
+                if item_diff.removed:
+                    await conn.execute(
+                        self._get_query("MANAGE/item/remove_master_item"),
+                        [item_rows[key]["item_id"] for key in item_diff.removed],
+                    )
+                await self._execute_many(
+                    conn,
+                    "MANAGE/item/update_master_item",
+                    [
+                        (
+                            item_rows[key]["item_id"],
+                            items[key].name,
+                            items[key].description,
+                            items[key].item_type,
+                            items[key].meta,
+                        )
+                        for key in item_diff.updated
+                    ],
+                )
+                await self._execute_many(
+                    conn,
+                    "MANAGE/item/inject_master_item",
+                    [_item_row(items[key], scenario_id) for key in item_diff.added],
+                )
 
-                return ScenarioInjectResponse(
-                    scenario_id=scenario_id, title=request.title
+                await graph.update_edges(
+                    [
+                        (edges[key]["id"], _relation_edge(relations[key])[2])
+                        for key in relation_diff.updated
+                    ]
+                )
+                new_edges = [
+                    _relation_edge(relations[key]) for key in relation_diff.added
+                ]
+                await graph.resolve_refs(
+                    scenario_id,
+                    {ref for start, end, _ in new_edges for ref in (start, end)},
                 )
+                created_edges = await self._create_edges(graph, new_edges)
+
+        result.applied_rows = (
+            int(scenario_updated)
+            + 2 * _changed(npc_diff)
+            + 2 * _changed(enemy_diff)
+            + _changed(item_diff)
+            + len(relation_diff.updated)
+            + len(relation_diff.removed)
+            + created_edges
+        )
+        result.elapsed_ms = round((time.perf_counter() - started) * 1e3, 3)
+        logger.info(
+            f"Scenario {scenario_id} re-injected: {result.applied_rows} rows "
+            f"in {result.elapsed_ms:.1f} ms"
+        )
+        return result
+
+    async def _removal_conflicts(
+        self, conn: Any, item_ids: List[Any], npc_ids: List[Any]
+    ) -> List[str]:
+        """삭제 예정 마스터 행 중 세션 데이터가 참조 중인 항목 ('<종류>:<키>')"""
+        if not item_ids and not npc_ids:
+            return []
+        rows = await conn.fetch(
+            self._get_query("INQUIRY/scenario/Master_references"), item_ids, npc_ids
+        )
+        return sorted(f"{row['kind']}:{row['ref']}" for row in rows)
+
+    async def _execute_many(
+        self, conn: Any, query_name: str, records: List[Tuple[Any, ...]]
+    ) -> None:
+        """동일 INSERT를 여러 행에 대해 한 번의 왕복(executemany)으로 실행"""
+        if records:
+            await conn.executemany(self._get_query(query_name), records)
+
+    async def _create_edges(
+        self, graph: GraphLoader, edges: List[Tuple[str, str, Dict[str, Any]]]
+    ) -> int:
+        """
+        Relation Edge 일괄 생성 후 생성 수 반환
+
+        양 끝 Vertex를 찾지 못한 Edge가 하나라도 있으면 422로 거부하여
+        트랜잭션 전체를 롤백합니다 (일부 Edge만 생성된 채 커밋되지 않음).
+        """
+        unknown = sorted(
+            {ref for start, end, _ in edges for ref in (start, end)}
+            - graph.id_map.keys()
+        )
+        if unknown:
+            raise HTTPException(
+                status_code=422, detail=f"Unknown relation endpoints: {unknown}"
+            )
+        return await graph.create_edges(edges)
+
+    async def get_all_scenarios(
+        self,
+        after_created_at: Optional[datetime] = None,
+        after_scenario_id: Optional[str] = None,
+        limit: Optional[int] = LIST_PAGE_DEFAULT_LIMIT,
+    ) -> List[Dict[str, Any]]:
+        """
+        전체 시나리오 목록 (최근 생성 순, keyset 페이지네이션)
+
+        다음 페이지는 마지막 행의 created_at / scenario_id를 커서로 전달합니다.
+        """
+        query = "INQUIRY/scenario/List_all"
+        return await run_sql_query(query, [after_created_at, after_scenario_id, limit])
+
+
+def _relation_key(from_id: str, to_id: str) -> str:
+    return f"{from_id}->{to_id}"
+
+
+def _uuid_key(value: str) -> str:
+    # item_id는 DB에서 UUID로 정규화되므로 요청 값도 같은 표기로 비교
+    try:
+        return str(UUID(value))
+    except ValueError:
+        return value
+
+
+def _keyed(entities: List[M], key: Callable[[M], str], kind: str) -> Dict[str, M]:
+    keyed: Dict[str, M] = {}
+    for entity in entities:
+        ref = key(entity)
+        if ref in keyed:
+            raise HTTPException(
+                status_code=422, detail=f"Duplicate {kind} key in request: {ref}"
+            )
+        keyed[ref] = entity
+    return keyed
+
+
+def _diff(existing: Dict[str, Any], desired: Dict[str, Any]) -> ScenarioEntityDiff:
+    """참조 키 기준 추가/변경/삭제 분류 (값은 비교 가능한 dict)"""
+    added = [key for key in desired if key not in existing]
+    removed = [key for key in existing if key not in desired]
+    updated = [
+        key for key in desired if key in existing and existing[key] != desired[key]
+    ]
+    return ScenarioEntityDiff(
+        added=added,
+        updated=updated,
+        removed=removed,
+        unchanged=len(desired) - len(added) - len(updated),
+    )
+
+
+def _changed(diff: ScenarioEntityDiff) -> int:
+    return len(diff.added) + len(diff.updated) + len(diff.removed)
+
+
+def _npc_fields(row: Any) -> Dict[str, Any]:
+    return {
+        "name": row["name"],
+        "description": row["description"] or "",
+        "tags": list(row["tags"] or []),
+        "state": row["state"],
+    }
+
+
+def _enemy_fields(row: Any) -> Dict[str, Any]:
+    return {
+        **_npc_fields(row),
+        "dropped_items": [str(item_id) for item_id in row["dropped_items"] or []],
+    }
+
+
+def _item_fields(row: Any) -> Dict[str, Any]:
+    return {
+        "name": row["name"],
+        "description": row["description"] or "",
+        "item_type": row["item_type"],
+        "meta": row["meta"],
+    }
+
+
+def _validate(model: Type[M], record: Dict[str, Any], line_no: int) -> M:
+    try:
+        return model.model_validate(record)
+    except ValidationError as e:
+        raise HTTPException(
+            status_code=422,
+            detail=f"line {line_no}: {e.errors(include_url=False)}",
+        ) from e
+
+
+class _ScenarioStreamIngest:
+    """스트리밍 주입 중 유형별 배치 버퍼 (배치가 차면 즉시 DB로 flush)"""
+
+    def __init__(self, repo: ScenarioRepository, conn: Any, scenario_id: str):
+        self.repo = repo
+        self.conn = conn
+        self.scenario_id = scenario_id
+        # Vertex id는 Edge flush 시점에 필요한 만큼만 조회 (id 맵 누적 없음)
+        self.graph = GraphLoader(conn, record_ids=False)
+        self.batch_size = max(SCENARIO_INJECT_BATCH_SIZE, 1)
+        self.buffers: Dict[str, List[Any]] = {key: [] for key in STREAM_RECORD_MODELS}
+        # 양 끝 Vertex가 아직 주입되지 않은 relation (마지막 flush에서 다시 연결)
+        self.deferred_relations: List[Any] = []
+        self.inserted_rows = 1
+
+    async def add(self, record_type: str, record: Any) -> None:
+        buffer = self.buffers[record_type]
+        buffer.append(record)
+        if len(buffer) >= self.batch_size:
+            if record_type == "relation":
+                # Edge가 참조할 수 있는 Vertex를 먼저 반영
+                await self._flush_vertices()
+            await self._flush_type(record_type)
+
+    async def flush(self) -> None:
+        await self._flush_vertices()
+        await self._flush_type("item")
+        self.buffers["relation"].extend(self.deferred_relations)
+        self.deferred_relations = []
+        await self._flush_type("relation", final=True)
+
+    async def _flush_vertices(self) -> None:
+        await self._flush_type("npc")
+        await self._flush_type("enemy")
 
-    async def get_all_scenarios(self) -> List[Dict[str, Any]]:
-        query = "SELECT * FROM scenario ORDER BY created_at DESC"
-        # run_sql_query는 내부적으로 파일을 읽으므로 원시 쿼리는 run_raw_query 사용 권장
-        from state_db.infrastructure import run_raw_query
+    async def _flush_type(self, record_type: str, final: bool = False) -> None:
+        batch = self.buffers[record_type]
+        if not batch:
+            return
+        self.buffers[record_type] = []
+        scenario_id = self.scenario_id
 
-        return await run_raw_query(query)
+        if record_type == "npc":
+            await self.repo._execute_many(
+                self.conn,
+                "MANAGE/npc/inject_master_npc",
+                [_npc_row(npc, scenario_id) for npc in batch],
+            )
+            await self.graph.create_vertices(
+                "npc", [_npc_vertex(npc, scenario_id) for npc in batch]
+            )
+            self.inserted_rows += 2 * len(batch)
+        elif record_type == "enemy":
+            await self.repo._execute_many(
+                self.conn,
+                "MANAGE/enemy/inject_master_enemy",
+                [_enemy_row(enemy, scenario_id) for enemy in batch],
+            )
+            await self.graph.create_vertices(
+                "enemy", [_enemy_vertex(enemy, scenario_id) for enemy in batch]
+            )
+            self.inserted_rows += 2 * len(batch)
+        elif record_type == "item":
+            await self.repo._execute_many(
+                self.conn,
+                "MANAGE/item/inject_master_item",
+                [_item_row(item, scenario_id) for item in batch],
+            )
+            self.inserted_rows += len(batch)
+        else:
+            edges = [_relation_edge(rel) for rel in batch]
+            refs = {ref for start, end, _ in edges for ref in (start, end)}
+            await self.graph.resolve_refs(scenario_id, refs)
+            if not final:
+                # 배치 크기와 관계없이 같은 결과가 되도록 미해결 relation은 보류
+                id_map = self.graph.id_map
+                ready = []
+                for rel, edge in zip(batch, edges, strict=True):
+                    if edge[0] in id_map and edge[1] in id_map:
+                        ready.append(edge)
+                    else:
+                        self.deferred_relations.append(rel)
+                edges = ready
+            created = await self.repo._create_edges(self.graph, edges)
+            self.graph.id_map.clear()
+            self.inserted_rows += created
@@ -1,17 +1,45 @@
-from typing import Any, Dict, List
+from datetime import datetime
+from typing import Any, AsyncIterator, Dict, List, Optional
 from uuid import UUID
 
 from fastapi import HTTPException
 
-from state_db.infrastructure import execute_sql_function, run_sql_command, run_sql_query
+from state_db.configs.setting import LIST_PAGE_DEFAULT_LIMIT
+from state_db.infrastructure import (
+    ITEM_CATALOG,
+    QUERY_REGISTRY,
+    SESSION_CACHE,
+    SESSION_POOL,
+    DatabaseManager,
+    GraphLoader,
+    execute_sql_function,
+    run_sql_command,
+    run_sql_query,
+    stream_sql_query,
+)
 from state_db.models import (
     ActChangeResult,
+    EnemyInfo,
+    InventoryItem,
+    ItemInfo,
+    NPCInfo,
+    PhaseChangeResult,
+    PlayerStats,
     SequenceChangeResult,
     SessionInfo,
+    TurnAddResult,
 )
 
 from .world import WorldStateRepository
 
+# 세션 목록 조회 쿼리 (모두 (started_at, session_id) 내림차순 keyset 페이지네이션)
+SESSION_LIST_QUERIES: Dict[str, str] = {
+    "all": "INQUIRY/session/Session_all-r",
+    "active": "INQUIRY/session/Session_active",
+    "paused": "INQUIRY/session/Session_paused-r",
+    "ended": "INQUIRY/session/Session_ended-r",
+}
+
 
 class SessionRepository(WorldStateRepository):
     # Session Lifecycle
@@ -26,59 +54,183 @@ class SessionRepository(WorldStateRepository):
                 status_code=400, detail=f"Invalid scenario_id: {scenario_id}"
             ) from e
 
-        result = await execute_sql_function(
-            "create_session", [scenario_uuid, act, sequence, location]
-        )
-        session_id = result[0].get("create_session") if result else None
+        session_id = None
+        if SESSION_POOL.enabled:
+            # 사전 복제된 세션이 있으면 트리거 캐스케이드 없이 할당
+            query = "START_by_session/claim_session"
+            result = await run_sql_query(
+                query, [scenario_uuid, act, sequence, location]
+            )
+            session_id = result[0].get("session_id") if result else None
+            SESSION_POOL.record_claim(session_id is not None)
+            if session_id is not None:
+                SESSION_CACHE.invalidate(session_id)
+
+        if session_id is None:
+            result = await execute_sql_function(
+                "create_session", [scenario_uuid, act, sequence, location]
+            )
+            session_id = result[0].get("create_session") if result else None
         if not session_id:
             raise Exception("Failed to create session")
 
         return await self.get_info(session_id)
 
+    async def start_bulk(
+        self,
+        scenario_id: str,
+        count: int,
+        act: int,
+        sequence: int,
+        location: str,
+    ) -> List[str]:
+        """동일 시나리오 세션 N개를 한 트랜잭션에서 집합 기반 복제로 생성"""
+        try:
+            scenario_uuid = UUID(scenario_id)
+        except (ValueError, AttributeError) as e:
+            raise HTTPException(
+                status_code=400, detail=f"Invalid scenario_id: {scenario_id}"
+            ) from e
+
+        query = QUERY_REGISTRY.get("START_by_session/bulk_create_sessions").sql
+        async with DatabaseManager.get_connection() as conn:
+            async with conn.transaction():
+                # 테이블 행은 SQL 집합 복제, 그래프는 id 맵 기반 GraphLoader로 복제
+                session_ids = await conn.fetchval(
+                    query, scenario_uuid, count, act, sequence, location, False
+                )
+                if not session_ids:
+                    raise Exception("Failed to create sessions")
+                await GraphLoader(conn).clone_scenario_graph(scenario_uuid, session_ids)
+        return [str(session_id) for session_id in session_ids]
+
     async def end(self, session_id: str) -> None:
-        sql_path = self.query_dir / "MANAGE" / "session" / "end_session.sql"
-        await run_sql_command(sql_path, [session_id])
+        query = "MANAGE/session/end_session"
+        await run_sql_command(query, [session_id])
+        SESSION_CACHE.invalidate(session_id)
 
     async def pause(self, session_id: str) -> None:
-        sql_path = self.query_dir / "MANAGE" / "session" / "pause_session.sql"
-        await run_sql_command(sql_path, [session_id])
+        query = "MANAGE/session/pause_session"
+        await run_sql_command(query, [session_id])
+        SESSION_CACHE.invalidate(session_id)
 
     async def resume(self, session_id: str) -> None:
-        sql_path = self.query_dir / "MANAGE" / "session" / "resume_session.sql"
-        await run_sql_command(sql_path, [session_id])
+        query = "MANAGE/session/resume_session"
+        await run_sql_command(query, [session_id])
+        SESSION_CACHE.invalidate(session_id)
 
     # Session Query
 
     async def get_info(self, session_id: str) -> SessionInfo:
-        sql_path = self.query_dir / "INQUIRY" / "session" / "Session_show-r.sql"
-        result = await run_sql_query(sql_path, [session_id])
+        cached = SESSION_CACHE.get(session_id, "info")
+        if cached is not None:
+            return cached
+        query = "INQUIRY/session/Session_show-r"
+        result = await run_sql_query(query, [session_id])
         if result:
-            return SessionInfo.model_validate(result[0])
+            info = SessionInfo.model_validate(result[0])
+            SESSION_CACHE.put(session_id, "info", info)
+            return info
         raise HTTPException(status_code=404, detail="Session not found")
 
-    async def get_active_sessions(self) -> List[SessionInfo]:
-        sql_path = self.query_dir / "INQUIRY" / "session" / "Session_active.sql"
-        results = await run_sql_query(sql_path)
-        return [SessionInfo.model_validate(row) for row in results]
+    async def get_item(self, session_id: str, item_id: str) -> ItemInfo:
+        """세션 시나리오의 공유 아이템 정의 조회 (카탈로그 캐시 우선)"""
+        if ITEM_CATALOG.enabled:
+            info = await self.get_info(session_id)
+            item = await ITEM_CATALOG.get(info.scenario_id, item_id)
+        else:
+            query = "INQUIRY/inventory/Detail_item"
+            result = await run_sql_query(query, [session_id, item_id])
+            item = result[0] if result else None
+        if item is None:
+            raise HTTPException(status_code=404, detail="Item not found")
+        return ItemInfo.model_validate(item)
 
-    async def get_all_sessions(self) -> List[SessionInfo]:
-        sql_path = self.query_dir / "INQUIRY" / "session" / "Session_all-r.sql"
-        results = await run_sql_query(sql_path)
-        return [SessionInfo.model_validate(row) for row in results]
+    async def get_snapshot(self, session_id: str) -> Dict[str, Any]:
+        """세션/플레이어/엔티티/인벤토리/Phase/Turn 상태를 한 번의 쿼리로 조회"""
+        query = "INQUIRY/session/Session_snapshot"
+        result = await run_sql_query(query, [session_id])
+        if not result:
+            raise HTTPException(status_code=404, detail="Session not found")
 
-    async def get_paused_sessions(self) -> List[SessionInfo]:
-        sql_path = self.query_dir / "INQUIRY" / "session" / "Session_paused-r.sql"
-        results = await run_sql_query(sql_path)
-        return [SessionInfo.model_validate(row) for row in results]
+        snapshot = result[0]["snapshot"]
+        player = snapshot.get("player")
+        info = SessionInfo.model_validate(snapshot["session"])
+        phase = PhaseChangeResult.model_validate(snapshot["phase"])
+        turn = TurnAddResult.model_validate(snapshot["turn"])
+        # 스냅샷은 항상 DB에서 읽으며, 읽은 세션 상태로 캐시를 갱신
+        SESSION_CACHE.put(session_id, "info", info)
+        SESSION_CACHE.put(session_id, "phase", phase)
+        SESSION_CACHE.put(session_id, "turn", turn)
+        return {
+            "session": info,
+            "player": PlayerStats.model_validate(player) if player else None,
+            "npcs": [NPCInfo.model_validate(row) for row in snapshot["npcs"]],
+            "enemies": [EnemyInfo.model_validate(row) for row in snapshot["enemies"]],
+            "inventory": [
+                InventoryItem.model_validate(row) for row in snapshot["inventory"]
+            ],
+            "phase": phase,
+            "turn": turn,
+        }
+
+    # State Changes
+
+    async def apply_state_changes(
+        self, session_id: str, changes: Dict[str, Any]
+    ) -> List[str]:
+        """판정 결과 전체를 단일 트랜잭션(1 round trip)으로 적용"""
+        query = "UPDATE/apply_state_changes"
+        result = await run_sql_query(query, [session_id, changes])
+        SESSION_CACHE.invalidate(session_id)
+        if not result or result[0]["updated_fields"] is None:
+            raise HTTPException(status_code=404, detail="Session not found")
+        return list(result[0]["updated_fields"])
+
+    async def list_sessions(
+        self,
+        status: str = "all",
+        after_started_at: Optional[datetime] = None,
+        after_session_id: Optional[str] = None,
+        limit: int = LIST_PAGE_DEFAULT_LIMIT,
+    ) -> List[SessionInfo]:
+        """
+        세션 목록 조회 (최근 시작 순, keyset 페이지네이션)
 
-    async def get_ended_sessions(self) -> List[SessionInfo]:
-        sql_path = self.query_dir / "INQUIRY" / "session" / "Session_ended-r.sql"
-        results = await run_sql_query(sql_path)
+        다음 페이지는 마지막 행의 started_at / session_id를 커서로 전달합니다.
+        """
+        query = SESSION_LIST_QUERIES[status]
+        params = [after_started_at, after_session_id, limit]
+        results = await run_sql_query(query, params)
         return [SessionInfo.model_validate(row) for row in results]
 
+    async def stream_sessions(
+        self,
+        status: str = "all",
+        after_started_at: Optional[datetime] = None,
+        after_session_id: Optional[str] = None,
+    ) -> AsyncIterator[Dict[str, Any]]:
+        """세션 목록을 서버 측 커서로 끝까지 스트리밍 (SessionInfo JSON 형태)"""
+        query = SESSION_LIST_QUERIES[status]
+        params = [after_started_at, after_session_id, None]
+        async for row in stream_sql_query(query, params):
+            yield SessionInfo.model_validate(row).model_dump(mode="json")
+
+    async def get_active_sessions(self, **page: Any) -> List[SessionInfo]:
+        return await self.list_sessions("active", **page)
+
+    async def get_all_sessions(self, **page: Any) -> List[SessionInfo]:
+        return await self.list_sessions("all", **page)
+
+    async def get_paused_sessions(self, **page: Any) -> List[SessionInfo]:
+        return await self.list_sessions("paused", **page)
+
+    async def get_ended_sessions(self, **page: Any) -> List[SessionInfo]:
+        return await self.list_sessions("ended", **page)
+
     async def get_progress(self, session_id: str) -> Dict[str, Any]:
-        sql_path = self.query_dir / "INQUIRY" / "Progress_get-r.sql"
-        result = await run_sql_query(sql_path, [session_id])
+        query = "INQUIRY/Progress_get-r"
+        result = await run_sql_query(query, [session_id])
         if result:
             return result[0]
         raise HTTPException(status_code=404, detail="Session not found")
@@ -86,57 +238,63 @@ class SessionRepository(WorldStateRepository):
     # Session Utilities
 
     async def phase_check(self, session_id: str) -> Dict[str, Any]:
-        sql_path = self.query_dir / "MANAGE" / "phase" / "phase_check.sql"
-        result = await run_sql_query(sql_path, [session_id])
+        query = "MANAGE/phase/phase_check"
+        result = await run_sql_query(query, [session_id])
         if result:
             return result[0]
         raise HTTPException(status_code=404, detail="Session not found")
 
     async def turn_changed(self, session_id: str) -> Dict[str, Any]:
-        sql_path = self.query_dir / "MANAGE" / "turn" / "turn_changed.sql"
-        result = await run_sql_query(sql_path, [session_id])
+        query = "MANAGE/turn/turn_changed"
+        result = await run_sql_query(query, [session_id])
+        SESSION_CACHE.invalidate(session_id)
         if result:
             return result[0]
         raise HTTPException(status_code=404, detail="Session not found")
 
     async def add_act(self, session_id: str) -> ActChangeResult:
-        sql_path = self.query_dir / "MANAGE" / "act" / "add_act.sql"
-        result = await run_sql_query(sql_path, [session_id])
+        query = "MANAGE/act/add_act"
+        result = await run_sql_query(query, [session_id])
+        SESSION_CACHE.invalidate(session_id)
         if result:
             return ActChangeResult.model_validate(result[0])
         raise HTTPException(status_code=404, detail="Session not found")
 
     async def back_act(self, session_id: str) -> ActChangeResult:
-        sql_path = self.query_dir / "MANAGE" / "act" / "back_act.sql"
-        result = await run_sql_query(sql_path, [session_id])
+        query = "MANAGE/act/back_act"
+        result = await run_sql_query(query, [session_id])
+        SESSION_CACHE.invalidate(session_id)
         if result:
             return ActChangeResult.model_validate(result[0])
         raise HTTPException(status_code=404, detail="Session not found")
 
     async def act_check(self, session_id: str) -> Dict[str, Any]:
-        sql_path = self.query_dir / "MANAGE" / "act" / "act_check.sql"
-        result = await run_sql_query(sql_path, [session_id])
+        query = "MANAGE/act/act_check"
+        result = await run_sql_query(query, [session_id])
         if result:
             return result[0]
         raise HTTPException(status_code=404, detail="Session not found")
 
     async def add_sequence(self, session_id: str) -> SequenceChangeResult:
-        sql_path = self.query_dir / "MANAGE" / "sequence" / "add_sequence.sql"
-        result = await run_sql_query(sql_path, [session_id])
+        query = "MANAGE/sequence/add_sequence"
+        result = await run_sql_query(query, [session_id])
+        SESSION_CACHE.invalidate(session_id)
         if result:
             return SequenceChangeResult.model_validate(result[0])
         raise HTTPException(status_code=404, detail="Session not found")
 
     async def back_sequence(self, session_id: str) -> SequenceChangeResult:
-        sql_path = self.query_dir / "MANAGE" / "sequence" / "back_sequence.sql"
-        result = await run_sql_query(sql_path, [session_id])
+        query = "MANAGE/sequence/back_sequence"
+        result = await run_sql_query(query, [session_id])
+        SESSION_CACHE.invalidate(session_id)
         if result:
             return SequenceChangeResult.model_validate(result[0])
         raise HTTPException(status_code=404, detail="Session not found")
 
     async def limit_sequence(self, session_id: str) -> Dict[str, Any]:
-        sql_path = self.query_dir / "MANAGE" / "sequence" / "limit_sequence.sql"
-        result = await run_sql_query(sql_path, [session_id])
+        query = "MANAGE/sequence/limit_sequence"
+        result = await run_sql_query(query, [session_id])
+        SESSION_CACHE.invalidate(session_id)
         if result:
             return result[0]
         raise HTTPException(status_code=404, detail="Session not found")
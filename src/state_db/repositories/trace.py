@@ -1,8 +1,10 @@
-from typing import Any, Dict, List, Optional
+from datetime import datetime
+from typing import Any, AsyncIterator, Dict, List, Optional
 
 from fastapi import HTTPException
 
-from state_db.infrastructure import run_sql_query
+from state_db.configs.setting import LIST_PAGE_DEFAULT_LIMIT
+from state_db.infrastructure import run_sql_query, stream_sql_query
 from state_db.repositories.base import BaseRepository
 
 
@@ -13,26 +15,38 @@ class TraceRepository(BaseRepository):
     # Turn History
     # ====================================================================
 
-    async def get_turn_history(self, session_id: str) -> List[Dict[str, Any]]:
-        """특정 세션의 Turn 이력 조회 (전체)"""
-        sql_path = self.query_dir / "TRACE" / "turn" / "get_history.sql"
-        results = await run_sql_query(sql_path, [session_id])
+    async def get_turn_history(
+        self,
+        session_id: str,
+        after_turn: Optional[int] = None,
+        limit: int = LIST_PAGE_DEFAULT_LIMIT,
+    ) -> List[Dict[str, Any]]:
+        """특정 세션의 Turn 이력 조회 (after_turn 이후 limit개, keyset 페이지네이션)"""
+        query = "TRACE/turn/get_history"
+        results = await run_sql_query(query, [session_id, after_turn, limit])
         return list(results) if results else []
 
+    def stream_turn_history(
+        self, session_id: str, after_turn: Optional[int] = None
+    ) -> AsyncIterator[Dict[str, Any]]:
+        """특정 세션의 Turn 이력을 서버 측 커서로 끝까지 스트리밍"""
+        query = "TRACE/turn/get_history"
+        return stream_sql_query(query, [session_id, after_turn, None])
+
     async def get_recent_turns(
         self, session_id: str, limit: int = 10
     ) -> List[Dict[str, Any]]:
         """최근 N개의 Turn 조회"""
-        sql_path = self.query_dir / "TRACE" / "turn" / "get_recent.sql"
-        results = await run_sql_query(sql_path, [session_id, limit])
+        query = "TRACE/turn/get_recent"
+        results = await run_sql_query(query, [session_id, limit])
         return list(results) if results else []
 
     async def get_turn_details(
         self, session_id: str, turn_number: int
     ) -> Dict[str, Any]:
         """특정 Turn의 상세 정보 조회"""
-        sql_path = self.query_dir / "TRACE" / "turn" / "get_details.sql"
-        result = await run_sql_query(sql_path, [session_id, turn_number])
+        query = "TRACE/turn/get_details"
+        result = await run_sql_query(query, [session_id, turn_number])
         if result:
             return result[0]
         raise HTTPException(status_code=404, detail="Turn not found")
@@ -41,42 +55,58 @@ class TraceRepository(BaseRepository):
         self, session_id: str, start_turn: int, end_turn: int
     ) -> List[Dict[str, Any]]:
         """Turn 범위 조회 (리플레이용)"""
-        sql_path = self.query_dir / "TRACE" / "turn" / "get_range.sql"
-        results = await run_sql_query(sql_path, [session_id, start_turn, end_turn])
+        query = "TRACE/turn/get_range"
+        results = await run_sql_query(query, [session_id, start_turn, end_turn])
         return list(results) if results else []
 
     async def get_latest_turn(self, session_id: str) -> Optional[Dict[str, Any]]:
         """가장 최근 Turn 조회"""
-        sql_path = self.query_dir / "TRACE" / "turn" / "get_latest.sql"
-        result = await run_sql_query(sql_path, [session_id])
+        query = "TRACE/turn/get_latest"
+        result = await run_sql_query(query, [session_id])
         return result[0] if result else None
 
     async def get_turn_statistics_by_phase(
         self, session_id: str
     ) -> List[Dict[str, Any]]:
-        """Phase별 Turn 수 집계 및 상세 통계"""
-        sql_path = self.query_dir / "TRACE" / "turn" / "get_statistics_by_phase.sql"
-        results = await run_sql_query(sql_path, [session_id])
+        """Phase별 Turn 수 집계 (세션 이력 요약 테이블)"""
+        query = "TRACE/turn/get_statistics_by_phase"
+        results = await run_sql_query(query, [session_id])
         return list(results) if results else []
 
     async def get_turn_statistics_by_type(
         self, session_id: str
     ) -> List[Dict[str, Any]]:
-        """Turn Type별 집계"""
-        sql_path = self.query_dir / "TRACE" / "turn" / "get_statistics_by_type.sql"
-        results = await run_sql_query(sql_path, [session_id])
+        """Turn Type별 집계 (세션 이력 요약 테이블)"""
+        query = "TRACE/turn/get_statistics_by_type"
+        results = await run_sql_query(query, [session_id])
         return list(results) if results else []
 
     async def get_turn_duration_analysis(self, session_id: str) -> List[Dict[str, Any]]:
         """각 Turn의 소요 시간 계산 및 분석"""
-        sql_path = self.query_dir / "TRACE" / "turn" / "get_duration_analysis.sql"
-        results = await run_sql_query(sql_path, [session_id])
+        query = "TRACE/turn/get_duration_analysis"
+        results = await run_sql_query(query, [session_id])
+        return list(results) if results else []
+
+    async def get_checkpoint_before(
+        self, session_id: str, turn_number: int
+    ) -> Optional[Dict[str, Any]]:
+        """turn_number 이하에서 가장 가까운 세션 상태 체크포인트"""
+        query = "TRACE/replay/get_checkpoint"
+        result = await run_sql_query(query, [session_id, turn_number])
+        return result[0] if result else None
+
+    async def get_turn_deltas(
+        self, session_id: str, after_turn: int, to_turn: int
+    ) -> List[Dict[str, Any]]:
+        """after_turn 초과 ~ to_turn 이하 Turn의 변경 내역 (리플레이용)"""
+        query = "TRACE/replay/get_deltas"
+        results = await run_sql_query(query, [session_id, after_turn, to_turn])
         return list(results) if results else []
 
     async def get_turn_summary(self, session_id: str) -> Dict[str, Any]:
-        """Turn 요약 리포트"""
-        sql_path = self.query_dir / "TRACE" / "turn" / "get_summary.sql"
-        result = await run_sql_query(sql_path, [session_id])
+        """Turn 요약 리포트 (세션 이력 요약 테이블)"""
+        query = "TRACE/turn/get_summary"
+        result = await run_sql_query(query, [session_id])
         if result:
             return result[0]
         return {}
@@ -85,56 +115,78 @@ class TraceRepository(BaseRepository):
     # Phase History
     # ====================================================================
 
-    async def get_phase_history(self, session_id: str) -> List[Dict[str, Any]]:
-        """특정 세션의 Phase 전환 이력 조회 (전체)"""
-        sql_path = self.query_dir / "TRACE" / "phase" / "get_history.sql"
-        results = await run_sql_query(sql_path, [session_id])
+    async def get_phase_history(
+        self,
+        session_id: str,
+        after_transitioned_at: Optional[datetime] = None,
+        after_phase_id: Optional[str] = None,
+        limit: int = LIST_PAGE_DEFAULT_LIMIT,
+    ) -> List[Dict[str, Any]]:
+        """
+        특정 세션의 Phase 전환 이력 조회 (keyset 페이지네이션)
+
+        다음 페이지는 마지막 행의 transitioned_at / phase_id를 커서로 전달합니다.
+        """
+        query = "TRACE/phase/get_history"
+        params = [session_id, after_transitioned_at, after_phase_id, limit]
+        results = await run_sql_query(query, params)
         return list(results) if results else []
 
+    def stream_phase_history(
+        self,
+        session_id: str,
+        after_transitioned_at: Optional[datetime] = None,
+        after_phase_id: Optional[str] = None,
+    ) -> AsyncIterator[Dict[str, Any]]:
+        """특정 세션의 Phase 전환 이력을 서버 측 커서로 끝까지 스트리밍"""
+        query = "TRACE/phase/get_history"
+        params = [session_id, after_transitioned_at, after_phase_id, None]
+        return stream_sql_query(query, params)
+
     async def get_recent_phases(
         self, session_id: str, limit: int = 5
     ) -> List[Dict[str, Any]]:
         """최근 N개의 Phase 전환 조회"""
-        sql_path = self.query_dir / "TRACE" / "phase" / "get_recent.sql"
-        results = await run_sql_query(sql_path, [session_id, limit])
+        query = "TRACE/phase/get_recent"
+        results = await run_sql_query(query, [session_id, limit])
         return list(results) if results else []
 
     async def get_phase_by_phase(
         self, session_id: str, phase: str
     ) -> List[Dict[str, Any]]:
         """특정 Phase로의 전환 이력만 조회"""
-        sql_path = self.query_dir / "TRACE" / "phase" / "get_by_phase.sql"
-        results = await run_sql_query(sql_path, [session_id, phase])
+        query = "TRACE/phase/get_by_phase"
+        results = await run_sql_query(query, [session_id, phase])
         return list(results) if results else []
 
     async def get_phase_range(
         self, session_id: str, start_turn: int, end_turn: int
     ) -> List[Dict[str, Any]]:
         """특정 Turn 범위의 Phase 전환 조회"""
-        sql_path = self.query_dir / "TRACE" / "phase" / "get_range.sql"
-        results = await run_sql_query(sql_path, [session_id, start_turn, end_turn])
+        query = "TRACE/phase/get_range"
+        results = await run_sql_query(query, [session_id, start_turn, end_turn])
         return list(results) if results else []
 
     async def get_latest_phase(self, session_id: str) -> Optional[Dict[str, Any]]:
         """가장 최근 Phase 전환 조회"""
-        sql_path = self.query_dir / "TRACE" / "phase" / "get_latest.sql"
-        result = await run_sql_query(sql_path, [session_id])
+        query = "TRACE/phase/get_latest"
+        result = await run_sql_query(query, [session_id])
         return result[0] if result else None
 
     async def get_phase_statistics(self, session_id: str) -> List[Dict[str, Any]]:
-        """Phase별 총 소요 시간 및 전환 횟수"""
-        sql_path = self.query_dir / "TRACE" / "phase" / "get_statistics.sql"
-        results = await run_sql_query(sql_path, [session_id])
+        """Phase별 총 소요 시간 및 전환 횟수 (세션 이력 요약 테이블)"""
+        query = "TRACE/phase/get_statistics"
+        results = await run_sql_query(query, [session_id])
         return list(results) if results else []
 
     async def get_phase_pattern(self, session_id: str) -> List[Dict[str, Any]]:
         """Phase 전환 패턴 조회"""
-        sql_path = self.query_dir / "TRACE" / "phase" / "get_pattern.sql"
-        results = await run_sql_query(sql_path, [session_id])
+        query = "TRACE/phase/get_pattern"
+        results = await run_sql_query(query, [session_id])
         return list(results) if results else []
 
     async def get_phase_summary(self, session_id: str) -> List[Dict[str, Any]]:
-        """Phase 전환 요약 리포트"""
-        sql_path = self.query_dir / "TRACE" / "phase" / "get_summary.sql"
-        results = await run_sql_query(sql_path, [session_id])
+        """Phase 전환 요약 리포트 (세션 이력 요약 테이블)"""
+        query = "TRACE/phase/get_summary"
+        results = await run_sql_query(query, [session_id])
         return list(results) if results else []
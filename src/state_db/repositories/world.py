@@ -1,13 +1,20 @@
-from typing import Any, Dict
+from typing import Any, Dict, List
 
 from fastapi import HTTPException
 
-from state_db.infrastructure import run_sql_command, run_sql_query
+from state_db.infrastructure import (
+    PHASE_RULES,
+    SESSION_CACHE,
+    run_sql_command,
+    run_sql_query,
+)
 from state_db.models import (
     ActChangeResult,
+    ActionAllowedResult,
     PhaseChangeResult,
     SequenceChangeResult,
     TurnAddResult,
+    TurnRollbackResult,
 )
 
 from .base import BaseRepository
@@ -18,64 +25,115 @@ class WorldStateRepository(BaseRepository):
 
     # Location
     async def update_location(self, session_id: str, location: str) -> None:
-        sql_path = self.query_dir / "UPDATE" / "update_location-r.sql"
-        await run_sql_command(sql_path, [session_id, location])
+        query = "UPDATE/update_location-r"
+        await run_sql_command(query, [session_id, location])
+        SESSION_CACHE.invalidate(session_id)
 
     async def get_location(self, session_id: str) -> Dict[str, Any]:
-        sql_path = self.query_dir / "INQUIRY" / "Location_now-r.sql"
-        result = await run_sql_query(sql_path, [session_id])
+        query = "INQUIRY/Location_now-r"
+        result = await run_sql_query(query, [session_id])
         if result:
             return result[0]
         raise HTTPException(status_code=404, detail="Session not found")
 
     async def location_change(self, session_id: str, location: str) -> None:
-        sql_path = self.query_dir / "MANAGE" / "location" / "location_change.sql"
-        await run_sql_command(sql_path, [session_id, location])
+        query = "MANAGE/location/location_change"
+        await run_sql_command(query, [session_id, location])
+        SESSION_CACHE.invalidate(session_id)
 
     # Phase
     async def change_phase(self, session_id: str, phase: str) -> PhaseChangeResult:
-        sql_path = self.query_dir / "MANAGE" / "phase" / "change_phase.sql"
-        await run_sql_command(sql_path, [session_id, phase])
+        query = "MANAGE/phase/change_phase"
+        await run_sql_command(query, [session_id, phase])
+        SESSION_CACHE.invalidate(session_id)
         return PhaseChangeResult(session_id=session_id, current_phase=phase)
 
     async def get_phase(self, session_id: str) -> PhaseChangeResult:
-        sql_path = self.query_dir / "INQUIRY" / "session" / "Session_phase-r.sql"
-        result = await run_sql_query(sql_path, [session_id])
+        cached = SESSION_CACHE.get(session_id, "phase")
+        if cached is not None:
+            return cached
+        query = "INQUIRY/session/Session_phase-r"
+        result = await run_sql_query(query, [session_id])
         if result:
-            return PhaseChangeResult.model_validate(result[0])
+            phase = PhaseChangeResult.model_validate(result[0])
+            SESSION_CACHE.put(session_id, "phase", phase)
+            return phase
         raise HTTPException(status_code=404, detail="Session phase not found")
 
     async def is_action_allowed(self, session_id: str, action: str) -> Dict[str, Any]:
-        sql_path = self.query_dir / "MANAGE" / "phase" / "is_action_allowed.sql"
-        result = await run_sql_query(sql_path, [session_id, action])
-        if result:
-            return result[0]
-        raise HTTPException(status_code=404, detail="Session not found")
+        result = await self.is_actions_allowed(session_id, [action])
+        return {
+            "session_id": result.session_id,
+            "current_phase": result.current_phase,
+            "action": action,
+            "is_allowed": result.allowed[action],
+        }
+
+    async def is_actions_allowed(
+        self, session_id: str, actions: List[str]
+    ) -> ActionAllowedResult:
+        """캐시된 현재 Phase + 인메모리 규칙 매트릭스로 행동 허용 여부 일괄 판정"""
+        phase = await self.get_phase(session_id)
+        await PHASE_RULES.ensure_loaded()
+        return ActionAllowedResult(
+            session_id=phase.session_id,
+            current_phase=phase.current_phase,
+            allowed=PHASE_RULES.check(phase.current_phase, actions),
+        )
 
     # Turn
     async def add_turn(self, session_id: str) -> TurnAddResult:
-        sql_path = self.query_dir / "MANAGE" / "turn" / "add_turn.sql"
-        result = await run_sql_query(sql_path, [session_id])
+        query = "MANAGE/turn/add_turn"
+        result = await run_sql_query(query, [session_id])
+        SESSION_CACHE.invalidate(session_id)
         if result:
             return TurnAddResult.model_validate(result[0])
         raise HTTPException(status_code=404, detail="Session not found")
 
     async def get_turn(self, session_id: str) -> TurnAddResult:
-        sql_path = self.query_dir / "INQUIRY" / "session" / "Session_turn-r.sql"
-        result = await run_sql_query(sql_path, [session_id])
+        cached = SESSION_CACHE.get(session_id, "turn")
+        if cached is not None:
+            return cached
+        query = "INQUIRY/session/Session_turn-r"
+        result = await run_sql_query(query, [session_id])
         if result:
-            return TurnAddResult.model_validate(result[0])
+            turn = TurnAddResult.model_validate(result[0])
+            SESSION_CACHE.put(session_id, "turn", turn)
+            return turn
         raise HTTPException(status_code=404, detail="Session turn not found")
 
+    async def rollback_turn(
+        self, session_id: str, target_turn: int
+    ) -> TurnRollbackResult:
+        """
+        target_turn 종료 시점으로 세션 상태 되돌리기
+
+        turn별 변경 전 이미지(turn_undo_log)를 역순 적용하므로
+        처리 시간은 세션 전체가 아닌 되돌리는 turn 수에 비례합니다.
+        """
+        query = "TRACE/turn/rollback_turn"
+        result = await run_sql_query(query, [session_id, target_turn])
+        SESSION_CACHE.invalidate(session_id)
+        if not result:
+            raise HTTPException(status_code=404, detail="Session not found or ended")
+        rollback = TurnRollbackResult.model_validate(result[0])
+        if rollback.previous_turn < target_turn:
+            raise HTTPException(
+                status_code=400,
+                detail=f"target_turn must be <= current turn {rollback.previous_turn}",
+            )
+        return rollback
+
     # Act
     async def change_act(self, session_id: str, act: int) -> ActChangeResult:
-        sql_path = self.query_dir / "MANAGE" / "act" / "select_act.sql"
-        await run_sql_command(sql_path, [session_id, act])
+        query = "MANAGE/act/select_act"
+        await run_sql_command(query, [session_id, act])
+        SESSION_CACHE.invalidate(session_id)
         return ActChangeResult(session_id=session_id, current_act=act)
 
     async def get_act(self, session_id: str) -> Dict[str, Any]:
-        sql_path = self.query_dir / "INQUIRY" / "Current_act-r.sql"
-        result = await run_sql_query(sql_path, [session_id])
+        query = "INQUIRY/Current_act-r"
+        result = await run_sql_query(query, [session_id])
         if result:
             return result[0]
         raise HTTPException(status_code=404, detail="Session not found")
@@ -84,13 +142,14 @@ class WorldStateRepository(BaseRepository):
     async def change_sequence(
         self, session_id: str, sequence: int
     ) -> SequenceChangeResult:
-        sql_path = self.query_dir / "MANAGE" / "sequence" / "select_sequence.sql"
-        await run_sql_command(sql_path, [session_id, sequence])
+        query = "MANAGE/sequence/select_sequence"
+        await run_sql_command(query, [session_id, sequence])
+        SESSION_CACHE.invalidate(session_id)
         return SequenceChangeResult(session_id=session_id, current_sequence=sequence)
 
     async def get_sequence(self, session_id: str) -> Dict[str, Any]:
-        sql_path = self.query_dir / "INQUIRY" / "Current_sequence-r.sql"
-        result = await run_sql_query(sql_path, [session_id])
+        query = "INQUIRY/Current_sequence-r"
+        result = await run_sql_query(query, [session_id])
         if result:
             return result[0]
         raise HTTPException(status_code=404, detail="Session not found")
@@ -1,29 +1,63 @@
 """Shared dependency injection helpers for routers."""
 
+from typing import Annotated, AsyncIterator
+
+from fastapi import Depends, Request
+
+from state_db.infrastructure import UnitOfWork
 from state_db.repositories import (
     EntityRepository,
     PlayerRepository,
+    ScenarioRepository,
     SessionRepository,
     TraceRepository,
 )
-from state_db.services import StateService
+from state_db.services import ReplayService, StateService
+
+# 요청 전체를 하나의 트랜잭션으로 묶는 HTTP 메서드
+TRANSACTIONAL_METHODS = frozenset({"POST", "PUT", "PATCH", "DELETE"})
+
+
+async def get_unit_of_work(request: Request) -> AsyncIterator[UnitOfWork]:
+    """
+    요청 범위 Unit of Work
+
+    한 요청에서 사용하는 모든 레포지토리가 하나의 커넥션을 공유하며,
+    쓰기 요청은 단일 트랜잭션으로 처리됩니다(예외 발생 시 전체 rollback).
+    FastAPI가 요청 단위로 의존성을 캐시하므로 레포지토리가 여러 개여도 1회만 생성됩니다.
+    """
+    async with UnitOfWork(
+        transactional=request.method in TRANSACTIONAL_METHODS
+    ) as unit_of_work:
+        yield unit_of_work
 
 
-def get_session_repo() -> SessionRepository:
+UnitOfWorkDep = Annotated[UnitOfWork, Depends(get_unit_of_work)]
+
+
+def get_session_repo(_: UnitOfWorkDep) -> SessionRepository:
     return SessionRepository()
 
 
-def get_player_repo() -> PlayerRepository:
+def get_player_repo(_: UnitOfWorkDep) -> PlayerRepository:
     return PlayerRepository()
 
 
-def get_entity_repo() -> EntityRepository:
+def get_entity_repo(_: UnitOfWorkDep) -> EntityRepository:
     return EntityRepository()
 
 
-def get_trace_repo() -> TraceRepository:
+def get_trace_repo(_: UnitOfWorkDep) -> TraceRepository:
     return TraceRepository()
 
 
-def get_state_service() -> StateService:
+def get_scenario_repo(_: UnitOfWorkDep) -> ScenarioRepository:
+    return ScenarioRepository()
+
+
+def get_state_service(_: UnitOfWorkDep) -> StateService:
     return StateService()
+
+
+def get_replay_service(_: UnitOfWorkDep) -> ReplayService:
+    return ReplayService()
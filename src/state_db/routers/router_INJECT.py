@@ -1,16 +1,22 @@
-from typing import Annotated, Any, Dict
+from typing import Annotated, Any, AsyncIterator, Dict, Tuple
 
-from fastapi import APIRouter, Depends
+import orjson
+from fastapi import APIRouter, Depends, HTTPException, Query, Request
 
 from state_db.custom import WrappedResponse
 from state_db.repositories.scenario import ScenarioRepository
-from state_db.schemas import ScenarioInjectRequest, ScenarioInjectResponse
+from state_db.schemas import (
+    ScenarioInjectRequest,
+    ScenarioInjectResponse,
+    ScenarioReinjectResponse,
+)
 
-router = APIRouter(tags=["Scenario Management"])
+from .dependencies import get_scenario_repo
 
+router = APIRouter(tags=["Scenario Management"])
 
-def get_scenario_repo() -> ScenarioRepository:
-    return ScenarioRepository()
+# NDJSON 한 줄(레코드)의 최대 크기
+MAX_NDJSON_LINE_BYTES = 1024 * 1024
 
 
 @router.post(
@@ -25,3 +31,87 @@ async def inject_scenario(
 ) -> Dict[str, Any]:
     result = await repo.inject_scenario(request)
     return {"status": "success", "data": result}
+
+
+@router.post(
+    "/scenario/inject/stream",
+    response_model=WrappedResponse[ScenarioInjectResponse],
+    summary="시나리오 스트리밍 주입 (NDJSON)",
+    description=(
+        "application/x-ndjson 본문을 줄 단위로 읽어 주입합니다. "
+        '첫 줄은 {"type": "scenario", ...} 헤더, 이후 줄은 type이 '
+        "npc/enemy/item/relation인 레코드이며 순서는 자유입니다. relation은 "
+        "참조하는 npc/enemy 레코드 뒤에 오면 바로 연결되고, 앞에 오면 스트림 끝까지 "
+        "보류했다가 연결합니다. 레코드는 배치 단위로 "
+        "하나의 트랜잭션 안에서 flush 되며, 오류 시 줄 번호와 함께 422를 반환하고 "
+        "전체 주입이 rollback 됩니다."
+    ),
+)
+async def inject_scenario_stream(
+    request: Request,
+    repo: Annotated[ScenarioRepository, Depends(get_scenario_repo)],
+) -> Dict[str, Any]:
+    result = await repo.inject_scenario_stream(iter_ndjson(request.stream()))
+    return {"status": "success", "data": result}
+
+
+@router.put(
+    "/scenario/{scenario_id}/inject",
+    response_model=WrappedResponse[ScenarioReinjectResponse],
+    summary="시나리오 증분 재주입",
+    description=(
+        "기존 시나리오의 마스터 데이터를 요청 내용과 비교해 변경된 행과 "
+        "Vertex/Edge만 반영합니다. NPC/Enemy/Item은 scenario_npc_id / "
+        "scenario_enemy_id / item_id로, 관계는 (from_id, to_id)로 대응시킵니다. "
+        "dry_run=true이면 diff만 반환합니다. 세션 데이터가 참조 중인 항목을 "
+        "삭제하려 하면 409를 반환합니다."
+    ),
+)
+async def reinject_scenario(
+    scenario_id: str,
+    request: ScenarioInjectRequest,
+    repo: Annotated[ScenarioRepository, Depends(get_scenario_repo)],
+    dry_run: bool = Query(False, description="diff만 계산하고 반영하지 않음"),
+) -> Dict[str, Any]:
+    result = await repo.reinject_scenario(scenario_id, request, dry_run)
+    return {"status": "success", "data": result}
+
+
+async def iter_ndjson(
+    chunks: AsyncIterator[bytes],
+) -> AsyncIterator[Tuple[int, Dict[str, Any]]]:
+    """바이트 청크 스트림을 (줄 번호, JSON 객체)로 분리 (빈 줄은 건너뜀)"""
+    buffer = b""
+    line_no = 0
+    async for chunk in chunks:
+        buffer += chunk
+        *lines, buffer = buffer.split(b"\n")
+        for line in lines:
+            line_no += 1
+            record = _parse_line(line, line_no)
+            if record is not None:
+                yield line_no, record
+        if len(buffer) > MAX_NDJSON_LINE_BYTES:
+            raise HTTPException(
+                status_code=413,
+                detail=f"line {line_no + 1}: exceeds {MAX_NDJSON_LINE_BYTES} bytes",
+            )
+    record = _parse_line(buffer, line_no + 1)
+    if record is not None:
+        yield line_no + 1, record
+
+
+def _parse_line(line: bytes, line_no: int) -> Any:
+    if not line.strip():
+        return None
+    try:
+        record = orjson.loads(line)
+    except orjson.JSONDecodeError as e:
+        raise HTTPException(
+            status_code=422, detail=f"line {line_no}: invalid JSON ({e})"
+        ) from e
+    if not isinstance(record, dict):
+        raise HTTPException(
+            status_code=422, detail=f"line {line_no}: record must be a JSON object"
+        )
+    return record
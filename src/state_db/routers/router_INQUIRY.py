@@ -1,14 +1,18 @@
 """Inquiry router - corresponds to Query/INQUIRY for data retrieval."""
 
-from typing import Annotated, Any, Dict, List
+from datetime import datetime
+from typing import Annotated, Any, Dict, List, Optional, Union
 
-from fastapi import APIRouter, Depends
+from fastapi import APIRouter, Depends, Query
 
-from state_db.custom import WrappedResponse
+from state_db.configs import LIST_PAGE_DEFAULT_LIMIT, LIST_PAGE_MAX_LIMIT
+from state_db.custom import NDJSONStreamingResponse, WrappedResponse
 from state_db.models import (
+    ActionAllowedResult,
     EnemyInfo,
     FullPlayerState,
     InventoryItem,
+    ItemInfo,
     NPCInfo,
     PhaseChangeResult,
     SessionInfo,
@@ -26,36 +30,87 @@ router = APIRouter(tags=["State Inquiry"])
 # ====================================================================
 
 
+# 세션 목록 공통 쿼리 파라미터 ((started_at, session_id) 내림차순 keyset 페이지네이션)
+AfterStartedAt = Annotated[
+    Optional[datetime],
+    Query(description="이 시각 이전에 시작된 세션부터 조회 (이전 페이지의 마지막 값)"),
+]
+AfterSessionId = Annotated[
+    Optional[str],
+    Query(description="같은 시각에 시작된 세션을 구분하는 마지막 session_id"),
+]
+PageLimit = Annotated[int, Query(ge=1, le=LIST_PAGE_MAX_LIMIT)]
+StreamMode = Annotated[
+    bool, Query(description="true면 limit 없이 끝까지 NDJSON으로 스트리밍")
+]
+
+
+async def _list_sessions(
+    repo: SessionRepository,
+    status: str,
+    after_started_at: Optional[datetime],
+    after_session_id: Optional[str],
+    limit: int,
+    stream: bool,
+) -> Union[Dict[str, Any], NDJSONStreamingResponse]:
+    if stream:
+        return NDJSONStreamingResponse(
+            repo.stream_sessions(status, after_started_at, after_session_id)
+        )
+    result = await repo.list_sessions(status, after_started_at, after_session_id, limit)
+    return {"status": "success", "data": result}
+
+
 @router.get("/sessions", response_model=WrappedResponse[List[SessionInfo]])
 async def get_all_sessions_endpoint(
     repo: Annotated[SessionRepository, Depends(get_session_repo)],
-) -> Dict[str, Any]:
-    result = await repo.get_all_sessions()
-    return {"status": "success", "data": result}
+    after_started_at: AfterStartedAt = None,
+    after_session_id: AfterSessionId = None,
+    limit: PageLimit = LIST_PAGE_DEFAULT_LIMIT,
+    stream: StreamMode = False,
+) -> Union[Dict[str, Any], NDJSONStreamingResponse]:
+    return await _list_sessions(
+        repo, "all", after_started_at, after_session_id, limit, stream
+    )
 
 
 @router.get("/sessions/active", response_model=WrappedResponse[List[SessionInfo]])
 async def get_active_sessions_endpoint(
     repo: Annotated[SessionRepository, Depends(get_session_repo)],
-) -> Dict[str, Any]:
-    result = await repo.get_active_sessions()
-    return {"status": "success", "data": result}
+    after_started_at: AfterStartedAt = None,
+    after_session_id: AfterSessionId = None,
+    limit: PageLimit = LIST_PAGE_DEFAULT_LIMIT,
+    stream: StreamMode = False,
+) -> Union[Dict[str, Any], NDJSONStreamingResponse]:
+    return await _list_sessions(
+        repo, "active", after_started_at, after_session_id, limit, stream
+    )
 
 
 @router.get("/sessions/paused", response_model=WrappedResponse[List[SessionInfo]])
 async def get_paused_sessions_endpoint(
     repo: Annotated[SessionRepository, Depends(get_session_repo)],
-) -> Dict[str, Any]:
-    result = await repo.get_paused_sessions()
-    return {"status": "success", "data": result}
+    after_started_at: AfterStartedAt = None,
+    after_session_id: AfterSessionId = None,
+    limit: PageLimit = LIST_PAGE_DEFAULT_LIMIT,
+    stream: StreamMode = False,
+) -> Union[Dict[str, Any], NDJSONStreamingResponse]:
+    return await _list_sessions(
+        repo, "paused", after_started_at, after_session_id, limit, stream
+    )
 
 
 @router.get("/sessions/ended", response_model=WrappedResponse[List[SessionInfo]])
 async def get_ended_sessions_endpoint(
     repo: Annotated[SessionRepository, Depends(get_session_repo)],
-) -> Dict[str, Any]:
-    result = await repo.get_ended_sessions()
-    return {"status": "success", "data": result}
+    after_started_at: AfterStartedAt = None,
+    after_session_id: AfterSessionId = None,
+    limit: PageLimit = LIST_PAGE_DEFAULT_LIMIT,
+    stream: StreamMode = False,
+) -> Union[Dict[str, Any], NDJSONStreamingResponse]:
+    return await _list_sessions(
+        repo, "ended", after_started_at, after_session_id, limit, stream
+    )
 
 
 @router.get("/session/{session_id}", response_model=WrappedResponse[SessionInfo])
@@ -90,6 +145,19 @@ async def get_inventory(
     return {"status": "success", "data": result}
 
 
+@router.get(
+    "/session/{session_id}/items/{item_id}",
+    response_model=WrappedResponse[ItemInfo],
+)
+async def get_item(
+    session_id: str,
+    item_id: str,
+    repo: Annotated[SessionRepository, Depends(get_session_repo)],
+) -> Dict[str, Any]:
+    result = await repo.get_item(session_id, item_id)
+    return {"status": "success", "data": result}
+
+
 # ====================================================================
 # 엔티티 조회 (NPCs, Enemies)
 # ====================================================================
@@ -130,6 +198,22 @@ async def get_phase(
     return {"status": "success", "data": result}
 
 
+@router.get(
+    "/session/{session_id}/actions/allowed",
+    response_model=WrappedResponse[ActionAllowedResult],
+)
+async def get_allowed_actions(
+    session_id: str,
+    repo: Annotated[SessionRepository, Depends(get_session_repo)],
+    actions: Annotated[
+        List[str],
+        Query(min_length=1, description="검증할 행동 목록 (?actions=a&actions=b)"),
+    ],
+) -> Dict[str, Any]:
+    result = await repo.is_actions_allowed(session_id, actions)
+    return {"status": "success", "data": result}
+
+
 @router.get("/session/{session_id}/turn", response_model=WrappedResponse[TurnAddResult])
 async def get_turn(
     session_id: str, repo: Annotated[SessionRepository, Depends(get_session_repo)]
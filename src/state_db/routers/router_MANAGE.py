@@ -12,6 +12,7 @@ from state_db.models import (
     SequenceChangeResult,
     SpawnResult,
     TurnAddResult,
+    TurnRollbackResult,
 )
 from state_db.repositories import EntityRepository, SessionRepository
 from state_db.schemas import (
@@ -20,6 +21,7 @@ from state_db.schemas import (
     NPCSpawnRequest,
     PhaseChangeRequest,
     SequenceChangeRequest,
+    TurnRollbackRequest,
 )
 
 from .dependencies import get_entity_repo, get_session_repo
@@ -149,6 +151,23 @@ async def add_turn_endpoint(
     return {"status": "success", "data": result}
 
 
+@router.post(
+    "/session/{session_id}/turn/rollback",
+    response_model=WrappedResponse[TurnRollbackResult],
+    description=(
+        "target_turn 종료 시점으로 HP/인벤토리/호감도/Enemy/세션 진행 상태를 복원하고 "
+        "이후 turn 이력을 삭제합니다."
+    ),
+)
+async def rollback_turn_endpoint(
+    session_id: str,
+    request: TurnRollbackRequest,
+    repo: Annotated[SessionRepository, Depends(get_session_repo)],
+) -> Dict[str, Any]:
+    result = await repo.rollback_turn(session_id, request.target_turn)
+    return {"status": "success", "data": result}
+
+
 # ====================================================================
 # Act/Sequence 관리
 # ====================================================================
@@ -7,7 +7,11 @@ from fastapi import APIRouter, Depends
 from state_db.custom import WrappedResponse
 from state_db.models import SessionInfo
 from state_db.repositories import SessionRepository
-from state_db.schemas import SessionStartRequest
+from state_db.schemas import (
+    SessionBulkStartRequest,
+    SessionBulkStartResponse,
+    SessionStartRequest,
+)
 
 from .dependencies import get_session_repo
 
@@ -30,3 +34,29 @@ async def start_session(
         location=request.location,
     )
     return {"status": "success", "data": result}
+
+
+@router.post(
+    "/session/start/bulk",
+    response_model=WrappedResponse[SessionBulkStartResponse],
+    summary="게임 세션 일괄 시작",
+)
+async def start_sessions_bulk(
+    request: SessionBulkStartRequest,
+    repo: Annotated[SessionRepository, Depends(get_session_repo)],
+) -> Dict[str, Any]:
+    session_ids = await repo.start_bulk(
+        scenario_id=request.scenario_id,
+        count=request.count,
+        act=request.current_act,
+        sequence=request.current_sequence,
+        location=request.location,
+    )
+    return {
+        "status": "success",
+        "data": SessionBulkStartResponse(
+            scenario_id=request.scenario_id,
+            count=len(session_ids),
+            session_ids=session_ids,
+        ),
+    }
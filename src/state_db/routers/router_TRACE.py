@@ -1,11 +1,14 @@
-from typing import Annotated, Any, Dict, List, Optional
+from typing import Annotated, Any, Dict, List, Optional, Union
 
 from fastapi import APIRouter, Depends, Query
 
-from state_db.custom import WrappedResponse
+from state_db.configs import LIST_PAGE_DEFAULT_LIMIT, LIST_PAGE_MAX_LIMIT
+from state_db.custom import NDJSONStreamingResponse, WrappedResponse
+from state_db.models import ReplayedState
 from state_db.repositories import TraceRepository
+from state_db.services import ReplayService
 
-from .dependencies import get_trace_repo
+from .dependencies import get_replay_service, get_trace_repo
 
 router = APIRouter(tags=["TRACE - Turn History"])
 
@@ -14,10 +17,21 @@ router = APIRouter(tags=["TRACE - Turn History"])
     "/session/{session_id}/turns", response_model=WrappedResponse[List[Dict[str, Any]]]
 )
 async def get_turn_history_endpoint(
-    session_id: str, repo: Annotated[TraceRepository, Depends(get_trace_repo)]
-) -> Dict[str, Any]:
-    """특정 세션의 Turn 이력 조회 (전체)"""
-    result = await repo.get_turn_history(session_id)
+    session_id: str,
+    repo: Annotated[TraceRepository, Depends(get_trace_repo)],
+    after_turn: Optional[int] = Query(
+        default=None,
+        description="이 turn_number 이후부터 조회 (이전 페이지의 마지막 값)",
+    ),
+    limit: int = Query(default=LIST_PAGE_DEFAULT_LIMIT, ge=1, le=LIST_PAGE_MAX_LIMIT),
+    stream: bool = Query(
+        default=False, description="true면 limit 없이 끝까지 NDJSON으로 스트리밍"
+    ),
+) -> Union[Dict[str, Any], NDJSONStreamingResponse]:
+    """특정 세션의 Turn 이력 조회 (turn_number 순 keyset 페이지네이션)"""
+    if stream:
+        return NDJSONStreamingResponse(repo.stream_turn_history(session_id, after_turn))
+    result = await repo.get_turn_history(session_id, after_turn, limit)
     return {"status": "success", "data": result}
 
 
@@ -61,6 +75,24 @@ async def get_turn_details_endpoint(
     return {"status": "success", "data": result}
 
 
+@router.get(
+    "/session/{session_id}/turn/{turn_number}/state",
+    response_model=WrappedResponse[ReplayedState],
+)
+async def get_state_at_turn_endpoint(
+    session_id: str,
+    turn_number: int,
+    service: Annotated[ReplayService, Depends(get_replay_service)],
+) -> Dict[str, Any]:
+    """
+    특정 Turn 종료 시점의 세션 상태 재구성 (리플레이)
+
+    가장 가까운 이전 체크포인트에서 시작해 이후 Turn의 state_changes를 적용합니다.
+    """
+    result = await service.get_state_at_turn(session_id, turn_number)
+    return {"status": "success", "data": result}
+
+
 @router.get(
     "/session/{session_id}/turns/range",
     response_model=WrappedResponse[List[Dict[str, Any]]],
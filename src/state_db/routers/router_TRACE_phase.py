@@ -1,8 +1,10 @@
-from typing import Annotated, Any, Dict, List, Optional
+from datetime import datetime
+from typing import Annotated, Any, Dict, List, Optional, Union
 
 from fastapi import APIRouter, Depends, Query
 
-from state_db.custom import WrappedResponse
+from state_db.configs import LIST_PAGE_DEFAULT_LIMIT, LIST_PAGE_MAX_LIMIT
+from state_db.custom import NDJSONStreamingResponse, WrappedResponse
 from state_db.repositories import TraceRepository
 
 from .dependencies import get_trace_repo
@@ -14,10 +16,28 @@ router = APIRouter(tags=["TRACE - Phase History"])
     "/session/{session_id}/phases", response_model=WrappedResponse[List[Dict[str, Any]]]
 )
 async def get_phase_history_endpoint(
-    session_id: str, repo: Annotated[TraceRepository, Depends(get_trace_repo)]
-) -> Dict[str, Any]:
-    """특정 세션의 Phase 전환 이력 조회 (전체)"""
-    result = await repo.get_phase_history(session_id)
+    session_id: str,
+    repo: Annotated[TraceRepository, Depends(get_trace_repo)],
+    after_transitioned_at: Annotated[
+        Optional[datetime],
+        Query(description="이 시각 이후부터 조회 (이전 페이지의 마지막 값)"),
+    ] = None,
+    after_phase_id: Optional[str] = Query(
+        default=None, description="같은 시각의 전환을 구분하는 마지막 phase_id"
+    ),
+    limit: int = Query(default=LIST_PAGE_DEFAULT_LIMIT, ge=1, le=LIST_PAGE_MAX_LIMIT),
+    stream: bool = Query(
+        default=False, description="true면 limit 없이 끝까지 NDJSON으로 스트리밍"
+    ),
+) -> Union[Dict[str, Any], NDJSONStreamingResponse]:
+    """특정 세션의 Phase 전환 이력 조회 (transitioned_at 순 keyset 페이지네이션)"""
+    if stream:
+        return NDJSONStreamingResponse(
+            repo.stream_phase_history(session_id, after_transitioned_at, after_phase_id)
+        )
+    result = await repo.get_phase_history(
+        session_id, after_transitioned_at, after_phase_id, limit
+    )
     return {"status": "success", "data": result}
 
 
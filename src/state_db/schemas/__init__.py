@@ -12,14 +12,19 @@ from .player import (
     PlayerStatsUpdateRequest,
 )
 from .scenario import (
+    ScenarioEntityDiff,
     ScenarioInjectEnemy,
+    ScenarioInjectHeader,
     ScenarioInjectItem,
     ScenarioInjectNPC,
     ScenarioInjectRelation,
     ScenarioInjectRequest,
     ScenarioInjectResponse,
+    ScenarioReinjectResponse,
 )
 from .session import (
+    SessionBulkStartRequest,
+    SessionBulkStartResponse,
     SessionEndResponse,
     SessionInfoResponse,
     SessionPauseResponse,
@@ -32,12 +37,15 @@ from .world import (
     LocationUpdateRequest,
     PhaseChangeRequest,
     SequenceChangeRequest,
+    TurnRollbackRequest,
 )
 
 __all__ = [
     "Phase",
     "SessionStartRequest",
     "SessionStartResponse",
+    "SessionBulkStartRequest",
+    "SessionBulkStartResponse",
     "SessionEndResponse",
     "SessionPauseResponse",
     "SessionResumeResponse",
@@ -62,10 +70,14 @@ __all__ = [
     "PhaseChangeRequest",
     "ActChangeRequest",
     "SequenceChangeRequest",
+    "TurnRollbackRequest",
     "ScenarioInjectNPC",
     "ScenarioInjectEnemy",
     "ScenarioInjectItem",
     "ScenarioInjectRelation",
+    "ScenarioInjectHeader",
     "ScenarioInjectRequest",
     "ScenarioInjectResponse",
+    "ScenarioEntityDiff",
+    "ScenarioReinjectResponse",
 ]
@@ -64,8 +64,8 @@ class ScenarioInjectRelation(BaseModel):
     meta: Dict[str, Any] = Field(default_factory=dict, description="관계 메타 데이터")
 
 
-class ScenarioInjectRequest(BaseModel):
-    """시나리오 주입 요청"""
+class ScenarioInjectHeader(BaseModel):
+    """시나리오 메타데이터 (스트리밍 주입의 type=scenario 헤더 레코드)"""
 
     title: str = Field(..., description="시나리오 제목")
     description: Optional[str] = Field(None, description="시나리오 설명")
@@ -76,6 +76,10 @@ class ScenarioInjectRequest(BaseModel):
     tags: List[str] = Field(default_factory=list, description="태그 목록")
     total_acts: int = Field(default=3, description="총 Act 수", ge=1)
 
+
+class ScenarioInjectRequest(ScenarioInjectHeader):
+    """시나리오 주입 요청"""
+
     npcs: List[ScenarioInjectNPC] = Field(default_factory=list, description="NPC 목록")
     enemies: List[ScenarioInjectEnemy] = Field(
         default_factory=list, description="Enemy 목록"
@@ -141,3 +145,42 @@ class ScenarioInjectResponse(BaseModel):
     title: str = Field(description="시나리오 제목")
     status: str = Field(default="success")
     message: str = Field(default="Scenario and master entities injected successfully")
+    inserted_rows: int = Field(default=0, description="주입된 행 수 (테이블 + 그래프)")
+    elapsed_ms: float = Field(default=0.0, description="주입 소요 시간 (ms)")
+    rows_per_sec: float = Field(default=0.0, description="초당 주입 행 수")
+
+
+class ScenarioEntityDiff(BaseModel):
+    """증분 재주입 엔티티 종류별 diff (참조 키 목록)"""
+
+    added: List[str] = Field(default_factory=list, description="추가된 키")
+    updated: List[str] = Field(default_factory=list, description="변경된 키")
+    removed: List[str] = Field(default_factory=list, description="삭제된 키")
+    unchanged: int = Field(default=0, description="변경 없는 항목 수")
+
+
+class ScenarioReinjectResponse(BaseModel):
+    """시나리오 증분 재주입 응답"""
+
+    scenario_id: str = Field(description="대상 시나리오 UUID")
+    dry_run: bool = Field(description="true이면 diff만 계산하고 반영하지 않음")
+    scenario_updated: bool = Field(
+        default=False, description="시나리오 메타데이터 변경 여부"
+    )
+    npcs: ScenarioEntityDiff = Field(default_factory=ScenarioEntityDiff)
+    enemies: ScenarioEntityDiff = Field(default_factory=ScenarioEntityDiff)
+    items: ScenarioEntityDiff = Field(default_factory=ScenarioEntityDiff)
+    relations: ScenarioEntityDiff = Field(
+        default_factory=ScenarioEntityDiff,
+        description="관계 diff (키: '<from_id>-><to_id>')",
+    )
+    conflicts: List[str] = Field(
+        default_factory=list,
+        description="세션 데이터가 참조 중이라 삭제할 수 없는 항목 ('<종류>:<키>')",
+    )
+    applied_rows: int = Field(default=0, description="반영된 행 수 (테이블 + 그래프)")
+    frozen_rows: int = Field(
+        default=0,
+        description="변경/삭제 전 Copy-on-Write 세션에 복제한 마스터 NPC/Enemy 행 수",
+    )
+    elapsed_ms: float = Field(default=0.0, description="소요 시간 (ms)")
@@ -1,5 +1,5 @@
 from datetime import datetime
-from typing import Optional
+from typing import List, Optional
 
 from pydantic import BaseModel, ConfigDict, Field
 
@@ -69,6 +69,51 @@ class SessionStartResponse(BaseModel):
     )
 
 
+class SessionBulkStartRequest(SessionStartRequest):
+    """세션 일괄 시작 요청 (동일 시나리오 N개)"""
+
+    count: int = Field(
+        ...,
+        description="생성할 세션 수",
+        ge=1,
+        le=1000,
+        json_schema_extra={"example": 100},
+    )
+
+    model_config = ConfigDict(
+        json_schema_extra={
+            "example": {
+                "scenario_id": "550e8400-e29b-41d4-a716-446655440000",
+                "count": 100,
+                "current_act": 1,
+                "current_sequence": 1,
+                "location": "Starting Town",
+            }
+        }
+    )
+
+
+class SessionBulkStartResponse(BaseModel):
+    """세션 일괄 시작 응답"""
+
+    scenario_id: str = Field(description="시나리오 UUID")
+    count: int = Field(description="생성된 세션 수")
+    session_ids: List[str] = Field(description="생성된 세션 UUID 목록")
+
+    model_config = ConfigDict(
+        json_schema_extra={
+            "example": {
+                "scenario_id": "550e8400-e29b-41d4-a716-446655440000",
+                "count": 2,
+                "session_ids": [
+                    "a1b2c3d4-e5f6-7890-abcd-ef1234567890",
+                    "b2c3d4e5-f6a7-8901-bcde-f12345678901",
+                ],
+            }
+        }
+    )
+
+
 class SessionEndResponse(BaseModel):
     """세션 종료 응답"""
 
@@ -27,6 +27,19 @@ class PhaseChangeRequest(BaseModel):
     model_config = ConfigDict(json_schema_extra={"example": {"new_phase": "combat"}})
 
 
+class TurnRollbackRequest(BaseModel):
+    """Turn 되돌리기 요청"""
+
+    target_turn: int = Field(
+        ...,
+        description="되돌릴 turn 번호 (해당 turn 종료 시점 상태로 복원)",
+        ge=0,
+        json_schema_extra={"example": 3},
+    )
+
+    model_config = ConfigDict(json_schema_extra={"example": {"target_turn": 3}})
+
+
 class ActChangeRequest(BaseModel):
     """Act 변경 요청"""
 
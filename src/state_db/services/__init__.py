@@ -1,3 +1,4 @@
+from state_db.services.replay import ReplayService
 from state_db.services.state_service import StateService
 
-__all__ = ["StateService"]
+__all__ = ["StateService", "ReplayService"]
@@ -0,0 +1,124 @@
+from typing import Any, Dict, Iterable
+
+from fastapi import HTTPException
+
+from state_db.repositories import TraceRepository
+
+
+class ReplayService:
+    """
+    세션 상태 리플레이 (특정 turn 종료 시점의 세션 전체 상태 재구성)
+
+    turn_number 이하에서 가장 가까운 체크포인트(session_checkpoint)를 불러와
+    이후 turn의 state_changes를 순서대로 적용합니다.
+    체크포인트는 TURN_CHECKPOINT_INTERVAL turn마다 기록되므로 적용할 turn 수는
+    세션 길이와 관계없이 그 간격 미만입니다.
+    """
+
+    def __init__(self) -> None:
+        self.trace_repo = TraceRepository()
+
+    async def get_state_at_turn(
+        self, session_id: str, turn_number: int
+    ) -> Dict[str, Any]:
+        checkpoint = await self.trace_repo.get_checkpoint_before(
+            session_id, turn_number
+        )
+        if checkpoint is None:
+            raise HTTPException(
+                status_code=404,
+                detail=f"No checkpoint at or before turn {turn_number}",
+            )
+
+        turns = await self.trace_repo.get_turn_deltas(
+            session_id, checkpoint["turn_number"], turn_number
+        )
+        last_turn = turns[-1]["turn_number"] if turns else checkpoint["turn_number"]
+        if last_turn != turn_number:
+            raise HTTPException(status_code=404, detail="Turn not found")
+
+        return {
+            "session_id": session_id,
+            "turn_number": turn_number,
+            "checkpoint_turn": checkpoint["turn_number"],
+            "replayed_turns": len(turns),
+            "state": replay_turns(checkpoint["state"], turns),
+        }
+
+
+def replay_turns(
+    state: Dict[str, Any], turns: Iterable[Dict[str, Any]]
+) -> Dict[str, Any]:
+    """체크포인트 상태에 turn 변경 내역을 순서대로 적용"""
+    for turn in turns:
+        apply_turn(state, turn)
+    return state
+
+
+def apply_turn(state: Dict[str, Any], turn: Dict[str, Any]) -> None:
+    """
+    turn 하나의 state_changes를 상태에 적용 (apply_state_changes와 같은 규칙)
+
+    아이템 사용(inventory_lost / lost_quantity)과 호감도 변화(npc_id /
+    affinity_change) 기록도 반영하며, turn으로 기록되지 않은 변경은
+    다음 체크포인트에서 반영됩니다.
+    """
+    changes = turn.get("state_changes") or {}
+    session = state["session"]
+    player = state.get("player")
+
+    if player is not None and changes.get("player_id"):
+        numeric = player.setdefault("state", {}).setdefault("numeric", {})
+        if "player_hp" in changes:
+            hp = numeric.get("HP")
+            numeric["HP"] = (100 if hp is None else int(hp)) + int(changes["player_hp"])
+        if "player_stats" in changes:
+            numeric.update(changes["player_stats"])
+        for npc_id, score in (changes.get("npc_affinity") or {}).items():
+            state["npc_affinity"][npc_id] = int(score)
+
+    for enemy_id, hp_change in (changes.get("enemy_hp") or {}).items():
+        enemy = state["enemies"].get(enemy_id)
+        if enemy is None:
+            continue
+        # jsonb_set은 numeric 객체가 없으면 상태를 바꾸지 않음
+        numeric = (enemy.get("state") or {}).get("numeric")
+        if not isinstance(numeric, dict):
+            continue
+        # HP가 없으면 NULL + delta = NULL: GREATEST(NULL, 0) = 0, 패배 태그 없음
+        if numeric.get("HP") is None:
+            numeric["HP"] = 0
+            continue
+        hp = int(numeric["HP"]) + int(hp_change)
+        numeric["HP"] = max(hp, 0)
+        tags = enemy.get("tags") or []
+        if hp <= 0 and "defeated" not in tags:
+            enemy["tags"] = [*tags, "defeated"]
+
+    if "npc_id" in changes and "affinity_change" in changes:
+        npc_id = str(changes["npc_id"])
+        score = state["npc_affinity"].get(npc_id, 50) + int(changes["affinity_change"])
+        state["npc_affinity"][npc_id] = max(0, min(100, score))
+
+    lost_quantity = int(changes.get("lost_quantity") or 0)
+    for item_id in changes.get("inventory_lost") or []:
+        item_id = str(item_id)
+        if item_id in state["inventory"]:
+            state["inventory"][item_id] -= lost_quantity
+
+    # 위치는 진행 중(active) 세션에만 적용
+    if "location" in changes and session.get("status") == "active":
+        session["location"] = changes["location"]
+
+    for key, field in (
+        ("act", "current_act"),
+        ("sequence", "current_sequence"),
+    ):
+        if key in changes:
+            session[field] = changes[key]
+
+    # phase_at_turn은 기록 시점의 실제 Phase (다른 경로의 Phase 전환 포함)
+    session["current_phase"] = turn.get("phase_at_turn") or changes.get(
+        "phase", session["current_phase"]
+    )
+    session["current_turn"] = turn["turn_number"]
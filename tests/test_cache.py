@@ -0,0 +1,110 @@
+from unittest.mock import AsyncMock, patch
+
+import pytest
+
+from state_db.infrastructure import SESSION_CACHE, DatabaseManager, UnitOfWork
+from state_db.infrastructure.cache import SessionStateCache, TTLCache
+from state_db.repositories import SessionRepository
+
+SESSION_ID = "11111111-1111-1111-1111-111111111111"
+
+
+class FakeClock:
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self):
+        return self.now
+
+
+def test_ttl_cache_lru_eviction_and_counters():
+    cache = TTLCache(max_size=2, ttl_seconds=60)
+    cache.set("a", 1)
+    cache.set("b", 2)
+    assert cache.get("a") == 1  # a가 최근 사용 -> b가 eviction 대상
+    cache.set("c", 3)
+
+    assert cache.get("b") is None
+    assert cache.get("c") == 3
+    stats = cache.stats()
+    assert (stats["hits"], stats["misses"], stats["evictions"]) == (2, 1, 1)
+
+
+def test_ttl_cache_expiration():
+    clock = FakeClock()
+    cache = TTLCache(max_size=10, ttl_seconds=5, clock=clock)
+    cache.set("a", 1)
+    clock.now = 4.9
+    assert cache.get("a") == 1
+    clock.now = 5.0
+    assert cache.get("a") is None
+    assert cache.stats()["expirations"] == 1
+
+
+def test_session_cache_invalidates_all_kinds():
+    cache = SessionStateCache(max_size=10, ttl_seconds=60)
+    cache.put(SESSION_ID, "info", "info")
+    cache.put(SESSION_ID, "phase", "phase")
+    cache.invalidate(SESSION_ID)
+
+    assert cache.get(SESSION_ID, "info") is None
+    assert cache.get(SESSION_ID, "phase") is None
+
+
+@pytest.mark.asyncio
+async def test_session_cache_skips_uncommitted_values():
+    cache = SessionStateCache(max_size=10, ttl_seconds=60)
+    async with UnitOfWork(transactional=True):
+        cache.put(SESSION_ID, "phase", "uncommitted")
+    assert cache.get(SESSION_ID, "phase") is None
+
+
+@pytest.mark.asyncio
+async def test_repository_reads_through_and_invalidates_on_write():
+    phase_row = [{"session_id": SESSION_ID, "current_phase": "combat"}]
+    repo = SessionRepository()
+
+    with patch(
+        "state_db.repositories.world.run_sql_query",
+        new=AsyncMock(return_value=phase_row),
+    ) as mock_query:
+        first = await repo.get_phase(SESSION_ID)
+        second = await repo.get_phase(SESSION_ID)
+        assert first.current_phase == second.current_phase == "combat"
+        assert mock_query.call_count == 1
+
+        with patch("state_db.repositories.world.run_sql_command", new=AsyncMock()):
+            await repo.update_location(SESSION_ID, "Town")
+
+        await repo.get_phase(SESSION_ID)
+        assert mock_query.call_count == 2
+
+
+def test_notification_invalidates_session_across_workers():
+    other_session = "22222222-2222-2222-2222-222222222222"
+    SESSION_CACHE.put(SESSION_ID, "info", "info")
+    SESSION_CACHE.put(other_session, "info", "other")
+
+    DatabaseManager._on_notification(
+        None, 0, "state_invalidation", f'{{"t": "npc", "s": "{SESSION_ID}", "v": 7}}'
+    )
+
+    assert SESSION_CACHE.get(SESSION_ID, "info") is None
+    assert SESSION_CACHE.get(other_session, "info") == "other"
+    assert DatabaseManager.listener_status()["last_version"] >= 7
+
+    # 해석할 수 없는 페이로드는 전체 무효화
+    DatabaseManager._on_notification(None, 0, "state_invalidation", "not-json")
+    assert SESSION_CACHE.get(other_session, "info") is None
+
+
+def test_cache_bypassed_while_listener_disconnected(monkeypatch):
+    monkeypatch.setattr(DatabaseManager, "_listener_task", object())
+    monkeypatch.setattr(DatabaseManager, "_listener_connected", False)
+
+    SESSION_CACHE.put(SESSION_ID, "turn", "turn")
+    assert SESSION_CACHE.get(SESSION_ID, "turn") is None
+
+    monkeypatch.setattr(DatabaseManager, "_listener_connected", True)
+    SESSION_CACHE.put(SESSION_ID, "turn", "turn")
+    assert SESSION_CACHE.get(SESSION_ID, "turn") == "turn"
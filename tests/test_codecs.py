@@ -0,0 +1,59 @@
+from state_db.infrastructure import wrap_cypher
+from state_db.infrastructure.codecs import agtype_decode, json_decode, json_encode
+from state_db.models import PlayerStats
+
+
+def test_json_codec_round_trip():
+    value = {"numeric": {"HP": 90, "gold": 10}, "boolean": {"alive": True}, 1: [1]}
+    encoded = json_encode(value)
+
+    assert isinstance(encoded, str)
+    assert json_decode(encoded) == {
+        "numeric": {"HP": 90, "gold": 10},
+        "boolean": {"alive": True},
+        "1": [1],
+    }
+
+
+def test_models_accept_decoded_jsonb():
+    stats = PlayerStats.model_validate(
+        {
+            "player_id": "p-1",
+            "name": "Hero",
+            "state": json_decode('{"numeric": {"HP": 90}}'),
+        }
+    )
+    assert stats.state["numeric"]["HP"] == 90
+
+
+def test_agtype_decode_graph_values():
+    vertex = agtype_decode(
+        '{"id": 844424930131969, "label": "npc", '
+        '"properties": {"name": "a::vertex"}}::vertex'
+    )
+    assert vertex == {
+        "id": 844424930131969,
+        "label": "npc",
+        "properties": {"name": "a::vertex"},
+    }
+
+    path = agtype_decode(
+        '[{"id": 1, "label": "npc", "properties": {}}::vertex, '
+        '{"id": 3, "label": "RELATION", "end_id": 2, "start_id": 1, '
+        '"properties": {"affinity": 50}}::edge, '
+        '{"id": 2, "label": "enemy", "properties": {}}::vertex]::path'
+    )
+    assert [p["label"] for p in path] == ["npc", "RELATION", "enemy"]
+    assert path[1]["start_id"] == 1
+
+    assert agtype_decode("1.5::numeric") == 1.5
+    assert agtype_decode('"text"') == "text"
+
+
+def test_wrap_cypher_is_cached_per_template():
+    cypher = "MATCH (n:npc {session_id: $session_id}) RETURN n"
+    wrapped = wrap_cypher(cypher)
+
+    assert wrapped is wrap_cypher(cypher)
+    assert "$cypher$, $1) AS (result agtype)" in wrapped
+    assert "::text" not in wrapped
@@ -0,0 +1,55 @@
+from unittest.mock import AsyncMock, patch
+
+import pytest
+from fastapi import HTTPException
+
+from state_db.repositories.entity import EntityRepository
+
+SESSION_ID = "11111111-1111-1111-1111-111111111111"
+MASTER_ENEMY_ID = "22222222-2222-2222-2222-222222222222"
+PHYSICAL_ENEMY_ID = "33333333-3333-3333-3333-333333333333"
+
+
+@pytest.mark.asyncio
+async def test_update_enemy_hp_materializes_before_update():
+    calls = []
+
+    async def fake_run_sql_query(query, params=None):
+        calls.append((query, params))
+        if query == "MANAGE/enemy/materialize_enemy":
+            return [{"enemy_id": PHYSICAL_ENEMY_ID}]
+        return [
+            {
+                "enemy_instance_id": MASTER_ENEMY_ID,
+                "current_hp": 20,
+                "is_defeated": False,
+            }
+        ]
+
+    with patch(
+        "state_db.repositories.entity.run_sql_query",
+        new=AsyncMock(side_effect=fake_run_sql_query),
+    ):
+        result = await EntityRepository().update_enemy_hp(
+            SESSION_ID, MASTER_ENEMY_ID, -10
+        )
+
+    assert calls[0] == (
+        "MANAGE/enemy/materialize_enemy",
+        [SESSION_ID, MASTER_ENEMY_ID],
+    )
+    # 변경 쿼리는 물리 행 ID로 실행, 응답의 ID는 공개(마스터) ID 유지
+    assert calls[1][1][0] == PHYSICAL_ENEMY_ID
+    assert result.enemy_instance_id == MASTER_ENEMY_ID
+    assert result.current_hp == 20
+
+
+@pytest.mark.asyncio
+async def test_update_enemy_hp_unknown_enemy_returns_404():
+    with patch(
+        "state_db.repositories.entity.run_sql_query",
+        new=AsyncMock(return_value=[{"enemy_id": None}]),
+    ):
+        with pytest.raises(HTTPException) as exc:
+            await EntityRepository().update_enemy_hp(SESSION_ID, MASTER_ENEMY_ID, -10)
+    assert exc.value.status_code == 404
@@ -0,0 +1,63 @@
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+
+from state_db.infrastructure import GraphLoader
+
+
+def _fake_connection() -> MagicMock:
+    """UNWIND ... RETURN [row.ref, id(n)] 흉내: 행마다 증가하는 내부 id 반환"""
+    conn = MagicMock()
+    state = {"next_id": 100}
+
+    async def fetch(sql, params):
+        if "RETURN [row.ref, id(n)]" not in sql:
+            return []
+        rows = []
+        for row in params["rows"]:
+            rows.append({"result": [row["ref"], state["next_id"]]})
+            state["next_id"] += 1
+        return rows
+
+    conn.fetch = AsyncMock(side_effect=fetch)
+    return conn
+
+
+@pytest.mark.asyncio
+async def test_vertices_are_mapped_and_edges_use_internal_ids():
+    conn = _fake_connection()
+    loader = GraphLoader(conn, batch_size=2)
+
+    await loader.create_vertices(
+        "npc", [(f"npc-{i}", {"name": f"NPC {i}"}) for i in range(3)]
+    )
+    await loader.create_vertices("enemy", [("enemy-0", {"name": "Goblin"})])
+
+    assert loader.id_map["npc-2"] == ("npc", 102)
+    assert loader.id_map["enemy-0"] == ("enemy", 103)
+
+    created = await loader.create_edges(
+        [
+            ("npc-0", "npc-1", {"relation_type": "friend"}),
+            ("npc-1", "enemy-0", {"relation_type": "hostile"}),
+            ("npc-0", "unknown", {"relation_type": "neutral"}),
+        ]
+    )
+
+    assert created == 2
+    edge_calls = [
+        call for call in conn.fetch.await_args_list if "CREATE (a)-" in call.args[0]
+    ]
+    # 라벨 조합별 1문장, 양 끝은 내부 id로 지정
+    assert len(edge_calls) == 2
+    assert "MATCH (a:npc), (b:enemy)" in edge_calls[1].args[0]
+    assert edge_calls[1].args[1]["rows"] == [
+        {"start": 101, "end": 103, "properties": {"relation_type": "hostile"}}
+    ]
+
+
+@pytest.mark.asyncio
+async def test_unknown_vertex_label_is_rejected():
+    loader = GraphLoader(MagicMock())
+    with pytest.raises(ValueError):
+        await loader.create_vertices("player) DETACH DELETE (x", [])
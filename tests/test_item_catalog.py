@@ -0,0 +1,86 @@
+from unittest.mock import AsyncMock, patch
+
+import pytest
+
+from state_db.infrastructure.database import InvalidationMessage
+from state_db.infrastructure.item_catalog import ItemCatalog
+from state_db.repositories.player import PlayerRepository
+
+SCENARIO_ID = "11111111-1111-1111-1111-111111111111"
+SESSION_ID = "22222222-2222-2222-2222-222222222222"
+POTION_ID = "33333333-3333-3333-3333-333333333333"
+
+CATALOG_ROWS = [
+    {
+        "item_id": POTION_ID,
+        "scenario_item_id": POTION_ID,
+        "name": "Potion",
+        "description": "Restores HP",
+        "item_type": "consumable",
+        "meta": {},
+        "created_at": None,
+    }
+]
+
+
+@pytest.mark.asyncio
+async def test_catalog_loads_scenario_once():
+    catalog = ItemCatalog()
+    with patch(
+        "state_db.infrastructure.item_catalog.run_sql_query",
+        new=AsyncMock(return_value=CATALOG_ROWS),
+    ) as mock_query:
+        first = await catalog.get(SCENARIO_ID, POTION_ID)
+        second = await catalog.get(SCENARIO_ID, POTION_ID)
+        missing = await catalog.get(SCENARIO_ID, "unknown")
+
+    assert first is not None and first["name"] == "Potion"
+    assert second is first
+    assert missing is None
+    mock_query.assert_awaited_once_with(
+        "INQUIRY/inventory/Catalog_items", [SCENARIO_ID]
+    )
+    assert catalog.stats()["loads"] == 1
+
+
+def test_catalog_invalidation_only_on_item_changes():
+    catalog = ItemCatalog()
+    catalog.load(SCENARIO_ID, CATALOG_ROWS)
+
+    catalog.apply_invalidation(InvalidationMessage("npc", SESSION_ID, 1))
+    assert catalog.stats()["scenarios"] == 1
+
+    catalog.apply_invalidation(InvalidationMessage("item", None, 1))
+    assert catalog.stats()["scenarios"] == 0
+
+
+@pytest.mark.asyncio
+async def test_inventory_names_served_from_catalog():
+    catalog = ItemCatalog()
+    catalog.load(SCENARIO_ID, CATALOG_ROWS)
+    inventory_rows = [
+        {
+            "scenario_id": SCENARIO_ID,
+            "player_id": "player-1",
+            "item_id": POTION_ID,
+            "quantity": 3,
+            "acquired_at": None,
+            "last_updated": None,
+        }
+    ]
+
+    with (
+        patch("state_db.repositories.player.ITEM_CATALOG", catalog),
+        patch(
+            "state_db.repositories.player.run_sql_query",
+            new=AsyncMock(return_value=inventory_rows),
+        ) as mock_query,
+    ):
+        result = await PlayerRepository().get_inventory(SESSION_ID)
+
+    mock_query.assert_awaited_once_with(
+        "INQUIRY/session/Session_inventory-r", [SESSION_ID]
+    )
+    assert result[0].item_name == "Potion"
+    assert result[0].category == "consumable"
+    assert result[0].quantity == 3
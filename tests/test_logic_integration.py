@@ -1,3 +1,4 @@
+import json
 import uuid
 
 import pytest
@@ -112,3 +113,628 @@ async def test_scenario_to_session_cloning_integration(real_db_client: AsyncClie
 
     assert len(graph_rels) == 1
     assert graph_rels[0]["relation_type"] == "hostile"
+
+    # 9. 스냅샷 인벤토리에 공유 아이템 카탈로그의 이름/분류 포함
+    from state_db.pipeline import get_state_snapshot
+
+    await run_raw_query(
+        "INSERT INTO player_inventory (player_id, item_id, quantity)"
+        " SELECT p.player_id, i.item_id, 1"
+        " FROM player p CROSS JOIN session_items(p.session_id) i"
+        " WHERE p.session_id = $1",
+        [session_id],
+    )
+    snapshot = await get_state_snapshot(session_id)
+    assert [(i.item_name, i.category) for i in snapshot["inventory"]] == [
+        ("Testing Hammer", "equipment")
+    ]
+
+
+@pytest.mark.asyncio
+async def test_copy_on_write_overlay_materializes_on_first_write(
+    real_db_client: AsyncClient,
+):
+    """
+    [통합 테스트] Copy-on-Write 세션: 시작 시 복제 없음 -> 최초 변경 시 1행 생성
+    """
+    from state_db.infrastructure import DatabaseManager
+
+    scenario_payload = {
+        "title": "Overlay Scenario",
+        "npcs": [{"scenario_npc_id": str(uuid.uuid4()), "name": "Guard"}],
+        "enemies": [
+            {
+                "scenario_enemy_id": str(uuid.uuid4()),
+                "name": "Goblin",
+                "state": {"numeric": {"HP": 30}},
+            },
+            {
+                "scenario_enemy_id": str(uuid.uuid4()),
+                "name": "Orc",
+                "state": {"numeric": {"HP": 80}},
+            },
+        ],
+    }
+    inject_resp = await real_db_client.post(
+        "/state/scenario/inject", json=scenario_payload
+    )
+    scenario_id = inject_resp.json()["data"]["scenario_id"]
+
+    async with DatabaseManager.get_connection() as conn:
+        await conn.execute("SET state_db.entity_overlay = 'on'")
+        try:
+            session_id = await conn.fetchval(
+                "SELECT create_session($1::UUID)", uuid.UUID(scenario_id)
+            )
+        finally:
+            await conn.execute("RESET state_db.entity_overlay")
+
+    # 세션 시작 시 NPC/Enemy 행은 복제되지 않음
+    from state_db.infrastructure import run_raw_query
+
+    copied = await run_raw_query(
+        "SELECT count(*) AS n FROM enemy WHERE session_id = $1", [session_id]
+    )
+    assert copied[0]["n"] == 0
+
+    # 조회는 마스터 행을 오버레이로 병합하여 반환
+    enemies_resp = await real_db_client.get(f"/state/session/{session_id}/enemies")
+    enemies = enemies_resp.json()["data"]
+    assert {e["name"] for e in enemies} == {"Goblin", "Orc"}
+    goblin = next(e for e in enemies if e["name"] == "Goblin")
+
+    # 최초 변경 시 해당 Enemy 1건만 세션 행으로 생성, 공개 ID는 유지
+    hp_resp = await real_db_client.put(
+        f"/state/enemy/{goblin['enemy_instance_id']}/hp",
+        json={"session_id": str(session_id), "hp_change": -10},
+    )
+    assert hp_resp.status_code == 200
+    assert hp_resp.json()["data"]["enemy_instance_id"] == goblin["enemy_instance_id"]
+
+    copied = await run_raw_query(
+        "SELECT count(*) AS n FROM enemy WHERE session_id = $1", [session_id]
+    )
+    assert copied[0]["n"] == 1
+
+    enemies_resp = await real_db_client.get(f"/state/session/{session_id}/enemies")
+    enemies = enemies_resp.json()["data"]
+    hp_by_name = {e["name"]: e["current_hp"] for e in enemies}
+    assert hp_by_name == {"Goblin": 20, "Orc": 80}
+
+
+@pytest.mark.asyncio
+async def test_graph_label_indexes_created(real_db_client: AsyncClient):
+    """
+    [통합 테스트] 그래프 복제 탐색용 AGE 라벨 인덱스가 스키마 초기화 시 생성됨
+    """
+    from state_db.infrastructure import run_raw_query
+
+    rows = await run_raw_query(
+        "SELECT indexname FROM pg_indexes WHERE schemaname = 'state_db'"
+    )
+    index_names = {row["indexname"] for row in rows}
+    assert {
+        "idx_graph_npc_session_id",
+        "idx_graph_npc_scenario_npc_id",
+        "idx_graph_enemy_session_id",
+        "idx_graph_enemy_scenario_enemy_id",
+        "idx_graph_relation_session_id",
+    } <= index_names
+
+
+@pytest.mark.asyncio
+async def test_scenario_reinject_applies_only_diff(real_db_client: AsyncClient):
+    """
+    [통합 테스트] 증분 재주입: dry_run diff 보고 -> 반영 -> 재비교 시 변경 없음
+    """
+    npc_a, npc_b, npc_c = (str(uuid.uuid4()) for _ in range(3))
+    item_id = str(uuid.uuid4())
+    payload = {
+        "title": "Reinject Scenario",
+        "npcs": [
+            {"scenario_npc_id": npc_a, "name": "Alice"},
+            {"scenario_npc_id": npc_b, "name": "Bob"},
+        ],
+        "items": [{"item_id": item_id, "name": "Rope"}],
+        "relations": [{"from_id": npc_a, "to_id": npc_b, "affinity": 40}],
+    }
+    inject_resp = await real_db_client.post("/state/scenario/inject", json=payload)
+    assert inject_resp.status_code == 200
+    scenario_id = inject_resp.json()["data"]["scenario_id"]
+
+    # Bob 삭제, Alice 이름 변경, Carol 추가, 관계 대상 변경
+    payload["npcs"] = [
+        {"scenario_npc_id": npc_a, "name": "Alicia"},
+        {"scenario_npc_id": npc_c, "name": "Carol"},
+    ]
+    payload["relations"] = [{"from_id": npc_a, "to_id": npc_c, "affinity": 70}]
+
+    dry_resp = await real_db_client.put(
+        f"/state/scenario/{scenario_id}/inject", params={"dry_run": True}, json=payload
+    )
+    assert dry_resp.status_code == 200
+    diff = dry_resp.json()["data"]
+    assert diff["npcs"] == {
+        "added": [npc_c],
+        "updated": [npc_a],
+        "removed": [npc_b],
+        "unchanged": 0,
+    }
+    assert diff["items"]["unchanged"] == 1
+    assert diff["relations"]["added"] == [f"{npc_a}->{npc_c}"]
+    assert diff["relations"]["removed"] == [f"{npc_a}->{npc_b}"]
+
+    apply_resp = await real_db_client.put(
+        f"/state/scenario/{scenario_id}/inject", json=payload
+    )
+    assert apply_resp.status_code == 200
+    assert apply_resp.json()["data"]["applied_rows"] == 2 * 3 + 2
+
+    recheck = await real_db_client.put(
+        f"/state/scenario/{scenario_id}/inject", params={"dry_run": True}, json=payload
+    )
+    after = recheck.json()["data"]
+    assert after["npcs"] == {"added": [], "updated": [], "removed": [], "unchanged": 2}
+    assert after["relations"]["unchanged"] == 1
+
+
+@pytest.mark.asyncio
+async def test_scenario_reinject_keeps_overlay_session_state(
+    real_db_client: AsyncClient,
+):
+    """
+    [통합 테스트] 증분 재주입: 진행 중인 Copy-on-Write 세션의 NPC/Enemy 값 유지
+    """
+    from state_db.infrastructure import DatabaseManager, run_raw_query
+
+    npc_key, goblin_key, orc_key = (str(uuid.uuid4()) for _ in range(3))
+    payload = {
+        "title": "Overlay Reinject Scenario",
+        "npcs": [{"scenario_npc_id": npc_key, "name": "Guard"}],
+        "enemies": [
+            {
+                "scenario_enemy_id": goblin_key,
+                "name": "Goblin",
+                "state": {"numeric": {"HP": 30}},
+            },
+            {
+                "scenario_enemy_id": orc_key,
+                "name": "Orc",
+                "state": {"numeric": {"HP": 80}},
+            },
+        ],
+    }
+    inject_resp = await real_db_client.post("/state/scenario/inject", json=payload)
+    scenario_id = inject_resp.json()["data"]["scenario_id"]
+
+    async with DatabaseManager.get_connection() as conn:
+        await conn.execute("SET state_db.entity_overlay = 'on'")
+        try:
+            session_id = await conn.fetchval(
+                "SELECT create_session($1::UUID)", uuid.UUID(scenario_id)
+            )
+        finally:
+            await conn.execute("RESET state_db.entity_overlay")
+
+    async def session_entities():
+        npcs = await real_db_client.get(f"/state/session/{session_id}/npcs")
+        enemies = await real_db_client.get(f"/state/session/{session_id}/enemies")
+        return (
+            {n["npc_id"]: n["name"] for n in npcs.json()["data"]},
+            {
+                e["enemy_instance_id"]: (e["name"], e["current_hp"])
+                for e in enemies.json()["data"]
+            },
+        )
+
+    before = await session_entities()
+
+    # Guard/Goblin 변경, Orc 삭제
+    payload["npcs"] = [{"scenario_npc_id": npc_key, "name": "Captain"}]
+    payload["enemies"] = [
+        {
+            "scenario_enemy_id": goblin_key,
+            "name": "Hobgoblin",
+            "state": {"numeric": {"HP": 60}},
+        }
+    ]
+    apply_resp = await real_db_client.put(
+        f"/state/scenario/{scenario_id}/inject", json=payload
+    )
+    assert apply_resp.status_code == 200
+    assert apply_resp.json()["data"]["frozen_rows"] == 3
+
+    # 진행 중인 세션은 공개 ID와 값 모두 재주입 전과 동일
+    assert await session_entities() == before
+
+    # 마스터는 갱신되었고, 고정 복제는 되돌리기 기록 대상이 아님
+    master = await run_raw_query(
+        "SELECT name FROM enemy"
+        " WHERE session_id = '00000000-0000-0000-0000-000000000000'"
+        " AND scenario_id = $1",
+        [scenario_id],
+    )
+    assert [row["name"] for row in master] == ["Hobgoblin"]
+    undo = await run_raw_query(
+        "SELECT count(*) AS n FROM turn_undo_log WHERE session_id = $1", [session_id]
+    )
+    assert undo[0]["n"] == 0
+
+
+@pytest.mark.asyncio
+async def test_history_partitions_prune_and_retention(real_db_client: AsyncClient):
+    """
+    [통합 테스트] turn/phase 월별 파티션: TRACE 쿼리 pruning 및 종료 세션 파티션 분리
+    """
+    from state_db.infrastructure import (
+        QUERY_REGISTRY,
+        apply_history_retention,
+        run_raw_command,
+        run_raw_query,
+    )
+
+    inject_resp = await real_db_client.post(
+        "/state/scenario/inject", json={"title": "Partition Scenario"}
+    )
+    scenario_id = inject_resp.json()["data"]["scenario_id"]
+    start_resp = await real_db_client.post(
+        "/state/session/start", json={"scenario_id": scenario_id}
+    )
+    session_id = start_resp.json()["data"]["session_id"]
+
+    # 1. 세션 기간 밖의 월별 파티션은 실행 시작 시점에 제외됨
+    plan = await run_raw_query(
+        "EXPLAIN " + QUERY_REGISTRY.get("TRACE/turn/get_history").sql,
+        [session_id, None, None],
+    )
+    plan_text = "\n".join(row["QUERY PLAN"] for row in plan)
+    assert "Subplans Removed" in plan_text
+
+    # 2. 400일 전에 시작/종료된 세션의 이력만 있는 파티션은 보존 기간 후 분리
+    await real_db_client.post(f"/state/session/{session_id}/end")
+    await run_raw_command(
+        "UPDATE session SET started_at = NOW() - INTERVAL '400 days', "
+        "ended_at = NOW() - INTERVAL '399 days' WHERE session_id = $1",
+        [session_id],
+    )
+    await run_raw_command(
+        "UPDATE turn SET created_at = NOW() - INTERVAL '400 days' "
+        "WHERE session_id = $1",
+        [session_id],
+    )
+    old_partition = (
+        await run_raw_query(
+            "SELECT 'turn_p' || to_char(NOW() - INTERVAL '400 days', 'YYYYMM') AS name"
+        )
+    )[0]["name"]
+
+    results = await apply_history_retention(retention_days=180, drop=False)
+    actions = {row["partition_name"]: row["action"] for row in results}
+    assert actions[old_partition] == "detached"
+
+    turns = await real_db_client.get(f"/state/session/{session_id}/turns")
+    assert turns.json()["data"] == []
+
+
+@pytest.mark.asyncio
+async def test_history_stats_maintained_on_write(real_db_client: AsyncClient):
+    """
+    [통합 테스트] turn/phase 기록 시 세션 이력 요약 테이블 증분 갱신 및 재구축 일치
+    """
+    from state_db.infrastructure import rebuild_history_stats, run_raw_query
+
+    inject_resp = await real_db_client.post(
+        "/state/scenario/inject", json={"title": "Stats Scenario"}
+    )
+    scenario_id = inject_resp.json()["data"]["scenario_id"]
+    start_resp = await real_db_client.post(
+        "/state/session/start", json={"scenario_id": scenario_id}
+    )
+    session_id = start_resp.json()["data"]["session_id"]
+
+    await real_db_client.post(f"/state/session/{session_id}/turn/add")
+    await real_db_client.put(
+        f"/state/session/{session_id}/phase", json={"new_phase": "combat"}
+    )
+    await real_db_client.post(f"/state/session/{session_id}/turn/add")
+    await real_db_client.put(
+        f"/state/session/{session_id}/phase", json={"new_phase": "exploration"}
+    )
+
+    async def snapshot():
+        summary = await real_db_client.get(f"/state/session/{session_id}/turns/summary")
+        by_phase = await real_db_client.get(
+            f"/state/session/{session_id}/turns/statistics/by-phase"
+        )
+        phases = await real_db_client.get(f"/state/session/{session_id}/phases/summary")
+        return (
+            summary.json()["data"]["total_turns"],
+            {r["phase_at_turn"]: r["turn_count"] for r in by_phase.json()["data"]},
+            {r["new_phase"]: r["transition_count"] for r in phases.json()["data"]},
+        )
+
+    # 요약 테이블 값이 이력 원본 집계와 일치
+    total_turns, by_phase, transitions = await snapshot()
+    raw_total = await run_raw_query(
+        "SELECT COUNT(*) AS n FROM turn WHERE session_id = $1", [session_id]
+    )
+    assert total_turns == raw_total[0]["n"]
+    assert sum(by_phase.values()) == total_turns
+    assert transitions["combat"] == 1
+    assert transitions["exploration"] == 2
+
+    # 재구축 후에도 동일한 결과
+    assert await rebuild_history_stats(session_id) == 1
+    assert await snapshot() == (total_turns, by_phase, transitions)
+
+
+@pytest.mark.asyncio
+async def test_turn_history_keyset_pagination_and_stream(real_db_client: AsyncClient):
+    """
+    [통합 테스트] Turn 이력 keyset 페이지네이션 및 NDJSON 스트리밍 결과 일치
+    """
+    inject_resp = await real_db_client.post(
+        "/state/scenario/inject", json={"title": "Paging Scenario"}
+    )
+    scenario_id = inject_resp.json()["data"]["scenario_id"]
+    start_resp = await real_db_client.post(
+        "/state/session/start", json={"scenario_id": scenario_id}
+    )
+    session_id = start_resp.json()["data"]["session_id"]
+    for _ in range(4):
+        await real_db_client.post(f"/state/session/{session_id}/turn/add")
+
+    # limit=2씩 마지막 turn_number를 커서로 넘겨 끝까지 조회
+    paged = []
+    after_turn = None
+    while True:
+        params = {"limit": 2}
+        if after_turn is not None:
+            params["after_turn"] = after_turn
+        resp = await real_db_client.get(
+            f"/state/session/{session_id}/turns", params=params
+        )
+        page = resp.json()["data"]
+        if not page:
+            break
+        assert len(page) <= 2
+        paged.extend(row["turn_number"] for row in page)
+        after_turn = page[-1]["turn_number"]
+
+    assert paged == sorted(paged)
+    assert len(paged) == len(set(paged)) >= 4
+
+    stream_resp = await real_db_client.get(
+        f"/state/session/{session_id}/turns", params={"stream": "true"}
+    )
+    assert stream_resp.headers["content-type"].startswith("application/x-ndjson")
+    streamed = [
+        json.loads(line)["turn_number"] for line in stream_resp.text.splitlines()
+    ]
+    assert streamed == paged
+
+
+@pytest.mark.asyncio
+async def test_replay_state_matches_live_state(real_db_client: AsyncClient):
+    """
+    [통합 테스트] 체크포인트 + turn 변경 내역 리플레이 결과가 실제 상태와 일치
+    """
+    from state_db.infrastructure import run_raw_query
+    from state_db.pipeline import write_state_snapshot
+
+    inject_resp = await real_db_client.post(
+        "/state/scenario/inject", json={"title": "Replay Scenario"}
+    )
+    scenario_id = inject_resp.json()["data"]["scenario_id"]
+    start_resp = await real_db_client.post(
+        "/state/session/start", json={"scenario_id": scenario_id}
+    )
+    data = start_resp.json()["data"]
+    session_id, player_id = data["session_id"], data["player_id"]
+
+    # 체크포인트 간격(기본 10)을 넘기도록 판정 결과를 turn으로 기록
+    for _ in range(12):
+        await write_state_snapshot(
+            session_id,
+            {"player_id": player_id, "player_hp": -1, "turn_increment": True},
+        )
+
+    checkpoints = await run_raw_query(
+        "SELECT turn_number FROM session_checkpoint WHERE session_id = $1 "
+        "ORDER BY turn_number",
+        [session_id],
+    )
+    assert [row["turn_number"] for row in checkpoints] == [0, 10]
+
+    replay_resp = await real_db_client.get(f"/state/session/{session_id}/turn/12/state")
+    replayed = replay_resp.json()["data"]
+    assert replayed["checkpoint_turn"] == 10
+    assert replayed["replayed_turns"] == 2
+
+    live = await run_raw_query(
+        "SELECT capture_session_state($1::UUID) AS state", [session_id]
+    )
+    assert replayed["state"]["player"]["state"] == live[0]["state"]["player"]["state"]
+    assert replayed["state"]["session"]["current_turn"] == 12
+
+    early = await real_db_client.get(f"/state/session/{session_id}/turn/5/state")
+    assert early.json()["data"]["checkpoint_turn"] == 0
+    assert early.json()["data"]["state"]["player"]["state"]["numeric"]["HP"] == 95
+
+
+@pytest.mark.asyncio
+async def test_rollback_turn_restores_state(real_db_client: AsyncClient):
+    """
+    [통합 테스트] N번 turn으로 되돌리면 이후 변경이 모두 복원되고 이력이 정리됨
+    """
+    from state_db.infrastructure import run_raw_query
+    from state_db.pipeline import write_state_snapshot
+
+    inject_resp = await real_db_client.post(
+        "/state/scenario/inject", json={"title": "Rollback Scenario"}
+    )
+    scenario_id = inject_resp.json()["data"]["scenario_id"]
+    start_resp = await real_db_client.post(
+        "/state/session/start",
+        json={"scenario_id": scenario_id, "location": "Town"},
+    )
+    data = start_resp.json()["data"]
+    session_id, player_id = data["session_id"], data["player_id"]
+
+    await write_state_snapshot(
+        session_id,
+        {"player_id": player_id, "player_hp": -5, "turn_increment": True},
+    )
+    before = await run_raw_query(
+        "SELECT capture_session_state($1::UUID) AS state", [session_id]
+    )
+
+    await write_state_snapshot(
+        session_id,
+        {
+            "player_id": player_id,
+            "player_hp": -5,
+            "player_stats": {"gold": 50},
+            "location": "Dark Forest",
+            "turn_increment": True,
+        },
+    )
+    await write_state_snapshot(
+        session_id,
+        {"player_id": player_id, "player_hp": -5, "turn_increment": True},
+    )
+
+    rollback_resp = await real_db_client.post(
+        f"/state/session/{session_id}/turn/rollback", json={"target_turn": 1}
+    )
+    assert rollback_resp.status_code == 200
+    result = rollback_resp.json()["data"]
+    assert result["previous_turn"] == 3
+    assert result["undone_turns"] == 2
+
+    after = await run_raw_query(
+        "SELECT capture_session_state($1::UUID) AS state", [session_id]
+    )
+    assert after[0]["state"] == before[0]["state"]
+    assert after[0]["state"]["session"]["location"] == "Town"
+
+    turns = await run_raw_query(
+        "SELECT MAX(turn_number) AS last_turn FROM turn WHERE session_id = $1",
+        [session_id],
+    )
+    assert turns[0]["last_turn"] == 1
+
+    invalid = await real_db_client.post(
+        f"/state/session/{session_id}/turn/rollback", json={"target_turn": 5}
+    )
+    assert invalid.status_code == 400
+
+
+@pytest.mark.asyncio
+async def test_archived_session_trace_reads_from_archive(real_db_client: AsyncClient):
+    """
+    [통합 테스트] 종료 세션 아카이브: 원본 행 삭제 후에도 TRACE 조회 결과 동일
+    """
+    from state_db.infrastructure import (
+        archive_ended_sessions,
+        run_raw_query,
+        run_sql_query,
+    )
+    from state_db.pipeline import write_state_snapshot
+
+    inject_resp = await real_db_client.post(
+        "/state/scenario/inject",
+        json={
+            "title": "Archive Scenario",
+            "npcs": [{"scenario_npc_id": str(uuid.uuid4()), "name": "Archivist"}],
+        },
+    )
+    scenario_id = inject_resp.json()["data"]["scenario_id"]
+    start_resp = await real_db_client.post(
+        "/state/session/start", json={"scenario_id": scenario_id}
+    )
+    data = start_resp.json()["data"]
+    session_id, player_id = data["session_id"], data["player_id"]
+
+    for _ in range(3):
+        await write_state_snapshot(
+            session_id,
+            {"player_id": player_id, "player_hp": -1, "turn_increment": True},
+        )
+    await real_db_client.post(f"/state/session/{session_id}/end")
+
+    trace_paths = [
+        f"/state/session/{session_id}/turns",
+        f"/state/session/{session_id}/turns/summary",
+        f"/state/session/{session_id}/phases",
+        f"/state/session/{session_id}/turn/3/state",
+    ]
+    before = [(await real_db_client.get(path)).json() for path in trace_paths]
+
+    # 다른 테스트의 종료 세션은 건드리지 않도록 대상 확인은 dry_run으로만 수행
+    candidates = await archive_ended_sessions(after_days=0, limit=1000, dry_run=True)
+    assert session_id in {str(r["session_id"]) for r in candidates}
+    archived = await run_sql_query("MANAGE/archive/archive_session", [session_id])
+    assert archived[0]["archived_rows"] > 0
+
+    hot_rows = await run_raw_query(
+        "SELECT (SELECT count(*) FROM turn WHERE session_id = $1)"
+        " + (SELECT count(*) FROM player WHERE session_id = $1)"
+        " + (SELECT count(*) FROM npc WHERE session_id = $1) AS n",
+        [session_id],
+    )
+    assert hot_rows[0]["n"] == 0
+
+    after = [(await real_db_client.get(path)).json() for path in trace_paths]
+    assert after == before
+
+
+@pytest.mark.asyncio
+async def test_pooled_claim_refreshes_initial_checkpoint(real_db_client: AsyncClient):
+    """
+    [통합 테스트] 풀 세션 claim 시 0번 turn 체크포인트와 이력 요약을 claim 시점으로 갱신
+    """
+    from state_db.infrastructure import run_raw_query
+
+    inject_resp = await real_db_client.post(
+        "/state/scenario/inject", json={"title": "Pooled Scenario"}
+    )
+    scenario_id = inject_resp.json()["data"]["scenario_id"]
+
+    provisioned = await run_raw_query(
+        "SELECT provision_pooled_session($1::UUID, 1) AS session_id", [scenario_id]
+    )
+    claimed = await run_raw_query(
+        "SELECT claim_pooled_session($1::UUID, $2, $3, $4) AS session_id",
+        [scenario_id, 2, 3, "Harbor"],
+    )
+    session_id = claimed[0]["session_id"]
+    assert session_id == provisioned[0]["session_id"]
+
+    checkpoint = await run_raw_query(
+        "SELECT state, capture_session_state($1::UUID) AS live "
+        "FROM session_checkpoint WHERE session_id = $1 AND turn_number = 0",
+        [session_id],
+    )
+    assert checkpoint[0]["state"]["session"]["location"] == "Harbor"
+    assert checkpoint[0]["state"]["session"]["current_act"] == 2
+    assert checkpoint[0]["state"] == checkpoint[0]["live"]
+
+    replay_resp = await real_db_client.get(f"/state/session/{session_id}/turn/0/state")
+    assert replay_resp.json()["data"]["state"]["session"]["location"] == "Harbor"
+
+    # 이력 요약의 시작 시각도 claim 시점으로 갱신된 turn / phase 기록과 일치
+    stats = await run_raw_query(
+        "SELECT hs.first_turn_at, hs.phase_since, ps.first_visit,"
+        " (SELECT created_at FROM turn WHERE session_id = $1 AND turn_number = 0)"
+        "  AS turn_at,"
+        " (SELECT transitioned_at FROM phase WHERE session_id = $1"
+        "  AND previous_phase IS NULL) AS phase_at"
+        " FROM session_history_stats hs"
+        " JOIN session_phase_stats ps ON ps.session_id = hs.session_id"
+        " WHERE hs.session_id = $1",
+        [session_id],
+    )
+    assert stats[0]["first_turn_at"] == stats[0]["turn_at"]
+    assert stats[0]["phase_since"] == stats[0]["phase_at"]
+    assert stats[0]["first_visit"] == stats[0]["phase_at"]
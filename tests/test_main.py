@@ -23,3 +23,13 @@ async def test_health_check(async_client: AsyncClient):
     response = await async_client.get("/health")
     assert response.status_code == 200
     assert response.json() == {"status": "healthy"}
+
+
+@pytest.mark.asyncio
+async def test_cache_health_check(async_client: AsyncClient):
+    """세션 캐시 통계 엔드포인트 테스트"""
+    response = await async_client.get("/health/cache")
+    assert response.status_code == 200
+    stats = response.json()["session_cache"]
+    for counter in ("hits", "misses", "evictions"):
+        assert counter in stats
@@ -0,0 +1,72 @@
+from unittest.mock import AsyncMock, patch
+
+import pytest
+
+from state_db.infrastructure import SESSION_CACHE, DatabaseManager, PhaseRulesMatrix
+from state_db.infrastructure.database import InvalidationMessage
+from state_db.repositories import SessionRepository
+
+SESSION_ID = "33333333-3333-3333-3333-333333333333"
+
+RULE_ROWS = [
+    {"phase": "combat", "allowed_actions": ["attack", "skill", "defend", "item"]},
+    {"phase": "dialogue", "allowed_actions": ["talk", "negotiate", "threaten"]},
+    {"phase": "exploration", "allowed_actions": ["move", "inspect", "talk"]},
+]
+
+
+def test_matrix_checks_actions_by_phase():
+    matrix = PhaseRulesMatrix()
+    matrix.load(RULE_ROWS)
+
+    assert matrix.is_allowed("combat", "attack")
+    assert not matrix.is_allowed("combat", "talk")
+    assert not matrix.is_allowed("rest", "attack")  # 규칙 없는 phase
+    assert matrix.check("exploration", ["talk", "attack", "unknown"]) == {
+        "talk": True,
+        "attack": False,
+        "unknown": False,
+    }
+    assert matrix.allowed_actions("dialogue") == {"talk", "negotiate", "threaten"}
+    assert matrix.stats()["actions"] == 9  # talk는 한 비트를 공유
+
+
+def test_matrix_reloads_only_on_phase_rules_notification():
+    matrix = PhaseRulesMatrix()
+    matrix.load(RULE_ROWS)
+
+    matrix.apply_invalidation(InvalidationMessage("session", SESSION_ID, 1))
+    assert matrix.loaded
+    matrix.apply_invalidation(InvalidationMessage("phase_rules", None, 2))
+    assert not matrix.loaded
+
+
+def test_phase_rules_notification_keeps_session_cache():
+    SESSION_CACHE.put(SESSION_ID, "info", "info")
+    DatabaseManager._on_notification(
+        None, 0, "state_invalidation", '{"t": "phase_rules", "s": null, "v": 3}'
+    )
+    assert SESSION_CACHE.get(SESSION_ID, "info") == "info"
+    SESSION_CACHE.invalidate(SESSION_ID)
+
+
+@pytest.mark.asyncio
+async def test_batch_action_check_uses_cached_phase(monkeypatch):
+    matrix = PhaseRulesMatrix()
+    matrix.load(RULE_ROWS)
+    monkeypatch.setattr("state_db.repositories.world.PHASE_RULES", matrix)
+    phase_row = [{"session_id": SESSION_ID, "current_phase": "combat"}]
+    repo = SessionRepository()
+
+    with patch(
+        "state_db.repositories.world.run_sql_query",
+        new=AsyncMock(return_value=phase_row),
+    ) as mock_query:
+        result = await repo.is_actions_allowed(SESSION_ID, ["attack", "talk"])
+        single = await repo.is_action_allowed(SESSION_ID, "defend")
+
+    assert result.current_phase == "combat"
+    assert result.allowed == {"attack": True, "talk": False}
+    assert single["is_allowed"] is True
+    assert mock_query.call_count == 1  # 두 번째 검증은 DB 접근 없음
+    SESSION_CACHE.invalidate(SESSION_ID)
@@ -115,3 +115,83 @@ async def test_write_state_snapshot():
         result = await pipeline.write_state_snapshot(MOCK_SESSION_ID, state_changes)
         assert result.status == "success"
         mock_write.assert_called_once_with(MOCK_SESSION_ID, state_changes)
+
+
+@pytest.mark.asyncio
+async def test_get_state_snapshot_single_query():
+    snapshot_row = {
+        "snapshot": {
+            "session": {
+                "session_id": MOCK_SESSION_ID,
+                "scenario_id": "test-scenario-id",
+                "player_id": MOCK_PLAYER_ID,
+                "current_act": 1,
+                "current_sequence": 1,
+                "current_phase": "combat",
+                "current_turn": 3,
+                "location": "Town",
+                "status": "active",
+                "updated_at": "2026-01-23T10:00:00+00:00",
+            },
+            "player": {
+                "player_id": MOCK_PLAYER_ID,
+                "name": "Hero",
+                "state": {"numeric": {"HP": 90}},
+                "relations": [],
+                "tags": ["player"],
+            },
+            "npcs": [],
+            "enemies": [
+                {
+                    "enemy_instance_id": "enemy-1",
+                    "scenario_enemy_id": "goblin",
+                    "name": "Goblin",
+                    "description": "",
+                    "current_hp": 10,
+                    "tags": ["enemy"],
+                    "state": {"numeric": {"HP": 10}},
+                }
+            ],
+            "inventory": [{"player_id": MOCK_PLAYER_ID, "item_id": 1, "quantity": 2}],
+            "phase": {"session_id": MOCK_SESSION_ID, "current_phase": "combat"},
+            "turn": {"session_id": MOCK_SESSION_ID, "current_turn": 3},
+        }
+    }
+
+    with patch(
+        "state_db.repositories.session.run_sql_query",
+        new=AsyncMock(return_value=[snapshot_row]),
+    ) as mock_query:
+        result = await pipeline.get_state_snapshot(MOCK_SESSION_ID)
+
+    mock_query.assert_called_once()
+    assert result["session"].current_turn == 3
+    assert result["player"].name == "Hero"
+    assert result["enemies"][0].current_hp == 10
+    assert result["inventory"][0].quantity == 2
+    assert result["phase"].current_phase == "combat"
+    assert result["turn"].current_turn == 3
+    assert result["snapshot_timestamp"] == result["session"].updated_at
+
+
+@pytest.mark.asyncio
+async def test_write_state_changes_single_batch_call():
+    state_changes = {
+        "player_id": MOCK_PLAYER_ID,
+        "enemy_hp": {"enemy-1": -10, "enemy-2": -30},
+        "npc_affinity": {"npc-1": 60, "npc-2": 40},
+        "turn_increment": True,
+    }
+    updated = ["enemy_hp_updated", "npc_affinity_updated", "turn_incremented"]
+
+    with patch(
+        "state_db.repositories.session.run_sql_query",
+        new=AsyncMock(return_value=[{"updated_fields": updated}]),
+    ) as mock_query:
+        result = await pipeline.write_state_snapshot(MOCK_SESSION_ID, state_changes)
+
+    mock_query.assert_called_once()
+    query, params = mock_query.call_args.args
+    assert query == "UPDATE/apply_state_changes"
+    assert params == [MOCK_SESSION_ID, state_changes]
+    assert result.updated_fields == updated
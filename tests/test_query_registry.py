@@ -0,0 +1,54 @@
+import pytest
+
+from state_db.infrastructure.database import _resolve_query
+from state_db.infrastructure.query_registry import (
+    DEFAULT_QUERY_DIR,
+    QueryRegistry,
+    count_params,
+)
+
+
+def test_count_params_ignores_function_bodies_and_comments():
+    sql = """
+    -- $9 는 주석이므로 무시
+    CREATE OR REPLACE FUNCTION f(a INT) RETURNS INT AS $$
+    BEGIN RETURN $1; END;
+    $$ LANGUAGE plpgsql;
+    SELECT * FROM session WHERE session_id = $1 AND status = $2;
+    """
+    assert count_params(sql) == 2
+    assert count_params("SELECT 1") == 0
+
+
+def test_count_params_ignores_string_literals():
+    assert count_params("SELECT '$3' AS price WHERE id = $1") == 1
+    assert count_params("SELECT 'it''s $2 -- not a comment' , $1") == 1
+    assert count_params("SELECT '--' AS dash, $2, $1") == 2
+    assert count_params("SELECT $$ '$5' $$, $1") == 1
+
+
+def test_registry_names_are_relative_paths_without_suffix():
+    registry = QueryRegistry()
+    registry.load()
+
+    query = registry.get("INQUIRY/session/Session_show-r")
+    assert query.param_count == 1
+    assert "INQUIRY/session/Session_show-r" in registry
+
+    by_path = registry.get_by_path(
+        DEFAULT_QUERY_DIR / "INQUIRY" / "session" / "Session_show-r.sql"
+    )
+    assert by_path is query
+
+
+def test_registry_unknown_query_raises():
+    registry = QueryRegistry()
+    with pytest.raises(FileNotFoundError):
+        registry.get("INQUIRY/does_not_exist")
+
+
+def test_resolve_query_validates_param_count():
+    with pytest.raises(ValueError):
+        _resolve_query("INQUIRY/session/Session_show-r", [])
+    sql = _resolve_query("INQUIRY/session/Session_show-r", ["sid"])
+    assert "session" in sql
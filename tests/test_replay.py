@@ -0,0 +1,166 @@
+from unittest.mock import AsyncMock, patch
+
+import pytest
+from fastapi import HTTPException
+
+from state_db.services.replay import ReplayService, apply_turn, replay_turns
+
+SESSION_ID = "22222222-2222-2222-2222-222222222222"
+PLAYER_ID = "33333333-3333-3333-3333-333333333333"
+ENEMY_ID = "44444444-4444-4444-4444-444444444444"
+NPC_ID = "55555555-5555-5555-5555-555555555555"
+ITEM_ID = "66666666-6666-6666-6666-666666666666"
+
+
+def _checkpoint_state() -> dict:
+    return {
+        "session": {
+            "current_act": 1,
+            "current_sequence": 1,
+            "current_phase": "dialogue",
+            "current_turn": 10,
+            "location": "Town",
+            "status": "active",
+        },
+        "player": {
+            "player_id": PLAYER_ID,
+            "state": {"numeric": {"HP": 100, "gold": 0}},
+            "tags": [],
+        },
+        "npcs": {NPC_ID: {"name": "Guard", "state": {}, "tags": []}},
+        "enemies": {
+            ENEMY_ID: {"name": "Goblin", "state": {"numeric": {"HP": 15}}, "tags": []}
+        },
+        "inventory": {ITEM_ID: 3},
+        "npc_affinity": {NPC_ID: 50},
+    }
+
+
+def test_replay_turns_applies_deltas_in_order():
+    turns = [
+        {
+            "turn_number": 11,
+            "phase_at_turn": "combat",
+            "state_changes": {
+                "player_id": PLAYER_ID,
+                "player_hp": -10,
+                "enemy_hp": {ENEMY_ID: -20},
+                "phase": "combat",
+                "location": "Forest",
+            },
+        },
+        {
+            "turn_number": 12,
+            "phase_at_turn": "combat",
+            "state_changes": {"inventory_lost": [ITEM_ID], "lost_quantity": 1},
+        },
+        {
+            "turn_number": 13,
+            "phase_at_turn": "exploration",
+            "state_changes": {
+                "npc_id": NPC_ID,
+                "affinity_change": 70,
+                "player_id": PLAYER_ID,
+                "player_stats": {"gold": 50},
+                "act": 2,
+            },
+        },
+    ]
+
+    state = replay_turns(_checkpoint_state(), turns)
+
+    assert state["player"]["state"]["numeric"] == {"HP": 90, "gold": 50}
+    assert state["enemies"][ENEMY_ID]["state"]["numeric"]["HP"] == 0
+    assert state["enemies"][ENEMY_ID]["tags"] == ["defeated"]
+    assert state["inventory"][ITEM_ID] == 2
+    assert state["npc_affinity"][NPC_ID] == 100
+    assert state["session"]["location"] == "Forest"
+    assert state["session"]["current_act"] == 2
+    assert state["session"]["current_phase"] == "exploration"
+    assert state["session"]["current_turn"] == 13
+
+
+def test_apply_turn_ignores_player_changes_without_player_id():
+    state = _checkpoint_state()
+    apply_turn(
+        state,
+        {
+            "turn_number": 11,
+            "phase_at_turn": "dialogue",
+            "state_changes": {"player_hp": -5},
+        },
+    )
+    assert state["player"]["state"]["numeric"]["HP"] == 100
+    assert state["session"]["current_turn"] == 11
+
+
+def test_apply_turn_enemy_without_hp_follows_sql_null_semantics():
+    state = _checkpoint_state()
+    state["enemies"][ENEMY_ID]["state"]["numeric"] = {"ATK": 3}
+    apply_turn(
+        state,
+        {
+            "turn_number": 11,
+            "phase_at_turn": "combat",
+            "state_changes": {"enemy_hp": {ENEMY_ID: -20}},
+        },
+    )
+    # NULL + delta = NULL, GREATEST(NULL, 0) = 0 이며 패배 태그는 붙지 않음
+    assert state["enemies"][ENEMY_ID]["state"]["numeric"] == {"ATK": 3, "HP": 0}
+    assert state["enemies"][ENEMY_ID]["tags"] == []
+
+
+def test_apply_turn_skips_location_unless_session_active():
+    state = _checkpoint_state()
+    state["session"]["status"] = "paused"
+    apply_turn(
+        state,
+        {
+            "turn_number": 11,
+            "phase_at_turn": "dialogue",
+            "state_changes": {"location": "Forest", "act": 2},
+        },
+    )
+    assert state["session"]["location"] == "Town"
+    assert state["session"]["current_act"] == 2
+
+
+@pytest.mark.asyncio
+async def test_get_state_at_turn_starts_from_nearest_checkpoint():
+    service = ReplayService()
+    checkpoint = {"turn_number": 10, "state": _checkpoint_state()}
+    deltas = [
+        {"turn_number": 11, "phase_at_turn": "dialogue", "state_changes": {}},
+        {"turn_number": 12, "phase_at_turn": "dialogue", "state_changes": {}},
+    ]
+    with (
+        patch.object(
+            service.trace_repo,
+            "get_checkpoint_before",
+            new=AsyncMock(return_value=checkpoint),
+        ),
+        patch.object(
+            service.trace_repo, "get_turn_deltas", new=AsyncMock(return_value=deltas)
+        ) as get_deltas,
+    ):
+        result = await service.get_state_at_turn(SESSION_ID, 12)
+
+    get_deltas.assert_awaited_once_with(SESSION_ID, 10, 12)
+    assert result["checkpoint_turn"] == 10
+    assert result["replayed_turns"] == 2
+    assert result["state"]["session"]["current_turn"] == 12
+
+    # 기록되지 않은 turn은 404
+    with (
+        patch.object(
+            service.trace_repo,
+            "get_checkpoint_before",
+            new=AsyncMock(return_value=checkpoint),
+        ),
+        patch.object(
+            service.trace_repo, "get_turn_deltas", new=AsyncMock(return_value=deltas)
+        ),
+        pytest.raises(HTTPException) as exc,
+    ):
+        await service.get_state_at_turn(SESSION_ID, 15)
+    assert exc.value.status_code == 404
@@ -106,6 +106,30 @@ async def test_get_inventory(async_client: AsyncClient):
         assert len(data["data"]) == 2
 
 
+@pytest.mark.asyncio
+async def test_get_item(async_client: AsyncClient):
+    item_id = "550e8400-e29b-41d4-a716-446655440003"
+    mock_item = {
+        "item_id": item_id,
+        "name": "Health Potion",
+        "item_type": "consumable",
+        "meta": {"stackable": True},
+    }
+
+    with patch(
+        "state_db.repositories.SessionRepository.get_item",
+        new=AsyncMock(return_value=mock_item),
+    ):
+        response = await async_client.get(
+            f"/state/session/{MOCK_SESSION_ID}/items/{item_id}"
+        )
+
+        assert response.status_code == 200
+        data = response.json()
+        assert data["status"] == "success"
+        assert data["data"]["name"] == "Health Potion"
+
+
 @pytest.mark.asyncio
 async def test_get_npcs(async_client: AsyncClient):
     mock_npcs = [
@@ -39,3 +39,32 @@ async def test_start_session(async_client: AsyncClient):
         data = response.json()
         assert data["status"] == "success"
         assert data["data"]["session_id"] == MOCK_SESSION_ID
+
+
+@pytest.mark.asyncio
+async def test_start_sessions_bulk(async_client: AsyncClient):
+    session_ids = ["session-1", "session-2", "session-3"]
+
+    with patch(
+        "state_db.repositories.SessionRepository.start_bulk",
+        new=AsyncMock(return_value=session_ids),
+    ) as mock_bulk:
+        response = await async_client.post(
+            "/state/session/start/bulk",
+            json={"scenario_id": MOCK_SCENARIO_ID, "count": 3},
+        )
+
+        assert response.status_code == 200
+        data = response.json()
+        assert data["data"]["count"] == 3
+        assert data["data"]["session_ids"] == session_ids
+        assert mock_bulk.call_args.kwargs["count"] == 3
+
+
+@pytest.mark.asyncio
+async def test_start_sessions_bulk_rejects_invalid_count(async_client: AsyncClient):
+    response = await async_client.post(
+        "/state/session/start/bulk",
+        json={"scenario_id": MOCK_SCENARIO_ID, "count": 0},
+    )
+    assert response.status_code == 422
@@ -18,6 +18,24 @@ async def test_get_turn_history(async_client: AsyncClient):
         assert response.status_code == 200
 
 
+@pytest.mark.asyncio
+async def test_get_turn_history_stream(async_client: AsyncClient):
+    async def mock_rows(*_args):
+        for turn_number in (1, 2):
+            yield {"session_id": MOCK_SESSION_ID, "turn_number": turn_number}
+
+    with patch(
+        "state_db.repositories.TraceRepository.stream_turn_history",
+        new=lambda _self, *args: mock_rows(*args),
+    ):
+        response = await async_client.get(
+            f"/state/session/{MOCK_SESSION_ID}/turns?stream=true"
+        )
+        assert response.status_code == 200
+        assert response.headers["content-type"].startswith("application/x-ndjson")
+        assert len(response.text.splitlines()) == 2
+
+
 @pytest.mark.asyncio
 async def test_get_recent_turns(async_client: AsyncClient):
     mock_turns = [{"turn_number": 5}]
@@ -0,0 +1,314 @@
+from contextlib import asynccontextmanager
+from functools import partial
+from unittest.mock import AsyncMock, MagicMock, patch
+
+import pytest
+from fastapi import HTTPException
+
+from state_db.infrastructure import GraphLoader
+from state_db.repositories.scenario import ScenarioRepository, _diff
+from state_db.routers.router_INJECT import iter_ndjson
+from state_db.schemas import ScenarioInjectRequest
+
+SCENARIO_ID = "11111111-1111-1111-1111-111111111111"
+
+
+def _fake_connection() -> MagicMock:
+    conn = MagicMock()
+    conn.fetchrow = AsyncMock(return_value={"scenario_id": SCENARIO_ID})
+    conn.executemany = AsyncMock()
+    state = {"next_id": 1}
+    # 생성된 Vertex의 시나리오 키 -> 내부 id (resolve_refs 응답용)
+    vertex_ids = {}
+
+    async def fetch(sql, params):
+        # GraphLoader Vertex id 조회: 요청한 키 중 존재하는 것만 [키, id] 반환
+        if "IN $refs" in sql:
+            return [
+                {"result": [ref, vertex_ids[ref]]}
+                for ref in params["refs"]
+                if ref in vertex_ids
+            ]
+        # GraphLoader Vertex 생성: [ref, 내부 id] 반환
+        if "RETURN [row.ref, id(n)]" not in sql:
+            return []
+        rows = []
+        for row in params["rows"]:
+            properties = row["properties"]
+            key = properties.get("scenario_npc_id") or properties.get(
+                "scenario_enemy_id"
+            )
+            vertex_ids[key] = state["next_id"]
+            rows.append({"result": [row["ref"], state["next_id"]]})
+            state["next_id"] += 1
+        return rows
+
+    conn.fetch = AsyncMock(side_effect=fetch)
+
+    @asynccontextmanager
+    async def transaction():
+        yield
+
+    conn.transaction = transaction
+    return conn
+
+
+@pytest.mark.asyncio
+async def test_inject_scenario_uses_bulk_statements():
+    request = ScenarioInjectRequest.model_validate(
+        {
+            "title": "Bulk",
+            "npcs": [
+                {"scenario_npc_id": f"npc-{i}", "name": f"NPC {i}"} for i in range(5)
+            ],
+            "enemies": [{"scenario_enemy_id": "enemy-0", "name": "Goblin"}],
+            "items": [
+                {"item_id": "550e8400-e29b-41d4-a716-446655440001", "name": "Potion"}
+            ],
+            "relations": [
+                {"from_id": "npc-0", "to_id": "npc-1"},
+                {"from_id": "npc-1", "to_id": "enemy-0"},
+            ],
+        }
+    )
+    conn = _fake_connection()
+
+    @asynccontextmanager
+    async def get_connection():
+        yield conn
+
+    with (
+        patch(
+            "state_db.repositories.scenario.DatabaseManager.get_connection",
+            new=get_connection,
+        ),
+        patch(
+            "state_db.repositories.scenario.GraphLoader",
+            new=partial(GraphLoader, batch_size=2),
+        ),
+    ):
+        result = await ScenarioRepository().inject_scenario(request)
+
+    # 테이블 행: 엔티티 종류별 executemany 1회 (npc, enemy, item)
+    assert conn.executemany.await_count == 3
+    npc_rows = conn.executemany.await_args_list[0].args[1]
+    assert len(npc_rows) == 5
+
+    # 그래프: NPC 5건은 2건씩 3배치, Enemy 1배치, Edge는 라벨 조합별 1배치
+    batches = [call.args[1]["rows"] for call in conn.fetch.await_args_list]
+    assert [len(batch) for batch in batches] == [2, 2, 1, 1, 1, 1]
+    # Edge 양 끝은 주입 중 확보한 Vertex 내부 id (npc-0 -> 1, npc-1 -> 2, enemy-0 -> 6)
+    edge_rows = [row for batch in batches[-2:] for row in batch]
+    assert [(row["start"], row["end"]) for row in edge_rows] == [(1, 2), (2, 6)]
+    assert edge_rows[0]["properties"]["session_id"] == (
+        "00000000-0000-0000-0000-000000000000"
+    )
+
+    assert result.scenario_id == SCENARIO_ID
+    assert result.inserted_rows == 1 + 5 * 2 + 1 * 2 + 1 + 2
+    assert result.rows_per_sec > 0
+
+
+@pytest.mark.asyncio
+async def test_inject_scenario_rejects_unknown_relation_endpoints():
+    request = ScenarioInjectRequest.model_validate(
+        {
+            "title": "Dangling",
+            "npcs": [{"scenario_npc_id": "npc-0", "name": "NPC 0"}],
+            "relations": [{"from_id": "npc-0", "to_id": "npc-missing"}],
+        }
+    )
+    conn = _fake_connection()
+
+    @asynccontextmanager
+    async def get_connection():
+        yield conn
+
+    with (
+        patch(
+            "state_db.repositories.scenario.DatabaseManager.get_connection",
+            new=get_connection,
+        ),
+        pytest.raises(HTTPException) as exc,
+    ):
+        await ScenarioRepository().inject_scenario(request)
+
+    # 일부 Edge만 만들지 않고 트랜잭션 전체를 422로 거부
+    assert exc.value.status_code == 422
+    assert "npc-missing" in exc.value.detail
+    assert not any(
+        "CREATE (a)-[r:RELATION]->(b)" in call.args[0]
+        for call in conn.fetch.await_args_list
+    )
+
+
+async def _chunks(*parts: bytes):
+    for part in parts:
+        yield part
+
+
+async def _records(*records):
+    for line_no, record in enumerate(records, start=1):
+        yield line_no, dict(record)
+
+
+@pytest.mark.asyncio
+async def test_iter_ndjson_splits_lines_across_chunks():
+    chunks = _chunks(b'{"type": "scenario", "ti', b'tle": "S"}\n\n{"type"', b': "npc"}')
+    records = [item async for item in iter_ndjson(chunks)]
+    assert records == [(1, {"type": "scenario", "title": "S"}), (3, {"type": "npc"})]
+
+    with pytest.raises(HTTPException) as exc:
+        _ = [item async for item in iter_ndjson(_chunks(b'{"type": "x"}\n[1]\n'))]
+    assert exc.value.status_code == 422
+    assert exc.value.detail.startswith("line 2:")
+
+
+@pytest.mark.asyncio
+async def test_inject_scenario_stream_flushes_bounded_batches():
+    records = _records(
+        {"type": "scenario", "title": "Stream"},
+        *(
+            {"type": "npc", "scenario_npc_id": f"npc-{i}", "name": "N"}
+            for i in range(3)
+        ),
+        {"type": "relation", "from_id": "npc-0", "to_id": "npc-1"},
+        {"type": "enemy", "scenario_enemy_id": "enemy-0", "name": "Goblin"},
+        {"type": "relation", "from_id": "npc-2", "to_id": "enemy-0"},
+        {
+            "type": "item",
+            "item_id": "550e8400-e29b-41d4-a716-446655440001",
+            "name": "P",
+        },
+    )
+    conn = _fake_connection()
+
+    @asynccontextmanager
+    async def get_connection():
+        yield conn
+
+    with (
+        patch(
+            "state_db.repositories.scenario.DatabaseManager.get_connection",
+            new=get_connection,
+        ),
+        patch("state_db.repositories.scenario.SCENARIO_INJECT_BATCH_SIZE", 2),
+    ):
+        result = await ScenarioRepository().inject_scenario_stream(records)
+
+    # 버퍼는 최대 2건: npc 2건 flush -> relation 2건째에 남은 npc/enemy 선반영 후 flush
+    # -> 종료 시 item flush
+    executed = [len(call.args[1]) for call in conn.executemany.await_args_list]
+    assert executed == [2, 1, 1, 1]
+
+    # Edge 양 끝은 flush 시점에 조회한 Vertex id로 연결
+    edge_calls = [
+        call.args[1]["rows"]
+        for call in conn.fetch.await_args_list
+        if "CREATE (a)-[r:RELATION]->(b)" in call.args[0]
+    ]
+    edges = sorted((row["start"], row["end"]) for batch in edge_calls for row in batch)
+    assert edges == [(1, 2), (3, 4)]
+
+    assert result.scenario_id == SCENARIO_ID
+    assert result.inserted_rows == 1 + 3 * 2 + 1 * 2 + 1 + 2
+
+
+@pytest.mark.parametrize("batch_size", [2, 500])
+@pytest.mark.asyncio
+async def test_inject_scenario_stream_defers_relations_to_late_vertices(batch_size):
+    # relation 3건 중 첫 배치의 npc-0 -> enemy-0은 Vertex보다 먼저 도착
+    records = _records(
+        {"type": "scenario", "title": "Late"},
+        {"type": "npc", "scenario_npc_id": "npc-0", "name": "N"},
+        {"type": "npc", "scenario_npc_id": "npc-1", "name": "N"},
+        {"type": "relation", "from_id": "npc-0", "to_id": "enemy-0"},
+        {"type": "relation", "from_id": "npc-0", "to_id": "npc-1"},
+        {"type": "relation", "from_id": "npc-1", "to_id": "npc-0"},
+        {"type": "enemy", "scenario_enemy_id": "enemy-0", "name": "Goblin"},
+    )
+    conn = _fake_connection()
+
+    @asynccontextmanager
+    async def get_connection():
+        yield conn
+
+    with (
+        patch(
+            "state_db.repositories.scenario.DatabaseManager.get_connection",
+            new=get_connection,
+        ),
+        patch("state_db.repositories.scenario.SCENARIO_INJECT_BATCH_SIZE", batch_size),
+    ):
+        result = await ScenarioRepository().inject_scenario_stream(records)
+
+    edge_calls = [
+        call.args[1]["rows"]
+        for call in conn.fetch.await_args_list
+        if "CREATE (a)-[r:RELATION]->(b)" in call.args[0]
+    ]
+    edges = sorted((row["start"], row["end"]) for batch in edge_calls for row in batch)
+    # 배치 크기와 관계없이 3건 모두 연결 (npc-0 -> 1, npc-1 -> 2, enemy-0 -> 3)
+    assert edges == [(1, 2), (1, 3), (2, 1)]
+    assert result.inserted_rows == 1 + 2 * 2 + 1 * 2 + 3
+
+
+@pytest.mark.parametrize("batch_size", [2, 500])
+@pytest.mark.asyncio
+async def test_inject_scenario_stream_rejects_never_resolved_relation(batch_size):
+    records = _records(
+        {"type": "scenario", "title": "Dangling"},
+        {"type": "npc", "scenario_npc_id": "npc-0", "name": "N"},
+        {"type": "relation", "from_id": "npc-0", "to_id": "npc-missing"},
+        {"type": "relation", "from_id": "npc-0", "to_id": "npc-0"},
+    )
+    conn = _fake_connection()
+
+    @asynccontextmanager
+    async def get_connection():
+        yield conn
+
+    with (
+        patch(
+            "state_db.repositories.scenario.DatabaseManager.get_connection",
+            new=get_connection,
+        ),
+        patch("state_db.repositories.scenario.SCENARIO_INJECT_BATCH_SIZE", batch_size),
+        pytest.raises(HTTPException) as exc,
+    ):
+        await ScenarioRepository().inject_scenario_stream(records)
+    assert exc.value.status_code == 422
+    assert "npc-missing" in exc.value.detail
+
+
+@pytest.mark.asyncio
+async def test_inject_scenario_stream_requires_header():
+    conn = _fake_connection()
+
+    @asynccontextmanager
+    async def get_connection():
+        yield conn
+
+    with (
+        patch(
+            "state_db.repositories.scenario.DatabaseManager.get_connection",
+            new=get_connection,
+        ),
+        pytest.raises(HTTPException) as exc,
+    ):
+        await ScenarioRepository().inject_scenario_stream(
+            _records({"type": "npc", "scenario_npc_id": "npc-0", "name": "N"})
+        )
+    assert exc.value.status_code == 422
+    conn.fetchrow.assert_not_awaited()
+
+
+def test_reinject_diff_classifies_by_key():
+    diff = _diff(
+        {"a": {"name": "A"}, "b": {"name": "B"}, "c": {"name": "C"}},
+        {"a": {"name": "A"}, "b": {"name": "B2"}, "d": {"name": "D"}},
+    )
+    assert diff.added == ["d"]
+    assert diff.updated == ["b"]
+    assert diff.removed == ["c"]
+    assert diff.unchanged == 1
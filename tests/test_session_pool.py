@@ -0,0 +1,131 @@
+from contextlib import asynccontextmanager
+from unittest.mock import AsyncMock, MagicMock, patch
+
+import pytest
+
+from state_db.infrastructure import SessionPoolRefiller
+from state_db.repositories import SessionRepository
+
+SCENARIO_ID = "44444444-4444-4444-4444-444444444444"
+SESSION_ID = "55555555-5555-5555-5555-555555555555"
+
+
+def fake_pool_queries(pooled: int, high_watermark: int):
+    """풀 상태 쿼리 흉내: provision 호출마다 풀이 1씩 증가"""
+    state = {"pooled": pooled}
+
+    async def run(query, params=None):
+        if query.endswith("drain_inactive"):
+            return [{"drained": 0}]
+        if query.endswith("pool_status"):
+            return [{"scenario_id": SCENARIO_ID, "pooled": state["pooled"]}]
+        if state["pooled"] >= high_watermark:
+            return [{"session_id": None}]
+        state["pooled"] += 1
+        return [{"session_id": f"session-{state['pooled']}"}]
+
+    return run, state
+
+
+@pytest.mark.asyncio
+async def test_refiller_fills_up_to_high_watermark_below_low():
+    refiller = SessionPoolRefiller(2, 5, interval_seconds=1)
+    run, state = fake_pool_queries(pooled=1, high_watermark=5)
+
+    with patch("state_db.infrastructure.session_pool.run_sql_query", new=run):
+        assert await refiller.refill_once() == 4
+    assert state["pooled"] == 5
+    assert refiller.stats()["provisioned"] == 4
+
+
+@pytest.mark.asyncio
+async def test_refiller_skips_scenarios_at_or_above_low_watermark():
+    refiller = SessionPoolRefiller(2, 5, interval_seconds=1)
+    run, state = fake_pool_queries(pooled=2, high_watermark=5)
+
+    with patch("state_db.infrastructure.session_pool.run_sql_query", new=run):
+        assert await refiller.refill_once() == 0
+    assert state["pooled"] == 2
+
+
+@pytest.mark.asyncio
+async def test_start_claims_pooled_session_before_creating(monkeypatch):
+    refiller = SessionPoolRefiller(1, 2, interval_seconds=1)
+    monkeypatch.setattr("state_db.repositories.session.SESSION_POOL", refiller)
+    repo = SessionRepository()
+    repo.get_info = AsyncMock(return_value="info")
+
+    with (
+        patch(
+            "state_db.repositories.session.run_sql_query",
+            new=AsyncMock(return_value=[{"session_id": SESSION_ID}]),
+        ) as claim,
+        patch(
+            "state_db.repositories.session.execute_sql_function", new=AsyncMock()
+        ) as create,
+    ):
+        assert await repo.start(SCENARIO_ID, 2, 3, "Town") == "info"
+
+    assert claim.call_args.args[0] == "START_by_session/claim_session"
+    create.assert_not_called()
+    repo.get_info.assert_awaited_once_with(SESSION_ID)
+    assert refiller.stats()["claims"] == 1
+
+
+@pytest.mark.asyncio
+async def test_start_falls_back_to_create_session_when_pool_empty(monkeypatch):
+    refiller = SessionPoolRefiller(1, 2, interval_seconds=1)
+    monkeypatch.setattr("state_db.repositories.session.SESSION_POOL", refiller)
+    repo = SessionRepository()
+    repo.get_info = AsyncMock(return_value="info")
+
+    with (
+        patch(
+            "state_db.repositories.session.run_sql_query",
+            new=AsyncMock(return_value=[{"session_id": None}]),
+        ),
+        patch(
+            "state_db.repositories.session.execute_sql_function",
+            new=AsyncMock(return_value=[{"create_session": SESSION_ID}]),
+        ) as create,
+    ):
+        await repo.start(SCENARIO_ID, 1, 1, "Town")
+
+    create.assert_awaited_once()
+    assert refiller.stats()["misses"] == 1
+
+
+@pytest.mark.asyncio
+async def test_start_bulk_returns_session_ids_from_single_call():
+    repo = SessionRepository()
+    conn = MagicMock()
+    conn.fetchval = AsyncMock(return_value=[SESSION_ID, SCENARIO_ID])
+
+    @asynccontextmanager
+    async def transaction():
+        yield
+
+    @asynccontextmanager
+    async def get_connection():
+        yield conn
+
+    conn.transaction = transaction
+    clone = AsyncMock()
+
+    with (
+        patch(
+            "state_db.repositories.session.DatabaseManager.get_connection",
+            new=get_connection,
+        ),
+        patch(
+            "state_db.repositories.session.GraphLoader.clone_scenario_graph",
+            new=clone,
+        ),
+    ):
+        result = await repo.start_bulk(SCENARIO_ID, 2, 1, 1, "Town")
+
+    assert result == [SESSION_ID, SCENARIO_ID]
+    conn.fetchval.assert_awaited_once()
+    # SQL 함수는 그래프 복제를 생략하고(False) GraphLoader가 같은 트랜잭션에서 복제
+    assert conn.fetchval.call_args.args[-1] is False
+    clone.assert_awaited_once()
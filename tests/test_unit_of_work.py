@@ -0,0 +1,78 @@
+import pytest
+
+from state_db.infrastructure import DatabaseManager, UnitOfWork, run_raw_query
+
+
+class FakeTransaction:
+    def __init__(self, log):
+        self.log = log
+
+    async def start(self):
+        self.log.append("begin")
+
+    async def commit(self):
+        self.log.append("commit")
+
+    async def rollback(self):
+        self.log.append("rollback")
+
+
+class FakeConnection:
+    def __init__(self, log):
+        self.log = log
+
+    def transaction(self):
+        return FakeTransaction(self.log)
+
+    async def fetch(self, query, *params):
+        self.log.append(query)
+        return []
+
+
+class FakePool:
+    def __init__(self):
+        self.log = []
+        self.acquired = 0
+
+    async def acquire(self):
+        self.acquired += 1
+        return FakeConnection(self.log)
+
+    async def release(self, conn):
+        self.log.append("release")
+
+
+@pytest.fixture
+def fake_pool(monkeypatch):
+    pool = FakePool()
+    monkeypatch.setattr(DatabaseManager, "_pool", pool)
+    return pool
+
+
+@pytest.mark.asyncio
+async def test_unit_of_work_shares_one_connection(fake_pool):
+    async with UnitOfWork(transactional=True):
+        await run_raw_query("SELECT 1")
+        await run_raw_query("SELECT 2")
+
+    assert fake_pool.acquired == 1
+    assert fake_pool.log == ["begin", "SELECT 1", "SELECT 2", "commit", "release"]
+
+
+@pytest.mark.asyncio
+async def test_unit_of_work_rolls_back_on_error(fake_pool):
+    with pytest.raises(RuntimeError):
+        async with UnitOfWork(transactional=True):
+            await run_raw_query("SELECT 1")
+            raise RuntimeError("boom")
+
+    assert fake_pool.log == ["begin", "SELECT 1", "rollback", "release"]
+
+
+@pytest.mark.asyncio
+async def test_unit_of_work_acquires_lazily(fake_pool):
+    async with UnitOfWork(transactional=True) as unit_of_work:
+        assert not unit_of_work.is_active
+
+    assert fake_pool.acquired == 0
+    assert fake_pool.log == []